@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("exercises", "0003_alter_exercise_duration"),
+        ("plans", "0032_alter_day_carbs_g_alter_day_carbs_g_goal_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="exercise",
+            index=models.Index(
+                fields=["day", "-time", "-id"], name="exercise_day_time_idx"
+            ),
+        ),
+    ]
@@ -53,6 +53,17 @@ class Exercise(BaseModel):
         null=True,
     )
 
+    class Meta(BaseModel.Meta):
+        """Exercise database metadata."""
+
+        abstract = False
+        indexes = [
+            models.Index(
+                fields=["day", "-time", "-id"],
+                name="exercise_day_time_idx",
+            )
+        ]
+
     def __str__(self) -> str:
         """Get string representation.
 
@@ -15,6 +15,11 @@ from apps.libs.graphql import (
     validated_decimal_field,
     validated_non_negative_decimal,
 )
+from apps.libs.pagination import (
+    Connection,
+    empty_connection,
+    keyset_connection,
+)
 
 MAX_DISTANCE = Decimal("99999999.99")
 MAX_DURATION_SECONDS = (2**63 - 1) // 1_000_000
@@ -185,6 +190,41 @@ class ExerciseQuery:
             ).order_by("-day__day", "-time")
         ]
 
+    @strawberry.field
+    def exercises_connection(
+        self,
+        info: Info,
+        first: int | None = None,
+        after: str | None = None,
+        last: int | None = None,
+        before: str | None = None,
+    ) -> Connection[ExerciseType]:
+        """Get a keyset-paginated page of exercises for the current user.
+
+        Args:
+            info (Info): GraphQL execution info.
+            first (int | None): number of exercises after the after cursor.
+            after (str | None): cursor to page forward from.
+            last (int | None): number of exercises before the before cursor.
+            before (str | None): cursor to page backward from.
+
+        Returns:
+            Connection[ExerciseType]: exercises, latest first.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return empty_connection()
+
+        return keyset_connection(
+            Exercise.objects.filter(day__plan__user=user),
+            ("-day__day", "-day_id", "-time", "-id"),
+            ExerciseType.from_model,
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+        )
+
     @strawberry.field
     def exercise(self, info: Info, id: strawberry.ID) -> ExerciseType | None:
         """Get a single exercise by ID.
@@ -228,6 +268,41 @@ class ExerciseQuery:
             ).order_by("-day__day")
         ]
 
+    @strawberry.field
+    def day_steps_list_connection(
+        self,
+        info: Info,
+        first: int | None = None,
+        after: str | None = None,
+        last: int | None = None,
+        before: str | None = None,
+    ) -> Connection[DayStepsType]:
+        """Get a keyset-paginated page of day steps for the current user.
+
+        Args:
+            info (Info): GraphQL execution info.
+            first (int | None): number of records after the after cursor.
+            after (str | None): cursor to page forward from.
+            last (int | None): number of records before the before cursor.
+            before (str | None): cursor to page backward from.
+
+        Returns:
+            Connection[DayStepsType]: day steps, latest day first.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return empty_connection()
+
+        return keyset_connection(
+            DaySteps.objects.filter(day__plan__user=user),
+            ("-day__day", "-day_id"),
+            DayStepsType.from_model,
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+        )
+
     @strawberry.field
     def day_steps(self, info: Info, id: strawberry.ID) -> DayStepsType | None:
         """Get a single day steps record by ID.
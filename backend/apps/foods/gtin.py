@@ -0,0 +1,57 @@
+"""GTIN barcode normalization module."""
+
+import re
+
+GTIN_LENGTHS = frozenset({8, 12, 13, 14})
+
+
+def normalize_gtin(barcode: str) -> str | None:
+    """Normalize and validate a product GTIN barcode.
+
+    Only GTIN-8, UPC-A/GTIN-12, EAN-13, and GTIN-14 values with a valid GS1
+    check digit are accepted. Surrounding whitespace is removed. Equivalent
+    zero-prefixed 13- and 14-digit forms are reduced no further than GTIN-12;
+    GTIN-8 values are preserved.
+
+    Args:
+        barcode: Raw scanned barcode value.
+
+    Returns:
+        str | None: normalized GTIN, or None when it is invalid.
+    """
+    normalized = barcode.strip()
+    if (
+        len(normalized) not in GTIN_LENGTHS
+        or re.fullmatch(r"[0-9]+", normalized) is None
+    ):
+        return None
+
+    weighted_sum = sum(
+        int(digit) * (3 if position % 2 else 1)
+        for position, digit in enumerate(reversed(normalized[:-1]), start=1)
+    )
+    check_digit = (10 - weighted_sum % 10) % 10
+    if check_digit != int(normalized[-1]):
+        return None
+    while len(normalized) > 12 and normalized.startswith("0"):
+        normalized = normalized[1:]
+    return normalized
+
+
+def equivalent_gtins(barcode: str) -> tuple[str, ...]:
+    """Return supported stored representations equivalent to a valid GTIN.
+
+    Args:
+        barcode: Raw or canonical GTIN value.
+
+    Returns:
+        tuple[str, ...]: Canonical form followed by zero-prefixed legacy forms.
+    """
+    canonical = normalize_gtin(barcode)
+    if canonical is None:
+        return ()
+    if len(canonical) == 8:
+        return (canonical,)
+    return tuple(
+        canonical.zfill(length) for length in range(len(canonical), 15)
+    )
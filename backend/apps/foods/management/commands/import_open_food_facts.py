@@ -0,0 +1,128 @@
+"""Import Open Food Facts dump management command module."""
+
+import time
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+
+from apps.foods.open_food_facts_dump import (
+    CSV_DEFAULT_DELIMITER,
+    DEFAULT_BATCH_SIZE,
+    DUMP_FORMATS,
+    DumpImportStats,
+    dump_format,
+    import_dump_batch,
+    iter_dump_records,
+    read_checkpoint,
+    write_checkpoint,
+)
+
+
+class Command(BaseCommand):
+    """Stream a local Open Food Facts dump into food products."""
+
+    help = (
+        "Create or refresh food products and their default servings from a "
+        "local Open Food Facts JSONL or CSV dump, optionally gzip compressed."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser (CommandParser): command argument parser.
+        """
+        parser.add_argument("dump", type=Path, help="Dump file path.")
+        parser.add_argument(
+            "--format",
+            choices=DUMP_FORMATS,
+            help="Dump format, inferred from the file name by default.",
+        )
+        parser.add_argument(
+            "--delimiter",
+            default=CSV_DEFAULT_DELIMITER,
+            help="CSV field delimiter, a tab by default as in OFF exports.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Records written per transaction.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            help="Checkpoint file, '<dump>.checkpoint' by default.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore an existing checkpoint and start from the top.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Import the dump batch by batch, checkpointing each commit.
+
+        Args:
+            args (Any): positional arguments.
+            options (Any): command options.
+
+        Raises:
+            CommandError: when the dump or options are unusable.
+        """
+        dump: Path = options["dump"]
+        if not dump.is_file():
+            raise CommandError(f"Dump file not found: {dump}")
+        fmt = options["format"] or dump_format(dump)
+        if fmt is None:
+            raise CommandError(
+                "Cannot infer the dump format, pass --format explicitly."
+            )
+        batch_size: int = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+        checkpoint: Path = options["checkpoint"] or dump.with_name(
+            f"{dump.name}.checkpoint"
+        )
+
+        resumed = (
+            0 if options["restart"] else read_checkpoint(checkpoint, dump)
+        )
+        records = iter_dump_records(dump, fmt, options["delimiter"])
+        if resumed:
+            deque(islice(records, resumed), maxlen=0)
+            self.stdout.write(f"Resuming after {resumed} records.")
+
+        stats = DumpImportStats(records=resumed)
+        started = time.monotonic()
+        while batch := list(islice(records, batch_size)):
+            stats.add(import_dump_batch(batch))
+            write_checkpoint(checkpoint, dump, stats.records)
+            self.stdout.write(self._progress(stats, resumed, started))
+
+        checkpoint.unlink(missing_ok=True)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {stats.records} records: {stats.created} created, "
+                f"{stats.updated} updated, {stats.unchanged} unchanged, "
+                f"{stats.skipped} skipped."
+            )
+        )
+
+    @staticmethod
+    def _progress(stats: DumpImportStats, resumed: int, started: float) -> str:
+        """Format running totals and throughput since this run started."""
+        elapsed = max(time.monotonic() - started, 1e-9)
+        rate = (stats.records - resumed) / elapsed
+        return (
+            f"{stats.records} records: {stats.created} created, "
+            f"{stats.updated} updated, {stats.unchanged} unchanged, "
+            f"{stats.skipped} skipped ({rate:.0f} records/s)"
+        )
@@ -0,0 +1,83 @@
+"""Refresh dependent recipes management command module."""
+
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.dateparse import parse_datetime
+
+from apps.foods.models import Food
+from apps.foods.recipe_ingredients import refresh_dependent_recipes
+
+
+class Command(BaseCommand):
+    """Recompute every recipe that transitively uses changed foods."""
+
+    help = (
+        "Re-snapshot the ingredients of changed foods and rebuild every "
+        "recipe depending on them, sub-recipes before their parents."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser (CommandParser): command argument parser.
+        """
+        parser.add_argument(
+            "food_ids", nargs="*", type=int, help="Changed food IDs."
+        )
+        parser.add_argument(
+            "--since",
+            help="Also refresh dependents of foods updated since this "
+            "ISO 8601 timestamp.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to refresh.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Refresh the dependents level by level.
+
+        Args:
+            args (Any): positional arguments.
+            options (Any): command options.
+
+        Raises:
+            CommandError: when no foods are given or recipes nest cyclically.
+        """
+        using: str = options["database"]
+        food_ids = set(options["food_ids"])
+        if options["since"]:
+            since = parse_datetime(options["since"])
+            if since is None:
+                raise CommandError("--since must be an ISO 8601 timestamp.")
+            food_ids.update(
+                Food.objects.using(using)
+                .filter(updated_at__gte=since)
+                .values_list("pk", flat=True)
+            )
+        if not food_ids and not options["since"]:
+            raise CommandError("Pass food IDs or --since.")
+
+        try:
+            levels = refresh_dependent_recipes(food_ids, using)
+        except ValidationError as error:
+            raise CommandError(" ".join(error.messages)) from error
+        for depth, recipe_ids in enumerate(levels, start=1):
+            self.stdout.write(
+                f"Level {depth}: {', '.join(map(str, recipe_ids))}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Refreshed {sum(map(len, levels))} recipes "
+                f"in {len(levels)} levels."
+            )
+        )
@@ -0,0 +1,81 @@
+"""Verify recipe aggregates management command module."""
+
+from typing import Any
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+    CommandParser,
+)
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.foods.signals.handlers.recipe_nutrients import (
+    verify_recipe_aggregates,
+)
+
+
+class Command(BaseCommand):
+    """Compare maintained recipe totals with full ingredient rebuilds."""
+
+    help = (
+        "Check the incrementally maintained totals of recipes calculated "
+        "from ingredients against a full rebuild, optionally repairing them."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser (CommandParser): command argument parser.
+        """
+        parser.add_argument(
+            "recipe_ids",
+            nargs="*",
+            type=int,
+            help="Recipes to check, every calculated recipe by default.",
+        )
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Overwrite drifted totals with the rebuilt values.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to check.",
+        )
+        parser.add_argument(
+            "--fail-on-drift",
+            action="store_true",
+            help="Exit with an error when drift is found and not repaired.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Report, and optionally repair, every drifted recipe.
+
+        Args:
+            args (Any): positional arguments.
+            options (Any): command options.
+
+        Raises:
+            CommandError: when unrepaired drift should fail the run.
+        """
+        repair: bool = options["repair"]
+        drifts = verify_recipe_aggregates(
+            options["recipe_ids"] or None,
+            using=options["database"],
+            repair=repair,
+        )
+        for drift in drifts:
+            self.stdout.write(
+                f"Recipe {drift.recipe_id}: {', '.join(drift.fields)} "
+                f"{'repaired' if repair else 'drifted'}"
+            )
+        if not drifts:
+            self.stdout.write(self.style.SUCCESS("No recipe drift found."))
+        elif repair:
+            self.stdout.write(
+                self.style.SUCCESS(f"Repaired {len(drifts)} recipes.")
+            )
+        elif options["fail_on_drift"]:
+            raise CommandError(f"{len(drifts)} recipes drifted.")
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("foods", "0039_open_food_facts_cache_and_rate_limit"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="foodproduct",
+            name="gtin",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="Canonical GTIN derived from the barcode on save, used for indexed barcode lookups.",
+                max_length=14,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,72 @@
+"""Restartably backfill canonical product GTINs from their barcodes."""
+
+import re
+
+from django.db import migrations, transaction
+
+BATCH_SIZE = 1000
+GTIN_LENGTHS = frozenset({8, 12, 13, 14})
+
+
+def _canonical_gtin(barcode):
+    """Return the canonical GTIN of a barcode as of this migration."""
+    normalized = str(barcode).strip()
+    if (
+        len(normalized) not in GTIN_LENGTHS
+        or re.fullmatch(r"[0-9]+", normalized) is None
+    ):
+        return None
+    weighted_sum = sum(
+        int(digit) * (3 if position % 2 else 1)
+        for position, digit in enumerate(reversed(normalized[:-1]), start=1)
+    )
+    if (10 - weighted_sum % 10) % 10 != int(normalized[-1]):
+        return None
+    while len(normalized) > 12 and normalized.startswith("0"):
+        normalized = normalized[1:]
+    return normalized
+
+
+def backfill_foodproduct_gtin(apps, schema_editor):
+    """Fill null GTINs in bounded, independently committed pk ranges."""
+    product_model = apps.get_model("foods", "FoodProduct")
+    database = schema_editor.connection.alias
+    products = product_model.objects.using(database)
+
+    last_pk = 0
+    while True:
+        with transaction.atomic(using=database):
+            batch = list(
+                products.select_for_update(of=("self",))
+                .filter(pk__gt=last_pk, gtin__isnull=True)
+                .exclude(barcode__isnull=True)
+                .exclude(barcode="")
+                .only("pk", "barcode", "gtin")
+                .order_by("pk")[:BATCH_SIZE]
+            )
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            changed = []
+            for product in batch:
+                product.gtin = _canonical_gtin(product.barcode)
+                if product.gtin is not None:
+                    changed.append(product)
+            products.bulk_update(changed, ["gtin"])
+
+
+class Migration(migrations.Migration):
+    """Run GTIN data work independently of schema DDL."""
+
+    atomic = False
+
+    dependencies = [("foods", "0040_foodproduct_gtin")]
+
+    operations = [
+        migrations.RunPython(
+            backfill_foodproduct_gtin,
+            reverse_code=migrations.RunPython.noop,
+            atomic=False,
+        ),
+    ]
@@ -0,0 +1,76 @@
+"""Index food names, brands and tags for ranked catalog search."""
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+SEARCH_VECTOR_INDEX = "foods_food_search_vector"
+TRIGRAM_INDEXES = {
+    "foods_food_name_trgm": ("foods", "Food", "name"),
+    "foods_food_brand_trgm": ("foods", "Food", "brand"),
+    "foods_taggit_tag_name_trgm": ("taggit", "Tag", "name"),
+}
+
+
+def _trigram_available(schema_editor):
+    """Return whether the server can install the pg_trgm extension."""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS ("
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')"
+        )
+        return cursor.fetchone()[0]
+
+
+def create_search_indexes(apps, schema_editor):
+    """Create full-text and, where supported, trigram GIN indexes."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    food = apps.get_model("foods", "Food")
+    schema_editor.add_index(
+        food,
+        GinIndex(
+            SearchVector("name", "brand", config="simple"),
+            name=SEARCH_VECTOR_INDEX,
+        ),
+    )
+    if not _trigram_available(schema_editor):
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, (app_label, model_name, field) in TRIGRAM_INDEXES.items():
+        schema_editor.add_index(
+            apps.get_model(app_label, model_name),
+            GinIndex(fields=[field], name=name, opclasses=["gin_trgm_ops"]),
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    """Drop the search indexes, leaving the extension installed."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name in (SEARCH_VECTOR_INDEX, *TRIGRAM_INDEXES):
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}"
+        )
+
+
+class Migration(migrations.Migration):
+    """Add the indexes behind the searchFoods query."""
+
+    dependencies = [
+        ("foods", "0041_backfill_foodproduct_gtin"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_search_indexes,
+            reverse_code=drop_search_indexes,
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("foods", "0042_food_search_indexes"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cupboarditem",
+            index=models.Index(
+                fields=["owner", "-purchased_at", "-id"],
+                name="cupboarditem_purchased_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="food",
+            index=models.Index(fields=["name", "id"], name="food_name_idx"),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("foods", "0043_food_listing_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="recipeingredient",
+            index=models.Index(
+                fields=["food", "recipe"], name="recipeingredient_food_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("foods", "0044_recipe_dependency_index"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="openfoodfactsratelimit",
+            name="request_timestamps",
+        ),
+        migrations.AddField(
+            model_name="openfoodfactsratelimit",
+            name="tokens",
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name="openfoodfactsratelimit",
+            name="refilled_at",
+            field=models.FloatField(
+                default=0, help_text="POSIX time of the last refill."
+            ),
+        ),
+    ]
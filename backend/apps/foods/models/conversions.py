@@ -0,0 +1,83 @@
+"""Exact unit conversion module.
+
+Conversions between concrete units are answered from a factor matrix built
+once at import time from the same definitions registered in ``UREG``, so hot
+write paths never construct pint quantities.
+"""
+
+from decimal import Context, Decimal
+from itertools import product
+
+from pint.errors import DimensionalityError, UndefinedUnitError
+
+from .units import MASS_UNITS, UNIT_DEFINITIONS, VOLUME_UNITS
+
+# Enough precision to keep every terminating factor exact; the product with an
+# amount is then rounded once, in the caller's decimal context.
+FACTOR_CONTEXT = Context(prec=50)
+
+
+def _defined_magnitudes() -> dict[str, Decimal]:
+    """Resolve every ``UREG`` definition to a magnitude in its base unit.
+
+    Definitions are read as ``name = factor reference = symbol``, or
+    ``name = [dimension] = symbol`` for base units, with decimal arithmetic
+    so that factors keep the exact digits they are defined with.
+
+    Returns:
+        dict[str, Decimal]: magnitude keyed by both unit name and symbol.
+    """
+    magnitudes: dict[str, Decimal] = {}
+    for definition in UNIT_DEFINITIONS:
+        name, value, symbol = (part.strip() for part in definition.split("="))
+        if value.startswith("["):
+            magnitude = Decimal(1)
+        else:
+            factor, reference = value.split()
+            magnitude = FACTOR_CONTEXT.multiply(
+                Decimal(factor), magnitudes[reference]
+            )
+        magnitudes[name] = magnitudes[symbol] = magnitude
+    return magnitudes
+
+
+_MAGNITUDES = _defined_magnitudes()
+
+#: Magnitude of each unit in its dimension's base unit (gram or litre).
+BASE_MAGNITUDES: dict[str, Decimal] = {
+    unit: _MAGNITUDES[unit] for unit in MASS_UNITS | VOLUME_UNITS
+}
+
+#: Multiplicative factor for every ordered pair of same-dimension units.
+CONVERSION_FACTORS: dict[tuple[str, str], Decimal] = {
+    (source, target): FACTOR_CONTEXT.divide(
+        BASE_MAGNITUDES[source], BASE_MAGNITUDES[target]
+    )
+    for dimension in (MASS_UNITS, VOLUME_UNITS)
+    for source, target in product(dimension, repeat=2)
+}
+
+
+def convert(amount: Decimal, from_unit: str, to_unit: str) -> Decimal:
+    """Convert an amount between two concrete units.
+
+    Args:
+        amount (Decimal): amount expressed in ``from_unit``.
+        from_unit (str): canonical source unit.
+        to_unit (str): canonical target unit.
+
+    Returns:
+        Decimal: amount expressed in ``to_unit``.
+
+    Raises:
+        UndefinedUnitError: if either unit has no physical definition.
+        DimensionalityError: if the units measure different dimensions.
+    """
+    try:
+        return amount * CONVERSION_FACTORS[from_unit, to_unit]
+    except KeyError:
+        pass
+    for unit in (from_unit, to_unit):
+        if unit not in BASE_MAGNITUDES:
+            raise UndefinedUnitError(unit)
+    raise DimensionalityError(from_unit, to_unit)
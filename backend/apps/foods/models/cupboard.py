@@ -56,6 +56,16 @@ class CupboardItem(models.Model):
         ),
     )
 
+    class Meta:
+        """Cupboard item database metadata."""
+
+        indexes = [
+            models.Index(
+                fields=["owner", "-purchased_at", "-id"],
+                name="cupboarditem_purchased_idx",
+            )
+        ]
+
     def __str__(self) -> str:
         """Get string representation of the object.
 
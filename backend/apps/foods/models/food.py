@@ -1,7 +1,7 @@
 """Food model module."""
 
 from decimal import Decimal
-from typing import Any
+from typing import Any, Collection
 
 from django.core.validators import MinValueValidator
 from django.db import models
@@ -10,8 +10,9 @@ from django.db import models
 from taggit.managers import TaggableManager  # type: ignore[import-untyped]
 
 from ..deletion import NutritionDeletionManager, NutritionDeletionMixin
+from .conversions import convert
 from .nutrients import Nutrients
-from .units import UNIT_CHOICES, UNIT_FLUID_OUNCE, UNIT_GRAM, UREG
+from .units import UNIT_CHOICES, UNIT_FLUID_OUNCE, UNIT_GRAM
 
 
 class Food(NutritionDeletionMixin, Nutrients):
@@ -69,6 +70,13 @@ class Food(NutritionDeletionMixin, Nutrients):
         default=1,
     )
 
+    class Meta:
+        """Food database metadata."""
+
+        indexes = [
+            models.Index(fields=["name", "id"], name="food_name_idx"),
+        ]
+
     def __str__(self) -> str:
         """Get string representation of the object.
 
@@ -80,6 +88,56 @@ class Food(NutritionDeletionMixin, Nutrients):
 
         return self.name
 
+    def derive_energy_from_abv(self) -> None:
+        """Derive the alcohol energy of drinks with an alcohol by volume."""
+        if self.abv_perc:
+            self.energy_kcal = (
+                convert(
+                    Decimal(str(self.nutritional_info_size)),
+                    self.nutritional_info_unit,
+                    UNIT_FLUID_OUNCE,
+                )
+                * Decimal("2.5")
+                * self.abv_perc
+            )
+
+    def _refreshed_field_names(
+        self,
+        candidates: Collection[str],
+        fields: Collection[str] | None,
+        from_queryset: models.QuerySet[Any] | None,
+    ) -> set[str]:
+        """Return candidate fields a refresh queryset will actually load."""
+        deferred_fields = self.get_deferred_fields()
+        refreshed_fields = set(candidates)
+        if fields is not None:
+            refreshed_fields.intersection_update(fields)
+        else:
+            refreshed_fields.difference_update(deferred_fields)
+        if from_queryset is None:
+            return refreshed_fields
+
+        reload_queryset = from_queryset
+        if fields is not None:
+            reload_queryset = reload_queryset.only(*fields)
+        elif deferred_fields:
+            reload_queryset = reload_queryset.only(
+                *{
+                    field.attname
+                    for field in self._meta.concrete_fields
+                    if field.attname not in deferred_fields
+                }
+            )
+        selected_fields, defer = reload_queryset.query.deferred_loading
+        if not selected_fields:
+            return refreshed_fields
+        selected_field_names = {
+            field.split("__", maxsplit=1)[0] for field in selected_fields
+        }
+        if defer:
+            return refreshed_fields - selected_field_names
+        return refreshed_fields & selected_field_names
+
     def save(self, *args: Any, **kwargs: Any) -> None:
         """Save instance into the db.
 
@@ -87,16 +145,6 @@ class Food(NutritionDeletionMixin, Nutrients):
             args (list): arguments.
             kwargs (dict): keyword arguments.
         """
-        if self.abv_perc:
-            self.energy_kcal = (
-                (
-                    UREG.Quantity(self.nutritional_info_size)
-                    * UREG(self.nutritional_info_unit)
-                )
-                .to(UNIT_FLUID_OUNCE)
-                .m
-                * Decimal("2.5")
-                * self.abv_perc
-            )
+        self.derive_energy_from_abv()
 
         super().save(*args, **kwargs)
@@ -0,0 +1,286 @@
+"""Fixed-layout nutrient values and precompiled decimal bounds."""
+
+import operator
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, cast
+
+from django.core.exceptions import ValidationError
+from django.core.validators import DecimalValidator
+from django.db import models
+
+from .nutrients import NUTRIENT_LIST
+
+ZERO = Decimal("0")
+
+_get_nutrients = operator.attrgetter(*NUTRIENT_LIST)
+
+
+class NutrientVector:
+    """Every nutrient of a row, in ``NUTRIENT_LIST`` order.
+
+    Values are exact decimals, so sums and scalings round exactly like
+    the per-nutrient arithmetic they replace. Missing nutrients load as
+    zero.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Iterable[Decimal]) -> None:
+        """Initialise the vector.
+
+        Args:
+            values (Iterable[Decimal]): one value per nutrient.
+        """
+        self.values = tuple(values)
+
+    @classmethod
+    def zero(cls) -> "NutrientVector":
+        """Return a vector of zeros.
+
+        Returns:
+            NutrientVector: all nutrients zero.
+        """
+        return cls((ZERO,) * len(NUTRIENT_LIST))
+
+    @classmethod
+    def load(cls, obj: models.Model) -> "NutrientVector":
+        """Read the nutrients of a Nutrients model instance.
+
+        Args:
+            obj (models.Model): Nutrients model instance.
+
+        Returns:
+            NutrientVector: its nutrients, missing ones as zero.
+        """
+        return cls(value or ZERO for value in _get_nutrients(obj))
+
+    @classmethod
+    def from_mapping(cls, values: Mapping[str, Decimal]) -> "NutrientVector":
+        """Build a vector from values keyed by nutrient name.
+
+        Args:
+            values (Mapping[str, Decimal]): every nutrient's value.
+
+        Returns:
+            NutrientVector: the values in layout order.
+        """
+        return cls(values[nutrient] or ZERO for nutrient in NUTRIENT_LIST)
+
+    @classmethod
+    def sum(cls, vectors: Iterable["NutrientVector"]) -> "NutrientVector":
+        """Add many vectors in one pass per nutrient.
+
+        Args:
+            vectors (Iterable[NutrientVector]): vectors to add.
+
+        Returns:
+            NutrientVector: their total, zero when there are none.
+        """
+        columns = list(zip(*(vector.values for vector in vectors)))
+        if not columns:
+            return cls.zero()
+        return cls(sum(column, ZERO) for column in columns)
+
+    def __add__(self, other: "NutrientVector") -> "NutrientVector":
+        """Add two vectors nutrient by nutrient.
+
+        Args:
+            other (NutrientVector): vector to add.
+
+        Returns:
+            NutrientVector: their sum.
+        """
+        return NutrientVector(map(operator.add, self.values, other.values))
+
+    def __sub__(self, other: "NutrientVector") -> "NutrientVector":
+        """Subtract a vector nutrient by nutrient.
+
+        Args:
+            other (NutrientVector): vector to subtract.
+
+        Returns:
+            NutrientVector: their difference.
+        """
+        return NutrientVector(map(operator.sub, self.values, other.values))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare nutrient values.
+
+        Args:
+            other (object): object to compare with.
+
+        Returns:
+            bool: whether every nutrient is numerically equal.
+        """
+        if not isinstance(other, NutrientVector):
+            return NotImplemented
+        return self.values == other.values
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return the non-zero nutrients.
+
+        Returns:
+            str: debugging representation.
+        """
+        return f"NutrientVector({dict(self.nonzero_items())!r})"
+
+    def scale(self, factor: int | Decimal) -> "NutrientVector":
+        """Multiply every nutrient by a factor.
+
+        Args:
+            factor (int | Decimal): multiplier.
+
+        Returns:
+            NutrientVector: scaled vector.
+        """
+        return NutrientVector(value * factor for value in self.values)
+
+    def is_zero(self) -> bool:
+        """Return whether every nutrient is zero.
+
+        Returns:
+            bool: True when no nutrient is set.
+        """
+        return not any(self.values)
+
+    def nonzero_items(self) -> Iterable[tuple[str, Decimal]]:
+        """Return the set nutrients with their names.
+
+        Returns:
+            Iterable[tuple[str, Decimal]]: name and value pairs.
+        """
+        return (
+            (nutrient, value)
+            for nutrient, value in zip(NUTRIENT_LIST, self.values)
+            if value
+        )
+
+    def map(
+        self, function: Callable[[str, Decimal], Decimal]
+    ) -> "NutrientVector":
+        """Apply a function to every nutrient.
+
+        Args:
+            function (Callable[[str, Decimal], Decimal]): receives each
+                nutrient name and value and returns the new value.
+
+        Returns:
+            NutrientVector: vector of the returned values.
+        """
+        return NutrientVector(map(function, NUTRIENT_LIST, self.values))
+
+    def store(self, obj: models.Model) -> None:
+        """Write the nutrients onto a Nutrients model instance.
+
+        Args:
+            obj (models.Model): instance receiving the values.
+        """
+        # Nutrient fields are plain instance attributes, so one update of
+        # the instance dictionary equals a setattr per nutrient.
+        vars(obj).update(zip(NUTRIENT_LIST, self.values))
+
+
+def copy_nutrients(source: models.Model, target: models.Model) -> None:
+    """Copy every nutrient between Nutrients instances, keeping nulls.
+
+    Args:
+        source (models.Model): instance to copy from.
+        target (models.Model): instance to copy to.
+    """
+    vars(target).update(zip(NUTRIENT_LIST, _get_nutrients(source)))
+
+
+@dataclass(frozen=True)
+class DecimalBounds:
+    """Precompiled ``DecimalField.clean`` for already converted decimals."""
+
+    max_digits: int | None
+    decimal_places: int | None
+    validators: tuple[Callable[[Any], None], ...]
+
+    @classmethod
+    def of(cls, field: models.DecimalField) -> "DecimalBounds":
+        """Compile the checks of a decimal model field.
+
+        Args:
+            field (models.DecimalField): destination field.
+
+        Returns:
+            DecimalBounds: its precision limits and extra validators.
+        """
+        return cls(
+            field.max_digits,
+            field.decimal_places,
+            tuple(
+                validator
+                for validator in field.validators
+                if not isinstance(validator, DecimalValidator)
+            ),
+        )
+
+    def check(self, value: Decimal) -> Decimal:
+        """Validate a decimal as the field's clean would.
+
+        Args:
+            value (Decimal): value to persist.
+
+        Returns:
+            Decimal: the unchanged value.
+
+        Raises:
+            ValidationError: if the field cannot represent the value.
+        """
+        _, digit_tuple, exponent = value.as_tuple()
+        if not isinstance(exponent, int):
+            raise ValidationError("Enter a number.", code="invalid")
+        if exponent >= 0:
+            digits = len(digit_tuple)
+            if digit_tuple != (0,):
+                digits += exponent
+            decimals = 0
+        elif -exponent > len(digit_tuple):
+            digits = decimals = -exponent
+        else:
+            digits = len(digit_tuple)
+            decimals = -exponent
+        if self.max_digits is not None and digits > self.max_digits:
+            raise ValidationError("Too many digits.", code="max_digits")
+        if self.decimal_places is not None and decimals > self.decimal_places:
+            raise ValidationError(
+                "Too many decimal places.", code="max_decimal_places"
+            )
+        if (
+            self.max_digits is not None
+            and self.decimal_places is not None
+            and digits - decimals > self.max_digits - self.decimal_places
+        ):
+            raise ValidationError(
+                "Too many digits before the decimal point.",
+                code="max_whole_digits",
+            )
+        for validator in self.validators:
+            validator(value)
+        return value
+
+
+@lru_cache(maxsize=None)
+def decimal_bounds(
+    model: type[models.Model], field_name: str
+) -> DecimalBounds:
+    """Return the compiled bounds of a model's decimal field.
+
+    Args:
+        model (type[models.Model]): destination model.
+        field_name (str): decimal field name.
+
+    Returns:
+        DecimalBounds: compiled checks, built once per field.
+    """
+    return DecimalBounds.of(
+        cast(models.DecimalField, model._meta.get_field(field_name))
+    )
@@ -141,6 +141,13 @@ class Nutrients(BaseModel):
         help_text="Alcohol by volume (%)",
     )
 
+    def derive_salt_and_sodium(self) -> None:
+        """Derive sodium from salt, or salt from sodium when salt is unset."""
+        if self.salt_g:
+            self.sodium_mg = self.salt_g / Decimal("2.5") * 1000
+        elif self.sodium_mg:
+            self.salt_g = self.sodium_mg * Decimal("2.5") / 1000
+
     def save(self, *args: Any, **kwargs: Any) -> None:
         """Save instance into the db.
 
@@ -148,16 +155,15 @@ class Nutrients(BaseModel):
             args (list): arguments.
             kwargs (dict): keyword arguments.
         """
-        if self.salt_g:
-            self.sodium_mg = self.salt_g / Decimal("2.5") * 1000
-        elif self.sodium_mg:
-            self.salt_g = self.sodium_mg * Decimal("2.5") / 1000
+        self.derive_salt_and_sodium()
 
         super().save(*args, **kwargs)
 
 
 NUTRIENT_LIST = [
     i
-    for i in Nutrients.__dict__
-    if i[:1] not in ["_", "M"] and i not in BaseModel.__dict__ and i != "save"
+    for i, value in Nutrients.__dict__.items()
+    if i[:1] not in ["_", "M"]
+    and i not in BaseModel.__dict__
+    and not callable(value)
 ]
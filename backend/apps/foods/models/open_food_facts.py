@@ -12,7 +12,15 @@ class OpenFoodFactsCacheEntry(models.Model):
 
 
 class OpenFoodFactsRateLimit(models.Model):
-    """Coordinate provider read timestamps across backend replicas."""
+    """Token bucket of provider reads shared by backend replicas.
+
+    A new row is an empty bucket last refilled at the epoch, which the
+    first request refills to capacity.
+    """
 
     key = models.CharField(max_length=64, primary_key=True)
-    request_timestamps = models.JSONField(default=list)
+    tokens = models.FloatField(default=0)
+    refilled_at = models.FloatField(
+        default=0,
+        help_text="POSIX time of the last refill.",
+    )
@@ -1,15 +1,31 @@
 """FoodProduct model module."""
 
+from typing import Any, Collection, Iterable, cast
+
 from django.db import models
 
 from apps.libs.utils import round_no_trailing_zeros
 
+from ..gtin import normalize_gtin
 from .food import Food
+from .nutrients import NUTRIENT_LIST
 
 
 class FoodProduct(Food):
     """FoodProduct model class."""
 
+    SERVING_SOURCE_FIELDS = frozenset(
+        NUTRIENT_LIST
+        + [
+            "nutritional_info_size",
+            "nutritional_info_unit",
+            "size",
+            "size_unit",
+            "num_servings",
+        ]
+    )
+    _loaded_serving_source_values: dict[str, Any] | None = None
+
     barcode = models.CharField(
         max_length=255,
         blank=True,
@@ -17,10 +33,143 @@ class FoodProduct(Food):
         default=0,
     )
 
+    gtin = models.CharField(
+        max_length=14,
+        blank=True,
+        null=True,
+        editable=False,
+        db_index=True,
+        help_text=(
+            "Canonical GTIN derived from the barcode on save, used for "
+            "indexed barcode lookups."
+        ),
+    )
+
     notes = models.TextField(
         blank=True,
     )
 
+    @classmethod
+    def from_db(
+        cls,
+        db: str | None,
+        field_names: Collection[str],
+        values: Collection[Any],
+    ) -> "FoodProduct":
+        """Remember loaded values that servings are derived from.
+
+        Args:
+            db: Database alias from which the row was loaded.
+            field_names: Model fields included in the query.
+            values: Values returned for those fields.
+
+        Returns:
+            The hydrated product with its serving-source baseline captured.
+        """
+        instance = cast(
+            "FoodProduct", super().from_db(db, field_names, values)
+        )
+        # Django's polymorphic from_db return type is narrower than its stubs.
+        # pylint: disable-next=no-member
+        instance.capture_serving_source_values()
+        return instance
+
+    def refresh_from_db(
+        self,
+        using: str | None = None,
+        fields: Iterable[str] | None = None,
+        from_queryset: models.QuerySet[Any] | None = None,
+    ) -> None:
+        """Reload values and re-baseline the serving-source fields reloaded.
+
+        Unsaved edits of fields the refresh leaves alone stay pending, so the
+        next save still re-derives the servings.
+
+        Args:
+            using: Database alias from which to reload.
+            fields: Optional concrete fields to reload.
+            from_queryset: Optional queryset used for the reload.
+        """
+        normalized_fields = None if fields is None else tuple(fields)
+        refreshed_fields = self._refreshed_field_names(
+            self.SERVING_SOURCE_FIELDS, normalized_fields, from_queryset
+        )
+        super().refresh_from_db(
+            using=using,
+            fields=normalized_fields,
+            from_queryset=from_queryset,
+        )
+        self.capture_serving_source_values(refreshed_fields)
+
+    def capture_serving_source_values(
+        self, fields: Collection[str] | None = None
+    ) -> None:
+        """Record the persisted values this instance's servings reflect.
+
+        Args:
+            fields: Fields to re-baseline, keeping the rest of the current
+                baseline, or None to capture every loaded field.
+        """
+        loaded = (
+            {}
+            if fields is None
+            else dict(self._loaded_serving_source_values or {})
+        )
+        captured_fields = self.SERVING_SOURCE_FIELDS
+        if fields is not None:
+            captured_fields = captured_fields & set(fields)
+        deferred_fields = self.get_deferred_fields()
+        loaded.update(
+            {
+                field: getattr(self, field)
+                for field in captured_fields
+                if field not in deferred_fields
+            }
+        )
+        self._loaded_serving_source_values = loaded
+
+    def serving_source_changed(
+        self, update_fields: Collection[str] | None = None
+    ) -> bool:
+        """Return whether a write may change the nutrients of its servings.
+
+        Instances without a captured baseline are assumed to have changed.
+
+        Args:
+            update_fields: Fields named by a partial save, if any.
+
+        Returns:
+            bool: Whether any nutritional or size field may have changed.
+        """
+        candidates = set(self.SERVING_SOURCE_FIELDS)
+        if update_fields is not None:
+            candidates.intersection_update(update_fields)
+        loaded = self._loaded_serving_source_values
+        if loaded is None:
+            return bool(candidates)
+        return any(
+            field not in loaded or getattr(self, field) != loaded[field]
+            for field in candidates
+        )
+
+    def sync_gtin(self) -> None:
+        """Derive the canonical GTIN column from the barcode."""
+        self.gtin = normalize_gtin(str(self.barcode)) if self.barcode else None
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Save instance into the db.
+
+        Args:
+            args (list): arguments.
+            kwargs (dict): keyword arguments.
+        """
+        self.sync_gtin()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "barcode" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "gtin"}
+
+        super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         """Get string representation.
 
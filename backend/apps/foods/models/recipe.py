@@ -8,6 +8,7 @@ from typing import Any, Collection, Iterable, cast
 from django.db import models, router, transaction
 
 from .food import Food
+from .nutrient_vector import NutrientVector
 from .nutrients import NUTRIENT_LIST, Nutrients
 from .units import UNIT_CHOICES, UNIT_CONTAINER, UNIT_SERVING
 
@@ -22,6 +23,9 @@ class RecipeIngredientQuerySet(models.QuerySet):
     def delete(self) -> tuple[int, dict[str, int]]:
         """Delete ingredients under one Recipe-to-RecipeIngredient lock pass.
 
+        An active lock bundle that already covers the affected recipes is
+        reused instead of locking them again.
+
         Returns:
             tuple[int, dict[str, int]]: Total and per-model deletion counts.
         """
@@ -31,11 +35,14 @@ class RecipeIngredientQuerySet(models.QuerySet):
         )
         from apps.foods.recipe_locks import (
             activate_recipe_aggregate_locks,
+            get_recipe_aggregate_locks,
             lock_recipe_aggregate_rows,
         )
 
         with transaction.atomic(using=using):
-            locks = lock_recipe_aggregate_rows(recipe_ids, using)
+            locks = get_recipe_aggregate_locks()
+            if locks is None or not locks.covers_all(recipe_ids, using):
+                locks = lock_recipe_aggregate_rows(recipe_ids, using)
             with activate_recipe_aggregate_locks(locks):
                 return super().delete()
 
@@ -124,35 +131,9 @@ class Recipe(Food):
         from_queryset: models.QuerySet[Any] | None,
     ) -> set[str]:
         """Return protected fields the refresh queryset will actually load."""
-        deferred_fields = self.get_deferred_fields()
-        refreshed_fields = set(self._PROTECTED_WRITE_FIELDS)
-        if fields is not None:
-            refreshed_fields.intersection_update(fields)
-        else:
-            refreshed_fields.difference_update(deferred_fields)
-        if from_queryset is None:
-            return refreshed_fields
-
-        reload_queryset = from_queryset
-        if fields is not None:
-            reload_queryset = reload_queryset.only(*fields)
-        elif deferred_fields:
-            reload_queryset = reload_queryset.only(
-                *{
-                    field.attname
-                    for field in self._meta.concrete_fields
-                    if field.attname not in deferred_fields
-                }
-            )
-        selected_fields, defer = reload_queryset.query.deferred_loading
-        if not selected_fields:
-            return refreshed_fields
-        selected_field_names = {
-            field.split("__", maxsplit=1)[0] for field in selected_fields
-        }
-        if defer:
-            return refreshed_fields - selected_field_names
-        return refreshed_fields & selected_field_names
+        return self._refreshed_field_names(
+            self._PROTECTED_WRITE_FIELDS, fields, from_queryset
+        )
 
     def _capture_protected_write_values(
         self, fields: Collection[str] | None = None
@@ -306,6 +287,16 @@ class RecipeIngredient(Nutrients):
         editable=False,
     )
 
+    class Meta:
+        """Recipe ingredient database metadata."""
+
+        indexes = [
+            # Walks from a food's servings up to the recipes using them.
+            models.Index(
+                fields=["food", "recipe"], name="recipeingredient_food_idx"
+            ),
+        ]
+
     def __str__(self) -> str:
         """Get string representation of the object.
 
@@ -350,6 +341,7 @@ class RecipeIngredient(Nutrients):
         """Prepare immutable amount, unit, and nutrient snapshot fields."""
         from apps.foods.signals.handlers.recipe_nutrients import (
             validate_derived_decimal,
+            validate_derived_nutrients,
         )
 
         serving_changed = previous is None or (
@@ -375,18 +367,11 @@ class RecipeIngredient(Nutrients):
             self.size_snapshot_unit = current_unit
             snapshot_fields.add("size_snapshot_unit")
         if serving_changed:
-            for nutrient in NUTRIENT_LIST:
-                value = getattr(self.food, nutrient) or 0
-                setattr(
-                    self,
-                    nutrient,
-                    validate_derived_decimal(
-                        value * self.num_servings,
-                        type(self),
-                        nutrient,
-                        "Recipe ingredient",
-                    ),
-                )
+            validate_derived_nutrients(
+                NutrientVector.load(self.food).scale(self.num_servings),
+                type(self),
+                "Recipe ingredient",
+            ).store(self)
             snapshot_fields.update(NUTRIENT_LIST)
         return (
             None if update_fields is None else update_fields | snapshot_fields
@@ -415,6 +400,7 @@ class RecipeIngredient(Nutrients):
 
         from apps.foods.recipe_locks import lock_recipe_ingredients
         from apps.foods.signals.handlers.recipe_nutrients import (
+            apply_recipe_ingredient_delta,
             recompute_recipe_nutrients,
             validate_recipe_ingredient_size,
         )
@@ -452,14 +438,29 @@ class RecipeIngredient(Nutrients):
         )
         if prepared_fields is not None:
             kwargs["update_fields"] = prepared_fields
-        validate_recipe_ingredient_size(self, target_recipe)
+        validate_recipe_ingredient_size(self, target_recipe, db_alias)
         super().save(*args, **kwargs)
+        owners = {ingredient.recipe_id for ingredient in ingredients}
         for recipe_id in sorted(recipe_ids):
-            recompute_recipe_nutrients(recipes[recipe_id], db_alias)
+            if recipe_id not in owners:
+                # A recipe without ingredients may still hold totals entered
+                # before it was calculated, so its first one rebuilds it.
+                recompute_recipe_nutrients(recipes[recipe_id], db_alias)
+                continue
+            apply_recipe_ingredient_delta(
+                recipes[recipe_id],
+                (
+                    previous
+                    if previous is not None and previous.recipe_id == recipe_id
+                    else None
+                ),
+                self if self.recipe_id == recipe_id else None,
+                db_alias,
+            )
         return recipes, aggregate_observer
 
     def save(self, *args: Any, **kwargs: Any) -> None:
-        """Lock, mutate, and authoritatively rebuild recipe aggregates atomically.
+        """Lock, mutate, and update recipe aggregates atomically.
 
         A movable row's owner sampled before locks is provisional. If the locked
         child reveals a different owner, the attempt rolls back completely and
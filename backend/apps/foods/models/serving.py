@@ -1,18 +1,51 @@
 """Serving model module."""
 
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any
+from typing import Any, Sequence
 
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.utils import timezone
 
 from apps.libs.utils import round_no_trailing_zeros
 
 from ..deletion import NutritionDeletionManager, NutritionDeletionMixin
+from .conversions import convert
 from .food import Food
+from .nutrient_vector import NutrientVector
 from .nutrients import NUTRIENT_LIST, Nutrients
 from .product import FoodProduct
-from .units import UNIT_CHOICES, UNIT_CONTAINER, UNIT_GRAM, UNIT_SERVING, UREG
+from .units import UNIT_CHOICES, UNIT_CONTAINER, UNIT_GRAM, UNIT_SERVING
+
+
+@dataclass(frozen=True)
+class ServingProjection:
+    """Ratio between a serving's size and its food's nutritional basis."""
+
+    serving_size: int | Decimal
+    basis_size: Decimal
+
+    def apply(self, value: int | Decimal) -> Decimal:
+        """Scale one food nutrient value to the serving.
+
+        Args:
+            value (int | Decimal): nutrient value per nutritional basis.
+
+        Returns:
+            Decimal: nutrient value for the serving.
+        """
+        return value * self.serving_size / self.basis_size
+
+
+def _is_food_product(food: Food) -> bool:
+    """Return whether a food row is a product rather than a recipe."""
+    if isinstance(food, FoodProduct):
+        return True
+    if food._meta.model is not Food:
+        # Any other concrete food kind, e.g. a recipe.
+        return False
+    return FoodProduct.objects.filter(pk=food.pk).exists()
 
 
 class Serving(NutritionDeletionMixin, Nutrients):
@@ -80,7 +113,7 @@ class Serving(NutritionDeletionMixin, Nutrients):
         # pylint: disable=fixme
         # TODO: if self.unit != self.food.size_unit, the self.size of
         # self.unit needs to be converted to self.food.size_unit first
-        # - This might be related to why the `get_portion_for` function is
+        # - This might be related to why the `get_projection` method is
         #   so convoluted.
         # pylint: enable=fixme
         return Decimal(self.serving_size)
@@ -94,46 +127,131 @@ class Serving(NutritionDeletionMixin, Nutrients):
         """
         return self.food.size_unit
 
-    def get_portion_for(self, food: Food, nutrient: str) -> Decimal:
-        """Get portion of nutrient for the given food.
+    def get_projection(self, food: Food | None = None) -> "ServingProjection":
+        """Get the scale that projects food nutrients onto this serving.
+
+        The food kind is resolved at most once, so the projection can be
+        applied to every nutrient without further queries or conversions.
 
         Args:
-            food (Food): food to get the nutrient from.
-            nutrient (str): nutrient name.
+            food (Food | None): food to project from, the serving's by default.
 
         Returns:
-            Decimal: proportion.
+            ServingProjection: the serving's nutrient scale.
         """
-        # pylint: disable=fixme
-        # TODO: Refactor this unintelligible function
-        # pylint: enable=fixme
-        value = getattr(food, nutrient) or 0
+        if food is None:
+            food = self.food
 
         unit = self.serving_unit
         size = Decimal(food.nutritional_info_size)
         self_size: int | Decimal = self.serving_size
         if self.serving_unit == UNIT_CONTAINER:
-            unit = self.food.size_unit
-            size = Decimal(self.food.nutritional_info_size)
-            self_size = self.food.size
+            unit = food.size_unit
+            self_size = food.size
         elif self.serving_unit == UNIT_SERVING:
-            unit = self.food.size_unit
-            if FoodProduct.objects.filter(pk=food.pk).exists():
-                size = Decimal(self.food.nutritional_info_size)
-                self_size = Decimal(self.food.size) / Decimal(
-                    self.food.num_servings
-                )
+            unit = food.size_unit
+            if _is_food_product(food):
+                self_size = Decimal(food.size) / Decimal(food.num_servings)
             else:
-                size = Decimal(self.food.num_servings)
+                size = Decimal(food.num_servings)
 
         if unit != food.nutritional_info_unit:
-            new_size = UREG.Quantity(
-                Decimal(str(food.nutritional_info_size))
-            ) * UREG(food.nutritional_info_unit)
-            new_size = new_size.to(unit).m
-            size = Decimal(new_size)
+            size = convert(
+                Decimal(str(food.nutritional_info_size)),
+                food.nutritional_info_unit,
+                unit,
+            )
+
+        return ServingProjection(self_size, size)
+
+    def get_portion_for(self, food: Food, nutrient: str) -> Decimal:
+        """Get portion of nutrient for the given food.
+
+        Args:
+            food (Food): food to get the nutrient from.
+            nutrient (str): nutrient name.
+
+        Returns:
+            Decimal: proportion.
+        """
+        return self.get_projection(food).apply(getattr(food, nutrient) or 0)
+
+    def project_nutrients(self) -> dict[str, Decimal]:
+        """Get the serving's share of every nutrient present in its food.
+
+        Returns:
+            dict[str, Decimal]: projected values keyed by nutrient name.
+        """
+        food = self.food
+        nutrients = NutrientVector.load(food)
+        if nutrients.is_zero():
+            return {}
+
+        projection = self.get_projection(food)
+        return {
+            nutrient: projection.apply(value)
+            for nutrient, value in nutrients.nonzero_items()
+        }
+
+    def _apply_projected_nutrients(self) -> None:
+        """Copy the serving's share of the food nutrients onto itself."""
+        for nutrient, value in self.project_nutrients().items():
+            setattr(self, nutrient, value)
+
+    def derive_nutrients(self) -> None:
+        """Set every nutrient derived on save without touching the db.
+
+        Lets bulk writes, which bypass ``save``, persist the same values.
+        """
+        self._apply_projected_nutrients()
+        self.derive_salt_and_sodium()
+
+    @classmethod
+    def defaults_for(cls, product: FoodProduct) -> list["Serving"]:
+        """Build the unsaved default servings of a product.
+
+        Args:
+            product (FoodProduct): persisted product to build servings for.
+
+        Returns:
+            list[Serving]: servings with their nutrients already derived.
+        """
+        sizes: list[tuple[Decimal | int, str]] = [
+            (product.nutritional_info_size, product.nutritional_info_unit)
+        ]
+        if product.nutritional_info_size != 1:
+            sizes.append((1, product.nutritional_info_unit))
+        sizes.append((1, UNIT_CONTAINER))
+        if product.num_servings > 1:
+            sizes.append((1, UNIT_SERVING))
+
+        servings = [
+            cls(food=product, serving_size=size, serving_unit=unit)
+            for size, unit in sizes
+        ]
+        for serving in servings:
+            serving.derive_nutrients()
+        return servings
+
+    @classmethod
+    def rederive_for(cls, products: Sequence[FoodProduct]) -> None:
+        """Re-project the servings of products with one bulk update.
+
+        Args:
+            products (Sequence[FoodProduct]): products holding the values
+                their servings must reflect.
+        """
+        products_by_pk = {product.pk: product for product in products}
+        servings = list(
+            cls.objects.filter(food_id__in=products_by_pk).order_by("pk")
+        )
+        now = timezone.now()
+        for serving in servings:
+            serving.food = products_by_pk[serving.food_id]
+            serving.derive_nutrients()
+            serving.updated_at = now
 
-        return value * self_size / size
+        cls.objects.bulk_update(servings, NUTRIENT_LIST + ["updated_at"])
 
     def save(self, *args: Any, **kwargs: Any) -> None:
         """Save instance into the db.
@@ -142,10 +260,6 @@ class Serving(NutritionDeletionMixin, Nutrients):
             args (list): arguments.
             kwargs (dict): keyword arguments.
         """
-        for nutrient in NUTRIENT_LIST:
-            value = getattr(self.food, nutrient)
-            if value:
-                value = self.get_portion_for(self.food, nutrient)
-                setattr(self, nutrient, value)
+        self._apply_projected_nutrients()
 
         super().save(*args, **kwargs)
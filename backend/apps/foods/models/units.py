@@ -2,20 +2,26 @@
 
 from pint import UnitRegistry
 
+#: Physical unit definitions, each referring only to units defined above it.
+UNIT_DEFINITIONS = (
+    "gram = [mass] = g",
+    "milligram = 0.001 gram = mg",
+    "kilogram = 1000 gram = kg",
+    "ounce = 28.349523125 gram = oz",
+    "pound = 16 ounce = lb",
+    "liter = [volume] = l",
+    "milliliter = 0.001 liter = ml",
+    "centiliter = 0.01 liter = cl",
+    "fluid_ounce = 29.573529562499985 milliliter = floz",
+    "cup = 8 fluid_ounce = c",
+    "teaspoon = 4.92892159375 milliliter = tsp",
+    "tablespoon = 3 teaspoon = tbsp",
+    "pint = 16 fluid_ounce = pt",
+)
+
 UREG: UnitRegistry = UnitRegistry(None)
-UREG.define("gram = [mass] = g")
-UREG.define("milligram = 0.001 gram = mg")
-UREG.define("kilogram = 1000 gram = kg")
-UREG.define("ounce = 28.349523125 gram = oz")
-UREG.define("pound = 16 ounce = lb")
-UREG.define("liter = [volume] = l")
-UREG.define("milliliter = 0.001 liter = ml")
-UREG.define("centiliter = 0.01 liter = cl")
-UREG.define("fluid_ounce = 29.573529562499985 milliliter = floz")
-UREG.define("cup = 8 fluid_ounce = c")
-UREG.define("teaspoon = 4.92892159375 milliliter = tsp")
-UREG.define("tablespoon = 3 teaspoon = tbsp")
-UREG.define("pint = 16 fluid_ounce = pt")
+for _definition in UNIT_DEFINITIONS:
+    UREG.define(_definition)
 
 # Weight
 UNIT_MILLIGRAM = "mg"
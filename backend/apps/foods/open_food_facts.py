@@ -1,8 +1,12 @@
 """Open Food Facts barcode lookup client module."""
 
 import re
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from decimal import ROUND_HALF_UP, Decimal, DecimalException, InvalidOperation
 from typing import Any
 from urllib.parse import quote
@@ -10,24 +14,44 @@ from urllib.parse import quote
 import requests
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
+from django.db import connection, models
 from django.utils import timezone
-
-from apps.foods.models import (
-    FoodProduct,
-    OpenFoodFactsCacheEntry,
-    OpenFoodFactsRateLimit,
+from requests.adapters import HTTPAdapter
+
+from apps.foods.gtin import normalize_gtin
+from apps.foods.models import FoodProduct, OpenFoodFactsCacheEntry
+from apps.foods.open_food_facts_cache import (
+    CachedProduct,
+    LocalProductCache,
+    TierStats,
 )
+from apps.foods.open_food_facts_rate_limit import RateLimitStats, TokenBucket
 
 OFF_API_BASE_URL = "https://world.openfoodfacts.org/api/v3"
 OFF_PRODUCT_PAGE_URL = "https://world.openfoodfacts.org/product/{barcode}"
 OFF_REQUEST_TIMEOUT_SECONDS = 10
 OFF_POSITIVE_CACHE_SECONDS = 24 * 60 * 60
 OFF_NEGATIVE_CACHE_SECONDS = 5 * 60
+# Expired products stay servable this long while OFF cannot be reached.
+OFF_STALE_CACHE_SECONDS = 60 * 60
+OFF_LOCAL_CACHE_MAX_PRODUCTS = 256
+OFF_LOCAL_CACHE_MAX_MISSING = 4096
+OFF_CACHE_TIERS = ("local", "database", "stale")
 OFF_RATE_LIMIT_WINDOW_SECONDS = 60
 # OFF currently permits 15 product reads/minute/IP. Keep one slot in reserve.
 OFF_RATE_LIMIT_MAX_REQUESTS = 14
 OFF_RATE_LIMIT_KEY = "product_reads"
+# Lookups wait this long for the next quota token before failing.
+OFF_RATE_LIMIT_MAX_WAIT_SECONDS = 5
+# Advisory lock namespace of single-flight product fetches, keyed by barcode.
+OFF_FETCH_LOCK_NAMESPACE = 0x0FF
+# Lookups wait this long for a concurrent fetch of the same barcode.
+OFF_FETCH_LOCK_WAIT_SECONDS = (
+    OFF_RATE_LIMIT_MAX_WAIT_SECONDS + OFF_REQUEST_TIMEOUT_SECONDS + 2
+)
+OFF_FETCH_LOCK_POLL_SECONDS = 0.05
+# Batch lookups fetch this many barcodes at once over pooled connections.
+OFF_FETCH_CONCURRENCY = 4
 OFF_PRODUCT_FIELDS = ",".join(
     (
         "brands",
@@ -40,6 +64,27 @@ OFF_PRODUCT_FIELDS = ",".join(
     )
 )
 
+#: Per-process tier in front of the shared OpenFoodFactsCacheEntry table.
+LOCAL_PRODUCT_CACHE = LocalProductCache(
+    max_products=OFF_LOCAL_CACHE_MAX_PRODUCTS,
+    max_missing=OFF_LOCAL_CACHE_MAX_MISSING,
+    stale_seconds=OFF_STALE_CACHE_SECONDS,
+)
+
+#: Provider read quota shared by backend replicas.
+REQUEST_BUCKET = TokenBucket(
+    OFF_RATE_LIMIT_KEY,
+    capacity=OFF_RATE_LIMIT_MAX_REQUESTS,
+    refill_per_second=(
+        OFF_RATE_LIMIT_MAX_REQUESTS / OFF_RATE_LIMIT_WINDOW_SECONDS
+    ),
+)
+
+#: Keep-alive connections to OFF shared by lookups of this process.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_maxsize=OFF_FETCH_CONCURRENCY))
+HTTP_SESSION.mount("http://", HTTPAdapter(pool_maxsize=OFF_FETCH_CONCURRENCY))
+
 MASS_UNITS = frozenset({"g", "kg", "mg", "oz", "lb"})
 VOLUME_UNITS = frozenset({"ml", "cl", "l", "c", "floz", "tbsp", "tsp", "pt"})
 CANONICAL_UNITS = MASS_UNITS | VOLUME_UNITS
@@ -60,7 +105,6 @@ PACKAGE_UNIT_CONVERSIONS = {
     "tsp": ((Decimal("4.92892159375"), "ml"),),
 }
 FOOD_SIZE_QUANTUM = Decimal("0.1")
-GTIN_LENGTHS = frozenset({8, 12, 13, 14})
 
 QUANTITY_PATTERN = re.compile(
     r"^\s*(\d+(?:[.,]\d+)?)\s*"
@@ -109,6 +153,15 @@ class OpenFoodFactsProduct:
     salt_g: Decimal | None
 
 
+@dataclass(frozen=True)
+class OpenFoodFactsLookup:
+    """Result of one barcode of a batch lookup."""
+
+    barcode: str
+    product: OpenFoodFactsProduct | None
+    error: str | None = None
+
+
 def parse_quantity(quantity: str) -> tuple[Decimal, str] | None:
     """Parse an OFF quantity label into an amount and canonical unit.
 
@@ -126,109 +179,297 @@ def parse_quantity(quantity: str) -> tuple[Decimal, str] | None:
     return amount, match.group(2).lower()
 
 
-def normalize_gtin(barcode: str) -> str | None:
-    """Normalize and validate a product GTIN barcode.
+def fetch_open_food_facts_product(
+    barcode: str,
+    *,
+    max_wait_seconds: float = OFF_RATE_LIMIT_MAX_WAIT_SECONDS,
+) -> OpenFoodFactsProduct | None:
+    """Fetch and map an Open Food Facts product for a barcode.
 
-    Only GTIN-8, UPC-A/GTIN-12, EAN-13, and GTIN-14 values with a valid GS1
-    check digit are accepted. Surrounding whitespace is removed. Equivalent
-    zero-prefixed 13- and 14-digit forms are reduced no further than GTIN-12;
-    GTIN-8 values are preserved.
+    The draft uses a 100 g basis for mass products and a 100 ml basis for
+    volume products. Normalized OFF package quantities take precedence over
+    display labels and are converted when needed to fit the Food model's
+    one-decimal package-size precision.
+
+    Results are cached in this process and in the shared cache table. A
+    recently expired product is revalidated with Open Food Facts, but it is
+    still served when the provider cannot be reached or the shared quota is
+    exhausted. Concurrent lookups of one barcode share a single provider
+    request: the others wait for it and read its cached result.
 
     Args:
-        barcode: Raw scanned barcode value.
+        barcode: The scanned product barcode.
+        max_wait_seconds: Longest wait for a provider quota token.
 
     Returns:
-        str | None: normalized GTIN, or None when it is invalid.
+        OpenFoodFactsProduct | None: the mapped product draft, or None when
+        the barcode is unknown or the product has no usable name.
+
+    Raises:
+        ValueError: When Open Food Facts cannot be reached.
     """
-    normalized = barcode.strip()
-    if (
-        len(normalized) not in GTIN_LENGTHS
-        or re.fullmatch(r"[0-9]+", normalized) is None
-    ):
+    normalized_barcode = normalize_gtin(barcode)
+    if normalized_barcode is None:
         return None
 
-    weighted_sum = sum(
-        int(digit) * (3 if position % 2 else 1)
-        for position, digit in enumerate(reversed(normalized[:-1]), start=1)
+    now = timezone.now()
+    cached = _cached_products([normalized_barcode], now).get(
+        normalized_barcode
     )
-    check_digit = (10 - weighted_sum % 10) % 10
-    if check_digit != int(normalized[-1]):
-        return None
-    while len(normalized) > 12 and normalized.startswith("0"):
-        normalized = normalized[1:]
-    return normalized
+    if cached is not None and cached.is_fresh(now.timestamp()):
+        return _map_product(cached.product, normalized_barcode)
+    return _revalidate_product(normalized_barcode, cached, max_wait_seconds)
+
+
+def iter_open_food_facts_products(
+    barcodes: Iterable[str],
+    *,
+    max_wait_seconds: float = OFF_RATE_LIMIT_MAX_WAIT_SECONDS,
+) -> Iterator[OpenFoodFactsLookup]:
+    """Look several barcodes up, yielding each result as soon as it is known.
+
+    Barcodes are normalized and de-duplicated; invalid ones are skipped.
+    Cached results come first, reading the shared cache table once for the
+    whole batch. The misses then take their fetch lock and quota token on
+    this thread, which also writes their cache entries, while only the
+    provider requests run concurrently over the pooled session. Fetched
+    results are yielded in the order they complete. A failed fetch is
+    reported on its barcode instead of failing the batch.
+
+    Args:
+        barcodes: Scanned product barcodes.
+        max_wait_seconds: Longest wait for each provider quota token.
+
+    Yields:
+        OpenFoodFactsLookup: the result of each distinct valid barcode.
+    """
+    normalized_barcodes = list(
+        dict.fromkeys(
+            normalized
+            for normalized in map(normalize_gtin, barcodes)
+            if normalized is not None
+        )
+    )
+    now = timezone.now()
+    cached = _cached_products(normalized_barcodes, now)
+    misses = []
+    for barcode in normalized_barcodes:
+        entry = cached.get(barcode)
+        if entry is not None and entry.is_fresh(now.timestamp()):
+            yield OpenFoodFactsLookup(
+                barcode, _map_product(entry.product, barcode)
+            )
+        else:
+            misses.append(barcode)
+    if not misses:
+        return
+
+    with (
+        ExitStack() as batch,
+        ThreadPoolExecutor(
+            max_workers=min(OFF_FETCH_CONCURRENCY, len(misses))
+        ) as executor,
+    ):
+        fetches: dict[Future[requests.Response], tuple[str, ExitStack]] = {}
+        for barcode in misses:
+            # Each fetch lock is released once its result is cached.
+            flight = batch.enter_context(ExitStack())
+            try:
+                stored = _claim_fetch(barcode, flight, max_wait_seconds)
+            except ValueError as exc:
+                flight.close()
+                yield _failed_lookup(barcode, cached.get(barcode), exc)
+                continue
+            if stored is not None:
+                flight.close()
+                yield OpenFoodFactsLookup(
+                    barcode, _map_product(stored.product, barcode)
+                )
+                continue
+            fetches[executor.submit(_request_product, barcode)] = (
+                barcode,
+                flight,
+            )
+        for future in as_completed(fetches):
+            barcode, flight = fetches[future]
+            with flight:
+                try:
+                    lookup = OpenFoodFactsLookup(
+                        barcode, _read_product(barcode, future.result)
+                    )
+                except ValueError as exc:
+                    lookup = _failed_lookup(barcode, cached.get(barcode), exc)
+            yield lookup
 
 
-def equivalent_gtins(barcode: str) -> tuple[str, ...]:
-    """Return supported stored representations equivalent to a valid GTIN.
+def open_food_facts_cache_stats() -> dict[str, TierStats]:
+    """Return this process's Open Food Facts cache counters per tier.
 
-    Args:
-        barcode: Raw or canonical GTIN value.
+    The ``local`` tier counts every lookup, ``database`` counts the local
+    misses that reached the shared table and ``stale`` counts expired
+    products served because revalidation failed.
 
     Returns:
-        tuple[str, ...]: Canonical form followed by zero-prefixed legacy forms.
+        dict[str, TierStats]: lookup counters keyed by tier name.
     """
-    canonical = normalize_gtin(barcode)
-    if canonical is None:
-        return ()
-    if len(canonical) == 8:
-        return (canonical,)
-    return tuple(
-        canonical.zfill(length) for length in range(len(canonical), 15)
-    )
+    stats = LOCAL_PRODUCT_CACHE.stats()
+    return {tier: stats.get(tier, TierStats()) for tier in OFF_CACHE_TIERS}
 
 
-def fetch_open_food_facts_product(
-    barcode: str,
+def open_food_facts_rate_limit_stats() -> RateLimitStats:
+    """Return this process's provider quota token requests.
+
+    Lock time is spent taking a token from the shared bucket row and wait
+    time is spent sleeping until a reserved token is due.
+
+    Returns:
+        RateLimitStats: token request counters and timings.
+    """
+    return REQUEST_BUCKET.stats()
+
+
+def _revalidate_product(
+    barcode: str, cached: CachedProduct | None, max_wait_seconds: float
 ) -> OpenFoodFactsProduct | None:
-    """Fetch and map an Open Food Facts product for a barcode.
+    """Fetch a product missing from the cache or serve its stale copy.
+
+    Args:
+        barcode: Canonical product barcode.
+        cached: Stale cached product, if any.
+        max_wait_seconds: Longest wait for a provider quota token.
+
+    Returns:
+        OpenFoodFactsProduct | None: the mapped product draft, or None.
+
+    Raises:
+        ValueError: When Open Food Facts cannot be reached and there is no
+            stale product to serve.
+    """
+    try:
+        with ExitStack() as flight:
+            stored = _claim_fetch(barcode, flight, max_wait_seconds)
+            if stored is not None:
+                return _map_product(stored.product, barcode)
+            return _read_product(barcode, lambda: _request_product(barcode))
+    except ValueError:
+        if cached is None:
+            raise
+        return _stale_product(barcode, cached)
 
-    The draft uses a 100 g basis for mass products and a 100 ml basis for
-    volume products. Normalized OFF package quantities take precedence over
-    display labels and are converted when needed to fit the Food model's
-    one-decimal package-size precision.
+
+def _claim_fetch(
+    barcode: str, flight: ExitStack, max_wait_seconds: float
+) -> CachedProduct | None:
+    """Take a barcode's fetch lock and then a provider quota token.
+
+    A lookup that waited for the lock reads the result the other one
+    cached instead, without taking a token.
 
     Args:
-        barcode: The scanned product barcode.
+        barcode: Canonical product barcode.
+        flight: Exit stack holding the fetch lock until the result is
+            cached.
+        max_wait_seconds: Longest wait for a provider quota token.
 
     Returns:
-        OpenFoodFactsProduct | None: the mapped product draft, or None when
-        the barcode is unknown or the product has no usable name.
+        CachedProduct | None: the fresh product cached by a concurrent
+        lookup, or None when this lookup must fetch it.
 
     Raises:
-        ValueError: When Open Food Facts cannot be reached.
+        ValueError: When the lock or a token is not available in time.
     """
-    normalized_barcode = normalize_gtin(barcode)
-    if normalized_barcode is None:
-        return None
+    if flight.enter_context(_single_flight(barcode)):
+        stored = _stored_products([barcode], timezone.now()).get(barcode)
+        if stored is not None and stored.is_fresh(time.time()):
+            LOCAL_PRODUCT_CACHE.put(barcode, stored)
+            return stored
+    REQUEST_BUCKET.acquire(max_wait_seconds)
+    return None
+
+
+def _failed_lookup(
+    barcode: str, cached: CachedProduct | None, error: ValueError
+) -> OpenFoodFactsLookup:
+    """Report a failed batch fetch, serving the stale product if any.
+
+    Args:
+        barcode: Canonical product barcode.
+        cached: Stale cached product, if any.
+        error: Why the product could not be fetched.
+
+    Returns:
+        OpenFoodFactsLookup: the stale product or the error.
+    """
+    if cached is None:
+        return OpenFoodFactsLookup(barcode, None, str(error))
+    return OpenFoodFactsLookup(barcode, _stale_product(barcode, cached))
+
+
+def _stale_product(
+    barcode: str, cached: CachedProduct
+) -> OpenFoodFactsProduct | None:
+    """Serve an expired product because revalidating it failed.
+
+    Args:
+        barcode: Canonical product barcode.
+        cached: Stale cached product.
+
+    Returns:
+        OpenFoodFactsProduct | None: the mapped product draft, or None.
+    """
+    LOCAL_PRODUCT_CACHE.record("stale", hit=True)
+    return _map_product(cached.product, barcode)
+
 
-    cache_hit, cached_product = _cached_product(normalized_barcode)
-    if cache_hit:
-        return _map_product(cached_product, normalized_barcode)
+def _request_product(barcode: str) -> requests.Response:
+    """Request a product from the Open Food Facts API.
 
-    _acquire_request_slot()
-    encoded_barcode = quote(normalized_barcode, safe="")
+    Only the HTTP request is made here, so batch lookups can run it on
+    worker threads without database access.
 
+    Args:
+        barcode: Canonical product barcode.
+
+    Returns:
+        requests.Response: the provider response.
+    """
+    return HTTP_SESSION.get(
+        f"{OFF_API_BASE_URL}/product/{quote(barcode, safe='')}",
+        headers={"User-Agent": settings.OPEN_FOOD_FACTS_USER_AGENT},
+        params={"fields": OFF_PRODUCT_FIELDS},
+        timeout=OFF_REQUEST_TIMEOUT_SECONDS,
+    )
+
+
+def _read_product(
+    barcode: str, response: Callable[[], requests.Response]
+) -> OpenFoodFactsProduct | None:
+    """Cache and map a product from an Open Food Facts API response.
+
+    Args:
+        barcode: Canonical product barcode.
+        response: Returns the provider response, or raises its request
+            error.
+
+    Returns:
+        OpenFoodFactsProduct | None: the mapped product draft, or None.
+
+    Raises:
+        ValueError: When Open Food Facts cannot be reached.
+    """
     try:
-        response = requests.get(
-            f"{OFF_API_BASE_URL}/product/{encoded_barcode}",
-            headers={"User-Agent": settings.OPEN_FOOD_FACTS_USER_AGENT},
-            params={"fields": OFF_PRODUCT_FIELDS},
-            timeout=OFF_REQUEST_TIMEOUT_SECONDS,
-        )
-        response.raise_for_status()
+        fetched = response()
+        fetched.raise_for_status()
     except requests.exceptions.HTTPError as exc:
         if exc.response is not None and exc.response.status_code == 404:
-            _cache_product(
-                normalized_barcode, None, OFF_NEGATIVE_CACHE_SECONDS
-            )
+            _cache_product(barcode, None, OFF_NEGATIVE_CACHE_SECONDS)
             return None
         raise ValueError("Open Food Facts lookup failed") from exc
     except requests.exceptions.RequestException as exc:
         raise ValueError("Open Food Facts lookup failed") from exc
 
     try:
-        payload = response.json()
+        payload = fetched.json()
     except ValueError as exc:
         raise ValueError("Open Food Facts lookup failed") from exc
 
@@ -236,17 +477,17 @@ def fetch_open_food_facts_product(
         raise ValueError("Open Food Facts lookup failed")
 
     if payload.get("status") != "success":
-        _cache_product(normalized_barcode, None, OFF_NEGATIVE_CACHE_SECONDS)
+        _cache_product(barcode, None, OFF_NEGATIVE_CACHE_SECONDS)
         return None
 
     product = payload.get("product")
     if not isinstance(product, dict):
-        _cache_product(normalized_barcode, None, OFF_NEGATIVE_CACHE_SECONDS)
+        _cache_product(barcode, None, OFF_NEGATIVE_CACHE_SECONDS)
         return None
 
-    mapped_product = _map_product(product, normalized_barcode)
+    mapped_product = _map_product(product, barcode)
     _cache_product(
-        normalized_barcode,
+        barcode,
         product if mapped_product is not None else None,
         (
             OFF_POSITIVE_CACHE_SECONDS
@@ -303,22 +544,120 @@ def _map_product(
     )
 
 
-def _cached_product(barcode: str) -> tuple[bool, dict[str, Any] | None]:
-    """Return whether a live cache entry exists and its provider product.
+def _cached_products(
+    barcodes: list[str], now: datetime
+) -> dict[str, CachedProduct]:
+    """Return the cached provider results of barcodes, tier by tier.
+
+    The process tier answers first and the shared table answers its misses
+    in one query, refilling the process tier. Expired products are returned
+    within the stale window; expired missing barcodes are not.
 
     Args:
-        barcode: Canonical product barcode.
+        barcodes: Canonical product barcodes.
+        now: Current time.
 
     Returns:
-        tuple[bool, dict[str, Any] | None]: cache hit flag and product.
+        dict[str, CachedProduct]: fresh or stale results by barcode.
     """
-    entry = OpenFoodFactsCacheEntry.objects.filter(
-        barcode=barcode, expires_at__gt=timezone.now()
-    ).first()
-    if entry is None:
-        return False, None
-    product = entry.product
-    return True, product if isinstance(product, dict) else None
+    timestamp = now.timestamp()
+    cached = {}
+    local_misses = []
+    for barcode in barcodes:
+        local = LOCAL_PRODUCT_CACHE.get(barcode, timestamp)
+        local_hit = local is not None and local.is_fresh(timestamp)
+        LOCAL_PRODUCT_CACHE.record("local", hit=local_hit)
+        if local is not None:
+            cached[barcode] = local
+        if not local_hit:
+            local_misses.append(barcode)
+    if not local_misses:
+        return cached
+
+    stored = _stored_products(local_misses, now)
+    for barcode in local_misses:
+        entry = stored.get(barcode)
+        LOCAL_PRODUCT_CACHE.record(
+            "database", hit=entry is not None and entry.is_fresh(timestamp)
+        )
+        if entry is not None:
+            LOCAL_PRODUCT_CACHE.put(barcode, entry)
+            cached[barcode] = entry
+    return cached
+
+
+def _stored_products(
+    barcodes: list[str], now: datetime
+) -> dict[str, CachedProduct]:
+    """Return the shared cache table's results for barcodes.
+
+    Args:
+        barcodes: Canonical product barcodes.
+        now: Current time.
+
+    Returns:
+        dict[str, CachedProduct]: fresh results and stale products by
+        barcode.
+    """
+    stored = {}
+    for entry in OpenFoodFactsCacheEntry.objects.filter(
+        barcode__in=barcodes,
+        expires_at__gt=now - timedelta(seconds=OFF_STALE_CACHE_SECONDS),
+    ):
+        product = entry.product if isinstance(entry.product, dict) else None
+        if product is None and entry.expires_at <= now:
+            continue
+        stored[entry.barcode] = CachedProduct(
+            product, entry.expires_at.timestamp()
+        )
+    return stored
+
+
+@contextmanager
+def _single_flight(barcode: str) -> Iterator[bool]:
+    """Hold the cross-process provider fetch lock of a barcode.
+
+    The lock is a session-level PostgreSQL advisory lock, so it is released
+    right after the cache entry is written rather than at the end of a
+    surrounding transaction. Other databases fetch without coordination.
+
+    Args:
+        barcode: Canonical product barcode.
+
+    Yields:
+        bool: whether another lookup held the lock first, in which case its
+        result may already be cached.
+
+    Raises:
+        ValueError: When the concurrent fetch outlives the wait.
+    """
+    if connection.vendor != "postgresql":
+        yield False
+        return
+
+    lock_args: list[int | str] = [OFF_FETCH_LOCK_NAMESPACE, barcode]
+    deadline = time.monotonic() + OFF_FETCH_LOCK_WAIT_SECONDS
+    waited = False
+    with connection.cursor() as cursor:
+        while True:
+            cursor.execute(
+                "SELECT pg_try_advisory_lock(%s, hashtext(%s))", lock_args
+            )
+            if cursor.fetchone()[0]:
+                break
+            if time.monotonic() >= deadline:
+                raise ValueError(
+                    "Open Food Facts lookup is temporarily unavailable"
+                )
+            waited = True
+            time.sleep(OFF_FETCH_LOCK_POLL_SECONDS)
+    try:
+        yield waited
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_unlock(%s, hashtext(%s))", lock_args
+            )
 
 
 def _cache_product(
@@ -331,45 +670,14 @@ def _cache_product(
         product: Provider product mapping, or None for a negative lookup.
         timeout_seconds: Cache lifetime in seconds.
     """
+    expires_at = timezone.now() + timedelta(seconds=timeout_seconds)
     OpenFoodFactsCacheEntry.objects.update_or_create(
         barcode=barcode,
-        defaults={
-            "product": product,
-            "expires_at": timezone.now() + timedelta(seconds=timeout_seconds),
-        },
+        defaults={"product": product, "expires_at": expires_at},
+    )
+    LOCAL_PRODUCT_CACHE.put(
+        barcode, CachedProduct(product, expires_at.timestamp())
     )
-
-
-def _acquire_request_slot() -> None:
-    """Reserve one shared OFF read below the documented provider quota.
-
-    Raises:
-        ValueError: When the quota window is already exhausted.
-    """
-    now = timezone.now().timestamp()
-    cutoff = now - OFF_RATE_LIMIT_WINDOW_SECONDS
-    with transaction.atomic():
-        (
-            limiter,
-            _created,
-        ) = OpenFoodFactsRateLimit.objects.select_for_update().get_or_create(
-            key=OFF_RATE_LIMIT_KEY
-        )
-        raw_timestamps = limiter.request_timestamps
-        timestamps = [
-            float(value)
-            for value in raw_timestamps
-            if isinstance(value, (int, float))
-            and not isinstance(value, bool)
-            and float(value) > cutoff
-        ]
-        if len(timestamps) >= OFF_RATE_LIMIT_MAX_REQUESTS:
-            raise ValueError(
-                "Open Food Facts lookup is temporarily unavailable"
-            )
-        timestamps.append(now)
-        limiter.request_timestamps = timestamps
-        limiter.save(update_fields=("request_timestamps",))
 
 
 def _decimal_or_none(
@@ -0,0 +1,171 @@
+"""Per-process tier of the Open Food Facts product cache module."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CachedProduct:
+    """Provider result held by a cache tier.
+
+    A None product is a confirmed-missing barcode.
+    """
+
+    product: dict[str, Any] | None
+    expires_at: float
+
+    def is_fresh(self, now: float) -> bool:
+        """Return whether the entry is still within its TTL.
+
+        Args:
+            now: Current POSIX timestamp.
+
+        Returns:
+            bool: whether the entry may be served without revalidation.
+        """
+        return now < self.expires_at
+
+
+@dataclass
+class TierStats:
+    """Lookup counters of one cache tier."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the share of lookups answered by the tier.
+
+        Returns:
+            float: hits over lookups, or 0 before the first lookup.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LocalProductCache:
+    """Size-bounded, thread-safe LRU of provider results.
+
+    Products and confirmed-missing barcodes are bounded separately. Missing
+    barcodes only keep an integer key and an expiry, so the filter holds
+    many more of them than the product tier holds payloads. Unlike a Bloom
+    filter it is exact: a product is never reported missing by mistake.
+    """
+
+    def __init__(
+        self, max_products: int, max_missing: int, stale_seconds: int
+    ):
+        """Create an empty cache.
+
+        Args:
+            max_products: Maximum number of cached product payloads.
+            max_missing: Maximum number of cached missing barcodes.
+            stale_seconds: How long expired products are kept to be served
+                when revalidation fails.
+        """
+        self.max_products = max_products
+        self.max_missing = max_missing
+        self.stale_seconds = stale_seconds
+        self._lock = threading.Lock()
+        self._products: OrderedDict[str, CachedProduct] = OrderedDict()
+        self._missing: OrderedDict[int, float] = OrderedDict()
+        self._stats: dict[str, TierStats] = {}
+
+    @staticmethod
+    def _missing_key(barcode: str) -> int:
+        """Pack a canonical barcode into an integer.
+
+        The leading one keeps GTIN-8 and zero-prefixed GTIN-12 values,
+        which are distinct canonical barcodes, from sharing a key.
+        """
+        return int(f"1{barcode}")
+
+    def get(self, barcode: str, now: float) -> CachedProduct | None:
+        """Return the cached result of a barcode.
+
+        Missing barcodes are returned only while fresh. Products are also
+        returned within the stale window after their expiry.
+
+        Args:
+            barcode: Canonical product barcode.
+            now: Current POSIX timestamp.
+
+        Returns:
+            CachedProduct | None: cached result, or None when unknown.
+        """
+        with self._lock:
+            key = self._missing_key(barcode)
+            missing_expires_at = self._missing.get(key)
+            if missing_expires_at is not None:
+                if now < missing_expires_at:
+                    self._missing.move_to_end(key)
+                    return CachedProduct(None, missing_expires_at)
+                del self._missing[key]
+
+            cached = self._products.get(barcode)
+            if cached is None:
+                return None
+            if now >= cached.expires_at + self.stale_seconds:
+                del self._products[barcode]
+                return None
+            self._products.move_to_end(barcode)
+            return cached
+
+    def put(self, barcode: str, cached: CachedProduct) -> None:
+        """Store the result of a barcode, evicting the least recently used.
+
+        Args:
+            barcode: Canonical product barcode.
+            cached: Provider result and its expiry.
+        """
+        with self._lock:
+            key = self._missing_key(barcode)
+            if cached.product is None:
+                self._products.pop(barcode, None)
+                self._missing[key] = cached.expires_at
+                self._missing.move_to_end(key)
+                while len(self._missing) > self.max_missing:
+                    self._missing.popitem(last=False)
+                return
+
+            self._missing.pop(key, None)
+            self._products[barcode] = cached
+            self._products.move_to_end(barcode)
+            while len(self._products) > self.max_products:
+                self._products.popitem(last=False)
+
+    def record(self, tier: str, hit: bool) -> None:
+        """Count a lookup against a tier.
+
+        Args:
+            tier: Tier name.
+            hit: Whether the tier answered the lookup.
+        """
+        with self._lock:
+            stats = self._stats.setdefault(tier, TierStats())
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+    def stats(self) -> dict[str, TierStats]:
+        """Return a snapshot of the lookup counters per tier.
+
+        Returns:
+            dict[str, TierStats]: counters keyed by tier name.
+        """
+        with self._lock:
+            return {
+                tier: TierStats(stats.hits, stats.misses)
+                for tier, stats in self._stats.items()
+            }
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        with self._lock:
+            self._products.clear()
+            self._missing.clear()
+            self._stats.clear()
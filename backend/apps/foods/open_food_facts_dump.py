@@ -0,0 +1,452 @@
+"""Open Food Facts data dump import module."""
+
+import csv
+import gzip
+import json
+import sys
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Sequence, cast
+
+from django.db import connections, models, router, transaction
+from django.utils import timezone
+
+from apps.foods.gtin import normalize_gtin
+from apps.foods.models import Food, FoodProduct, Serving
+from apps.foods.open_food_facts import (
+    NUTRIMENT_KEYS,
+    NUTRIMENT_MODEL_FIELDS,
+    OFF_PRODUCT_PAGE_URL,
+    OpenFoodFactsProduct,
+    _map_product,
+)
+
+DUMP_FORMAT_JSONL = "jsonl"
+DUMP_FORMAT_CSV = "csv"
+DUMP_FORMATS = (DUMP_FORMAT_JSONL, DUMP_FORMAT_CSV)
+DUMP_FORMAT_SUFFIXES = {
+    ".jsonl": DUMP_FORMAT_JSONL,
+    ".ndjson": DUMP_FORMAT_JSONL,
+    ".json": DUMP_FORMAT_JSONL,
+    ".csv": DUMP_FORMAT_CSV,
+    ".tsv": DUMP_FORMAT_CSV,
+}
+#: The OFF CSV export is tab separated despite its extension.
+CSV_DEFAULT_DELIMITER = "\t"
+CSV_PRODUCT_COLUMNS = (
+    "code",
+    "brands",
+    "product_name",
+    "product_quantity",
+    "product_quantity_unit",
+    "quantity",
+    "url",
+)
+CSV_NUTRIMENT_COLUMNS = tuple(f"{key}_100g" for key in NUTRIMENT_KEYS.values())
+DEFAULT_BATCH_SIZE = 1000
+
+#: Food fields written from a draft, nutrient names in model form.
+IMPORTED_FIELDS = (
+    "name",
+    "brand",
+    "url",
+    "barcode",
+    "gtin",
+    "nutritional_info_size",
+    "nutritional_info_unit",
+    "size",
+    "size_unit",
+    "num_servings",
+    *(NUTRIMENT_MODEL_FIELDS.get(key, key) for key in NUTRIMENT_KEYS),
+)
+#: Fields a refresh may change, including those derived on save.
+UPDATED_FIELDS = tuple(
+    dict.fromkeys((*IMPORTED_FIELDS, "energy_kcal", "sodium_mg"))
+)
+
+
+@dataclass
+class DumpImportStats:
+    """Running totals of a dump import."""
+
+    records: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+
+    def add(self, other: "DumpImportStats") -> None:
+        """Accumulate the totals of another batch.
+
+        Args:
+            other (DumpImportStats): batch totals to add.
+        """
+        self.records += other.records
+        self.created += other.created
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.skipped += other.skipped
+
+
+def dump_format(path: Path) -> str | None:
+    """Infer a dump format from its file name.
+
+    Args:
+        path (Path): dump path, optionally gzip compressed.
+
+    Returns:
+        str | None: the dump format, or None when it cannot be inferred.
+    """
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if suffixes and suffixes[-1] == ".gz":
+        suffixes.pop()
+    if not suffixes:
+        return None
+    return DUMP_FORMAT_SUFFIXES.get(suffixes[-1])
+
+
+def _open_dump(path: Path) -> IO[str]:
+    """Open a plain or gzip compressed dump for streaming text reads."""
+    if path.suffix.lower() == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return path.open(encoding="utf-8", newline="")
+
+
+def iter_dump_records(
+    path: Path,
+    fmt: str,
+    delimiter: str = CSV_DEFAULT_DELIMITER,
+) -> Iterator[dict[str, Any] | None]:
+    """Stream the product records of a dump one at a time.
+
+    Each yielded record has the shape of an OFF API product so it can go
+    through the same mapping. Unparseable records are yielded as None so
+    record positions, and therefore checkpoints, stay stable.
+
+    Args:
+        path (Path): dump path, optionally gzip compressed.
+        fmt (str): dump format, one of ``DUMP_FORMATS``.
+        delimiter (str): CSV field delimiter.
+
+    Yields:
+        dict[str, Any] | None: one product record, or None.
+    """
+    with _open_dump(path) as dump:
+        if fmt == DUMP_FORMAT_JSONL:
+            yield from _jsonl_records(dump)
+        else:
+            yield from _csv_records(dump, delimiter)
+
+
+def _jsonl_records(lines: Iterable[str]) -> Iterator[dict[str, Any] | None]:
+    """Parse one product per non-blank JSONL line."""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield None
+            continue
+        yield record if isinstance(record, dict) else None
+
+
+def _csv_records(
+    lines: Iterable[str], delimiter: str
+) -> Iterator[dict[str, Any] | None]:
+    """Reshape CSV rows into API-like products with nested nutriments."""
+    # OFF rows carry very long ingredient and tag columns.
+    csv.field_size_limit(min(sys.maxsize, 2**31 - 1))
+    for row in csv.DictReader(lines, delimiter=delimiter):
+        record: dict[str, Any] = {
+            column: row[column]
+            for column in CSV_PRODUCT_COLUMNS
+            if row.get(column)
+        }
+        record["nutriments"] = {
+            column: row[column]
+            for column in CSV_NUTRIMENT_COLUMNS
+            if row.get(column)
+        }
+        yield record
+
+
+def map_dump_record(
+    record: dict[str, Any] | None,
+) -> OpenFoodFactsProduct | None:
+    """Map one dump record through the barcode lookup mapping.
+
+    Args:
+        record (dict[str, Any] | None): product record from the dump.
+
+    Returns:
+        OpenFoodFactsProduct | None: the mapped draft, or None when the
+        record has no valid GTIN or no usable name.
+    """
+    if record is None:
+        return None
+    barcode = normalize_gtin(str(record.get("code") or ""))
+    if barcode is None:
+        return None
+    return _map_product(record, barcode)
+
+
+def read_checkpoint(checkpoint: Path, dump: Path) -> int:
+    """Return how many records of a dump a previous run committed.
+
+    Args:
+        checkpoint (Path): checkpoint file path.
+        dump (Path): dump the checkpoint must belong to.
+
+    Returns:
+        int: committed record count, or 0 without a usable checkpoint.
+    """
+    try:
+        state = json.loads(checkpoint.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0
+    if not isinstance(state, dict) or state.get("dump") != str(dump.resolve()):
+        return 0
+    records = state.get("records")
+    if not isinstance(records, int) or records < 0:
+        return 0
+    return records
+
+
+def write_checkpoint(checkpoint: Path, dump: Path, records: int) -> None:
+    """Atomically record how many dump records have been committed.
+
+    Args:
+        checkpoint (Path): checkpoint file path.
+        dump (Path): dump being imported.
+        records (int): committed record count.
+    """
+    pending = checkpoint.with_name(f"{checkpoint.name}.tmp")
+    pending.write_text(
+        json.dumps({"dump": str(dump.resolve()), "records": records}),
+        encoding="utf-8",
+    )
+    pending.replace(checkpoint)
+
+
+def import_dump_batch(
+    records: Sequence[dict[str, Any] | None],
+) -> DumpImportStats:
+    """Map and import one batch of dump records in its own transaction.
+
+    When a barcode repeats within the batch, its last record wins and the
+    earlier ones count as skipped, as do unmappable records.
+
+    Args:
+        records (Sequence[dict[str, Any] | None]): consecutive dump records.
+
+    Returns:
+        DumpImportStats: batch totals.
+    """
+    drafts: dict[str, OpenFoodFactsProduct] = {}
+    for record in records:
+        draft = map_dump_record(record)
+        if draft is not None:
+            drafts[draft.barcode] = draft
+
+    with transaction.atomic():
+        stats = import_drafts(list(drafts.values()))
+    stats.records = len(records)
+    stats.skipped = len(records) - len(drafts)
+    return stats
+
+
+def import_drafts(
+    drafts: Sequence[OpenFoodFactsProduct],
+) -> DumpImportStats:
+    """Insert or refresh products and their servings from mapped drafts.
+
+    Existing products are matched on their canonical GTIN. Products
+    whose values are unchanged are not written. New products and their
+    default servings are inserted, and changed products and their servings
+    updated, with a constant number of statements per call. Callers own
+    the surrounding transaction.
+
+    Args:
+        drafts (Sequence[OpenFoodFactsProduct]): drafts with distinct
+            canonical barcodes.
+
+    Returns:
+        DumpImportStats: created, updated, and unchanged totals.
+    """
+    stats = DumpImportStats()
+    now = timezone.now()
+    existing = _existing_products(draft.barcode for draft in drafts)
+    created: list[FoodProduct] = []
+    updated: list[FoodProduct] = []
+    for draft in drafts:
+        values = _product_values(draft)
+        product = existing.get(draft.barcode)
+        if product is None:
+            product = FoodProduct(**values)
+            _derive_nutrients(product)
+            created.append(product)
+            continue
+
+        before = [getattr(product, field) for field in UPDATED_FIELDS]
+        for field, value in values.items():
+            setattr(product, field, value)
+        _derive_nutrients(product)
+        if before != [getattr(product, field) for field in UPDATED_FIELDS]:
+            product.updated_at = now
+            updated.append(product)
+        else:
+            stats.unchanged += 1
+
+    # Servings are derived from re-read rows, so that they use the
+    # persisted decimal precision as a saved product's servings do.
+    if created:
+        _bulk_create_products(created)
+        Serving.objects.bulk_create(
+            [
+                serving
+                for product in _persisted(created)
+                for serving in Serving.defaults_for(product)
+            ]
+        )
+    if updated:
+        FoodProduct.objects.bulk_update(
+            updated, [*UPDATED_FIELDS, "updated_at"]
+        )
+        Serving.rederive_for(_persisted(updated))
+
+    stats.created = len(created)
+    stats.updated = len(updated)
+    return stats
+
+
+def _existing_products(barcodes: Iterable[str]) -> dict[str, FoodProduct]:
+    """Return the oldest stored product for each canonical barcode."""
+    products: dict[str, FoodProduct] = {}
+    for product in FoodProduct.objects.filter(
+        gtin__in=list(barcodes)
+    ).order_by("pk"):
+        products.setdefault(str(product.gtin), product)
+    return products
+
+
+def _persisted(products: Sequence[FoodProduct]) -> list[FoodProduct]:
+    """Re-read written products with one query."""
+    return list(
+        FoodProduct.objects.filter(
+            pk__in=[product.pk for product in products]
+        ).order_by("pk")
+    )
+
+
+def _product_values(draft: OpenFoodFactsProduct) -> dict[str, Any]:
+    """Return FoodProduct field values for a draft.
+
+    Drafts without a package size describe one nutritional basis. Required
+    nutrients OFF does not publish default to zero, as in the create form.
+    """
+    size, size_unit = draft.size, draft.size_unit
+    if size is None or size_unit is None:
+        size = draft.nutritional_info_size
+        size_unit = draft.nutritional_info_unit
+
+    url = draft.url
+    if len(url) > _max_length("url"):
+        url = OFF_PRODUCT_PAGE_URL.format(barcode=draft.barcode)
+
+    values: dict[str, Any] = {
+        "name": _fitted("name", draft.name),
+        "brand": _fitted("brand", draft.brand),
+        "url": url,
+        "barcode": draft.barcode,
+        "gtin": draft.barcode,
+        "nutritional_info_size": draft.nutritional_info_size,
+        "nutritional_info_unit": draft.nutritional_info_unit,
+        "size": size,
+        "size_unit": size_unit,
+        "num_servings": draft.num_servings,
+    }
+    for attribute in NUTRIMENT_KEYS:
+        field = NUTRIMENT_MODEL_FIELDS.get(attribute, attribute)
+        value = getattr(draft, attribute)
+        if value is None and not _column(field).null:
+            value = Decimal("0")
+        values[field] = value
+    return values
+
+
+def _column(name: str) -> models.Field:
+    """Return a concrete Food field."""
+    return cast(models.Field, Food._meta.get_field(name))
+
+
+def _max_length(name: str) -> int:
+    """Return the length limit of a Food text column."""
+    return cast(int, _column(name).max_length)
+
+
+def _fitted(field: str, value: str | None) -> str | None:
+    """Truncate a text value to its Food column length."""
+    if value is None:
+        return None
+    return value[: _max_length(field)]
+
+
+def _derive_nutrients(product: FoodProduct) -> None:
+    """Apply the derivations ``save`` would run for a bulk write."""
+    product.derive_energy_from_abv()
+    product.derive_salt_and_sodium()
+
+
+def _bulk_create_products(products: Sequence[FoodProduct]) -> None:
+    """Insert multi-table products with one statement per table.
+
+    Django's ``bulk_create`` refuses multi-table children, so the parent
+    Food rows are bulk created first, which needs a backend that returns
+    inserted primary keys, and the product rows then inserted for those
+    keys.
+
+    Args:
+        products (Sequence[FoodProduct]): unsaved products, updated in place
+            with their primary keys.
+    """
+    parent_fields = Food._meta.concrete_fields
+    parents = Food.objects.bulk_create(
+        [
+            Food(
+                **{
+                    field.attname: getattr(product, field.attname)
+                    for field in parent_fields
+                }
+            )
+            for product in products
+        ]
+    )
+
+    for product, parent in zip(products, parents):
+        for field in parent_fields:
+            setattr(product, field.attname, getattr(parent, field.attname))
+        product.food_ptr_id = parent.pk
+
+    connection = connections[router.db_for_write(FoodProduct)]
+    quote = connection.ops.quote_name
+    opts = FoodProduct._meta
+    fields = opts.local_concrete_fields
+    table = quote(opts.db_table)
+    columns = ", ".join(quote(field.column) for field in fields)
+    placeholders = ", ".join(["%s"] * len(fields))
+    sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"  # nosec B608
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            sql,
+            [
+                [
+                    field.get_db_prep_save(
+                        getattr(product, field.attname), connection
+                    )
+                    for field in fields
+                ]
+                for product in products
+            ],
+        )
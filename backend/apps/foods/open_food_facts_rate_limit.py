@@ -0,0 +1,178 @@
+"""Shared token-bucket limiter of Open Food Facts reads module."""
+
+import threading
+import time
+from dataclasses import dataclass, replace
+
+from django.db import connection, transaction
+
+from apps.foods.models import OpenFoodFactsRateLimit
+
+
+@dataclass
+class RateLimitStats:
+    """Token requests made by this process and the time they took."""
+
+    granted: int = 0
+    rejected: int = 0
+    lock_seconds: float = 0.0
+    max_lock_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class TokenBucket:
+    """Token bucket kept in one OpenFoodFactsRateLimit row.
+
+    Every request takes a token with a single ``UPDATE ... RETURNING`` that
+    first refills the bucket for the time elapsed since the previous one,
+    using the database clock so that replicas agree on it. Other databases
+    lock the row and do the same arithmetic in Python. Tokens may go
+    negative: a request finding the bucket empty reserves the next token
+    and sleeps until it is due, unless that is later than its deadline.
+    """
+
+    def __init__(self, key: str, capacity: int, refill_per_second: float):
+        """Create a limiter for one bucket row.
+
+        Args:
+            key: Primary key of the bucket row, created on first use.
+            capacity: Maximum number of tokens, i.e. the allowed burst.
+            refill_per_second: Tokens added back per second.
+        """
+        self.key = key
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._stats = RateLimitStats()
+        self._stats_lock = threading.Lock()
+
+    def acquire(self, max_wait_seconds: float) -> None:
+        """Take a token, waiting for it up to a deadline.
+
+        Args:
+            max_wait_seconds: Longest acceptable wait for the next token.
+
+        Raises:
+            ValueError: When no token is due within the deadline.
+        """
+        started = time.monotonic()
+        tokens = self._take(max_wait_seconds)
+        if tokens is None:
+            # The row may be missing, or created by a concurrent request
+            # since, so the token is taken again either way.
+            OpenFoodFactsRateLimit.objects.get_or_create(key=self.key)
+            tokens = self._take(max_wait_seconds)
+        lock_seconds = time.monotonic() - started
+        if tokens is None:
+            self._record(lock_seconds, None)
+            raise ValueError(
+                "Open Food Facts lookup is temporarily unavailable"
+            )
+
+        wait_seconds = max(0.0, -tokens / self.refill_per_second)
+        self._record(lock_seconds, wait_seconds)
+        if wait_seconds:
+            time.sleep(wait_seconds)
+
+    def stats(self) -> RateLimitStats:
+        """Return a snapshot of this process's token requests.
+
+        Returns:
+            RateLimitStats: granted and rejected requests with their lock
+            and wait times.
+        """
+        with self._stats_lock:
+            return replace(self._stats)
+
+    def _take(self, max_wait_seconds: float) -> float | None:
+        """Take a token in one statement.
+
+        Args:
+            max_wait_seconds: Longest acceptable wait for the token.
+
+        Returns:
+            float | None: tokens left, negative while reserved tokens are
+            not due yet, or None when the bucket row is missing or the
+            token would not be due in time.
+        """
+        if connection.vendor != "postgresql":
+            return self._take_locked(max_wait_seconds)
+
+        table = connection.ops.quote_name(
+            OpenFoodFactsRateLimit._meta.db_table
+        )
+        available = (
+            "LEAST(%(capacity)s, bucket.tokens"
+            " + GREATEST(clock.now - bucket.refilled_at, 0) * %(rate)s)"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} AS bucket "  # nosec B608
+                f"SET tokens = {available} - 1, "
+                "refilled_at = GREATEST(bucket.refilled_at, clock.now) "
+                "FROM (SELECT EXTRACT(EPOCH FROM clock_timestamp())::float8"
+                " AS now) AS clock "
+                f"WHERE bucket.key = %(key)s AND {available} - 1 >= %(floor)s "
+                "RETURNING bucket.tokens",
+                {
+                    "capacity": float(self.capacity),
+                    "rate": self.refill_per_second,
+                    "key": self.key,
+                    "floor": -max_wait_seconds * self.refill_per_second,
+                },
+            )
+            row = cursor.fetchone()
+        return None if row is None else row[0]
+
+    def _take_locked(self, max_wait_seconds: float) -> float | None:
+        """Take a token under a row lock, on databases other than PostgreSQL.
+
+        Args:
+            max_wait_seconds: Longest acceptable wait for the token.
+
+        Returns:
+            float | None: tokens left, as ``_take`` returns them.
+        """
+        with transaction.atomic():
+            bucket = (
+                OpenFoodFactsRateLimit.objects.select_for_update()
+                .filter(key=self.key)
+                .first()
+            )
+            if bucket is None:
+                return None
+            now = time.time()
+            tokens = (
+                min(
+                    self.capacity,
+                    bucket.tokens
+                    + max(now - bucket.refilled_at, 0)
+                    * self.refill_per_second,
+                )
+                - 1
+            )
+            if tokens < -max_wait_seconds * self.refill_per_second:
+                return None
+            bucket.tokens = tokens
+            bucket.refilled_at = max(bucket.refilled_at, now)
+            bucket.save(update_fields=("tokens", "refilled_at"))
+        return tokens
+
+    def _record(self, lock_seconds: float, wait_seconds: float | None) -> None:
+        """Count a token request.
+
+        Args:
+            lock_seconds: Time spent updating the bucket row.
+            wait_seconds: Time to wait for the token, or None when it was
+                refused.
+        """
+        with self._stats_lock:
+            stats = self._stats
+            stats.lock_seconds += lock_seconds
+            stats.max_lock_seconds = max(stats.max_lock_seconds, lock_seconds)
+            if wait_seconds is None:
+                stats.rejected += 1
+                return
+            stats.granted += 1
+            stats.wait_seconds += wait_seconds
+            stats.max_wait_seconds = max(stats.max_wait_seconds, wait_seconds)
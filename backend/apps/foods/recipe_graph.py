@@ -0,0 +1,138 @@
+"""Dependency graph from foods to the recipes that use them."""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Iterable
+
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.foods.models import RecipeIngredient
+
+
+def _direct_dependents(
+    food_ids: Iterable[int], using: str
+) -> list[tuple[int, int]]:
+    """Return food and recipe pairs where the recipe uses the food.
+
+    The lookup walks the ``recipeingredient_food_idx`` index from each
+    serving of the foods to the recipes using it.
+    """
+    return list(
+        RecipeIngredient.objects.using(using)
+        .filter(food__food_id__in=list(food_ids))
+        .values_list("food__food_id", "recipe_id")
+        .distinct()
+    )
+
+
+@dataclass(frozen=True)
+class RecipeDependencies:
+    """Recipes depending directly or transitively on some foods."""
+
+    roots: frozenset[int]
+    dependents: dict[int, frozenset[int]]
+
+    @classmethod
+    def collect(
+        cls, food_ids: Iterable[int], using: str = DEFAULT_DB_ALIAS
+    ) -> "RecipeDependencies":
+        """Walk up from foods to every recipe that transitively uses them.
+
+        Args:
+            food_ids (Iterable[int]): foods whose dependents are wanted.
+            using (str): database alias to read.
+
+        Returns:
+            RecipeDependencies: the dependency subgraph above the foods.
+        """
+        roots = frozenset(food_ids)
+        dependents: defaultdict[int, set[int]] = defaultdict(set)
+        seen = set(roots)
+        frontier = set(roots)
+        while frontier:
+            reached = set()
+            for food_id, recipe_id in _direct_dependents(frontier, using):
+                dependents[food_id].add(recipe_id)
+                if recipe_id not in seen:
+                    seen.add(recipe_id)
+                    reached.add(recipe_id)
+            frontier = reached
+        return cls(
+            roots,
+            {
+                food_id: frozenset(recipe_ids)
+                for food_id, recipe_ids in dependents.items()
+            },
+        )
+
+    @property
+    def recipes(self) -> frozenset[int]:
+        """Return every recipe using one of the roots, at any depth.
+
+        Returns:
+            frozenset[int]: dependent recipe IDs.
+        """
+        return frozenset().union(*self.dependents.values())
+
+    def levels(self) -> list[list[int]]:
+        """Order the dependent recipes so each follows all its ingredients.
+
+        Recipes on one level only use foods from earlier levels or the
+        roots, so a level can be recomputed as one batch.
+
+        Returns:
+            list[list[int]]: recipe IDs per level, lowest level first.
+
+        Raises:
+            ValidationError: if the recipes nest inside themselves.
+        """
+        pending = {recipe_id: 0 for recipe_id in self.recipes | self.roots}
+        for recipe_ids in self.dependents.values():
+            for recipe_id in recipe_ids:
+                pending[recipe_id] += 1
+        ready = sorted(node for node, count in pending.items() if not count)
+        levels = []
+        while ready:
+            for node in ready:
+                del pending[node]
+            reached = set()
+            for node in ready:
+                for recipe_id in self.dependents.get(node, ()):
+                    pending[recipe_id] -= 1
+                    if not pending[recipe_id]:
+                        reached.add(recipe_id)
+            ready = sorted(reached)
+            if ready:
+                levels.append(ready)
+        if pending:
+            raise ValidationError(
+                "Recipes contain themselves through their ingredients: "
+                + ", ".join(str(recipe_id) for recipe_id in sorted(pending))
+            )
+        return levels
+
+
+def validate_acyclic_ingredient(
+    recipe_id: int,
+    food_id: int,
+    using: str = DEFAULT_DB_ALIAS,
+    dependents: frozenset[int] | None = None,
+) -> None:
+    """Reject an ingredient through which a recipe would contain itself.
+
+    Args:
+        recipe_id (int): recipe receiving the ingredient.
+        food_id (int): food of the ingredient's serving.
+        using (str): database alias to read.
+        dependents (frozenset[int] | None): recipes using the recipe, when
+            a batch already collected them; walked from the database
+            otherwise.
+
+    Raises:
+        ValidationError: if the food is the recipe or one of its dependents.
+    """
+    if dependents is None:
+        dependents = RecipeDependencies.collect([recipe_id], using).recipes
+    if food_id == recipe_id or food_id in dependents:
+        raise ValidationError("Recipe ingredient cannot contain its recipe")
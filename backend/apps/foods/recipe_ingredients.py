@@ -0,0 +1,231 @@
+"""Batched recipe ingredient changes under one recipe lock bundle."""
+
+import copy
+import dataclasses
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable
+
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from apps.foods.models import Recipe, RecipeIngredient, Serving
+from apps.foods.models.nutrients import NUTRIENT_LIST
+from apps.foods.recipe_graph import RecipeDependencies
+from apps.foods.recipe_locks import (
+    activate_recipe_aggregate_locks,
+    lock_recipe_aggregate_rows,
+    lock_recipe_ingredients,
+)
+from apps.foods.signals.handlers.recipe_nutrients import (
+    apply_recipe_ingredient_totals,
+    validate_recipe_ingredient_size,
+)
+
+_UPDATED_FIELDS = [
+    "food",
+    "num_servings",
+    "size_snapshot",
+    "size_snapshot_unit",
+] + NUTRIENT_LIST
+
+
+@dataclass(frozen=True)
+class IngredientChange:
+    """One add, update or removal in a batch of ingredient changes.
+
+    A change without ``ingredient_id`` adds an ingredient, one with
+    ``delete`` set removes it and any other change updates it.
+    """
+
+    ingredient_id: int | None = None
+    serving_id: int | None = None
+    num_servings: Decimal = Decimal("1")
+    delete: bool = False
+
+
+def _validated_changes(
+    changes: list[IngredientChange],
+) -> list[IngredientChange]:
+    """Reject batches that touch a row twice or lack a serving."""
+    repeated = [
+        ingredient_id
+        for ingredient_id, count in Counter(
+            change.ingredient_id
+            for change in changes
+            if change.ingredient_id is not None
+        ).items()
+        if count > 1
+    ]
+    if repeated:
+        raise ValidationError(
+            f"Recipe ingredient {repeated[0]} is changed more than once"
+        )
+    if any(
+        not change.delete and change.serving_id is None for change in changes
+    ):
+        raise ValidationError("Recipe ingredient changes require a food")
+    return changes
+
+
+def change_recipe_ingredients(
+    recipe_id: int,
+    changes: Iterable[IngredientChange],
+    using: str = DEFAULT_DB_ALIAS,
+) -> Recipe:
+    """Apply many ingredient changes to one recipe in one transaction.
+
+    The recipe hierarchy is locked once, rows are written with bulk
+    operations and the aggregates and recipe serving are recomputed once.
+
+    Args:
+        recipe_id (int): recipe whose ingredients change.
+        changes (Iterable[IngredientChange]): changes in request order.
+        using (str): database alias used by the mutation.
+
+    Returns:
+        Recipe: the locked recipe with its updated aggregates.
+
+    Raises:
+        Recipe.DoesNotExist: if the recipe does not exist.
+        RecipeIngredient.DoesNotExist: if a change targets an ingredient
+            of another recipe or a missing one.
+        Serving.DoesNotExist: if a change refers to a missing serving.
+    """
+    pending = _validated_changes(list(changes))
+    with transaction.atomic(using=using):
+        locks = lock_recipe_aggregate_rows([recipe_id], using)
+        recipe = locks.recipes_by_pk.get(recipe_id)
+        if recipe is None:
+            raise Recipe.DoesNotExist("Recipe not found")
+        current = {
+            ingredient.pk: ingredient for ingredient in locks.ingredients
+        }
+        serving_ids = {
+            change.serving_id
+            for change in pending
+            if change.serving_id is not None
+        }
+        servings = (
+            Serving.objects.using(using)
+            .select_related("food")
+            .in_bulk(serving_ids)
+        )
+        if len(servings) != len(serving_ids):
+            raise Serving.DoesNotExist("Serving not found")
+        # One walk of the recipe graph serves every change of the batch.
+        dependents = (
+            RecipeDependencies.collect([recipe_id], using).recipes
+            if serving_ids
+            else frozenset()
+        )
+
+        added: list[RecipeIngredient] = []
+        updated: list[RecipeIngredient] = []
+        removed: list[int] = []
+        for change in pending:
+            if change.ingredient_id is None:
+                previous = None
+                ingredient = RecipeIngredient(recipe=recipe)
+            elif change.ingredient_id in current:
+                previous = current.pop(change.ingredient_id)
+                ingredient = copy.copy(previous)
+            else:
+                raise RecipeIngredient.DoesNotExist(
+                    "RecipeIngredient not found"
+                )
+            if change.delete:
+                removed.append(ingredient.pk)
+                continue
+            ingredient.food = servings[change.serving_id]
+            ingredient.num_servings = change.num_servings
+            # pylint: disable-next=protected-access
+            ingredient._prepare_snapshots(previous, None)
+            validate_recipe_ingredient_size(
+                ingredient, recipe, using, dependents
+            )
+            (added if previous is None else updated).append(ingredient)
+
+        if removed:
+            # Deletion signals skip aggregates; they are recomputed below.
+            with activate_recipe_aggregate_locks(
+                dataclasses.replace(locks, maintain_aggregates=False)
+            ):
+                RecipeIngredient.objects.using(using).filter(
+                    pk__in=removed
+                ).delete()
+        if updated:
+            RecipeIngredient.objects.using(using).bulk_update(
+                updated, _UPDATED_FIELDS
+            )
+        if added:
+            RecipeIngredient.objects.using(using).bulk_create(added)
+
+        if recipe.nutrients_from_ingredients:
+            apply_recipe_ingredient_totals(
+                recipe, [*current.values(), *updated, *added]
+            )
+            recipe.save(
+                using=using,
+                update_fields=NUTRIENT_LIST + ["size"],
+                _skip_aggregate_lock=True,
+            )
+    return recipe
+
+
+def _refresh_recipe_level(
+    recipe_ids: list[int], changed_food_ids: set[int], using: str
+) -> None:
+    """Re-snapshot changed ingredients of one level and rebuild it."""
+    with transaction.atomic(using=using):
+        recipes, ingredients = lock_recipe_ingredients(recipe_ids, using)
+        stale = [
+            ingredient
+            for ingredient in ingredients
+            if ingredient.food.food_id in changed_food_ids
+        ]
+        for ingredient in stale:
+            # pylint: disable-next=protected-access
+            ingredient._prepare_snapshots(None, None)
+        RecipeIngredient.objects.using(using).bulk_update(
+            stale, _UPDATED_FIELDS[2:]
+        )
+        by_recipe = defaultdict(list)
+        for ingredient in ingredients:
+            by_recipe[ingredient.recipe_id].append(ingredient)
+        for recipe_id, recipe in recipes.items():
+            if not recipe.nutrients_from_ingredients:
+                continue
+            apply_recipe_ingredient_totals(recipe, by_recipe[recipe_id])
+            recipe.save(
+                using=using,
+                update_fields=NUTRIENT_LIST + ["size"],
+                _skip_aggregate_lock=True,
+            )
+
+
+def refresh_dependent_recipes(
+    food_ids: Iterable[int], using: str = DEFAULT_DB_ALIAS
+) -> list[list[int]]:
+    """Refresh every recipe that transitively uses changed foods.
+
+    Recipes are refreshed level by level so each one reads servings its
+    sub-recipes already updated. Ingredients of changed foods take new
+    snapshots and the recipe aggregates are rebuilt. Every level is one
+    transaction.
+
+    Args:
+        food_ids (Iterable[int]): foods whose nutrients or size changed.
+        using (str): database alias to refresh.
+
+    Returns:
+        list[list[int]]: refreshed recipe IDs per level, lowest first.
+    """
+    dependencies = RecipeDependencies.collect(food_ids, using)
+    levels = dependencies.levels()
+    changed_food_ids = set(dependencies.roots)
+    for level in levels:
+        _refresh_recipe_level(level, changed_food_ids, using)
+        changed_food_ids.update(level)
+    return levels
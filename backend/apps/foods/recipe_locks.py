@@ -10,11 +10,16 @@ from django.apps import apps
 
 @dataclass(frozen=True)
 class RecipeAggregateLocks:
-    """Canonical Recipe then RecipeIngredient locks held by a writer."""
+    """Canonical Recipe then RecipeIngredient locks held by a writer.
+
+    A writer that recomputes aggregates itself once it is done clears
+    ``maintain_aggregates`` so deletions under the bundle leave them alone.
+    """
 
     using: str
     recipes_by_pk: dict[int, Any]
     ingredients: tuple[Any, ...]
+    maintain_aggregates: bool = True
 
     def covers(self, recipe_id: int, using: str) -> bool:
         """Return whether this bundle owns the requested recipe hierarchy.
@@ -28,6 +33,18 @@ class RecipeAggregateLocks:
         """
         return self.using == using and recipe_id in self.recipes_by_pk
 
+    def covers_all(self, recipe_ids: Iterable[int], using: str) -> bool:
+        """Return whether this bundle owns every requested recipe hierarchy.
+
+        Args:
+            recipe_ids (Iterable[int]): Recipe primary keys to cover.
+            using (str): Database alias on which locks must be held.
+
+        Returns:
+            bool: Whether every requested hierarchy is locked by this bundle.
+        """
+        return all(self.covers(recipe_id, using) for recipe_id in recipe_ids)
+
 
 _active_recipe_aggregate_locks: ContextVar[RecipeAggregateLocks | None] = (
     ContextVar("active_recipe_aggregate_locks", default=None)
@@ -74,8 +91,10 @@ def lock_recipe_ingredients(
     recipe_model = apps.get_model("foods", "Recipe")
     ingredient_model = apps.get_model("foods", "RecipeIngredient")
     ordered_ids = sorted(set(recipe_ids))
+    # The totals live on the parent food row, so it is locked as well and
+    # the values read here are the latest committed ones.
     recipes = list(
-        recipe_model.objects.select_for_update(of=("self",))
+        recipe_model.objects.select_for_update(of=("self", "food_ptr"))
         .using(using)
         .filter(pk__in=ordered_ids)
         .order_by("pk")
@@ -8,9 +8,10 @@ from typing import cast
 
 import strawberry
 from django.db import models, transaction
-from django.db.models import Prefetch
+from django.db.models import F
 from strawberry.types import Info
 
+from apps.foods.gtin import normalize_gtin
 from apps.foods.models import (
     CupboardItem,
     Food,
@@ -27,10 +28,16 @@ from apps.foods.models.units import (
 )
 from apps.foods.open_food_facts import (
     OpenFoodFactsProduct,
-    equivalent_gtins,
     fetch_open_food_facts_product,
-    normalize_gtin,
+    iter_open_food_facts_products,
+    open_food_facts_cache_stats,
+    open_food_facts_rate_limit_stats,
 )
+from apps.foods.recipe_ingredients import (
+    IngredientChange,
+    change_recipe_ingredients,
+)
+from apps.foods.search import FoodSearchHit, search_foods
 from apps.foods.signals.handlers.cupboard import (
     get_linked_consumed_perc,
     recalculate_consumed_perc,
@@ -41,9 +48,19 @@ from apps.libs.graphql import (
     validated_non_negative_decimal,
     validated_positive_decimal,
 )
+from apps.libs.loaders import RelationLoader
+from apps.libs.pagination import (
+    Connection,
+    empty_connection,
+    keyset_connection,
+)
+from apps.libs.projection import Column, column_values, project
 
 # pylint: disable=too-few-public-methods,too-many-lines
 
+# Most distinct barcodes a batch barcode lookup accepts.
+MAX_BARCODE_BATCH_SIZE = 50
+
 
 def _require_staff_user(info: Info) -> None:
     """Require an authenticated staff user for shared catalog writes."""
@@ -196,6 +213,72 @@ class ServingType:
         )
 
 
+def _optional_float(value: Decimal | None) -> float | None:
+    """Return a decimal as a float, or None when it is absent.
+
+    Args:
+        value (Decimal | None): decimal value to convert.
+
+    Returns:
+        float | None: the converted value, or None.
+    """
+    return float(value) if value is not None else None
+
+
+def _id(value: int) -> strawberry.ID:
+    """Return a primary key as a GraphQL ID."""
+    return strawberry.ID(str(value))
+
+
+def _food_columns(**columns: Column) -> dict[str, Column]:
+    """Return the column-backed GraphQL fields shared by every food.
+
+    Args:
+        columns (Column): extra columns of the concrete food type.
+
+    Returns:
+        dict[str, Column]: columns keyed by GraphQL type field name.
+    """
+    return {
+        "id": Column("id", _id),
+        "brand": Column("brand"),
+        "name": Column("name", default=""),
+        "size": Column("size", float, 0.0),
+        "size_unit": Column("size_unit", default=""),
+        "num_servings": Column("num_servings", float, 0.0),
+        "energy_kcal": Column("energy_kcal", float, 0.0),
+        "protein_g": Column("protein_g", float, 0.0),
+        "fat_g": Column("fat_g", float, 0.0),
+        "carbs_g": Column("carbs_g", float, 0.0),
+        "saturated_fat_g": Column("saturated_fat_g", _optional_float),
+        "sugars_g": Column("sugar_carbs_g", _optional_float),
+        "fibre_g": Column("fibre_carbs_g", _optional_float),
+        "salt_g": Column("salt_g", _optional_float),
+        **columns,
+    }
+
+
+_PRODUCT_COLUMNS = _food_columns(
+    url=Column("url"),
+    barcode=Column("barcode"),
+    notes=Column("notes", default=""),
+    nutritional_info_size=Column("nutritional_info_size", float, 0.0),
+    nutritional_info_unit=Column("nutritional_info_unit", default=""),
+)
+_RECIPE_COLUMNS = _food_columns(
+    description=Column("description", default=""),
+    nutrients_from_ingredients=Column(
+        "nutrients_from_ingredients", default=False
+    ),
+)
+
+
+_SERVINGS = RelationLoader(
+    "servings",
+    lambda: Serving.objects.select_related("food").order_by("id"),
+)
+
+
 @strawberry.type
 class FoodProductType:
     """GraphQL FoodProduct Type."""
@@ -230,7 +313,7 @@ class FoodProductType:
         """
         model = self.model
         if model is not None:
-            return [ServingType.from_model(s) for s in model.servings.all()]
+            return [ServingType.from_model(s) for s in _SERVINGS.load(model)]
         return [
             ServingType.from_model(s)
             for s in Serving.objects.filter(food_id=self.id).order_by("id")
@@ -246,40 +329,9 @@ class FoodProductType:
         Returns:
             FoodProductType: GraphQL type.
         """
-        wrapped = FoodProductType(
-            id=strawberry.ID(str(obj.id)),
-            brand=obj.brand,
-            name=obj.name,
-            url=obj.url,
-            barcode=obj.barcode,
-            notes=obj.notes,
-            nutritional_info_size=float(obj.nutritional_info_size),
-            nutritional_info_unit=obj.nutritional_info_unit,
-            size=float(obj.size),
-            size_unit=obj.size_unit,
-            num_servings=float(obj.num_servings),
-            energy_kcal=float(obj.energy_kcal),
-            protein_g=float(obj.protein_g),
-            fat_g=float(obj.fat_g),
-            carbs_g=float(obj.carbs_g),
-            saturated_fat_g=(
-                float(obj.saturated_fat_g)
-                if obj.saturated_fat_g is not None
-                else None
-            ),
-            sugars_g=(
-                float(obj.sugar_carbs_g)
-                if obj.sugar_carbs_g is not None
-                else None
-            ),
-            fibre_g=(
-                float(obj.fibre_carbs_g)
-                if obj.fibre_carbs_g is not None
-                else None
-            ),
-            salt_g=float(obj.salt_g) if obj.salt_g is not None else None,
-        )
+        wrapped = FoodProductType(**column_values(obj, _PRODUCT_COLUMNS))
         wrapped.model = obj
+        _SERVINGS.add(obj)
         return wrapped
 
 
@@ -311,6 +363,22 @@ def _requested_field_names(info: Info) -> set[str]:
     return names
 
 
+def _food_products(info: Info) -> models.QuerySet[FoodProduct]:
+    """Return food products loading only the selected columns.
+
+    Args:
+        info (Info): GraphQL execution info.
+
+    Returns:
+        models.QuerySet[FoodProduct]: unordered food products.
+    """
+    return project(
+        FoodProduct.objects.all(),
+        _requested_field_names(info),
+        _PRODUCT_COLUMNS,
+    )
+
+
 @strawberry.type
 class OpenFoodFactsProductType:
     """GraphQL Open Food Facts product draft type."""
@@ -374,16 +442,36 @@ class FoodProductBarcodeLookupType:
     open_food_facts: OpenFoodFactsProductType | None
 
 
-def _optional_float(value: Decimal | None) -> float | None:
-    """Return a decimal as a float, or None when it is absent.
+@strawberry.type
+class FoodProductBarcodeResultType:
+    """Barcode lookup result of one barcode of a batch."""
 
-    Args:
-        value (Decimal | None): decimal value to convert.
+    barcode: str
+    product: FoodProductType | None
+    open_food_facts: OpenFoodFactsProductType | None
+    error: str | None
 
-    Returns:
-        float | None: the converted value, or None.
-    """
-    return float(value) if value is not None else None
+
+@strawberry.type
+class OpenFoodFactsCacheTierType:
+    """GraphQL Open Food Facts cache tier counters type."""
+
+    tier: str
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+@strawberry.type
+class OpenFoodFactsRateLimitStatsType:
+    """GraphQL Open Food Facts quota token requests type."""
+
+    granted: int
+    rejected: int
+    lock_seconds: float
+    max_lock_seconds: float
+    wait_seconds: float
+    max_wait_seconds: float
 
 
 @strawberry.type
@@ -404,17 +492,81 @@ class FoodQuery:
         if user is None or not user.is_authenticated:
             return []
 
-        queryset = FoodProduct.objects.order_by("name")
-        if "servings" in _requested_field_names(info):
-            queryset = queryset.prefetch_related(
-                Prefetch(
-                    "servings",
-                    queryset=Serving.objects.select_related("food").order_by(
-                        "id"
-                    ),
-                )
+        return [
+            FoodProductType.from_model(fp)
+            for fp in _food_products(info).order_by("name")
+        ]
+
+    @strawberry.field
+    def food_products_connection(
+        self,
+        info: Info,
+        first: int | None = None,
+        after: str | None = None,
+        last: int | None = None,
+        before: str | None = None,
+    ) -> Connection[FoodProductType]:
+        """Get a keyset-paginated page of food products (authenticated).
+
+        Args:
+            info (Info): GraphQL execution info.
+            first (int | None): number of products after the after cursor.
+            after (str | None): cursor to page forward from.
+            last (int | None): number of products before the before cursor.
+            before (str | None): cursor to page backward from.
+
+        Returns:
+            Connection[FoodProductType]: products ordered by name.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return empty_connection()
+
+        return keyset_connection(
+            _food_products(info),
+            ("name", "id"),
+            FoodProductType.from_model,
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+        )
+
+    @strawberry.field
+    def search_foods(
+        self,
+        info: Info,
+        query: str,
+        first: int = 20,
+        after: str | None = None,
+    ) -> "FoodSearchResultsType":
+        """Search products and recipes by name, brand and tags.
+
+        Args:
+            info (Info): GraphQL execution info.
+            query (str): search text, tolerant of typos.
+            first (int): maximum number of results.
+            after (str | None): cursor of the last result already seen.
+
+        Returns:
+            FoodSearchResultsType: ranked results, best matches first.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return FoodSearchResultsType(
+                hits=[], has_next_page=False, end_cursor=None
             )
-        return [FoodProductType.from_model(fp) for fp in queryset]
+        page = search_foods(
+            query,
+            first,
+            after,
+            with_ingredients="ingredients" in _requested_field_names(info),
+        )
+        return FoodSearchResultsType(
+            hits=[FoodSearchHitType.from_hit(hit) for hit in page.hits],
+            has_next_page=page.has_next_page,
+            end_cursor=page.hits[-1].cursor if page.hits else None,
+        )
 
     @strawberry.field
     def food_product(
@@ -434,16 +586,7 @@ class FoodQuery:
             return None
 
         try:
-            return FoodProductType.from_model(
-                FoodProduct.objects.prefetch_related(
-                    Prefetch(
-                        "servings",
-                        queryset=Serving.objects.select_related(
-                            "food"
-                        ).order_by("id"),
-                    )
-                ).get(pk=id)
-            )
+            return FoodProductType.from_model(_food_products(info).get(pk=id))
         except FoodProduct.DoesNotExist:
             return None
 
@@ -477,19 +620,7 @@ class FoodQuery:
                 product=None, open_food_facts=None
             )
 
-        queryset = FoodProduct.objects.filter(
-            barcode__in=equivalent_gtins(normalized_barcode)
-        )
-        if "servings" in _requested_field_names(info):
-            queryset = queryset.prefetch_related(
-                Prefetch(
-                    "servings",
-                    queryset=Serving.objects.select_related("food").order_by(
-                        "id"
-                    ),
-                )
-            )
-        product = queryset.first()
+        product = _food_products(info).filter(gtin=normalized_barcode).first()
         if product is not None:
             return FoodProductBarcodeLookupType(
                 product=FoodProductType.from_model(product),
@@ -506,6 +637,128 @@ class FoodQuery:
             open_food_facts=OpenFoodFactsProductType.from_product(off_product),
         )
 
+    @strawberry.field
+    def food_products_by_barcodes(
+        self, info: Info, barcodes: list[str]
+    ) -> list[FoodProductBarcodeResultType]:
+        """Look several scanned barcodes up at once.
+
+        Barcodes are normalized and de-duplicated, and invalid ones are left
+        out. Local products are read in one query and take precedence. The
+        other barcodes are looked up on Open Food Facts like
+        ``foodProductByBarcode``, with cache misses fetched concurrently. A
+        failed lookup is reported on its own barcode.
+
+        Args:
+            info (Info): GraphQL execution info.
+            barcodes (list[str]): scanned product barcodes.
+
+        Returns:
+            list[FoodProductBarcodeResultType]: one result per distinct
+            valid barcode, in request order.
+
+        Raises:
+            ValueError: When too many distinct barcodes are requested.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return []
+
+        normalized_barcodes = list(
+            dict.fromkeys(
+                normalized
+                for normalized in map(normalize_gtin, barcodes)
+                if normalized is not None
+            )
+        )
+        if len(normalized_barcodes) > MAX_BARCODE_BATCH_SIZE:
+            raise ValueError(
+                f"At most {MAX_BARCODE_BATCH_SIZE} barcodes can be looked up "
+                "at once"
+            )
+
+        results = {
+            product.lookup_gtin: FoodProductBarcodeResultType(
+                barcode=product.lookup_gtin,
+                product=FoodProductType.from_model(product),
+                open_food_facts=None,
+                error=None,
+            )
+            for product in _food_products(info)
+            .filter(gtin__in=normalized_barcodes)
+            .annotate(lookup_gtin=F("gtin"))
+        }
+        misses = [
+            barcode
+            for barcode in normalized_barcodes
+            if barcode not in results
+        ]
+        for lookup in iter_open_food_facts_products(misses):
+            results[lookup.barcode] = FoodProductBarcodeResultType(
+                barcode=lookup.barcode,
+                product=None,
+                open_food_facts=(
+                    OpenFoodFactsProductType.from_product(lookup.product)
+                    if lookup.product is not None
+                    else None
+                ),
+                error=lookup.error,
+            )
+        return [results[barcode] for barcode in normalized_barcodes]
+
+    @strawberry.field
+    def open_food_facts_cache_stats(
+        self, info: Info
+    ) -> list[OpenFoodFactsCacheTierType]:
+        """Get the Open Food Facts cache hit ratios of this process.
+
+        Args:
+            info (Info): GraphQL execution info.
+
+        Returns:
+            list[OpenFoodFactsCacheTierType]: counters per cache tier.
+
+        Raises:
+            PermissionError: When the user is not staff.
+        """
+        _require_staff_user(info)
+        return [
+            OpenFoodFactsCacheTierType(
+                tier=tier,
+                hits=stats.hits,
+                misses=stats.misses,
+                hit_ratio=stats.hit_ratio,
+            )
+            for tier, stats in open_food_facts_cache_stats().items()
+        ]
+
+    @strawberry.field
+    def open_food_facts_rate_limit_stats(
+        self, info: Info
+    ) -> OpenFoodFactsRateLimitStatsType:
+        """Get the Open Food Facts quota token requests of this process.
+
+        Args:
+            info (Info): GraphQL execution info.
+
+        Returns:
+            OpenFoodFactsRateLimitStatsType: token request counters with
+            their lock and wait times.
+
+        Raises:
+            PermissionError: When the user is not staff.
+        """
+        _require_staff_user(info)
+        stats = open_food_facts_rate_limit_stats()
+        return OpenFoodFactsRateLimitStatsType(
+            granted=stats.granted,
+            rejected=stats.rejected,
+            lock_seconds=stats.lock_seconds,
+            max_lock_seconds=stats.max_lock_seconds,
+            wait_seconds=stats.wait_seconds,
+            max_wait_seconds=stats.max_wait_seconds,
+        )
+
 
 def _validated_product_num_servings(num_servings: float) -> Decimal:
     """Return a finite positive product serving count."""
@@ -940,6 +1193,14 @@ class RecipeIngredientType:
         return str(model.food)
 
 
+_INGREDIENTS = RelationLoader(
+    "ingredients",
+    lambda: RecipeIngredient.objects.select_related("food__food").order_by(
+        "id"
+    ),
+)
+
+
 @strawberry.type
 class RecipeType:
     """GraphQL Recipe Type."""
@@ -973,7 +1234,7 @@ class RecipeType:
         if model is not None:
             return [
                 RecipeIngredientType.from_model(i)
-                for i in model.ingredients.all()
+                for i in _INGREDIENTS.load(model)
             ]
         return [
             RecipeIngredientType.from_model(i)
@@ -992,40 +1253,26 @@ class RecipeType:
         Returns:
             RecipeType: GraphQL type.
         """
-        wrapped = RecipeType(
-            id=strawberry.ID(str(obj.id)),
-            brand=obj.brand,
-            name=obj.name,
-            description=obj.description,
-            nutrients_from_ingredients=obj.nutrients_from_ingredients,
-            size=float(obj.size),
-            size_unit=obj.size_unit,
-            num_servings=float(obj.num_servings),
-            energy_kcal=float(obj.energy_kcal),
-            protein_g=float(obj.protein_g),
-            fat_g=float(obj.fat_g),
-            carbs_g=float(obj.carbs_g),
-            saturated_fat_g=(
-                float(obj.saturated_fat_g)
-                if obj.saturated_fat_g is not None
-                else None
-            ),
-            sugars_g=(
-                float(obj.sugar_carbs_g)
-                if obj.sugar_carbs_g is not None
-                else None
-            ),
-            fibre_g=(
-                float(obj.fibre_carbs_g)
-                if obj.fibre_carbs_g is not None
-                else None
-            ),
-            salt_g=float(obj.salt_g) if obj.salt_g is not None else None,
-        )
+        wrapped = RecipeType(**column_values(obj, _RECIPE_COLUMNS))
         wrapped.model = obj
+        _INGREDIENTS.add(obj)
         return wrapped
 
 
+def _recipes(info: Info) -> models.QuerySet[Recipe]:
+    """Return recipes loading only the selected columns.
+
+    Args:
+        info (Info): GraphQL execution info.
+
+    Returns:
+        models.QuerySet[Recipe]: unordered recipes.
+    """
+    return project(
+        Recipe.objects.all(), _requested_field_names(info), _RECIPE_COLUMNS
+    )
+
+
 @strawberry.type
 class RecipeQuery:
     """Recipe queries."""
@@ -1043,17 +1290,43 @@ class RecipeQuery:
         user = get_request_user(info.context)
         if user is None or not user.is_authenticated:
             return []
-        queryset = Recipe.objects.order_by("name")
-        if "ingredients" in _requested_field_names(info):
-            queryset = queryset.prefetch_related(
-                Prefetch(
-                    "ingredients",
-                    queryset=RecipeIngredient.objects.select_related(
-                        "food__food"
-                    ).order_by("id"),
-                )
-            )
-        return [RecipeType.from_model(r) for r in queryset]
+        return [
+            RecipeType.from_model(r) for r in _recipes(info).order_by("name")
+        ]
+
+    @strawberry.field
+    def recipes_connection(
+        self,
+        info: Info,
+        first: int | None = None,
+        after: str | None = None,
+        last: int | None = None,
+        before: str | None = None,
+    ) -> Connection[RecipeType]:
+        """Get a keyset-paginated page of recipes (authenticated).
+
+        Args:
+            info (Info): GraphQL execution info.
+            first (int | None): number of recipes after the after cursor.
+            after (str | None): cursor to page forward from.
+            last (int | None): number of recipes before the before cursor.
+            before (str | None): cursor to page backward from.
+
+        Returns:
+            Connection[RecipeType]: recipes ordered by name.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return empty_connection()
+        return keyset_connection(
+            _recipes(info),
+            ("name", "id"),
+            RecipeType.from_model,
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+        )
 
     @strawberry.field
     def recipe(self, info: Info, id: strawberry.ID) -> RecipeType | None:
@@ -1070,20 +1343,58 @@ class RecipeQuery:
         if user is None or not user.is_authenticated:
             return None
         try:
-            return RecipeType.from_model(
-                Recipe.objects.prefetch_related(
-                    Prefetch(
-                        "ingredients",
-                        queryset=RecipeIngredient.objects.select_related(
-                            "food__food"
-                        ).order_by("id"),
-                    ),
-                ).get(pk=id)
-            )
+            return RecipeType.from_model(_recipes(info).get(pk=id))
         except Recipe.DoesNotExist:
             return None
 
 
+@strawberry.type
+class FoodSearchHitType:
+    """A ranked food search result, either a product or a recipe."""
+
+    cursor: str
+    rank: float
+    product: FoodProductType | None
+    recipe: RecipeType | None
+    servings: list[ServingType]
+
+    @staticmethod
+    def from_hit(hit: FoodSearchHit) -> "FoodSearchHitType":
+        """Create the GraphQL type from a ranked search hit.
+
+        Args:
+            hit (FoodSearchHit): ranked match with its food loaded.
+
+        Returns:
+            FoodSearchHitType: GraphQL type.
+        """
+        food = hit.food
+        return FoodSearchHitType(
+            cursor=hit.cursor,
+            rank=hit.rank,
+            product=(
+                FoodProductType.from_model(food)
+                if isinstance(food, FoodProduct)
+                else None
+            ),
+            recipe=(
+                RecipeType.from_model(food)
+                if isinstance(food, Recipe)
+                else None
+            ),
+            servings=[ServingType.from_model(s) for s in food.servings.all()],
+        )
+
+
+@strawberry.type
+class FoodSearchResultsType:
+    """A page of ranked food search results."""
+
+    hits: list[FoodSearchHitType]
+    has_next_page: bool
+    end_cursor: str | None
+
+
 def _validated_recipe_num_servings(num_servings: float) -> Decimal:
     """Return a valid positive recipe serving count."""
     return validated_positive_decimal(
@@ -1102,6 +1413,20 @@ def _validated_ingredient_num_servings(num_servings: float) -> Decimal:
     )
 
 
+@strawberry.input
+class RecipeIngredientChangeInput:
+    """One ingredient change in a batch recipe ingredient mutation.
+
+    Omit ``id`` to add an ingredient, set ``delete`` to remove one and
+    otherwise update it.
+    """
+
+    id: strawberry.ID | None = None
+    food_id: strawberry.ID | None = None
+    num_servings: float = 1.0
+    delete: bool = False
+
+
 @strawberry.type
 class RecipeMutation:
     """Recipe mutations."""
@@ -1382,6 +1707,56 @@ class RecipeMutation:
         except RecipeIngredient.DoesNotExist as e:
             raise ValueError("RecipeIngredient not found") from e
 
+    @strawberry.mutation
+    def patch_recipe_ingredients(
+        self,
+        info: Info,
+        recipe_id: strawberry.ID,
+        changes: list[RecipeIngredientChangeInput],
+    ) -> RecipeType:
+        """Add, update and remove many recipe ingredients at once.
+
+        Args:
+            info (Info): GraphQL execution info.
+            recipe_id (strawberry.ID): recipe ID.
+            changes (list[RecipeIngredientChangeInput]): ingredient changes.
+
+        Returns:
+            RecipeType: the recipe with its recomputed aggregates.
+
+        Raises:
+            PermissionError: if user is not authenticated.
+            ValueError: if the recipe, an ingredient or a food is not found.
+        """
+        _require_staff_user(info)
+        validated = [
+            IngredientChange(
+                ingredient_id=None if change.id is None else int(change.id),
+                serving_id=(
+                    None if change.food_id is None else int(change.food_id)
+                ),
+                num_servings=(
+                    Decimal("1")
+                    if change.delete
+                    else _validated_ingredient_num_servings(
+                        change.num_servings
+                    )
+                ),
+                delete=change.delete,
+            )
+            for change in changes
+        ]
+
+        try:
+            recipe = change_recipe_ingredients(int(recipe_id), validated)
+        except Recipe.DoesNotExist as e:
+            raise ValueError("Recipe not found") from e
+        except RecipeIngredient.DoesNotExist as e:
+            raise ValueError("RecipeIngredient not found") from e
+        except Serving.DoesNotExist as e:
+            raise ValueError("Serving not found") from e
+        return RecipeType.from_model(recipe)
+
 
 @strawberry.type
 class CupboardItemType:
@@ -1465,6 +1840,40 @@ class CupboardQuery:
             )
         ]
 
+    @strawberry.field
+    def cupboard_items_connection(
+        self,
+        info: Info,
+        first: int | None = None,
+        after: str | None = None,
+        last: int | None = None,
+        before: str | None = None,
+    ) -> Connection[CupboardItemType]:
+        """Get a keyset-paginated page of cupboard items (authenticated).
+
+        Args:
+            info (Info): GraphQL execution info.
+            first (int | None): number of items after the after cursor.
+            after (str | None): cursor to page forward from.
+            last (int | None): number of items before the before cursor.
+            before (str | None): cursor to page backward from.
+
+        Returns:
+            Connection[CupboardItemType]: items, latest purchases first.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return empty_connection()
+        return keyset_connection(
+            CupboardItem.objects.filter(owner=user),
+            ("-purchased_at", "-id"),
+            CupboardItemType.from_model,
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+        )
+
     @strawberry.field
     def cupboard_item(
         self, info: Info, id: strawberry.ID
@@ -0,0 +1,281 @@
+"""Ranked full-text and trigram search over the food catalog."""
+
+import base64
+import binascii
+from dataclasses import dataclass
+from functools import cache
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connection, connections
+from django.db.models import (
+    Case,
+    Expression,
+    FloatField,
+    Prefetch,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest
+
+from apps.foods.models import (
+    Food,
+    FoodProduct,
+    Recipe,
+    RecipeIngredient,
+    Serving,
+)
+
+SEARCH_CONFIG = "simple"
+MAX_SEARCH_RESULTS = 50
+CURSOR_PREFIX = "offset:"
+
+
+@dataclass(frozen=True)
+class FoodSearchHit:
+    """A ranked catalog match with its concrete food loaded."""
+
+    food: FoodProduct | Recipe
+    rank: float
+    cursor: str
+
+
+@dataclass(frozen=True)
+class FoodSearchPage:
+    """One page of ranked catalog matches."""
+
+    hits: list[FoodSearchHit]
+    has_next_page: bool
+
+
+def search_vector() -> SearchVector:
+    """Return the document indexed for full-text food search.
+
+    The expression matches the GIN index created by the search migration,
+    so PostgreSQL can answer the match from the index.
+
+    Returns:
+        SearchVector: name and brand document.
+    """
+    return SearchVector("name", "brand", config=SEARCH_CONFIG)
+
+
+def encode_cursor(offset: int) -> str:
+    """Return the opaque cursor of the result at an offset.
+
+    Args:
+        offset (int): zero-based position of the result.
+
+    Returns:
+        str: opaque pagination cursor.
+    """
+    return base64.urlsafe_b64encode(
+        f"{CURSOR_PREFIX}{offset}".encode()
+    ).decode()
+
+
+def decode_cursor(cursor: str | None) -> int:
+    """Return the offset following an opaque cursor.
+
+    Args:
+        cursor (str | None): cursor of the last result already seen.
+
+    Returns:
+        int: zero-based offset of the next result.
+
+    Raises:
+        ValueError: when the cursor was not issued by this search.
+    """
+    if cursor is None:
+        return 0
+    try:
+        decoded = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    offset = decoded.removeprefix(CURSOR_PREFIX)
+    if offset == decoded or not offset.isdigit():
+        raise ValueError("Invalid cursor")
+    return int(offset) + 1
+
+
+def full_text_search_enabled() -> bool:
+    """Return whether the database supports full-text search.
+
+    Returns:
+        bool: True on PostgreSQL, the only backend with tsvector matching.
+    """
+    return connection.vendor == "postgresql"
+
+
+@cache
+def _pg_trgm_installed(alias: str) -> bool:
+    """Return whether a PostgreSQL database has the pg_trgm extension.
+
+    Migrations install the extension, so it is probed once per database
+    and process rather than on every search.
+    """
+    with connections[alias].cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS ("
+            "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+        )
+        row = cursor.fetchone()
+    return bool(row and row[0])
+
+
+def trigram_search_enabled() -> bool:
+    """Return whether the pg_trgm extension is installed.
+
+    Returns:
+        bool: True when trigram operators and indexes are available.
+    """
+    return full_text_search_enabled() and _pg_trgm_installed(connection.alias)
+
+
+def _substring_ranked_foods(query: str) -> QuerySet[Food]:
+    """Return foods whose name, brand or tags contain the query.
+
+    Databases without full-text search rank name and brand matches above
+    tag matches.
+    """
+    in_name_or_brand = Q(name__icontains=query) | Q(brand__icontains=query)
+    return (
+        Food.objects.filter(
+            pk__in=Food.objects.filter(
+                in_name_or_brand | Q(tags__name__icontains=query)
+            ).values("pk")
+        )
+        .annotate(
+            rank=Case(
+                When(in_name_or_brand, then=Value(1.0)),
+                default=Value(0.0),
+                output_field=FloatField(),
+            )
+        )
+        .order_by("-rank", "pk")
+    )
+
+
+def ranked_foods(query: str) -> QuerySet[Food]:
+    """Return foods matching a query, best matches first.
+
+    Names and brands match through the full-text index, and through
+    typo-tolerant trigram word similarity when pg_trgm is installed.
+    Without it, substring matching keeps search usable, unindexed. Each
+    match source is a separate branch of a union so PostgreSQL can answer
+    every branch from its own index before ranking the matches. Other
+    databases only match substrings.
+
+    Args:
+        query (str): user search text.
+
+    Returns:
+        QuerySet[Food]: matches annotated with their rank.
+    """
+    if not full_text_search_enabled():
+        return _substring_ranked_foods(query)
+
+    search_query = SearchQuery(
+        query, config=SEARCH_CONFIG, search_type="websearch"
+    )
+    lookup = (
+        "trigram_word_similar" if trigram_search_enabled() else "icontains"
+    )
+    matches = (
+        Food.objects.annotate(document=search_vector())
+        .filter(document=search_query)
+        .values("pk")
+        .union(
+            *(
+                Food.objects.filter(**{f"{field}__{lookup}": query}).values(
+                    "pk"
+                )
+                for field in ("name", "brand", "tags__name")
+            )
+        )
+    )
+    rank: Expression = SearchRank(search_vector(), search_query)
+    if lookup == "trigram_word_similar":
+        rank = rank + Greatest(
+            TrigramWordSimilarity(query, "name"),
+            TrigramWordSimilarity(query, Coalesce("brand", Value(""))),
+        )
+    return (
+        Food.objects.filter(pk__in=matches)
+        .annotate(rank=rank)
+        .order_by("-rank", "pk")
+    )
+
+
+def search_foods(
+    query: str,
+    first: int,
+    after: str | None = None,
+    *,
+    with_ingredients: bool = False,
+) -> FoodSearchPage:
+    """Return one page of ranked products and recipes with servings.
+
+    The page costs a constant number of queries: one ranked id lookup,
+    then the products and recipes on the page with their servings.
+
+    Args:
+        query (str): user search text.
+        first (int): maximum number of results.
+        after (str | None): cursor of the last result already seen.
+        with_ingredients (bool): whether to prefetch recipe ingredients.
+
+    Returns:
+        FoodSearchPage: ranked results and whether more follow.
+
+    Raises:
+        ValueError: when the page size or cursor is invalid.
+    """
+    if not 1 <= first <= MAX_SEARCH_RESULTS:
+        raise ValueError(f"first must be between 1 and {MAX_SEARCH_RESULTS}")
+    offset = decode_cursor(after)
+    query = query.strip()
+    if not query:
+        return FoodSearchPage(hits=[], has_next_page=False)
+
+    # The stubs cannot see the rank annotation of the returned queryset.
+    ranked_rows = ranked_foods(query).values_list(  # type: ignore[misc]
+        "pk", "rank"
+    )
+    end = offset + first + 1
+    ranked = list(ranked_rows[offset:end])
+    page = ranked[:first]
+    ids = [pk for pk, _rank in page]
+    servings = Prefetch("servings", queryset=Serving.objects.order_by("id"))
+    recipes = Recipe.objects.prefetch_related(servings)
+    if with_ingredients:
+        recipes = recipes.prefetch_related(
+            Prefetch(
+                "ingredients",
+                queryset=RecipeIngredient.objects.select_related(
+                    "food__food"
+                ).order_by("id"),
+            )
+        )
+    foods: dict[int, FoodProduct | Recipe] = {
+        **FoodProduct.objects.prefetch_related(servings).in_bulk(ids),
+        **recipes.in_bulk(ids),
+    }
+    return FoodSearchPage(
+        hits=[
+            FoodSearchHit(
+                food=foods[pk],
+                rank=float(rank),
+                cursor=encode_cursor(offset + position),
+            )
+            for position, (pk, rank) in enumerate(page)
+            if pk in foods
+        ],
+        has_next_page=len(ranked) > first,
+    )
@@ -19,12 +19,8 @@ from apps.foods.models import (
     Recipe,
     Serving,
 )
-from apps.foods.models.units import (
-    UNIT_CONTAINER,
-    UNIT_SERVING,
-    UNIT_UNIT,
-    UREG,
-)
+from apps.foods.models.conversions import convert
+from apps.foods.models.units import UNIT_CONTAINER, UNIT_SERVING, UNIT_UNIT
 from apps.libs.utils import round_no_trailing_zeros
 from apps.plans.models import Intake
 
@@ -71,14 +67,28 @@ def _get_consumed_perc(
             )
         converted_amount = consumed_amount
     else:
-        converted_amount = (
-            UREG.Quantity(consumed_amount * UREG(consumed_unit))
-            .to(stock_unit)
-            .m
+        converted_amount = convert(
+            Decimal(str(consumed_amount)), consumed_unit, stock_unit
         )
     return converted_amount * 100 / Decimal(str(food.size))
 
 
+def get_consumption_perc(consumption: CupboardItemConsumption) -> Decimal:
+    """Get the share of its cupboard item a new consumption takes.
+
+    Args:
+        consumption (CupboardItemConsumption): consumption of a loaded item.
+
+    Returns:
+        Decimal: consumed percentage, rounded as it is stored.
+    """
+    return round_no_trailing_zeros(
+        _get_consumed_perc(
+            consumption.item.food, *consumption.resolved_consumed_snapshot
+        )
+    )
+
+
 def get_linked_consumed_perc(cupboard_item: CupboardItem) -> Decimal:
     """Return the percentage consumed by linked recipes and intakes.
 
@@ -455,13 +465,5 @@ def control_finished_items(
     if instance.id is not None:
         return
 
-    consumed_perc = _get_consumed_perc(
-        cupboard_item.food,
-        *instance.resolved_consumed_snapshot,
-    )
-
-    if (
-        cupboard_item.consumed_perc + round_no_trailing_zeros(consumed_perc)
-        > 100
-    ):
+    if cupboard_item.consumed_perc + get_consumption_perc(instance) > 100:
         raise CupboardItemConsumptionTooBigError()
@@ -5,8 +5,7 @@ from typing import Any
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from apps.foods.models import Food, FoodProduct, Serving
-from apps.foods.models.units import UNIT_CONTAINER, UNIT_SERVING
+from apps.foods.models import FoodProduct, Serving
 
 
 @receiver(post_save, sender=FoodProduct)
@@ -18,6 +17,8 @@ def add_default_servings(
 ) -> None:
     """Add default servings.
 
+    The servings are derived in memory and inserted in a single statement.
+
     Args:
         sender (FoodProduct): signal sender.
         instance (FoodProduct): instance to be saved.
@@ -27,33 +28,10 @@ def add_default_servings(
     if not created:
         return
 
-    food = Food.objects.get(id=instance.id)
-
-    Serving.objects.create(
-        food=food,
-        serving_size=food.nutritional_info_size,
-        serving_unit=food.nutritional_info_unit,
-    )
-
-    if food.nutritional_info_size != 1:
-        Serving.objects.create(
-            food=food,
-            serving_size=1,
-            serving_unit=food.nutritional_info_unit,
-        )
+    # Re-read so derived nutrients use the persisted decimal precision.
+    food = FoodProduct.objects.get(id=instance.id)
 
-    Serving.objects.create(
-        food=food,
-        serving_size=1,
-        serving_unit=UNIT_CONTAINER,
-    )
-
-    if food.num_servings > 1:
-        Serving.objects.create(
-            food=food,
-            serving_size=1,
-            serving_unit=UNIT_SERVING,
-        )
+    Serving.objects.bulk_create(Serving.defaults_for(food))
 
 
 @receiver(post_save, sender=FoodProduct)
@@ -65,16 +43,22 @@ def update_servings_on_nutritional_change(
 ) -> None:
     """Update servings on a nutritional change.
 
+    Saves that leave every nutritional and size field untouched skip the
+    servings entirely. Otherwise every serving is projected in memory and
+    written back with a single bulk update.
+
     Args:
         sender (FoodProduct): signal sender.
         instance (FoodProduct): instance to be saved.
         created (bool): whether is created or not.
         kwargs (Any): keyword arguments.
     """
-    if created:
+    if created or not instance.serving_source_changed(
+        kwargs.get("update_fields")
+    ):
+        instance.capture_serving_source_values()
         return
 
-    food = Food.objects.get(id=instance.id)
-
-    for serving in food.servings.all():
-        serving.save()
+    # Re-read so projections use the persisted decimal precision.
+    Serving.rederive_for([FoodProduct.objects.get(id=instance.id)])
+    instance.capture_serving_source_values()
@@ -1,20 +1,30 @@
 """Recipe aggregate locking, validation, and signal handlers."""
 
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Iterable, cast
+from typing import Any, Iterable
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, transaction
 from django.db.models.signals import post_delete, pre_delete, pre_save
 from django.dispatch import receiver
 from pint.errors import DimensionalityError, UndefinedUnitError
 
 from apps.foods.models import Recipe, RecipeIngredient
+from apps.foods.models.conversions import convert
+from apps.foods.models.nutrient_vector import (
+    NutrientVector,
+    copy_nutrients,
+    decimal_bounds,
+)
 from apps.foods.models.nutrients import NUTRIENT_LIST
-from apps.foods.models.units import UNIT_CONTAINER, UNIT_SERVING, UREG
+from apps.foods.models.units import UNIT_CONTAINER, UNIT_SERVING
+from apps.foods.recipe_graph import validate_acyclic_ingredient
 from apps.foods.recipe_locks import (
     get_recipe_aggregate_locks,
     lock_recipe_aggregate_rows,
+    lock_recipe_ingredients,
 )
 
 CONTEXTUAL_UNITS = {UNIT_CONTAINER, UNIT_SERVING}
@@ -46,12 +56,9 @@ def validate_derived_decimal(
     Raises:
         ValidationError: If the value exceeds destination-field precision.
     """
-    field = cast(
-        models.DecimalField, destination_model._meta.get_field(field_name)
-    )
     normalized = value.normalize() if value else Decimal("0")
     try:
-        return field.clean(normalized, None)
+        return decimal_bounds(destination_model, field_name).check(normalized)
     except ValidationError as error:
         label = _camel_case(field_name)
         if field_name == "size_snapshot":
@@ -61,6 +68,28 @@ def validate_derived_decimal(
         ) from error
 
 
+def validate_derived_nutrients(
+    values: NutrientVector,
+    destination_model: type[Recipe] | type[RecipeIngredient],
+    scope: str,
+) -> NutrientVector:
+    """Validate derived nutrients against their persisted decimal fields.
+
+    Args:
+        values (NutrientVector): Derived nutrients to validate.
+        destination_model (type): Model whose fields will persist them.
+        scope (str): Stable validation-message prefix.
+
+    Returns:
+        NutrientVector: Validated normalized nutrients.
+    """
+    return values.map(
+        lambda nutrient, value: validate_derived_decimal(
+            value, destination_model, nutrient, scope
+        )
+    )
+
+
 def synchronize_recipe_aggregates(
     source: Recipe, target: Recipe | None
 ) -> bool:
@@ -75,8 +104,8 @@ def synchronize_recipe_aggregates(
     """
     if target is None or target.pk != source.pk:
         return False
-    for field in NUTRIENT_LIST + ["size"]:
-        setattr(target, field, getattr(source, field))
+    copy_nutrients(source, target)
+    target.size = source.size
     return True
 
 
@@ -88,29 +117,73 @@ def _size_in_recipe_unit(
     if source_unit in CONTEXTUAL_UNITS or recipe.size_unit in CONTEXTUAL_UNITS:
         raise ValidationError("Recipe ingredient size units must be concrete")
     try:
-        converted = UREG.Quantity(ingredient.size, source_unit).to(
-            recipe.size_unit
+        return convert(
+            Decimal(str(ingredient.size)), source_unit, recipe.size_unit
         )
     except (DimensionalityError, UndefinedUnitError) as error:
         raise ValidationError(
             "Recipe ingredient size unit is incompatible with the recipe unit"
         ) from error
-    return Decimal(str(converted.magnitude))
 
 
 def validate_recipe_ingredient_size(
-    ingredient: RecipeIngredient, recipe: Recipe
+    ingredient: RecipeIngredient,
+    recipe: Recipe,
+    using: str = DEFAULT_DB_ALIAS,
+    dependents: frozenset[int] | None = None,
 ) -> None:
-    """Reject an ingredient that cannot contribute to an enabled aggregate.
+    """Reject an ingredient that cannot contribute to its recipe.
+
+    The ingredient must not nest the recipe inside itself and, for an
+    enabled aggregate, its size must convert to the recipe unit.
 
     Args:
         ingredient (RecipeIngredient): proposed ingredient state.
         recipe (Recipe): authoritative target recipe.
+        using (str): database alias used by the mutation.
+        dependents (frozenset[int] | None): recipes using the recipe, when
+            already collected for a batch.
     """
+    validate_acyclic_ingredient(
+        recipe.pk, ingredient.food.food_id, using, dependents
+    )
     if recipe.nutrients_from_ingredients:
         _size_in_recipe_unit(ingredient, recipe)
 
 
+def _ingredient_contribution(
+    ingredient: RecipeIngredient, recipe: Recipe
+) -> tuple[Decimal, NutrientVector]:
+    """Return the validated size and nutrients one ingredient adds."""
+    size = validate_derived_decimal(
+        _size_in_recipe_unit(ingredient, recipe), Recipe, "size", "Recipe"
+    )
+    return size, validate_derived_nutrients(
+        NutrientVector.load(ingredient), Recipe, "Recipe"
+    )
+
+
+def _ingredient_totals(
+    recipe: Recipe, ingredients: Iterable[RecipeIngredient]
+) -> tuple[Decimal, NutrientVector]:
+    """Return the validated size and nutrients of a full rebuild."""
+    contributions = [
+        _ingredient_contribution(ingredient, recipe)
+        for ingredient in ingredients
+    ]
+    total_size = validate_derived_decimal(
+        sum((size for size, _ in contributions), Decimal("0")),
+        Recipe,
+        "size",
+        "Recipe",
+    )
+    return total_size, validate_derived_nutrients(
+        NutrientVector.sum(nutrients for _, nutrients in contributions),
+        Recipe,
+        "Recipe",
+    )
+
+
 def apply_recipe_ingredient_totals(
     recipe: Recipe, ingredients: Iterable[RecipeIngredient]
 ) -> None:
@@ -122,37 +195,8 @@ def apply_recipe_ingredient_totals(
     """
     if not recipe.nutrients_from_ingredients:
         return
-    totals = {nutrient: Decimal("0") for nutrient in NUTRIENT_LIST}
-    total_size = Decimal("0")
-    for ingredient in ingredients:
-        size_contribution = validate_derived_decimal(
-            _size_in_recipe_unit(ingredient, recipe),
-            Recipe,
-            "size",
-            "Recipe",
-        )
-        total_size = validate_derived_decimal(
-            total_size + size_contribution,
-            Recipe,
-            "size",
-            "Recipe",
-        )
-        for nutrient in NUTRIENT_LIST:
-            contribution = validate_derived_decimal(
-                getattr(ingredient, nutrient) or Decimal("0"),
-                Recipe,
-                nutrient,
-                "Recipe",
-            )
-            totals[nutrient] = validate_derived_decimal(
-                totals[nutrient] + contribution,
-                Recipe,
-                nutrient,
-                "Recipe",
-            )
-    recipe.size = total_size
-    for nutrient, value in totals.items():
-        setattr(recipe, nutrient, value)
+    recipe.size, nutrients = _ingredient_totals(recipe, ingredients)
+    nutrients.store(recipe)
 
 
 def recompute_recipe_nutrients(recipe: Recipe, using: str) -> None:
@@ -178,6 +222,140 @@ def recompute_recipe_nutrients(recipe: Recipe, using: str) -> None:
     )
 
 
+def _has_snapshots(ingredient: RecipeIngredient) -> bool:
+    """Return whether an ingredient's contribution needs no serving read."""
+    return (
+        ingredient.size_snapshot is not None
+        and ingredient.size_snapshot_unit is not None
+    )
+
+
+def apply_recipe_ingredient_delta(
+    recipe: Recipe,
+    removed: RecipeIngredient | None,
+    added: RecipeIngredient | None,
+    using: str,
+) -> None:
+    """Move a locked recipe's totals from one ingredient state to another.
+
+    Only the difference between the removed and added snapshots is applied
+    to the stored totals, so a change costs the same for any recipe size.
+    Rows without snapshots, totals the delta would push out of range and
+    disabled incremental maintenance fall back to a full rebuild.
+
+    Args:
+        recipe (Recipe): authoritative locked recipe instance.
+        removed (RecipeIngredient | None): previous ingredient state, if any.
+        added (RecipeIngredient | None): saved ingredient state, if any.
+        using (str): database alias used by the mutation.
+    """
+    if not recipe.nutrients_from_ingredients:
+        return
+    if not settings.RECIPE_AGGREGATES_INCREMENTAL or (
+        removed is not None and not _has_snapshots(removed)
+    ):
+        recompute_recipe_nutrients(recipe, using)
+        return
+    size = recipe.size
+    nutrients = NutrientVector.load(recipe)
+    if added is not None:
+        added_size, added_nutrients = _ingredient_contribution(added, recipe)
+        size += added_size
+        nutrients += added_nutrients
+    try:
+        if removed is not None:
+            removed_size, removed_nutrients = _ingredient_contribution(
+                removed, recipe
+            )
+            size -= removed_size
+            nutrients -= removed_nutrients
+        size = validate_derived_decimal(size, Recipe, "size", "Recipe")
+        nutrients = validate_derived_nutrients(nutrients, Recipe, "Recipe")
+    except ValidationError:
+        # The stored totals no longer match their ingredients; rebuild them.
+        recompute_recipe_nutrients(recipe, using)
+        return
+    recipe.size = size
+    nutrients.store(recipe)
+    recipe.save(
+        using=using,
+        update_fields=NUTRIENT_LIST + ["size"],
+        _skip_aggregate_lock=True,
+    )
+
+
+@dataclass(frozen=True)
+class RecipeAggregateDrift:
+    """Stored recipe totals that differ from a full ingredient rebuild."""
+
+    recipe_id: int
+    fields: tuple[str, ...]
+
+
+def _drifted_fields(
+    recipe: Recipe, size: Decimal, nutrients: NutrientVector
+) -> tuple[str, ...]:
+    """Return the aggregate fields whose stored value differs."""
+    stored = NutrientVector.load(recipe).values
+    drifted = [
+        nutrient
+        for nutrient, current, expected in zip(
+            NUTRIENT_LIST, stored, nutrients.values
+        )
+        if current != expected
+    ]
+    if recipe.size != size:
+        drifted.append("size")
+    return tuple(drifted)
+
+
+def verify_recipe_aggregates(
+    recipe_ids: Iterable[int] | None = None,
+    using: str = "default",
+    repair: bool = False,
+) -> list[RecipeAggregateDrift]:
+    """Compare maintained recipe totals with full rebuilds.
+
+    Each recipe is locked and checked in its own short transaction, so the
+    verifier can run periodically alongside normal writes.
+
+    Args:
+        recipe_ids (Iterable[int] | None): recipes to check, all enabled
+            recipes when omitted.
+        using (str): database alias to check.
+        repair (bool): whether to overwrite drifted totals with the rebuild.
+
+    Returns:
+        list[RecipeAggregateDrift]: recipes whose stored totals drifted.
+    """
+    candidates = Recipe.objects.using(using).filter(
+        nutrients_from_ingredients=True
+    )
+    if recipe_ids is not None:
+        candidates = candidates.filter(pk__in=list(recipe_ids))
+    drifts = []
+    for recipe_id in candidates.order_by("pk").values_list("pk", flat=True):
+        with transaction.atomic(using=using):
+            recipes, ingredients = lock_recipe_ingredients([recipe_id], using)
+            recipe = recipes.get(recipe_id)
+            if recipe is None or not recipe.nutrients_from_ingredients:
+                continue
+            size, nutrients = _ingredient_totals(recipe, ingredients)
+            fields = _drifted_fields(recipe, size, nutrients)
+            if not fields:
+                continue
+            drifts.append(RecipeAggregateDrift(recipe_id, fields))
+            if repair:
+                recipe.size = size
+                nutrients.store(recipe)
+                recipe.save(
+                    using=using,
+                    update_fields=NUTRIENT_LIST + ["size"],
+                    _skip_aggregate_lock=True,
+                )
+    return drifts
+
+
 def increase_recipe_nutrients(
     sender: RecipeIngredient,  # pylint: disable=unused-argument
     instance: RecipeIngredient,
@@ -229,7 +407,7 @@ def decrease_recipe_nutrients(
     using: str,
     **kwargs: Any,
 ) -> None:
-    """Rebuild the recipe after the locked ingredient deletion.
+    """Remove the deleted ingredient from the locked recipe's totals.
 
     Args:
         sender (RecipeIngredient): signal sender.
@@ -237,8 +415,11 @@ def decrease_recipe_nutrients(
         using (str): database alias used by the mutation.
         kwargs (Any): additional signal arguments.
     """
+    locks = get_recipe_aggregate_locks()
+    if locks is not None and not locks.maintain_aggregates:
+        return
     recipe = getattr(instance, "_locked_recipe", instance.recipe)
-    recompute_recipe_nutrients(recipe, using)
+    apply_recipe_ingredient_delta(recipe, instance, None, using)
     synchronize_recipe_aggregates(
         recipe, getattr(instance, "_aggregate_observer", None)
     )
@@ -5,7 +5,7 @@ from typing import Any
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from apps.foods.models import Food, Recipe, Serving
+from apps.foods.models import Recipe, Serving
 from apps.foods.models.units import UNIT_SERVING
 
 
@@ -28,13 +28,12 @@ def add_recipe_serving(
     if not created:
         return
 
-    food = Food.objects.get(id=instance.id)
+    # Re-read so derived nutrients use the persisted decimal precision.
+    food = Recipe.objects.get(id=instance.id)
 
-    Serving.objects.create(
-        food=food,
-        serving_size=1,
-        serving_unit=UNIT_SERVING,
-    )
+    serving = Serving(food=food, serving_size=1, serving_unit=UNIT_SERVING)
+    serving.derive_nutrients()
+    Serving.objects.bulk_create([serving])
 
 
 @receiver(post_save, sender=Recipe)
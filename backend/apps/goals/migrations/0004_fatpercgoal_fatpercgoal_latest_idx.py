@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("goals", "0003_alter_fatpercgoal_body_fat_perc"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="fatpercgoal",
+            index=models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="fatpercgoal_latest_idx",
+            ),
+        ),
+    ]
@@ -27,6 +27,17 @@ class FatPercGoal(BaseModel):
         help_text="Body fat percentage goal.",
     )
 
+    class Meta(BaseModel.Meta):
+        """Fat percentage goal database metadata."""
+
+        abstract = False
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="fatpercgoal_latest_idx",
+            )
+        ]
+
     def get_weeks_to_goal(self, cutting_kcals_week: int) -> Decimal:
         """Get weeks to goal.
 
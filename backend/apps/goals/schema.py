@@ -7,6 +7,11 @@ from strawberry.types import Info
 
 from apps.goals.models import FatPercGoal
 from apps.libs.graphql import get_request_user, validated_percentage_decimal
+from apps.libs.pagination import (
+    Connection,
+    empty_connection,
+    keyset_connection,
+)
 
 
 @strawberry.type
@@ -59,6 +64,41 @@ class GoalQuery:
             ).order_by("-created_at")
         ]
 
+    @strawberry.field
+    def fat_perc_goals_connection(
+        self,
+        info: Info,
+        first: int | None = None,
+        after: str | None = None,
+        last: int | None = None,
+        before: str | None = None,
+    ) -> Connection[FatPercGoalType]:
+        """Get a keyset-paginated page of fat percentage goals for the current user.
+
+        Args:
+            info (Info): GraphQL execution info.
+            first (int | None): number of goals after the after cursor.
+            after (str | None): cursor to page forward from.
+            last (int | None): number of goals before the before cursor.
+            before (str | None): cursor to page backward from.
+
+        Returns:
+            Connection[FatPercGoalType]: fat percentage goals, latest first.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return empty_connection()
+
+        return keyset_connection(
+            FatPercGoal.objects.filter(user=user),
+            ("-created_at", "-id"),
+            FatPercGoalType.from_model,
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+        )
+
     @strawberry.field
     def fat_perc_goal(
         self, info: Info, id: strawberry.ID
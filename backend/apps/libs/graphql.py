@@ -1,11 +1,14 @@
 """Shared helpers for GraphQL request contexts."""
 
 import math
+from collections.abc import Iterable
 from decimal import Decimal
 from typing import Any
 
 from django.core.exceptions import ValidationError
 from django.db import models
+from strawberry.types import Info
+from strawberry.types.nodes import FragmentSpread, InlineFragment, Selection
 
 
 def validated_decimal_field(
@@ -126,3 +129,29 @@ def get_request_user(context: Any) -> Any:
     if user is None or not user.is_authenticated:
         return None
     return user
+
+
+def requested_field_names(info: Info) -> set[str]:
+    """Return the GraphQL field names selected on the current field's type.
+
+    Named and inline fragments on the type are followed, while the fields
+    selected below a nested field are not the current type's fields.
+
+    Args:
+        info (Info): GraphQL execution info.
+
+    Returns:
+        set[str]: names of selected fields on the current type.
+    """
+    names: set[str] = set()
+
+    def _visit(selections: Iterable[Selection]) -> None:
+        for selection in selections:
+            if isinstance(selection, (FragmentSpread, InlineFragment)):
+                _visit(selection.selections)
+            else:
+                names.add(selection.name)
+
+    for field in info.selected_fields:
+        _visit(field.selections)
+    return names
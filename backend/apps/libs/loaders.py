@@ -0,0 +1,131 @@
+"""Request-scoped batch loaders for nested GraphQL relations."""
+
+from collections.abc import Callable, Iterator
+from contextvars import ContextVar
+from typing import Any
+
+from django.db.models import (
+    Model,
+    Prefetch,
+    QuerySet,
+    prefetch_related_objects,
+)
+from strawberry.extensions import SchemaExtension
+
+_pending: ContextVar[dict["BatchLoader", list[Model]] | None] = ContextVar(
+    "relation_loader_pending", default=None
+)
+
+
+class RelationLoaderExtension(SchemaExtension):
+    """Scope relation loader batches to one GraphQL operation."""
+
+    def on_operation(self) -> Iterator[None]:
+        """Start an empty batch for the operation and drop it afterwards.
+
+        Yields:
+            None: while the operation executes.
+        """
+        token = _pending.set({})
+        yield
+        _pending.reset(token)
+
+
+class BatchLoader:
+    """Load something for every instance of an operation at once.
+
+    Instances are queued as their GraphQL types are built. The first one
+    whose value is resolved loads it for the whole queue with one call, so
+    a field costs the same however many instances the query returns.
+    Instances that already hold the value are skipped.
+    """
+
+    def __init__(
+        self,
+        is_loaded: Callable[[Any], bool],
+        load_batch: Callable[[list[Any]], None],
+    ) -> None:
+        """Initialise the loader.
+
+        Args:
+            is_loaded (Callable[[Any], bool]): whether an instance holds
+                the value already.
+            load_batch (Callable[[list[Any]], None]): stores the value on
+                every instance of a batch.
+        """
+        self.is_loaded = is_loaded
+        self.load_batch = load_batch
+
+    def add(self, instance: Model) -> None:
+        """Queue an instance for the next batched load.
+
+        Outside of a GraphQL operation this is a no-op and instances load
+        their value on their own.
+
+        Args:
+            instance (Model): model instance.
+        """
+        pending = _pending.get()
+        if pending is None or self.is_loaded(instance):
+            return
+        pending.setdefault(self, []).append(instance)
+
+    def ensure_loaded(self, instance: Model) -> None:
+        """Load an instance's value with its batch unless it holds one.
+
+        Args:
+            instance (Model): model instance.
+        """
+        if self.is_loaded(instance):
+            return
+        pending = _pending.get()
+        batch = pending.pop(self, []) if pending is not None else []
+        if not any(queued is instance for queued in batch):
+            batch.append(instance)
+        self.load_batch(batch)
+
+
+class RelationLoader(BatchLoader):
+    """Batch one reverse relation across every parent of an operation.
+
+    The first parent whose relation is resolved loads it for the whole
+    queue with a single IN query keyed on the parent IDs, so nested fields
+    cost one query per relation and batch however the query is shaped,
+    including aliases and fragments. Parents whose relation was already
+    prefetched are skipped.
+    """
+
+    def __init__(self, lookup: str, queryset: Callable[[], QuerySet]) -> None:
+        """Initialise the loader.
+
+        Args:
+            lookup (str): reverse relation name on the parent model.
+            queryset (Callable[[], QuerySet]): builds the related rows
+                queryset, including their ordering.
+        """
+        super().__init__(self._is_loaded, self._prefetch)
+        self.lookup = lookup
+        self.queryset = queryset
+
+    def _is_loaded(self, instance: Model) -> bool:
+        """Return whether the relation is cached on a parent."""
+        cache = getattr(instance, "_prefetched_objects_cache", {})
+        return self.lookup in cache
+
+    def _prefetch(self, batch: list[Model]) -> None:
+        """Prefetch the relation of a batch of parents."""
+        prefetch_related_objects(
+            batch, Prefetch(self.lookup, queryset=self.queryset())
+        )
+
+    def load(self, instance: Model) -> list[Any]:
+        """Return a parent's related rows, loading its batch if needed.
+
+        Args:
+            instance (Model): parent model instance.
+
+        Returns:
+            list[Any]: related rows in the queryset ordering.
+        """
+        self.ensure_loaded(instance)
+        return list(getattr(instance, self.lookup).all())
@@ -0,0 +1,241 @@
+"""Keyset-paginated Relay connections for GraphQL list resolvers."""
+
+import base64
+import binascii
+import datetime
+import json
+from collections.abc import Callable, Sequence
+from typing import Any, Generic, TypeVar
+
+import strawberry
+from django.core.exceptions import ValidationError
+from django.db.models import F, Model, Q, QuerySet
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+NodeT = TypeVar("NodeT")
+
+
+@strawberry.type
+class PageInfo:
+    """Relay page information."""
+
+    has_next_page: bool
+    has_previous_page: bool
+    start_cursor: str | None
+    end_cursor: str | None
+
+
+@strawberry.type
+class Edge(Generic[NodeT]):
+    """Relay edge holding a node and its cursor."""
+
+    cursor: str
+    node: NodeT
+
+
+@strawberry.type
+class Connection(Generic[NodeT]):
+    """Relay connection holding one page of edges."""
+
+    edges: list[Edge[NodeT]]
+    page_info: PageInfo
+
+
+def empty_connection() -> Connection[Any]:
+    """Return a connection without edges, as served to anonymous users.
+
+    Returns:
+        Connection[Any]: empty connection.
+    """
+    return Connection(
+        edges=[],
+        page_info=PageInfo(
+            has_next_page=False,
+            has_previous_page=False,
+            start_cursor=None,
+            end_cursor=None,
+        ),
+    )
+
+
+def _cursor_value(value: Any) -> Any:
+    """Return a JSON representation of an ordering key value."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Return the opaque cursor of a row's ordering key values.
+
+    Args:
+        values (Sequence[Any]): ordering key values of the row.
+
+    Returns:
+        str: opaque pagination cursor.
+    """
+    payload = json.dumps([_cursor_value(value) for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Return the ordering key values encoded in a cursor.
+
+    Args:
+        cursor (str): opaque pagination cursor.
+        size (int): number of ordering keys the cursor must hold.
+
+    Returns:
+        list[Any]: ordering key values.
+
+    Raises:
+        ValueError: when the cursor was not issued for this ordering.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _page_size(first: int | None, last: int | None) -> int:
+    """Validate the requested page size.
+
+    Args:
+        first (int | None): forward page size.
+        last (int | None): backward page size.
+
+    Returns:
+        int: number of edges to return.
+
+    Raises:
+        ValueError: when both or an out of range size are requested.
+    """
+    if first is not None and last is not None:
+        raise ValueError("Pass either first or last, not both")
+    size = first if first is not None else last
+    if size is None:
+        return DEFAULT_PAGE_SIZE
+    if not 0 <= size <= MAX_PAGE_SIZE:
+        raise ValueError(
+            f"{'first' if first is not None else 'last'} must be between "
+            f"0 and {MAX_PAGE_SIZE}"
+        )
+    return size
+
+
+def _beyond(
+    keys: Sequence[str], descending: Sequence[bool], values: Sequence[Any]
+) -> Q:
+    """Return the rows strictly past a cursor in the given ordering.
+
+    The leading key is also bounded inclusively so PostgreSQL can turn the
+    condition into a range scan of the composite ordering index.
+
+    Args:
+        keys (Sequence[str]): annotated ordering key names.
+        descending (Sequence[bool]): whether each key sorts descending.
+        values (Sequence[Any]): cursor values of the keys.
+
+    Returns:
+        Q: keyset condition.
+    """
+    condition = Q()
+    for index, key in enumerate(keys):
+        lookup = "lt" if descending[index] else "gt"
+        condition |= Q(
+            **dict(zip(keys[:index], values[:index])),
+            **{f"{key}__{lookup}": values[index]},
+        )
+    leading = "lte" if descending[0] else "gte"
+    return Q(**{f"{keys[0]}__{leading}": values[0]}) & condition
+
+
+def keyset_connection(
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    wrap: Callable[[Any], NodeT],
+    *,
+    first: int | None = None,
+    after: str | None = None,
+    last: int | None = None,
+    before: str | None = None,
+) -> Connection[NodeT]:
+    """Return one page of a queryset as a Relay connection.
+
+    Pages are selected by comparing ordering keys against the cursor
+    instead of skipping rows, so every page costs the same index range
+    scan however deep into the history it is. The ordering must end in
+    a unique key, such as the primary key, for cursors to be stable.
+
+    Args:
+        queryset (QuerySet): rows to paginate.
+        ordering (Sequence[str]): order_by expressions, unique overall.
+        wrap (Callable[[Any], NodeT]): converts a row to its node.
+        first (int | None): number of edges after the after cursor.
+        after (str | None): cursor to page forward from.
+        last (int | None): number of edges before the before cursor.
+        before (str | None): cursor to page backward from.
+
+    Returns:
+        Connection[NodeT]: the requested page.
+
+    Raises:
+        ValueError: when a cursor or page size is invalid.
+    """
+    size = _page_size(first, last)
+    keys = [f"keyset_{index}" for index in range(len(ordering))]
+    descending = [expression.startswith("-") for expression in ordering]
+    queryset = queryset.annotate(
+        **{
+            key: F(expression.lstrip("-"))
+            for key, expression in zip(keys, ordering)
+        }
+    )
+    try:
+        if after is not None:
+            queryset = queryset.filter(
+                _beyond(keys, descending, decode_cursor(after, len(keys)))
+            )
+        if before is not None:
+            queryset = queryset.filter(
+                _beyond(
+                    keys,
+                    [not desc for desc in descending],
+                    decode_cursor(before, len(keys)),
+                )
+            )
+    except (ValidationError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    backward = last is not None
+    order = [
+        f"-{key}" if desc != backward else key
+        for key, desc in zip(keys, descending)
+    ]
+    rows: list[Model] = list(queryset.order_by(*order)[: size + 1])
+    has_more = len(rows) > size
+    rows = rows[:size]
+    if backward:
+        rows.reverse()
+
+    edges = [
+        Edge(
+            cursor=encode_cursor([getattr(row, key) for key in keys]),
+            node=wrap(row),
+        )
+        for row in rows
+    ]
+    return Connection(
+        edges=edges,
+        page_info=PageInfo(
+            has_next_page=has_more and not backward,
+            has_previous_page=has_more and backward,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
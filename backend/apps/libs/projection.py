@@ -0,0 +1,80 @@
+"""Selection-driven column projection for GraphQL reads."""
+
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+from typing import Any, TypeVar, cast
+
+from django.db.models import Field, Model, QuerySet
+from strawberry.utils.str_converters import to_camel_case
+
+ModelT = TypeVar("ModelT", bound=Model)
+
+
+@dataclass(frozen=True)
+class Column:
+    """A GraphQL type field read straight from one model column.
+
+    Attributes:
+        field (str): model field name.
+        convert (Callable[[Any], Any] | None): converts the column value to
+            the GraphQL value, identity when None.
+        default (Any): value of the field when its column was not loaded.
+    """
+
+    field: str
+    convert: Callable[[Any], Any] | None = None
+    default: Any = None
+
+
+def project(
+    queryset: QuerySet[ModelT],
+    selected: Collection[str],
+    columns: Mapping[str, Column],
+) -> QuerySet[ModelT]:
+    """Restrict a queryset to the columns of the selected GraphQL fields.
+
+    Selected names that are not columns, such as relations or nested
+    fields, are ignored, so over-broad selections only load more columns.
+    The id column is always loaded.
+
+    Args:
+        queryset (QuerySet[ModelT]): rows to read.
+        selected (Collection[str]): selected GraphQL field names.
+        columns (Mapping[str, Column]): type fields backed by columns,
+            keyed by their Python name.
+
+    Returns:
+        QuerySet[ModelT]: queryset deferring every unselected column.
+    """
+    fields = {
+        column.field
+        for name, column in columns.items()
+        if name == "id" or to_camel_case(name) in selected
+    }
+    return queryset.only(*sorted(fields))
+
+
+def column_values(obj: Model, columns: Mapping[str, Column]) -> dict[str, Any]:
+    """Return GraphQL type constructor values from a possibly projected row.
+
+    Deferred columns are never loaded; their fields take the column
+    default instead, which is never serialized because only unselected
+    fields are deferred.
+
+    Args:
+        obj (Model): model instance.
+        columns (Mapping[str, Column]): type fields backed by columns.
+
+    Returns:
+        dict[str, Any]: field values keyed by Python name.
+    """
+    deferred = obj.get_deferred_fields()
+    values = {}
+    for name, column in columns.items():
+        attname = cast(Field, obj._meta.get_field(column.field)).attname
+        if attname in deferred:
+            values[name] = column.default
+            continue
+        value = getattr(obj, attname)
+        values[name] = column.convert(value) if column.convert else value
+    return values
@@ -13,6 +13,11 @@ from apps.libs.graphql import (
     validated_percentage_decimal,
     validated_positive_decimal,
 )
+from apps.libs.pagination import (
+    Connection,
+    empty_connection,
+    keyset_connection,
+)
 from apps.measurements.models import Measurement
 from apps.plans.locks import lock_plan_aggregate_rows
 from apps.plans.models import Day, WeekPlan
@@ -82,6 +87,41 @@ class MeasurementQuery:
             ).order_by("-created_at")
         ]
 
+    @strawberry.field
+    def measurements_connection(
+        self,
+        info: Info,
+        first: int | None = None,
+        after: str | None = None,
+        last: int | None = None,
+        before: str | None = None,
+    ) -> Connection[MeasurementType]:
+        """Get a keyset-paginated page of measurements for the current user.
+
+        Args:
+            info (Info): GraphQL execution info.
+            first (int | None): number of measurements after the after cursor.
+            after (str | None): cursor to page forward from.
+            last (int | None): number of measurements before the before cursor.
+            before (str | None): cursor to page backward from.
+
+        Returns:
+            Connection[MeasurementType]: measurements, latest first.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return empty_connection()
+
+        return keyset_connection(
+            Measurement.objects.filter(user=user),
+            ("-created_at", "-id"),
+            MeasurementType.from_model,
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+        )
+
     @strawberry.field
     def latest_measurement(self, info: Info) -> MeasurementType | None:
         """Get the newest measurement for the current user.
@@ -0,0 +1,105 @@
+"""Logged activity behind the day flags."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.apps import apps
+from django.db.models import Count, Exists, OuterRef, Q, Subquery, Sum
+
+
+@dataclass(frozen=True)
+class DayActivity:
+    """Logged meals, exercises and steps that drive a day's flags."""
+
+    logged_meals: frozenset[str] = frozenset()
+    pending_meals: frozenset[str] = frozenset()
+    has_exercises: bool = False
+    exercise_kcals: int = 0
+    steps: int | None = None
+
+    @classmethod
+    def collect(
+        cls, day_ids: Iterable[int], using: str
+    ) -> dict[int, "DayActivity"]:
+        """Read the activity of many days in one grouped query.
+
+        Meals are counted with conditional aggregates over the intakes
+        join. Exercises are summed in a correlated subquery so they do not
+        multiply the intake rows.
+
+        Args:
+            day_ids (Iterable[int]): days whose activity is wanted.
+            using (str): database alias to read.
+
+        Returns:
+            dict[int, DayActivity]: activity per existing day.
+        """
+        day_model = apps.get_model("plans", "Day")
+        exercise_model = apps.get_model("exercises", "Exercise")
+        exercises = exercise_model.objects.filter(
+            day_id=OuterRef("pk")
+        ).order_by()
+        meals = list(apps.get_model("plans", "Intake").MEAL_ORDER)
+        rows = (
+            day_model.objects.using(using)
+            .filter(pk__in=list(day_ids))
+            .order_by()
+            .values("pk", "steps__steps")
+            .annotate(
+                **{
+                    f"{meal}_logged": Count(
+                        "intakes", filter=Q(intakes__meal=meal)
+                    )
+                    for meal in meals
+                },
+                **{
+                    f"{meal}_pending": Count(
+                        "intakes",
+                        filter=Q(intakes__meal=meal, intakes__processed=False),
+                    )
+                    for meal in meals
+                },
+                has_exercises=Exists(exercises),
+                exercise_kcals=Subquery(
+                    exercises.values("day_id")
+                    .annotate(total=Sum("kcals"))
+                    .values("total")
+                ),
+            )
+        )
+        return {
+            row["pk"]: cls(
+                logged_meals=frozenset(
+                    meal for meal in meals if row[f"{meal}_logged"]
+                ),
+                pending_meals=frozenset(
+                    meal for meal in meals if row[f"{meal}_pending"]
+                ),
+                has_exercises=row["has_exercises"],
+                exercise_kcals=row["exercise_kcals"] or 0,
+                steps=row["steps__steps"],
+            )
+            for row in rows
+        }
+
+    def meal_flag(self, meal: str) -> bool:
+        """Return whether a meal is logged and fully processed.
+
+        Args:
+            meal (str): meal name.
+
+        Returns:
+            bool: whether the meal counts as logged.
+        """
+        return meal in self.logged_meals and meal not in self.pending_meals
+
+    @property
+    def steps_kcals(self) -> Decimal:
+        """Get the kcals burnt by the logged steps.
+
+        Returns:
+            Decimal: steps kcals, zero when no steps are logged.
+        """
+        steps_model = apps.get_model("exercises", "DaySteps")
+        return steps_model(steps=self.steps).kcals
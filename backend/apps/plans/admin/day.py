@@ -2,6 +2,7 @@
 
 from django import forms
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.db import models
 from django.http import HttpRequest
 
@@ -9,6 +10,7 @@ from apps.exercises.admin import DayStepsInlineBase, ExerciseInlineBase
 from apps.libs.admin import progress_bar_field, round_field
 
 from ..models import Day
+from ..models.day import load_accumulated_diffs
 from .intake import IntakeInlineBase
 
 
@@ -193,6 +195,24 @@ class DayAdmin(admin.ModelAdmin):
         "protein_g_intake_progress_bar",
     ]
 
+    def get_changelist_instance(self, request: HttpRequest) -> ChangeList:
+        """Get the change list with the page's accumulated diffs loaded.
+
+        The diffs run over whole plans, so they are loaded for the page's
+        plans with one window query rather than annotated on the filtered
+        and paginated queryset.
+
+        Args:
+            request (HttpRequest): request object.
+
+        Returns:
+            ChangeList: change list of the requested page.
+        """
+        changelist = super().get_changelist_instance(request)
+        changelist.result_list = list(changelist.result_list)
+        load_accumulated_diffs(changelist.result_list)
+        return changelist
+
     def has_add_permission(self, request: HttpRequest) -> bool:
         """Get whether it has add permission.
 
@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import Any, Dict
 
 from django.contrib import admin
+from django.db.models import QuerySet
 from django.http import HttpRequest
 
 # pylint: disable=no-name-in-module
@@ -103,6 +104,17 @@ class WeekPlanAdmin(NestedModelAdmin):
         "rounded_energy_kcal_goal_diff",
     ]
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """Get plans with their weekly summary annotated.
+
+        Args:
+            request (HttpRequest): request object.
+
+        Returns:
+            QuerySet: summarised plans.
+        """
+        return super().get_queryset(request).with_summary()
+
     def get_changeform_initial_data(self, request: HttpRequest) -> Dict:
         """Get initial data for the change form.
 
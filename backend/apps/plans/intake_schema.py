@@ -0,0 +1,101 @@
+"""Batch intake logging GraphQL schema module."""
+
+# pylint: disable=too-few-public-methods
+
+from typing import cast
+
+import strawberry
+from django.db import models, router
+from strawberry.types import Info
+
+from apps.foods.models import Serving
+from apps.libs.graphql import (
+    get_request_user,
+    validated_non_negative_decimal,
+    validated_positive_decimal,
+)
+from apps.plans.intakes import IntakeEntry, log_intakes
+from apps.plans.models import Day, Intake
+from apps.plans.schema import IntakeType
+
+
+@strawberry.input
+class IntakeInput:
+    """One intake in a batch intake mutation.
+
+    Intakes with a ``food_id`` take their nutrients from that serving.
+    """
+
+    day_id: int
+    meal: str
+    num_servings: float
+    food_id: strawberry.ID | None = None
+    energy_kcal: float | None = None
+    protein_g: float | None = None
+    fat_g: float | None = None
+    carbs_g: float | None = None
+
+
+def _validated_intake_entry(intake: IntakeInput) -> IntakeEntry:
+    """Validate one batch intake like the single intake mutation does."""
+    nutrients = {}
+    if not intake.food_id:
+        for field_name, label, value in (
+            ("energy_kcal", "energyKcal", intake.energy_kcal),
+            ("protein_g", "proteinG", intake.protein_g),
+            ("fat_g", "fatG", intake.fat_g),
+            ("carbs_g", "carbsG", intake.carbs_g),
+        ):
+            nutrients[field_name] = validated_non_negative_decimal(
+                value if value is not None else 0,
+                label,
+                cast(models.DecimalField, Intake._meta.get_field(field_name)),
+            )
+    return IntakeEntry(
+        day_id=intake.day_id,
+        meal=Intake.validate_meal(intake.meal),
+        num_servings=validated_positive_decimal(
+            intake.num_servings,
+            "numServings",
+            cast(models.DecimalField, Intake._meta.get_field("num_servings")),
+        ),
+        food_id=int(intake.food_id) if intake.food_id else None,
+        **nutrients,
+    )
+
+
+@strawberry.type
+class IntakeBatchMutation:
+    """Batch intake mutations."""
+
+    @strawberry.mutation
+    def create_intakes(
+        self, info: Info, intakes: list[IntakeInput]
+    ) -> list[IntakeType]:
+        """Log many intakes, e.g. a whole meal, at once.
+
+        Args:
+            info (Info): GraphQL execution info.
+            intakes (list[IntakeInput]): intakes to create.
+
+        Returns:
+            list[IntakeType]: the created intakes, in request order.
+
+        Raises:
+            PermissionError: if user is not authenticated.
+            ValueError: if a day or food is not found.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            raise PermissionError("Authentication required")
+        entries = [_validated_intake_entry(intake) for intake in intakes]
+
+        try:
+            created = log_intakes(
+                user.pk, entries, router.db_for_write(Intake)
+            )
+        except Day.DoesNotExist as e:
+            raise ValueError("Day not found") from e
+        except Serving.DoesNotExist as e:
+            raise ValueError("Serving not found") from e
+        return [IntakeType.from_model(intake) for intake in created]
@@ -0,0 +1,190 @@
+"""Batched intake logging under one plan, day and cupboard lock bundle."""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.foods.cupboard_locks import lock_cupboard_items
+from apps.foods.models import CupboardItem, CupboardItemConsumption, Serving
+from apps.foods.models.nutrient_vector import NutrientVector
+from apps.foods.signals.handlers.cupboard import (
+    get_consumption_perc,
+    recalculate_consumed_perc,
+)
+from apps.plans.locks import lock_plan_aggregate_rows
+from apps.plans.models import Day, Intake
+from apps.plans.recompute import plan_recompute
+
+
+@dataclass(frozen=True)
+class IntakeEntry:
+    """One intake in a batch logged at once.
+
+    An entry with ``food_id`` takes its nutrients from that serving; any
+    other entry keeps the nutrients it is given.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    day_id: int
+    meal: str
+    num_servings: Decimal = Decimal("1")
+    food_id: int | None = None
+    energy_kcal: Decimal = Decimal("0")
+    protein_g: Decimal = Decimal("0")
+    fat_g: Decimal = Decimal("0")
+    carbs_g: Decimal = Decimal("0")
+
+
+def _consumption_items(
+    servings: Iterable[Serving], owner_id: int, using: str
+) -> list[int]:
+    """Return the unfinished cupboard items of the servings' foods."""
+    return list(
+        CupboardItem.objects.using(using)
+        .filter(
+            food_id__in={serving.food_id for serving in servings},
+            finished=False,
+            owner_id=owner_id,
+        )
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+
+def _consumptions(
+    intakes: Iterable[Intake], items: Iterable[CupboardItem]
+) -> list[CupboardItemConsumption]:
+    """Link each food intake to the oldest unfinished item of its food.
+
+    Items finished by earlier intakes of the batch are skipped, as they
+    would be if the intakes were logged one at a time.
+    """
+    queues: dict[int, list[CupboardItem]] = defaultdict(list)
+    for item in items:
+        if not item.finished:
+            queues[item.food_id].append(item)
+    consumed = {
+        item.pk: item.consumed_perc
+        for queue in queues.values()
+        for item in queue
+    }
+    consumptions = []
+    for intake in intakes:
+        if intake.food is None or not queues[intake.food.food_id]:
+            continue
+        item = queues[intake.food.food_id][0]
+        consumption = CupboardItemConsumption(
+            item=item,
+            serving=intake.food,
+            num_servings=intake.num_servings,
+            intake=intake,
+        )
+        consumption.consumed_amount, consumption.consumed_unit = (
+            consumption.resolved_consumed_snapshot
+        )
+        consumptions.append(consumption)
+        consumed[item.pk] += get_consumption_perc(consumption)
+        if consumed[item.pk] >= 100:
+            queues[intake.food.food_id].pop(0)
+    return consumptions
+
+
+def log_intakes(
+    user_id: int,
+    entries: Iterable[IntakeEntry],
+    using: str = DEFAULT_DB_ALIAS,
+) -> list[Intake]:
+    """Log many intakes of a user's days in one transaction.
+
+    Plans, days and cupboard items are locked once in the canonical order,
+    intakes and their cupboard consumptions are bulk inserted and each
+    affected day and plan is recomputed once.
+
+    Args:
+        user_id (int): owner of the days.
+        entries (Iterable[IntakeEntry]): intakes in request order.
+        using (str): database alias used by the mutation.
+
+    Returns:
+        list[Intake]: the created intakes, in request order.
+
+    Raises:
+        Day.DoesNotExist: if a day is missing or owned by another user.
+        Serving.DoesNotExist: if an entry refers to a missing serving.
+    """
+    entries = list(entries)
+    meals = [Intake.validate_meal(entry.meal) for entry in entries]
+    if not entries:
+        return []
+    with plan_recompute(using) as recompute:
+        locks = lock_plan_aggregate_rows(
+            using=using, day_ids={entry.day_id for entry in entries}
+        )
+        try:
+            days = locks.days_by_pk
+            if any(
+                entry.day_id not in days
+                or days[entry.day_id].plan.user_id != user_id
+                for entry in entries
+            ):
+                raise Day.DoesNotExist("Day not found")
+            food_ids = {
+                entry.food_id for entry in entries if entry.food_id is not None
+            }
+            servings = (
+                Serving.objects.using(using)
+                .select_related("food")
+                .in_bulk(food_ids)
+            )
+            if len(servings) != len(food_ids):
+                raise Serving.DoesNotExist("Serving not found")
+            item_ids = _consumption_items(servings.values(), user_id, using)
+            cupboard_locks = lock_cupboard_items(item_ids, using)
+
+            intakes = []
+            for entry, meal in zip(entries, meals):
+                intake = Intake(
+                    day=days[entry.day_id],
+                    meal=meal,
+                    meal_order=Intake.MEAL_ORDER[meal],
+                    num_servings=entry.num_servings,
+                    energy_kcal=entry.energy_kcal,
+                    protein_g=entry.protein_g,
+                    fat_g=entry.fat_g,
+                    carbs_g=entry.carbs_g,
+                )
+                if entry.food_id is not None:
+                    intake.food = servings[entry.food_id]
+                    NutrientVector.load(intake.food).scale(
+                        entry.num_servings
+                    ).store(intake)
+                intake.processed = (
+                    intake.food is not None
+                    or not NutrientVector.load(intake).is_zero()
+                )
+                intakes.append(intake)
+            Intake.objects.using(using).bulk_create(intakes)
+
+            consumptions = _consumptions(
+                intakes, cupboard_locks.items_by_pk.values()
+            )
+            linked = {
+                consumption.item_id: consumption.item
+                for consumption in consumptions
+            }
+            # Split legacy totals before the new links count towards them.
+            for item in linked.values():
+                recalculate_consumed_perc(item, already_locked=True)
+            CupboardItemConsumption.objects.using(using).bulk_create(
+                consumptions
+            )
+            for item in linked.values():
+                recalculate_consumed_perc(item, already_locked=True)
+        finally:
+            locks.clear_markers()
+        for intake in intakes:
+            recompute.mark_days((intake.day_id,), observer=intake)
+    return intakes
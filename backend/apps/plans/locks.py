@@ -1,10 +1,15 @@
 """Canonical row locking for plan aggregate mutations."""
 
-from dataclasses import dataclass
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Iterable, cast
 
 from django.apps import apps
 
+from apps.plans.rollups import DayRollupValues, set_counted_rollup_values
+
 if TYPE_CHECKING:
     from apps.plans.models import Day, WeekPlan
 
@@ -66,6 +71,82 @@ class PlanAggregateLocks:
                 setattr(day, "_plan_aggregate_locks", None)
 
 
+@dataclass
+class HeldPlanRows:
+    """Plan and day rows a unit of work has locked so far."""
+
+    using: str
+    plan_ids: set[int] = field(default_factory=set)
+    day_ids: set[int] = field(default_factory=set)
+
+    def covers(
+        self, plans: Iterable["WeekPlan"], days: Iterable["Day"]
+    ) -> bool:
+        """Return whether every given row is already locked.
+
+        Args:
+            plans (Iterable[WeekPlan]): plans about to be written.
+            days (Iterable[Day]): days about to be written.
+
+        Returns:
+            bool: Whether the unit of work holds all of their locks.
+        """
+        return {plan.pk for plan in plans}.issubset(self.plan_ids) and {
+            day.pk for day in days
+        }.issubset(self.day_ids)
+
+
+_held_plan_rows: ContextVar[HeldPlanRows | None] = ContextVar(
+    "held_plan_rows", default=None
+)
+
+
+@contextmanager
+def hold_plan_aggregate_rows(using: str) -> Iterator[HeldPlanRows]:
+    """Record the plan and day rows locked on a database within the block.
+
+    Args:
+        using (str): Database alias whose locks are recorded.
+
+    Yields:
+        HeldPlanRows: The rows locked so far.
+    """
+    held = HeldPlanRows(using)
+    token = _held_plan_rows.set(held)
+    try:
+        yield held
+    finally:
+        _held_plan_rows.reset(token)
+
+
+def adopt_plan_aggregate_rows(
+    using: str, plans: Iterable["WeekPlan"], days: Iterable["Day"]
+) -> PlanAggregateLocks:
+    """Mark rows this transaction already locked as held by their writer.
+
+    Each day gets its locked plan and the values the rollups count until
+    it is saved, so saving it neither reads the plan again nor re-locks.
+
+    Args:
+        using (str): Database alias on which the locks are held.
+        plans (Iterable[WeekPlan]): Locked plans, ordered by primary key.
+        days (Iterable[Day]): Locked days, ordered by primary key.
+
+    Returns:
+        PlanAggregateLocks: The rows bundled as live locks.
+    """
+    locks = PlanAggregateLocks(
+        using=using, plans=tuple(plans), days=tuple(days)
+    )
+    plans_by_pk = locks.plans_by_pk
+    for day in locks.days:
+        day.plan = plans_by_pk[day.plan_id]
+        # The locked row is what the rollups count until the day is saved.
+        set_counted_rollup_values(day, DayRollupValues.of(day))
+        setattr(day, "_plan_aggregate_locks", locks)
+    return locks
+
+
 def lock_plan_aggregate_rows(
     *,
     using: str,
@@ -105,7 +186,6 @@ def lock_plan_aggregate_rows(
         .filter(pk__in=normalized_plan_ids)
         .order_by("pk")
     )
-    plans_by_pk = {plan.pk: plan for plan in plans}
     days = tuple(
         day
         for day in day_model.objects.select_for_update(of=("self",))
@@ -113,9 +193,8 @@ def lock_plan_aggregate_rows(
         .filter(pk__in=normalized_day_ids)
         .order_by("pk")
     )
-    for day in days:
-        day.plan = plans_by_pk[day.plan_id]
-    locks = PlanAggregateLocks(using=using, plans=plans, days=days)
-    for day in days:
-        setattr(day, "_plan_aggregate_locks", locks)
-    return locks
+    held = _held_plan_rows.get()
+    if held is not None and held.using == using:
+        held.plan_ids.update(plan.pk for plan in plans)
+        held.day_ids.update(day.pk for day in days)
+    return adopt_plan_aggregate_rows(using, plans, days)
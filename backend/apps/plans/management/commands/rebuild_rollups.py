@@ -0,0 +1,58 @@
+"""Rebuild rollups management command module."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.plans.models import WeekPlan
+from apps.plans.rollup_rebuild import rebuild_rollups
+
+
+class Command(BaseCommand):
+    """Recompute the week and month rollups from the days."""
+
+    help = (
+        "Recompute the week and month rollups of users from their days, "
+        "one user per transaction."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments.
+
+        Args:
+            parser (CommandParser): command argument parser.
+        """
+        parser.add_argument(
+            "user_ids",
+            nargs="*",
+            type=int,
+            help="Users to rebuild, every user with a plan by default.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to rebuild.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Rebuild the rollups user by user.
+
+        Args:
+            args (Any): positional arguments.
+            options (Any): command options.
+        """
+        using: str = options["database"]
+        user_ids = options["user_ids"] or (
+            WeekPlan.objects.using(using)
+            .order_by("user_id")
+            .values_list("user_id", flat=True)
+            .distinct()
+        )
+        users = rows = 0
+        for user_id in user_ids:
+            rows += rebuild_rollups(user_id, using)
+            users += 1
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {rows} rollups of {users} users.")
+        )
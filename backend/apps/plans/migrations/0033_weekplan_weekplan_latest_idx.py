@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "measurements",
+            "0004_measurement_body_fat_calculation_perc_and_more",
+        ),
+        ("plans", "0032_alter_day_carbs_g_alter_day_carbs_g_goal_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="weekplan",
+            index=models.Index(
+                fields=["user", "-start_date", "-id"],
+                name="weekplan_latest_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,280 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("plans", "0033_weekplan_weekplan_latest_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "start",
+                    models.DateField(help_text="First day of the period."),
+                ),
+                (
+                    "days",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Number of plan days in the period.",
+                    ),
+                ),
+                ("tracked_days", models.IntegerField(default=0)),
+                ("completed_days", models.IntegerField(default=0)),
+                (
+                    "energy_kcal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Energy (kcal)",
+                    ),
+                ),
+                (
+                    "protein_g",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Protein (g)",
+                    ),
+                ),
+                (
+                    "fat_g",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Fat (g)",
+                    ),
+                ),
+                (
+                    "carbs_g",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Carbs (g)",
+                    ),
+                ),
+                (
+                    "energy_kcal_goal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Energy (kcal) Goal",
+                    ),
+                ),
+                (
+                    "protein_g_goal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Protein (g) Goal",
+                    ),
+                ),
+                (
+                    "fat_g_goal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Fat (g) Goal",
+                    ),
+                ),
+                (
+                    "carbs_g_goal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Carbs (g) Goal",
+                    ),
+                ),
+                (
+                    "tdee",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="TDEE",
+                    ),
+                ),
+                (
+                    "deficit",
+                    models.IntegerField(
+                        default=0, verbose_name="Planned deficit (kcals)"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="month_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["user", "-start"],
+                "abstract": False,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "start"),
+                        name="monthrollup_user_start_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="WeekRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "start",
+                    models.DateField(help_text="First day of the period."),
+                ),
+                (
+                    "days",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Number of plan days in the period.",
+                    ),
+                ),
+                ("tracked_days", models.IntegerField(default=0)),
+                ("completed_days", models.IntegerField(default=0)),
+                (
+                    "energy_kcal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Energy (kcal)",
+                    ),
+                ),
+                (
+                    "protein_g",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Protein (g)",
+                    ),
+                ),
+                (
+                    "fat_g",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Fat (g)",
+                    ),
+                ),
+                (
+                    "carbs_g",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Carbs (g)",
+                    ),
+                ),
+                (
+                    "energy_kcal_goal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Energy (kcal) Goal",
+                    ),
+                ),
+                (
+                    "protein_g_goal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Protein (g) Goal",
+                    ),
+                ),
+                (
+                    "fat_g_goal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Fat (g) Goal",
+                    ),
+                ),
+                (
+                    "carbs_g_goal",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="Carbs (g) Goal",
+                    ),
+                ),
+                (
+                    "tdee",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=12,
+                        verbose_name="TDEE",
+                    ),
+                ),
+                (
+                    "deficit",
+                    models.IntegerField(
+                        default=0, verbose_name="Planned deficit (kcals)"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="week_rollups",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["user", "-start"],
+                "abstract": False,
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "start"),
+                        name="weekrollup_user_start_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-10-19 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("plans", "0034_monthrollup_weekrollup"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="day",
+            index=models.Index(fields=["-day", "-id"], name="day_latest_idx"),
+        ),
+    ]
@@ -35,4 +35,5 @@ Fat and carbohydrates are based on the previous energy goals
 
 from .day import Day
 from .intake import Intake, IntakePicture
+from .rollup import MonthRollup, PeriodRollup, WeekRollup
 from .week import WeekPlan
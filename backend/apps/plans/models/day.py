@@ -1,33 +1,127 @@
 """Day model module."""
 
+from collections.abc import Iterable
 from decimal import Decimal
 from typing import Any
 
 from django.conf import settings
 from django.contrib import admin
 from django.db import models, router, transaction
+from django.db.models import (
+    Case,
+    F,
+    Q,
+    RowRange,
+    Sum,
+    Value,
+    When,
+    Window,
+)
 
 from apps.foods.models.nutrients import Nutrients
 from apps.libs.admin import progress_bar
 from apps.libs.utils import round_no_trailing_zeros
+from apps.plans.activity import DayActivity
+from apps.plans.recompute import apply_rollup_changes
+from apps.plans.rollups import (
+    DayRollupValues,
+    counted_rollup_values,
+    day_rollup_changes,
+    set_counted_rollup_values,
+    stored_column,
+)
 
 from .intake import (
     Intake,
     IntakeCascadeDeletionMixin,
-    IntakeCascadeManager,
+    IntakeCascadeQuerySet,
 )
 
 
+class DayQuerySet(IntakeCascadeQuerySet):
+    """Day queryset."""
+
+    def with_accumulated_diff(self) -> "DayQuerySet":
+        """Annotate each day's running energy goal diff within its plan.
+
+        Completed days add their whole diff and incomplete days only add
+        a surplus. The running sum is one window function over the rows
+        the queryset selects, so select whole plans before applying it.
+
+        Returns:
+            DayQuerySet: days with an ``accumulated_energy_kcal_goal_diff``
+                annotation.
+        """
+        goal_diff = Case(
+            When(energy_kcal_goal=0, then=Value(Decimal("0"))),
+            default=stored_column(Day, "energy_kcal_goal")
+            - stored_column(Day, "energy_kcal"),
+        )
+        counted_diff = Case(
+            When(completed=True, then=goal_diff),
+            When(
+                ~Q(energy_kcal_goal=0)
+                & Q(energy_kcal__gt=F("energy_kcal_goal")),
+                then=goal_diff,
+            ),
+            default=Value(Decimal("0")),
+            output_field=models.DecimalField(),
+        )
+        return self.annotate(
+            accumulated_energy_kcal_goal_diff=Window(
+                # Typed as the day field, so sums read back at its scale.
+                Sum(
+                    counted_diff,
+                    output_field=Day._meta.get_field("energy_kcal_goal"),
+                ),
+                partition_by=[F("plan_id")],
+                order_by=F("day_num").asc(),
+                frame=RowRange(start=None, end=0),
+            )
+        )
+
+
+class DayManager(
+    models.Manager.from_queryset(DayQuerySet)  # type: ignore[misc]
+):
+    """Manager exposing deletion-safe and annotated day querysets."""
+
+
+def load_accumulated_diffs(days: Iterable["Day"]) -> None:
+    """Set the accumulated energy goal diff of days from one query.
+
+    Args:
+        days (Iterable[Day]): days, of one or many plans, to annotate.
+    """
+    days = list(days)
+    if not days:
+        return
+    diffs = dict(
+        Day.objects.using(router.db_for_read(Day, instance=days[0]))
+        .filter(plan_id__in={day.plan_id for day in days})
+        .with_accumulated_diff()
+        .values_list("pk", "accumulated_energy_kcal_goal_diff")
+    )
+    for day in days:
+        day.accumulated_energy_kcal_goal_diff = diffs.get(day.pk, Decimal("0"))
+
+
 class Day(IntakeCascadeDeletionMixin, Nutrients):
     """Day model class."""
 
     # pylint: disable=too-many-instance-attributes
 
-    objects = IntakeCascadeManager()
+    objects = DayManager()
     _plan_aggregate_locks: Any = None
+    _activity: DayActivity | None = None
+    # Set by DayQuerySet.with_accumulated_diff() or load_accumulated_diffs()
+    accumulated_energy_kcal_goal_diff: Decimal
 
     class Meta:
         ordering = ["-plan", "-day"]
+        indexes = [
+            models.Index(fields=["-day", "-id"], name="day_latest_idx"),
+        ]
 
     plan = models.ForeignKey(
         "plans.WeekPlan",
@@ -253,82 +347,97 @@ class Day(IntakeCascadeDeletionMixin, Nutrients):
             try:
                 kwargs["using"] = using
                 self._save_derived_fields(*args, **kwargs)
+                self._record_rollups(aggregate_locks, using)
             finally:
                 if owns_locks and aggregate_locks is not None:
                     aggregate_locks.clear_markers()
 
     def _save_derived_fields(self, *args: Any, **kwargs: Any) -> None:
-        """Calculate derived fields and persist while aggregate locks are held."""
-        # Goals
-        self.energy_kcal_goal = self._energy_kcal_goal
-        self.protein_g_goal = (
-            self.plan.protein_g_kg * self.plan.measurement.weight
-        )
-        self.fat_g_goal = self._fat_g_goal
-        self.carbs_g_goal = self._carbs_g_goal
-
-        # Intake percentages
-        self.energy_kcal_intake_perc = self._energy_kcal_intake_perc
-        self.protein_g_intake_perc = self._protein_g_intake_perc
-        self.fat_g_intake_perc = self._fat_g_intake_perc
-        self.carbs_g_intake_perc = self._carbs_g_intake_perc
-
-        # Flags
-        self.breakfast_flag = (
-            self.breakfast_exc
-            or bool(self.id)
-            and not (
-                self.intakes.filter(meal=Intake.MEAL_BREAKFAST)
-                .filter(processed=False)
-                .exists()
+        """Calculate derived fields and persist while aggregate locks are held.
+
+        The meals, exercises and steps behind the flags are read in one
+        query unless a bulk recompute already collected them.
+        """
+        activity = self._activity
+        if activity is None:
+            activity = (
+                DayActivity.collect((self.id,), kwargs["using"]).get(
+                    self.id, DayActivity()
+                )
+                if self.id
+                else DayActivity()
             )
-            and self.intakes.filter(meal=Intake.MEAL_BREAKFAST).exists()
+        self.derive_fields(activity)
+        super().save(*args, **kwargs)
+
+    def _record_rollups(self, aggregate_locks: Any, using: str) -> None:
+        """Replace what the rollups count for this day by its saved values.
+
+        The locked copy of the row holds the values counted so far, and
+        the saved values from now on.
+
+        Args:
+            aggregate_locks (Any): locks the day was saved under.
+            using (str): database alias of the save.
+        """
+        locked = aggregate_locks.days_by_pk.get(self.pk)
+        before = counted_rollup_values(locked) if locked is not None else None
+        after = DayRollupValues.of(self)
+        if locked is not None:
+            set_counted_rollup_values(locked, after)
+        apply_rollup_changes(
+            day_rollup_changes(self.plan.user_id, before, after), using
         )
-        self.lunch_flag = (
-            self.lunch_exc
-            or bool(self.id)
-            and not (
-                self.intakes.filter(meal=Intake.MEAL_LUNCH)
-                .filter(processed=False)
-                .exists()
+
+    def derive_fields(self, activity: DayActivity) -> None:
+        """Calculate goals, percentages and flags without saving.
+
+        Args:
+            activity (DayActivity): the day's logged meals, exercises and
+                steps.
+        """
+        self._activity = activity
+        try:
+            # Goals
+            self.energy_kcal_goal = self._energy_kcal_goal
+            self.protein_g_goal = (
+                self.plan.protein_g_kg * self.plan.measurement.weight
             )
-            and self.intakes.filter(meal=Intake.MEAL_LUNCH).exists()
-        )
-        self.snack_flag = (
-            self.snack_exc
-            or bool(self.id)
-            and not (
-                self.intakes.filter(meal=Intake.MEAL_SNACK)
-                .filter(processed=False)
-                .exists()
+            self.fat_g_goal = self._fat_g_goal
+            self.carbs_g_goal = self._carbs_g_goal
+
+            # Intake percentages
+            self.energy_kcal_intake_perc = self._energy_kcal_intake_perc
+            self.protein_g_intake_perc = self._protein_g_intake_perc
+            self.fat_g_intake_perc = self._fat_g_intake_perc
+            self.carbs_g_intake_perc = self._carbs_g_intake_perc
+
+            # Flags
+            self.breakfast_flag = self.breakfast_exc or activity.meal_flag(
+                Intake.MEAL_BREAKFAST
             )
-            and self.intakes.filter(meal=Intake.MEAL_SNACK).exists()
-        )
-        self.dinner_flag = (
-            self.dinner_exc
-            or bool(self.id)
-            and not (
-                self.intakes.filter(meal=Intake.MEAL_DINNER)
-                .filter(processed=False)
-                .exists()
+            self.lunch_flag = self.lunch_exc or activity.meal_flag(
+                Intake.MEAL_LUNCH
             )
-            and self.intakes.filter(meal=Intake.MEAL_DINNER).exists()
-        )
-        self.exercises_flag = (
-            self.exercises_exc or bool(self.id) and self.exercises.exists()
-        )
-        self.steps_flag = self.steps_exc or hasattr(self, "steps")
-
-        self.completed = (
-            self.breakfast_flag
-            and self.lunch_flag
-            and self.snack_flag
-            and self.dinner_flag
-            and self.exercises_flag
-            and self.steps_flag
-        )
-
-        super().save(*args, **kwargs)
+            self.snack_flag = self.snack_exc or activity.meal_flag(
+                Intake.MEAL_SNACK
+            )
+            self.dinner_flag = self.dinner_exc or activity.meal_flag(
+                Intake.MEAL_DINNER
+            )
+            self.exercises_flag = self.exercises_exc or activity.has_exercises
+            self.steps_flag = self.steps_exc or activity.steps is not None
+
+            self.completed = (
+                self.breakfast_flag
+                and self.lunch_flag
+                and self.snack_flag
+                and self.dinner_flag
+                and self.exercises_flag
+                and self.steps_flag
+            )
+        finally:
+            self._activity = None
 
     # Goals calculators
     @property
@@ -375,6 +484,9 @@ class Day(IntakeCascadeDeletionMixin, Nutrients):
         Returns:
             Decimal: Non-Exercise Activity Thermogenesis.
         """
+        if self._activity is not None:
+            return self._activity.steps_kcals
+
         if hasattr(self, "steps"):
             return self.steps.kcals
 
@@ -399,6 +511,9 @@ class Day(IntakeCascadeDeletionMixin, Nutrients):
         Returns:
             int: Exercise Activity Thermogenesis.
         """
+        if self._activity is not None:
+            return self._activity.exercise_kcals
+
         if self.id is None:
             return 0
 
@@ -502,6 +617,9 @@ class Day(IntakeCascadeDeletionMixin, Nutrients):
         Returns:
             Decimal: accumulated energy goal diff.
         """
+        if hasattr(self, "accumulated_energy_kcal_goal_diff"):
+            return self.accumulated_energy_kcal_goal_diff
+
         return self.plan.energy_kcal_goal_accumulated_diff(self.day_num)
 
     @admin.display(description="Energy")
@@ -8,8 +8,10 @@ from typing import Any, Iterator, cast
 from django.apps import apps
 from django.db import models, router, transaction
 
-from apps.foods.models.nutrients import NUTRIENT_LIST, Nutrients
+from apps.foods.models.nutrient_vector import NutrientVector
+from apps.foods.models.nutrients import Nutrients
 from apps.plans.locks import PlanAggregateLocks, lock_plan_aggregate_rows
+from apps.plans.recompute import plan_recompute
 
 
 class _IntakeOwnerChanged(Exception):
@@ -174,7 +176,7 @@ class IntakeQuerySet(models.QuerySet):
             tuple[int, dict[str, int]]: Total and per-model deletion counts.
         """
         using = self.db
-        with transaction.atomic(using=using):
+        with plan_recompute(using):
             locks = lock_intake_deletion_rows(self, using)
             try:
                 with activate_intake_deletion_locks(locks):
@@ -219,14 +221,17 @@ class IntakeCascadeQuerySet(models.QuerySet):
     def delete(self) -> tuple[int, dict[str, int]]:
         """Delete roots after locking every cascaded intake hierarchy.
 
+        The deletion is one unit of work, so the rollups of deleted days
+        are recomputed once.
+
         Returns:
             tuple[int, dict[str, int]]: Total and per-model deletion counts.
         """
         using = self.db
         intake_targets = intake_targets_for_cascade(self, using)
-        if not intake_targets.exists():
-            return super().delete()
-        with transaction.atomic(using=using):
+        with plan_recompute(using):
+            if not intake_targets.exists():
+                return super().delete()
             locks = lock_intake_deletion_rows(intake_targets, using)
             try:
                 with activate_intake_deletion_locks(locks):
@@ -262,9 +267,9 @@ class IntakeCascadeDeletionMixin:
         manager = cast(Any, model).objects
         targets = manager.using(using).filter(pk=instance.pk)
         intake_targets = intake_targets_for_cascade(targets, using)
-        if not intake_targets.exists():
-            return models.Model.delete(instance, *args, **kwargs)
-        with transaction.atomic(using=using):
+        with plan_recompute(using):
+            if not intake_targets.exists():
+                return models.Model.delete(instance, *args, **kwargs)
             locks = lock_intake_deletion_rows(intake_targets, using)
             try:
                 with activate_intake_deletion_locks(locks):
@@ -476,28 +481,24 @@ class Intake(Nutrients):
                     self.meal = self.validate_meal(self.meal)
                     self.meal_order = self.meal_order_for(self.meal)
 
+                    nutrients = NutrientVector.load(self)
                     if previous is not None and self.food is None:
                         removed_food_without_macro_edits = (
                             previous.food_id is not None
-                            and all(
-                                (getattr(self, nutrient) or 0)
-                                == (getattr(previous, nutrient) or 0)
-                                for nutrient in NUTRIENT_LIST
-                            )
+                            and nutrients == NutrientVector.load(previous)
                         )
                         if removed_food_without_macro_edits:
-                            for nutrient in NUTRIENT_LIST:
-                                setattr(self, nutrient, 0)
+                            nutrients = NutrientVector.zero()
+                            nutrients.store(self)
 
-                    self.processed = self.food is not None or any(
-                        (getattr(self, nutrient) or 0) != 0
-                        for nutrient in NUTRIENT_LIST
+                    self.processed = (
+                        self.food is not None or not nutrients.is_zero()
                     )
 
                     if self.food:
-                        for nutrient in NUTRIENT_LIST:
-                            value = getattr(self.food, nutrient) or 0
-                            setattr(self, nutrient, value * self.num_servings)
+                        NutrientVector.load(self.food).scale(
+                            self.num_servings
+                        ).store(self)
 
                     from apps.foods.cupboard_locks import (
                         activate_cupboard_item_locks,
@@ -0,0 +1,272 @@
+"""Per-user week and month rollup models module."""
+
+import datetime
+from collections.abc import Callable
+from decimal import Decimal
+from typing import ClassVar
+
+from django.db import models
+from django.db.models.functions import TruncMonth, TruncWeek
+
+
+class PeriodRollup(models.Model):
+    """Totals of one user's days over a period.
+
+    Rows are kept in step with the days by ``apps.plans.rollups`` and can
+    be rebuilt from the days with the ``rebuild_rollups`` command.
+    """
+
+    # Day counters and the totals averaged over the period's days
+    COUNTERS = ["days", "tracked_days", "completed_days"]
+    TOTALS = [
+        "energy_kcal",
+        "protein_g",
+        "fat_g",
+        "carbs_g",
+        "energy_kcal_goal",
+        "protein_g_goal",
+        "fat_g_goal",
+        "carbs_g_goal",
+        "tdee",
+        "deficit",
+    ]
+
+    # Set by the subclasses along with their user foreign key
+    period_trunc: type[models.Func]
+    period_start: Callable[[datetime.date], datetime.date]
+    period_end: Callable[[datetime.date], datetime.date]
+    user_id: int
+    objects: ClassVar[models.Manager["PeriodRollup"]]
+
+    class Meta:
+        abstract = True
+        ordering = ["user", "-start"]
+
+    start = models.DateField(
+        help_text="First day of the period.",
+    )
+
+    days = models.IntegerField(
+        default=0,
+        help_text="Number of plan days in the period.",
+    )
+
+    tracked_days = models.IntegerField(
+        default=0,
+    )
+
+    completed_days = models.IntegerField(
+        default=0,
+    )
+
+    energy_kcal = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="Energy (kcal)",
+    )
+
+    protein_g = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="Protein (g)",
+    )
+
+    fat_g = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="Fat (g)",
+    )
+
+    carbs_g = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="Carbs (g)",
+    )
+
+    energy_kcal_goal = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="Energy (kcal) Goal",
+    )
+
+    protein_g_goal = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="Protein (g) Goal",
+    )
+
+    fat_g_goal = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="Fat (g) Goal",
+    )
+
+    carbs_g_goal = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="Carbs (g) Goal",
+    )
+
+    tdee = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name="TDEE",
+    )
+
+    deficit = models.IntegerField(
+        default=0,
+        verbose_name="Planned deficit (kcals)",
+    )
+
+    @property
+    def end(self) -> datetime.date:
+        """Get the last day of the period.
+
+        Returns:
+            datetime.date: last day of the period.
+        """
+        return self.period_end(self.start) - datetime.timedelta(1)
+
+    @property
+    def adherence_perc(self) -> Decimal:
+        """Get the percentage of the period's days that are completed.
+
+        Returns:
+            Decimal: completed days percentage.
+        """
+        if not self.days:
+            return Decimal("0")
+
+        return Decimal(self.completed_days * 100) / self.days
+
+    def average(self, field_name: str) -> Decimal:
+        """Get the per-day average of a total.
+
+        Args:
+            field_name (str): one of ``TOTALS``.
+
+        Returns:
+            Decimal: the total divided by the period's days.
+        """
+        if not self.days:
+            return Decimal("0")
+
+        return Decimal(getattr(self, field_name)) / self.days
+
+
+class WeekRollup(PeriodRollup):
+    """Totals of one user's days over an ISO week."""
+
+    period_trunc = TruncWeek
+
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="week_rollups",
+    )
+
+    class Meta(PeriodRollup.Meta):
+        """Week rollup database metadata."""
+
+        abstract = False
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "start"], name="weekrollup_user_start_uniq"
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Get string representation.
+
+        Returns:
+            str: string representation.
+        """
+        year, week, _ = self.start.isocalendar()
+        return f"{year}-W{week:02d}"
+
+    @classmethod
+    def period_start(cls, day: datetime.date) -> datetime.date:
+        """Get the Monday of a day's ISO week.
+
+        Args:
+            day (datetime.date): any day.
+
+        Returns:
+            datetime.date: Monday of its week.
+        """
+        return day - datetime.timedelta(day.weekday())
+
+    @classmethod
+    def period_end(cls, start: datetime.date) -> datetime.date:
+        """Get the Monday after a week.
+
+        Args:
+            start (datetime.date): Monday of the week.
+
+        Returns:
+            datetime.date: Monday of the next week.
+        """
+        return start + datetime.timedelta(7)
+
+
+class MonthRollup(PeriodRollup):
+    """Totals of one user's days over a calendar month."""
+
+    period_trunc = TruncMonth
+
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="month_rollups",
+    )
+
+    class Meta(PeriodRollup.Meta):
+        """Month rollup database metadata."""
+
+        abstract = False
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "start"], name="monthrollup_user_start_uniq"
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Get string representation.
+
+        Returns:
+            str: string representation.
+        """
+        return self.start.strftime("%Y-%m")
+
+    @classmethod
+    def period_start(cls, day: datetime.date) -> datetime.date:
+        """Get the first day of a day's month.
+
+        Args:
+            day (datetime.date): any day.
+
+        Returns:
+            datetime.date: first day of its month.
+        """
+        return day.replace(day=1)
+
+    @classmethod
+    def period_end(cls, start: datetime.date) -> datetime.date:
+        """Get the first day of the month after a month.
+
+        Args:
+            start (datetime.date): first day of the month.
+
+        Returns:
+            datetime.date: first day of the next month.
+        """
+        return (start + datetime.timedelta(32)).replace(day=1)
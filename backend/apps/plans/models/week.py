@@ -1,24 +1,157 @@
 """Week model module."""
 
+import datetime
 from decimal import Decimal
 from typing import Any
 
-from django.db import models
+from django.apps import apps
+from django.db import models, router, transaction
+from django.db.models import (
+    Case,
+    Count,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Coalesce
 
 from apps.libs.basemodel import BaseModel
+from apps.plans.activity import DayActivity
+from apps.plans.locks import lock_plan_aggregate_rows
+from apps.plans.recompute import apply_rollup_changes
+from apps.plans.rollups import (
+    DayRollupValues,
+    RollupChanges,
+    stored_column,
+)
+
+from .day import Day
+from .intake import IntakeCascadeDeletionMixin, IntakeCascadeQuerySet
+
+
+def _plan_total(
+    model: type[models.Model],
+    plan_path: str,
+    expression: Any,
+    output_field: models.Field | None = None,
+    **filters: Any,
+) -> Coalesce:
+    """Total an expression over one plan's rows in a correlated subquery."""
+    output_field = output_field or models.DecimalField()
+    totals = (
+        # pylint: disable-next=protected-access
+        model._default_manager.filter(**{plan_path: OuterRef("pk")}, **filters)
+        .order_by()
+        .values(plan_path)
+        .annotate(total=Cast(expression, output_field))
+        .values("total")
+    )
+    return Coalesce(
+        Subquery(totals, output_field=output_field),
+        Value(0),
+        output_field=output_field,
+    )
+
+
+class WeekPlanQuerySet(IntakeCascadeQuerySet):
+    """WeekPlan queryset."""
+
+    def with_summary(self) -> "WeekPlanQuerySet":
+        """Annotate the weekly energy summary computed from the days.
 
-from .intake import IntakeCascadeDeletionMixin, IntakeCascadeManager
+        Every total is a correlated subquery, so plans are neither joined
+        to nor multiplied by their days, exercises and steps. The BMR part
+        of the TWEE comes from the plan's measurement in Python.
+
+        Returns:
+            WeekPlanQuerySet: plans with ``summary_*`` annotations.
+        """
+        exercise_model = apps.get_model("exercises", "Exercise")
+        steps_model = apps.get_model("exercises", "DaySteps")
+        kcal_field = Day._meta.get_field("energy_kcal")
+        energy_kcal = stored_column(Day, "energy_kcal")
+        energy_kcal_goal = stored_column(Day, "energy_kcal_goal")
+        return self.select_related("measurement").annotate(
+            summary_energy_kcal_goal=_plan_total(
+                Day, "plan", Sum(energy_kcal_goal), kcal_field
+            ),
+            summary_energy_kcal=_plan_total(
+                Day, "plan", Sum(energy_kcal), kcal_field
+            ),
+            summary_energy_kcal_goal_diff=_plan_total(
+                Day,
+                "plan",
+                Sum(
+                    Case(
+                        When(energy_kcal_goal=0, then=Value(Decimal("0"))),
+                        default=energy_kcal_goal - energy_kcal,
+                    )
+                ),
+                kcal_field,
+            ),
+            summary_tracked_days=_plan_total(
+                Day, "plan", Count("pk"), models.IntegerField(), tracked=True
+            ),
+            summary_untracked_days=_plan_total(
+                Day, "plan", Count("pk"), models.IntegerField(), tracked=False
+            ),
+            summary_tracked_tef=_plan_total(
+                Day,
+                "plan",
+                Sum(energy_kcal) * Value(Decimal("0.1")),
+                tracked=True,
+            ),
+            summary_tracked_eat=_plan_total(
+                exercise_model, "day__plan", Sum("kcals"), day__tracked=True
+            ),
+            summary_tracked_neat=_plan_total(
+                steps_model,
+                "day__plan",
+                Sum("steps") * Value(Decimal("0.03")),
+                day__tracked=True,
+            ),
+        )
+
+
+class WeekPlanManager(
+    models.Manager.from_queryset(WeekPlanQuerySet)  # type: ignore[misc]
+):
+    """Manager exposing deletion-safe and summarised plan querysets."""
 
 
 class WeekPlan(IntakeCascadeDeletionMixin, BaseModel):
     """WeekPlan model class."""
 
-    objects = IntakeCascadeManager()
+    objects = WeekPlanManager()
 
     PLAN_LENGTH_DAYS = 7
     # The following represent percentages. They should all sum 700
     DEFICIT_DISTRIBUTION = [90, 80, 90, 110, 110, 110, 110]
     EXERCISE_RATE = Decimal("1.375")
+    # Day fields a cloned week copies from its source week
+    CLONED_DAY_FIELDS = [
+        "tracked",
+        "breakfast_exc",
+        "lunch_exc",
+        "snack_exc",
+        "dinner_exc",
+        "exercises_exc",
+        "steps_exc",
+    ]
+
+    _day_template: "WeekPlan | None" = None
+
+    # Set on plans read through WeekPlanQuerySet.with_summary()
+    summary_energy_kcal_goal: Decimal
+    summary_energy_kcal: Decimal
+    summary_energy_kcal_goal_diff: Decimal
+    summary_tracked_days: int
+    summary_untracked_days: int
+    summary_tracked_tef: Decimal
+    summary_tracked_eat: Decimal
+    summary_tracked_neat: Decimal
 
     user = models.ForeignKey(
         "users.User",
@@ -80,6 +213,17 @@ class WeekPlan(IntakeCascadeDeletionMixin, BaseModel):
         ),
     )
 
+    class Meta(BaseModel.Meta):
+        """Week plan database metadata."""
+
+        abstract = False
+        indexes = [
+            models.Index(
+                fields=["user", "-start_date", "-id"],
+                name="weekplan_latest_idx",
+            )
+        ]
+
     def __str__(self) -> str:
         """Get string representation.
 
@@ -95,6 +239,17 @@ class WeekPlan(IntakeCascadeDeletionMixin, BaseModel):
         Returns:
             Decimal: TWEE.
         """
+        if hasattr(self, "summary_tracked_days"):
+            bmr = self.measurement.bmr
+            return (
+                bmr * self.summary_tracked_days
+                + self.summary_tracked_neat
+                + self.summary_tracked_tef
+                + self.summary_tracked_eat
+                + (bmr * self.EXERCISE_RATE).normalize()
+                * self.summary_untracked_days
+            )
+
         twee = Decimal("0")
         for day in self.days.all():
             twee += day.tdee
@@ -107,6 +262,9 @@ class WeekPlan(IntakeCascadeDeletionMixin, BaseModel):
         Returns:
             Decimal: energy goal.
         """
+        if hasattr(self, "summary_energy_kcal_goal"):
+            return self.summary_energy_kcal_goal
+
         goal = Decimal("0")
         for day in self.days.all():
             goal += day.energy_kcal_goal
@@ -120,6 +278,9 @@ class WeekPlan(IntakeCascadeDeletionMixin, BaseModel):
         Returns:
             Decimal: energy intake.
         """
+        if hasattr(self, "summary_energy_kcal"):
+            return self.summary_energy_kcal
+
         kcals = Decimal("0")
         for day in self.days.all():
             kcals += day.energy_kcal
@@ -144,11 +305,106 @@ class WeekPlan(IntakeCascadeDeletionMixin, BaseModel):
         Returns:
             Decimal: energy diff.
         """
+        if hasattr(self, "summary_energy_kcal_goal_diff"):
+            return self.summary_energy_kcal_goal_diff
+
         diff = Decimal("0")
         for day in self.days.all():
             diff += day.energy_kcal_goal_diff
         return diff
 
+    def create_days(self, using: str | None = None) -> list[Day]:
+        """Create the plan's days with one insert.
+
+        New days have nothing logged, so their goals and flags are derived
+        in memory and added to the rollups at once. Days of a cloned week
+        copy the source week's settings.
+
+        Args:
+            using (str | None): database alias of the plan.
+
+        Returns:
+            list[Day]: the created days, by day number.
+        """
+        using = using or router.db_for_write(type(self), instance=self)
+        templates = {}
+        if self._day_template is not None:
+            templates = {
+                day.day_num: day
+                for day in self._day_template.days.using(using)
+            }
+        with transaction.atomic(using=using):
+            # Goals come from the stored plan and its measurement, read once
+            # under the plan lock, as a day saved on its own reads them.
+            plan = lock_plan_aggregate_rows(
+                using=using, plan_ids=(self.pk,)
+            ).plans[0]
+            days = []
+            for num in range(self.PLAN_LENGTH_DAYS):
+                day = Day(
+                    plan=plan,
+                    day=plan.start_date + datetime.timedelta(num),
+                    day_num=num + 1,
+                    deficit=(
+                        plan.deficit * self.DEFICIT_DISTRIBUTION[num] / 100
+                    ),
+                )
+                template = templates.get(day.day_num)
+                if template is not None:
+                    for field_name in self.CLONED_DAY_FIELDS:
+                        setattr(day, field_name, getattr(template, field_name))
+                day.derive_fields(DayActivity())
+                days.append(day)
+            Day.objects.using(using).bulk_create(days)
+            rollups = RollupChanges()
+            for day in days:
+                rollups.add(self.user_id, DayRollupValues.of(day))
+            apply_rollup_changes(rollups, using)
+
+            completed = all(day.completed for day in days)
+            if completed != self.completed:
+                type(self).objects.using(using).filter(pk=self.pk).update(
+                    completed=completed
+                )
+                self.completed = completed
+        return days
+
+    def clone(
+        self,
+        start_date: datetime.date | None = None,
+        measurement_id: int | None = None,
+        using: str | None = None,
+    ) -> "WeekPlan":
+        """Create a copy of this plan for another week.
+
+        Args:
+            start_date (datetime.date | None): first day of the new week,
+                the week after this one by default.
+            measurement_id (int | None): measurement of the new week, this
+                plan's by default.
+            using (str | None): database alias of the plan.
+
+        Returns:
+            WeekPlan: the new plan with its days.
+        """
+        using = using or router.db_for_write(type(self), instance=self)
+        plan = type(self)(
+            user_id=self.user_id,
+            measurement_id=measurement_id or self.measurement_id,
+            start_date=start_date
+            or self.start_date + datetime.timedelta(self.PLAN_LENGTH_DAYS),
+            protein_g_kg=self.protein_g_kg,
+            fat_perc=self.fat_perc,
+            deficit=self.deficit,
+        )
+        setattr(plan, "_day_template", self)
+        try:
+            with transaction.atomic(using=using):
+                plan.save(using=using)
+        finally:
+            setattr(plan, "_day_template", None)
+        return plan
+
     def energy_kcal_goal_accumulated_diff(self, day_num: int) -> Decimal:
         """Get accumulated energy goal diff.
 
@@ -158,15 +414,17 @@ class WeekPlan(IntakeCascadeDeletionMixin, BaseModel):
         Returns:
             Decimal: accumulated energy goal diff.
         """
+        diffs = (
+            Day.objects.using(router.db_for_read(Day, instance=self))
+            .filter(plan=self)
+            .with_accumulated_diff()
+            .order_by("day_num")
+            .values_list("day_num", "accumulated_energy_kcal_goal_diff")
+        )
         diff = Decimal("0")
-        for day in self.days.filter(day_num__lte=day_num):
-            if day.completed:
-                diff += day.energy_kcal_goal_diff
-
-            # If the day isn't completed, only adds difference if it's surplus
-            elif day.energy_kcal_goal_diff < 0:
-                diff += day.energy_kcal_goal_diff
-
+        for num, accumulated in diffs:
+            if num <= day_num:
+                diff = accumulated
         return diff
 
     def save(self, *args: Any, **kwargs: Any) -> None:
@@ -0,0 +1,269 @@
+"""Transaction-scoped coalescing of Day and WeekPlan recomputation."""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, cast
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Sum
+
+from apps.foods.models.nutrient_vector import NutrientVector
+from apps.foods.models.nutrients import NUTRIENT_LIST
+from apps.plans.activity import DayActivity
+from apps.plans.locks import (
+    HeldPlanRows,
+    PlanAggregateLocks,
+    adopt_plan_aggregate_rows,
+    hold_plan_aggregate_rows,
+    lock_plan_aggregate_rows,
+)
+from apps.plans.rollups import RollupChanges
+
+if TYPE_CHECKING:
+    from apps.plans.models import Day, WeekPlan
+
+
+def intake_totals_by_day(
+    day_ids: Iterable[int], using: str
+) -> dict[int, NutrientVector]:
+    """Sum the processed intakes of many days in one grouped query.
+
+    Args:
+        day_ids (Iterable[int]): days whose totals are wanted.
+        using (str): database alias to read.
+
+    Returns:
+        dict[int, NutrientVector]: totals per day, zero for days without
+            processed intakes.
+    """
+    intake_model = apps.get_model("plans", "Intake")
+    day_ids = list(day_ids)
+    totals = {day_id: NutrientVector.zero() for day_id in day_ids}
+    rows = (
+        intake_model.objects.using(using)
+        .filter(day_id__in=day_ids, processed=True)
+        .order_by()
+        .values("day_id")
+        .annotate(
+            **{
+                nutrient: Sum(nutrient, default=Decimal("0"))
+                for nutrient in NUTRIENT_LIST
+            }
+        )
+    )
+    for row in rows:
+        totals[row["day_id"]] = NutrientVector.from_mapping(row)
+    return totals
+
+
+@dataclass
+class PlanRecompute:
+    """Days and plans a unit of work changed, recomputed once at its end."""
+
+    using: str
+    day_ids: set[int] = field(default_factory=set)
+    plan_ids: set[int] = field(default_factory=set)
+    tracked_day_ids: set[int] = field(default_factory=set)
+    observers: list[tuple[Any, Any]] = field(default_factory=list)
+    rollups: RollupChanges = field(default_factory=RollupChanges)
+    held: HeldPlanRows | None = None
+
+    def mark_days(
+        self,
+        day_ids: Iterable[int],
+        *,
+        tracked: bool = False,
+        observer: Any = None,
+        caller_day: Any = None,
+    ) -> None:
+        """Queue days whose intakes, exercises or steps changed.
+
+        Args:
+            day_ids (Iterable[int]): changed days.
+            tracked (bool): whether the days must become tracked.
+            observer (Any): intake whose ``day`` receives the flushed row.
+            caller_day (Any): caller-held day refreshed after the flush.
+        """
+        day_ids = set(day_ids)
+        self.day_ids.update(day_ids)
+        if tracked:
+            self.tracked_day_ids.update(day_ids)
+        if observer is not None:
+            self.observers.append((observer, caller_day))
+
+    def mark_plans(self, plan_ids: Iterable[int]) -> None:
+        """Queue plans whose days changed.
+
+        Args:
+            plan_ids (Iterable[int]): changed plans.
+        """
+        self.plan_ids.update(plan_ids)
+
+    def flush(self) -> None:
+        """Recompute every queued day, then every queued plan, once.
+
+        The write paths lock their plans and days up front, so the queued
+        rows are read again without locking them a second time. Rows
+        deleted by the unit of work are skipped. The activity behind the
+        day flags is read for all days at once and the rollups the days
+        owe are written last.
+        """
+        flushed: dict[int, "Day"] = {}
+        while self.day_ids or self.plan_ids:
+            day_ids, self.day_ids = self.day_ids, set()
+            locks = self._held_rows(day_ids)
+            try:
+                totals = intake_totals_by_day(day_ids, self.using)
+                activities = DayActivity.collect(day_ids, self.using)
+                for day in locks.days:
+                    totals[day.pk].store(day)
+                    # pylint: disable-next=protected-access
+                    day._activity = activities.get(day.pk)
+                    if day.pk in self.tracked_day_ids:
+                        day.tracked = True
+                    # Saving a day queues its plan instead of saving it.
+                    day.save(using=self.using)
+                    flushed[day.pk] = day
+                plans_by_pk = locks.plans_by_pk
+                plan_ids, self.plan_ids = self.plan_ids, set()
+                for plan_id in sorted(plan_ids & plans_by_pk.keys()):
+                    plans_by_pk[plan_id].save(using=self.using)
+            finally:
+                locks.clear_markers()
+        self.rollups.apply(self.using)
+        self._refresh_observers(flushed)
+
+    def _held_rows(self, day_ids: set[int]) -> PlanAggregateLocks:
+        """Read the queued days and their plans under the held locks.
+
+        A write path that queued rows without locking them first has them
+        locked here, in the canonical order, as a last resort.
+
+        Args:
+            day_ids (set[int]): queued days.
+
+        Returns:
+            PlanAggregateLocks: the current rows, ordered by primary key.
+        """
+        day_model = cast(type["Day"], apps.get_model("plans", "Day"))
+        plan_model = cast(
+            type["WeekPlan"], apps.get_model("plans", "WeekPlan")
+        )
+        days = tuple(
+            day_model.objects.using(self.using)
+            .filter(pk__in=day_ids)
+            .order_by("pk")
+        )
+        plans = tuple(
+            plan_model.objects.using(self.using)
+            .filter(pk__in=self.plan_ids | {day.plan_id for day in days})
+            .order_by("pk")
+        )
+        if self.held is None or not self.held.covers(plans, days):
+            return lock_plan_aggregate_rows(
+                using=self.using, day_ids=day_ids, plan_ids=self.plan_ids
+            )
+        return adopt_plan_aggregate_rows(self.using, plans, days)
+
+    def _refresh_observers(self, flushed: dict[int, "Day"]) -> None:
+        """Point queued intakes and caller days at the flushed day rows."""
+        day_model = apps.get_model("plans", "Day")
+        for observer, caller_day in self.observers:
+            day = flushed.get(observer.day_id)
+            if day is None:
+                continue
+            observer.day = day
+            if caller_day is not None and caller_day.pk == day.pk:
+                for day_field in day_model._meta.concrete_fields:
+                    setattr(
+                        caller_day,
+                        day_field.attname,
+                        getattr(day, day_field.attname),
+                    )
+        self.observers.clear()
+
+
+_active_plan_recompute: ContextVar[PlanRecompute | None] = ContextVar(
+    "active_plan_recompute", default=None
+)
+
+
+def get_plan_recompute(using: str) -> PlanRecompute | None:
+    """Return the unit of work open on a database alias, if any.
+
+    Args:
+        using (str): database alias of the write.
+
+    Returns:
+        PlanRecompute | None: the open unit of work.
+    """
+    recompute = _active_plan_recompute.get()
+    if recompute is None or recompute.using != using:
+        return None
+    return recompute
+
+
+@contextmanager
+def plan_recompute(using: str) -> Iterator[PlanRecompute]:
+    """Defer Day and WeekPlan recomputation to the end of a transaction.
+
+    Write paths inside the block queue the days and plans they affect.
+    Each is recomputed once just before the block's transaction commits.
+    Nested blocks join the outermost one.
+
+    Args:
+        using (str): database alias of the writes.
+
+    Yields:
+        PlanRecompute: the open unit of work.
+    """
+    active = get_plan_recompute(using)
+    if active is not None:
+        yield active
+        return
+    recompute = PlanRecompute(using)
+    token = _active_plan_recompute.set(recompute)
+    try:
+        with (
+            transaction.atomic(using=using),
+            hold_plan_aggregate_rows(using) as recompute.held,
+        ):
+            yield recompute
+            recompute.flush()
+    finally:
+        _active_plan_recompute.reset(token)
+
+
+def queue_plan_save(plan_id: int, using: str) -> bool:
+    """Queue a plan into the open unit of work instead of saving it.
+
+    Args:
+        plan_id (int): WeekPlan whose completion may have changed.
+        using (str): database alias of the write.
+
+    Returns:
+        bool: whether a unit of work took the plan.
+    """
+    recompute = get_plan_recompute(using)
+    if recompute is None:
+        return False
+    recompute.mark_plans((plan_id,))
+    return True
+
+
+def apply_rollup_changes(changes: RollupChanges, using: str) -> None:
+    """Apply rollup changes now, or when the open unit of work flushes.
+
+    Args:
+        changes (RollupChanges): updates owed by day writes.
+        using (str): database alias of the writes.
+    """
+    recompute = get_plan_recompute(using)
+    if recompute is None:
+        changes.apply(using)
+        return
+    recompute.rollups.merge(changes)
@@ -0,0 +1,41 @@
+"""Rebuilding the per-user week and month rollups from the days."""
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Q
+
+from apps.plans.locks import lock_plan_aggregate_rows
+from apps.plans.rollups import period_rollups, rollup_models
+
+
+def rebuild_rollups(user_id: int, using: str) -> int:
+    """Recompute every rollup row of a user from their days.
+
+    The user's plans are locked first, so day writes wait for the rebuild
+    instead of incrementing rows that are being replaced.
+
+    Args:
+        user_id (int): user whose history is rebuilt.
+        using (str): database alias to rebuild.
+
+    Returns:
+        int: number of rollup rows written.
+    """
+    day_model = apps.get_model("plans", "Day")
+    plan_model = apps.get_model("plans", "WeekPlan")
+    written = 0
+    with transaction.atomic(using=using):
+        lock_plan_aggregate_rows(
+            using=using,
+            plan_ids=plan_model.objects.using(using)
+            .filter(user_id=user_id)
+            .values_list("pk", flat=True),
+        )
+        days = day_model.objects.using(using).filter(plan__user_id=user_id)
+        for model in rollup_models():
+            rollups = model.objects.using(using)
+            rollups.filter(Q(user_id=user_id)).delete()
+            rows = period_rollups(model, days)
+            rollups.bulk_create(rows)
+            written += len(rows)
+    return written
@@ -0,0 +1,123 @@
+"""Week and month rollups GraphQL schema module."""
+
+# pylint: disable=too-few-public-methods
+
+import datetime
+
+import strawberry
+from django.db.models import Q
+from strawberry.types import Info
+
+from apps.libs.graphql import get_request_user
+from apps.plans.models import MonthRollup, PeriodRollup, WeekRollup
+
+
+@strawberry.type
+class RollupValuesType:
+    """GraphQL totals, or per-day averages, of a rollup."""
+
+    energy_kcal: float
+    protein_g: float
+    fat_g: float
+    carbs_g: float
+    energy_kcal_goal: float
+    protein_g_goal: float
+    fat_g_goal: float
+    carbs_g_goal: float
+    tdee: float
+    deficit: float
+
+
+@strawberry.type
+class RollupType:
+    """GraphQL week or month rollup type."""
+
+    start: str
+    end: str
+    days: int
+    tracked_days: int
+    completed_days: int
+    adherence_perc: float
+    totals: RollupValuesType
+    averages: RollupValuesType
+
+    @staticmethod
+    def from_model(obj: PeriodRollup) -> "RollupType":
+        """Create RollupType from model instance.
+
+        Args:
+            obj (PeriodRollup): model instance.
+
+        Returns:
+            RollupType: GraphQL type.
+        """
+        return RollupType(
+            start=obj.start.isoformat(),
+            end=obj.end.isoformat(),
+            days=obj.days,
+            tracked_days=obj.tracked_days,
+            completed_days=obj.completed_days,
+            adherence_perc=float(obj.adherence_perc),
+            totals=RollupValuesType(
+                **{name: float(getattr(obj, name)) for name in obj.TOTALS}
+            ),
+            averages=RollupValuesType(
+                **{name: float(obj.average(name)) for name in obj.TOTALS}
+            ),
+        )
+
+
+_ROLLUP_MODELS: dict[str, type[PeriodRollup]] = {
+    "week": WeekRollup,
+    "month": MonthRollup,
+}
+
+
+@strawberry.type
+class RollupQuery:
+    """Rollup queries."""
+
+    @strawberry.field
+    def rollups(
+        self,
+        info: Info,
+        period: str = "week",
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[RollupType]:
+        """Get the current user's week or month rollups, latest first.
+
+        Args:
+            info (Info): GraphQL execution info.
+            period (str): "week" for ISO weeks or "month" for calendar
+                months.
+            since (str | None): ISO date the periods must end on or after.
+            until (str | None): ISO date the periods must start on or
+                before.
+
+        Returns:
+            list[RollupType]: rollups of the period.
+
+        Raises:
+            ValueError: if the period is unknown.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return []
+
+        try:
+            model = _ROLLUP_MODELS[period]
+        except KeyError as e:
+            raise ValueError("period must be week or month") from e
+        rollups = model.objects.filter(Q(user=user))
+        if since is not None:
+            rollups = rollups.filter(
+                start__gte=model.period_start(
+                    datetime.date.fromisoformat(since)
+                )
+            )
+        if until is not None:
+            rollups = rollups.filter(
+                start__lte=datetime.date.fromisoformat(until)
+            )
+        return [RollupType.from_model(r) for r in rollups.order_by("-start")]
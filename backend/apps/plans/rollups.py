@@ -0,0 +1,377 @@
+"""Incremental maintenance of the per-user week and month rollups."""
+
+import datetime
+from dataclasses import dataclass, field
+from decimal import ROUND_HALF_UP, Decimal
+from functools import reduce
+from operator import or_
+from typing import TYPE_CHECKING, Any, cast
+
+from django.apps import apps
+from django.db import connections, models
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Round
+
+if TYPE_CHECKING:
+    from apps.plans.models import Day
+    from apps.plans.models.rollup import PeriodRollup
+
+# Day fields summed into the rollups as they are stored
+SUMMED_DAY_FIELDS = [
+    "energy_kcal",
+    "protein_g",
+    "fat_g",
+    "carbs_g",
+    "energy_kcal_goal",
+    "protein_g_goal",
+    "fat_g_goal",
+    "carbs_g_goal",
+]
+
+
+def rollup_models() -> tuple[type["PeriodRollup"], ...]:
+    """Return the rollup models, shortest period first.
+
+    Returns:
+        tuple[type[PeriodRollup], ...]: week and month rollup models.
+    """
+    return (
+        apps.get_model("plans", "WeekRollup"),
+        apps.get_model("plans", "MonthRollup"),
+    )
+
+
+def stored_column(model: type[models.Model], field_name: str) -> Round:
+    """Read a decimal column rounded as PostgreSQL stores it.
+
+    SQLite keeps the unrounded decimals a save writes, so sums over its
+    rows would drift from the values read back one row at a time.
+
+    Args:
+        model (type[models.Model]): model owning the column.
+        field_name (str): decimal field to read.
+
+    Returns:
+        Round: the column rounded to the field's decimal places.
+    """
+    model_field = cast(models.DecimalField, model._meta.get_field(field_name))
+    return Round(
+        field_name, model_field.decimal_places, output_field=model_field
+    )
+
+
+def _stored(day: "Day", field_name: str) -> Any:
+    """Return a day field's value as the database stores it.
+
+    Derived fields hold unrounded decimals in memory. PostgreSQL rounds
+    them half away from zero on write, so deltas are rounded the same way.
+    """
+    model_field = cast(models.Field, day._meta.get_field(field_name))
+    value = model_field.to_python(getattr(day, field_name))
+    if isinstance(model_field, models.DecimalField):
+        return value.quantize(
+            Decimal(1).scaleb(-model_field.decimal_places),
+            rounding=ROUND_HALF_UP,
+        )
+    return value
+
+
+@dataclass(frozen=True)
+class DayRollupValues:
+    """What one day adds to the rollups of its week and month."""
+
+    day: datetime.date
+    values: dict[str, Decimal]
+
+    @classmethod
+    def of(cls, day: "Day") -> "DayRollupValues":
+        """Read a day's rollup values.
+
+        Args:
+            day (Day): saved or about to be saved day.
+
+        Returns:
+            DayRollupValues: the day's contribution.
+        """
+        values = {name: _stored(day, name) for name in SUMMED_DAY_FIELDS}
+        deficit = Decimal(_stored(day, "deficit"))
+        values.update(
+            days=Decimal(1),
+            tracked_days=Decimal(day.tracked),
+            completed_days=Decimal(day.completed),
+            deficit=deficit,
+            tdee=values["energy_kcal_goal"] + deficit,
+        )
+        return cls(day.day, values)
+
+
+def counted_rollup_values(day: "Day") -> DayRollupValues | None:
+    """Return what the rollups count for a locked day row.
+
+    Args:
+        day (Day): day row read under its aggregate lock.
+
+    Returns:
+        DayRollupValues | None: the counted contribution, if recorded.
+    """
+    return getattr(day, "_rollup_values", None)
+
+
+def set_counted_rollup_values(day: "Day", values: DayRollupValues) -> None:
+    """Record what the rollups count for a locked day row.
+
+    Args:
+        day (Day): day row read under its aggregate lock.
+        values (DayRollupValues): contribution the rollups now count.
+    """
+    setattr(day, "_rollup_values", values)
+
+
+def _rollup_aggregates(
+    model: type["PeriodRollup"],
+) -> dict[str, models.Aggregate]:
+    """Return the aggregates computing rollup columns from day rows.
+
+    Keys are the rollup columns. Day rows share some of their names, so
+    the aggregates must be annotated under other aliases.
+    """
+    day_model = apps.get_model("plans", "Day")
+    return {
+        "days": Count("pk"),
+        "tracked_days": Count("pk", filter=Q(tracked=True)),
+        "completed_days": Count("pk", filter=Q(completed=True)),
+        **{
+            name: Sum(
+                stored_column(day_model, name),
+                output_field=model._meta.get_field(name),
+            )
+            for name in SUMMED_DAY_FIELDS
+        },
+        "deficit": Sum("deficit"),
+        "tdee": Sum(
+            stored_column(day_model, "energy_kcal_goal") + F("deficit"),
+            output_field=model._meta.get_field("tdee"),
+        ),
+    }
+
+
+def period_rollups(
+    model: type["PeriodRollup"], days: models.QuerySet
+) -> list["PeriodRollup"]:
+    """Total days per user and period in one grouped query.
+
+    Args:
+        model (type[PeriodRollup]): rollup model of the period.
+        days (models.QuerySet): days to total.
+
+    Returns:
+        list[PeriodRollup]: unsaved rollup rows, one per user and period.
+    """
+    aggregates = _rollup_aggregates(model)
+    rows = (
+        days.order_by()
+        .annotate(period=model.period_trunc("day"))
+        .values("plan__user_id", "period")
+        .annotate(
+            **{f"rollup_{name}": value for name, value in aggregates.items()}
+        )
+    )
+    return [
+        model(
+            start=row["period"],
+            **{
+                "user_id": row["plan__user_id"],
+                **{name: row[f"rollup_{name}"] for name in aggregates},
+            },
+        )
+        for row in rows
+    ]
+
+
+def _increment(
+    model: type["PeriodRollup"],
+    deltas: dict[tuple[int, datetime.date], dict[str, Decimal]],
+    using: str,
+) -> None:
+    """Add deltas to rollup rows, creating missing rows, in one upsert."""
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    columns = model.COUNTERS + model.TOTALS
+    row_sql = f"({', '.join(['%s'] * (len(columns) + 2))})"
+    sql = (
+        f"INSERT INTO {table} "  # nosec B608
+        f"({', '.join(map(quote, ['user_id', 'start', *columns]))}) "
+        f"VALUES {', '.join([row_sql] * len(deltas))} "
+        f"ON CONFLICT ({quote('user_id')}, {quote('start')}) DO UPDATE SET "
+        + ", ".join(
+            f"{quote(column)} = {table}.{quote(column)} "
+            f"+ EXCLUDED.{quote(column)}"
+            for column in columns
+        )
+    )
+    params: list[Any] = []
+    # Rows are written in key order so concurrent upserts cannot deadlock.
+    for (user_id, start), values in sorted(deltas.items()):
+        params += [user_id, start]
+        params += [
+            cast(models.Field, model._meta.get_field(column)).get_db_prep_save(
+                values.get(column, Decimal("0")), connection
+            )
+            for column in columns
+        ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def _refresh(
+    model: type["PeriodRollup"],
+    periods: set[tuple[int, datetime.date]],
+    using: str,
+) -> None:
+    """Recompute rollup rows from the days of their periods."""
+    day_model = apps.get_model("plans", "Day")
+    rollups = model.objects.using(using)
+    # Locking the rows first makes the totals below see every committed
+    # increment and makes later increments wait for the new totals.
+    locked = {
+        (row.user_id, row.start): row.pk
+        for row in rollups.select_for_update()
+        .filter(
+            reduce(
+                or_,
+                (
+                    Q(user_id=user_id, start=start)
+                    for user_id, start in periods
+                ),
+            )
+        )
+        .order_by("user_id", "start")
+    }
+    fresh = period_rollups(
+        model,
+        day_model.objects.using(using).filter(
+            reduce(
+                or_,
+                (
+                    Q(
+                        plan__user_id=user_id,
+                        day__gte=start,
+                        day__lt=model.period_end(start),
+                    )
+                    for user_id, start in periods
+                ),
+            )
+        ),
+    )
+    if fresh:
+        rollups.bulk_create(
+            fresh,
+            update_conflicts=True,
+            unique_fields=["user", "start"],
+            update_fields=model.COUNTERS + model.TOTALS,
+        )
+    empty = locked.keys() - {(row.user_id, row.start) for row in fresh}
+    if empty:
+        rollups.filter(pk__in=[locked[key] for key in empty]).delete()
+
+
+@dataclass
+class RollupChanges:
+    """Rollup updates owed by day writes, applied together."""
+
+    deltas: dict[
+        tuple[type["PeriodRollup"], int, datetime.date], dict[str, Decimal]
+    ] = field(default_factory=dict)
+    stale: set[tuple[int, datetime.date]] = field(default_factory=set)
+
+    def add(
+        self, user_id: int, values: DayRollupValues | None, sign: int = 1
+    ) -> None:
+        """Add or, with a negative sign, remove a day's contribution.
+
+        Args:
+            user_id (int): owner of the day.
+            values (DayRollupValues | None): the day's contribution, if it
+                has any.
+            sign (int): 1 to add the contribution, -1 to remove it.
+        """
+        if values is None:
+            return
+        for model in rollup_models():
+            totals = self.deltas.setdefault(
+                (model, user_id, model.period_start(values.day)), {}
+            )
+            for name, value in values.values.items():
+                totals[name] = totals.get(name, Decimal("0")) + sign * value
+
+    def mark_stale(self, user_id: int, day: datetime.date) -> None:
+        """Recompute the week and month of a day from the days left.
+
+        Args:
+            user_id (int): owner of the day.
+            day (datetime.date): date of a deleted day.
+        """
+        self.stale.add((user_id, day))
+
+    def merge(self, other: "RollupChanges") -> None:
+        """Take over the updates of other changes.
+
+        Args:
+            other (RollupChanges): changes to merge into these.
+        """
+        for key, values in other.deltas.items():
+            totals = self.deltas.setdefault(key, {})
+            for name, value in values.items():
+                totals[name] = totals.get(name, Decimal("0")) + value
+        self.stale |= other.stale
+
+    def apply(self, using: str) -> None:
+        """Write the updates with one statement per rollup table.
+
+        Increments go first. Periods of deleted days are then recomputed
+        from the rows left, which also drops periods without days.
+
+        Args:
+            using (str): database alias of the writes.
+        """
+        deltas, self.deltas = self.deltas, {}
+        stale, self.stale = self.stale, set()
+        for model in rollup_models():
+            changed = {
+                (user_id, start): values
+                for (key_model, user_id, start), values in deltas.items()
+                if key_model is model and any(values.values())
+            }
+            if changed:
+                _increment(model, changed, using)
+            if stale:
+                _refresh(
+                    model,
+                    {
+                        (user_id, model.period_start(day))
+                        for user_id, day in stale
+                    },
+                    using,
+                )
+
+
+def day_rollup_changes(
+    user_id: int,
+    before: DayRollupValues | None,
+    after: DayRollupValues | None,
+) -> RollupChanges:
+    """Return the rollup updates of a day going from one state to another.
+
+    Args:
+        user_id (int): owner of the day.
+        before (DayRollupValues | None): contribution already counted.
+        after (DayRollupValues | None): contribution to count instead.
+
+    Returns:
+        RollupChanges: the updates to apply.
+    """
+    changes = RollupChanges()
+    changes.add(user_id, before, sign=-1)
+    changes.add(user_id, after)
+    return changes
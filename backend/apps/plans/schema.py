@@ -3,7 +3,6 @@
 # pylint: disable=too-few-public-methods
 
 import datetime
-from collections.abc import Iterable
 from decimal import Decimal
 from typing import cast
 
@@ -15,55 +14,26 @@ from strawberry.types import Info
 
 from apps.libs.graphql import (
     get_request_user,
+    requested_field_names,
     validated_non_negative_decimal,
     validated_percentage_decimal,
     validated_positive_decimal,
 )
+from apps.libs.loaders import BatchLoader, RelationLoader
+from apps.libs.pagination import (
+    Connection,
+    empty_connection,
+    keyset_connection,
+)
+from apps.libs.projection import Column, column_values, project
 from apps.measurements.models import Measurement
 from apps.plans.locks import lock_plan_aggregate_rows
 from apps.plans.models import Day, Intake, WeekPlan
+from apps.plans.models.day import DayQuerySet, load_accumulated_diffs
+from apps.plans.recompute import plan_recompute
 
-# WeekPlanType fields that traverse the days relation (and therefore need the
-# batched day prefetch to avoid per-plan query growth).
-_DAY_DEPENDENT_FIELDS = frozenset(
-    {
-        "days",
-        "twee",
-        "energyKcalGoal",
-        "energyKcal",
-    }
-)
-
-
-def _requested_field_names(info: Info) -> set[str]:
-    """Return the GraphQL field names selected on the current field's type.
-
-    Recurses into named and inline fragment selections so conditional
-    hydration stays bounded for fragment-based queries too.
-
-    Args:
-        info (Info): GraphQL execution info.
-
-    Returns:
-        set[str]: names of selected fields on the current type.
-    """
-    names: set[str] = set()
-
-    def _visit(selections: Iterable[object]) -> None:
-        for selection in selections:
-            name = getattr(selection, "name", None)
-            if name:
-                names.add(name)
-            nested = getattr(selection, "selections", None)
-            if nested:
-                _visit(nested)
-
-    for field in info.selected_fields:
-        _visit(field.selections)
-    return names
 
-
-def _day_queryset() -> models.QuerySet:
+def _day_queryset() -> DayQuerySet:
     """Build the Day queryset with all TDEE dependencies preloaded.
 
     Selects the plan measurement and reverse one-to-one steps, prefetches
@@ -83,6 +53,19 @@ def _day_queryset() -> models.QuerySet:
     )
 
 
+_INTAKES = RelationLoader(
+    "intakes",
+    lambda: Intake.objects.order_by("meal_order", "created_at"),
+)
+# Loaded days cover whole plans, so their running diffs are exact.
+_DAYS = RelationLoader("days", lambda: _day_queryset().with_accumulated_diff())
+# Other days read the running diffs of their plans in one query.
+_ACCUMULATED_DIFFS = BatchLoader(
+    lambda day: hasattr(day, "accumulated_energy_kcal_goal_diff"),
+    load_accumulated_diffs,
+)
+
+
 def _day_tdee(day: Day) -> Decimal:
     """Compute a day's TDEE from prefetched or annotated data.
 
@@ -209,6 +192,30 @@ class IntakeType:
         )
 
 
+def _goal_float(value: Decimal | None) -> float:
+    """Return a daily goal as a float, zero when it is not set yet."""
+    return float(value) if value else 0.0
+
+
+_DAY_COLUMNS = {
+    "id": Column("id", lambda value: strawberry.ID(str(value))),
+    "plan_id": Column("plan", default=0),
+    "day": Column("day", datetime.date.isoformat, ""),
+    "day_num": Column("day_num", default=0),
+    "deficit": Column("deficit", default=0),
+    "tracked": Column("tracked", default=False),
+    "completed": Column("completed", default=False),
+    "energy_kcal_goal": Column("energy_kcal_goal", _goal_float, 0.0),
+    "protein_g_goal": Column("protein_g_goal", _goal_float, 0.0),
+    "fat_g_goal": Column("fat_g_goal", _goal_float, 0.0),
+    "carbs_g_goal": Column("carbs_g_goal", _goal_float, 0.0),
+    "energy_kcal": Column("energy_kcal", float, 0.0),
+    "protein_g": Column("protein_g", float, 0.0),
+    "fat_g": Column("fat_g", float, 0.0),
+    "carbs_g": Column("carbs_g", float, 0.0),
+}
+
+
 @strawberry.type
 class DayType:
     """GraphQL Day Type."""
@@ -239,7 +246,7 @@ class DayType:
         """
         model = self.model
         if model is not None:
-            return [IntakeType.from_model(i) for i in model.intakes.all()]
+            return [IntakeType.from_model(i) for i in _INTAKES.load(model)]
         return [
             IntakeType.from_model(i)
             for i in Intake.objects.filter(day_id=self.id).order_by(
@@ -260,28 +267,10 @@ class DayType:
         Returns:
             DayType: GraphQL type.
         """
-        wrapped = DayType(
-            id=strawberry.ID(str(obj.id)),
-            plan_id=obj.plan_id,
-            day=obj.day.isoformat(),
-            day_num=obj.day_num,
-            deficit=obj.deficit,
-            tracked=obj.tracked,
-            completed=obj.completed,
-            energy_kcal_goal=(
-                float(obj.energy_kcal_goal) if obj.energy_kcal_goal else 0.0
-            ),
-            protein_g_goal=(
-                float(obj.protein_g_goal) if obj.protein_g_goal else 0.0
-            ),
-            fat_g_goal=float(obj.fat_g_goal) if obj.fat_g_goal else 0.0,
-            carbs_g_goal=float(obj.carbs_g_goal) if obj.carbs_g_goal else 0.0,
-            energy_kcal=float(obj.energy_kcal),
-            protein_g=float(obj.protein_g),
-            fat_g=float(obj.fat_g),
-            carbs_g=float(obj.carbs_g),
-        )
+        wrapped = DayType(**column_values(obj, _DAY_COLUMNS))
         wrapped.model = obj
+        _INTAKES.add(obj)
+        _ACCUMULATED_DIFFS.add(obj)
         return wrapped
 
     @strawberry.field
@@ -295,6 +284,36 @@ class DayType:
             return 0.0
         return float(_day_tdee(self.model))
 
+    @strawberry.field
+    def energy_kcal_goal_accumulated_diff(self) -> float:
+        """Resolve the plan's running energy goal diff up to this day.
+
+        Returns:
+            float: accumulated energy goal diff.
+        """
+        if self.model is None:
+            return 0.0
+        _ACCUMULATED_DIFFS.ensure_loaded(self.model)
+        return float(self.model.energy_kcal_goal_accumulated_diff)
+
+
+_WEEK_PLAN_SUMMARY_FIELDS = {"twee", "energyKcalGoal", "energyKcal"}
+
+
+def _week_plan_queryset(info: Info) -> models.QuerySet:
+    """Build the WeekPlan queryset, summarised when totals are selected.
+
+    Args:
+        info (Info): GraphQL execution info.
+
+    Returns:
+        models.QuerySet: week plans, with ``with_summary()`` annotations
+            when a weekly total is requested.
+    """
+    if requested_field_names(info) & _WEEK_PLAN_SUMMARY_FIELDS:
+        return WeekPlan.objects.with_summary()
+    return WeekPlan.objects.all()
+
 
 @strawberry.type
 class WeekPlanType:
@@ -317,9 +336,9 @@ class WeekPlanType:
         """
         model = self.model
         if model is not None:
-            # The conditional week_plans/week_plan prefetch builds this cache
-            # with _day_queryset(), so TDEE dependencies are already loaded.
-            return [DayType.from_model(d) for d in model.days.all()]
+            # Days load through _day_queryset(), so TDEE dependencies are
+            # already loaded.
+            return [DayType.from_model(d) for d in _DAYS.load(model)]
         return [
             DayType.from_model(d)
             for d in Day.objects.filter(plan_id=int(str(self.id))).order_by(
@@ -346,6 +365,7 @@ class WeekPlanType:
             completed=obj.completed,
         )
         wrapped.model = obj
+        _DAYS.add(obj)
         return wrapped
 
     @strawberry.field
@@ -357,8 +377,10 @@ class WeekPlanType:
         """
         if self.model is None:
             return 0.0
+        if hasattr(self.model, "summary_tracked_days"):
+            return float(self.model.twee)
         total = Decimal("0")
-        for day in self.model.days.all():
+        for day in _DAYS.load(self.model):
             total += _day_tdee(day)
         return float(total)
 
@@ -371,6 +393,8 @@ class WeekPlanType:
         """
         if self.model is None:
             return 0.0
+        if not hasattr(self.model, "summary_energy_kcal_goal"):
+            _DAYS.load(self.model)
         return float(self.model.energy_kcal_goal)
 
     @strawberry.field
@@ -382,6 +406,8 @@ class WeekPlanType:
         """
         if self.model is None:
             return 0.0
+        if not hasattr(self.model, "summary_energy_kcal"):
+            _DAYS.load(self.model)
         return float(self.model.energy_kcal)
 
 
@@ -403,16 +429,48 @@ class PlanQuery:
         if user is None or not user.is_authenticated:
             return []
 
-        queryset = WeekPlan.objects.filter(user=user)
-        if _requested_field_names(info) & _DAY_DEPENDENT_FIELDS:
-            queryset = queryset.prefetch_related(
-                Prefetch("days", queryset=_day_queryset())
-            )
         return [
             WeekPlanType.from_model(p)
-            for p in queryset.order_by("-start_date")
+            for p in _week_plan_queryset(info)
+            .filter(user=user)
+            .order_by("-start_date")
         ]
 
+    @strawberry.field
+    def week_plans_connection(
+        self,
+        info: Info,
+        first: int | None = None,
+        after: str | None = None,
+        last: int | None = None,
+        before: str | None = None,
+    ) -> Connection[WeekPlanType]:
+        """Get a keyset-paginated page of week plans for the current user.
+
+        Args:
+            info (Info): GraphQL execution info.
+            first (int | None): number of plans after the after cursor.
+            after (str | None): cursor to page forward from.
+            last (int | None): number of plans before the before cursor.
+            before (str | None): cursor to page backward from.
+
+        Returns:
+            Connection[WeekPlanType]: week plans, latest start first.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            return empty_connection()
+
+        return keyset_connection(
+            _week_plan_queryset(info).filter(user=user),
+            ("-start_date", "-id"),
+            WeekPlanType.from_model,
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+        )
+
     @strawberry.field
     def week_plan(self, info: Info, id: strawberry.ID) -> WeekPlanType | None:
         """Get a single week plan.
@@ -429,12 +487,7 @@ class PlanQuery:
             return None
 
         try:
-            queryset = WeekPlan.objects.filter(pk=id, user=user)
-            if _requested_field_names(info) & _DAY_DEPENDENT_FIELDS:
-                queryset = queryset.prefetch_related(
-                    Prefetch("days", queryset=_day_queryset())
-                )
-            obj = queryset.get()
+            obj = _week_plan_queryset(info).get(pk=id, user=user)
         except WeekPlan.DoesNotExist:
             return None
         return WeekPlanType.from_model(obj)
@@ -454,9 +507,14 @@ class PlanQuery:
         if user is None or not user.is_authenticated:
             return None
 
-        queryset = Day.objects.filter(plan__user=user)
-        if _requested_field_names(info) & {"intakes", "tdee"}:
+        selected = requested_field_names(info)
+        queryset: models.QuerySet
+        if "tdee" in selected:
             queryset = _day_queryset().filter(plan__user=user)
+        else:
+            queryset = project(
+                Day.objects.filter(plan__user=user), selected, _DAY_COLUMNS
+            )
         try:
             obj = queryset.get(pk=id)
         except Day.DoesNotExist:
@@ -543,7 +601,6 @@ class PlanMutation:
         return WeekPlanType.from_model(obj)
 
     @strawberry.mutation
-    @transaction.atomic
     def update_week_plan(
         self,
         info: Info,
@@ -577,33 +634,98 @@ class PlanMutation:
         except WeekPlan.DoesNotExist as e:
             raise ValueError("WeekPlan not found") from e
 
-        day_ids = tuple(obj.days.order_by("pk").values_list("pk", flat=True))
-        aggregate_locks = lock_plan_aggregate_rows(
-            using=router.db_for_write(WeekPlan, instance=obj),
-            plan_ids=(obj.pk,),
-            day_ids=day_ids,
-        )
-        obj = aggregate_locks.plans_by_pk[obj.pk]
-        days = sorted(aggregate_locks.days, key=lambda day: day.day_num)
-        try:
-            validated_protein, validated_fat, validated_deficit = (
-                _validated_week_plan_parameters(
-                    obj.measurement,
-                    protein_g_kg,
-                    fat_perc,
-                    deficit,
-                    [day.tdee for day in days],
+        using = router.db_for_write(WeekPlan, instance=obj)
+        # Day saves queue one plan save instead of one save each.
+        with plan_recompute(using):
+            day_ids = tuple(
+                obj.days.order_by("pk").values_list("pk", flat=True)
+            )
+            aggregate_locks = lock_plan_aggregate_rows(
+                using=using,
+                plan_ids=(obj.pk,),
+                day_ids=day_ids,
+            )
+            obj = aggregate_locks.plans_by_pk[obj.pk]
+            days = sorted(aggregate_locks.days, key=lambda day: day.day_num)
+            try:
+                validated_protein, validated_fat, validated_deficit = (
+                    _validated_week_plan_parameters(
+                        obj.measurement,
+                        protein_g_kg,
+                        fat_perc,
+                        deficit,
+                        [day.tdee for day in days],
+                    )
                 )
+                obj.protein_g_kg = validated_protein
+                obj.fat_perc = validated_fat
+                obj.deficit = validated_deficit
+                obj.save()
+                for day, deficit_perc in zip(days, obj.DEFICIT_DISTRIBUTION):
+                    day.deficit = obj.deficit * deficit_perc / 100
+                    day.save()
+            finally:
+                aggregate_locks.clear_markers()
+        return WeekPlanType.from_model(obj)
+
+    @strawberry.mutation
+    def clone_week_plan(
+        self,
+        info: Info,
+        id: strawberry.ID,
+        start_date: str | None = None,
+        measurement_id: int | None = None,
+    ) -> WeekPlanType:
+        """Copy a week plan and its day settings to another week.
+
+        Args:
+            info (Info): GraphQL execution info.
+            id (strawberry.ID): week plan ID to copy.
+            start_date (str | None): the new start date in ISO format, the
+                following week by default.
+            measurement_id (int | None): the new week's measurement ID, the
+                copied plan's by default.
+
+        Returns:
+            WeekPlanType: the new week plan.
+
+        Raises:
+            PermissionError: if user is not authenticated.
+            ValueError: if week plan or measurement not found.
+        """
+        user = get_request_user(info.context)
+        if user is None or not user.is_authenticated:
+            raise PermissionError("Authentication required")
+
+        try:
+            source = WeekPlan.objects.select_related("measurement").get(
+                pk=id, user=user
             )
-            obj.protein_g_kg = validated_protein
-            obj.fat_perc = validated_fat
-            obj.deficit = validated_deficit
-            obj.save()
-            for day, deficit_perc in zip(days, obj.DEFICIT_DISTRIBUTION):
-                day.deficit = obj.deficit * deficit_perc / 100
-                day.save()
-        finally:
-            aggregate_locks.clear_markers()
+        except WeekPlan.DoesNotExist as e:
+            raise ValueError("WeekPlan not found") from e
+        measurement = source.measurement
+        if measurement_id is not None:
+            try:
+                measurement = Measurement.objects.get(
+                    pk=measurement_id, user=user
+                )
+            except Measurement.DoesNotExist as e:
+                raise ValueError("Measurement not found") from e
+
+        _validated_week_plan_parameters(
+            measurement,
+            float(source.protein_g_kg),
+            float(source.fat_perc),
+            source.deficit,
+        )
+        obj = source.clone(
+            start_date=(
+                None
+                if start_date is None
+                else datetime.date.fromisoformat(start_date)
+            ),
+            measurement_id=measurement.pk,
+        )
         return WeekPlanType.from_model(obj)
 
     @strawberry.mutation
@@ -1,11 +1,8 @@
 """plans app signal handlers module."""
 
-import datetime
-from decimal import Decimal
 from typing import Any
 
 from django.db import transaction
-from django.db.models import Sum
 from django.db.models.signals import (
     post_delete,
     post_save,
@@ -14,10 +11,16 @@ from django.db.models.signals import (
 from django.dispatch import receiver
 
 from apps.exercises.models import DaySteps, Exercise
-from apps.foods.models.nutrients import NUTRIENT_LIST
 from apps.plans.locks import lock_plan_aggregate_rows
 from apps.plans.models import Day, Intake, WeekPlan
 from apps.plans.models.intake import get_intake_deletion_locks
+from apps.plans.recompute import (
+    apply_rollup_changes,
+    get_plan_recompute,
+    intake_totals_by_day,
+    queue_plan_save,
+)
+from apps.plans.rollups import RollupChanges
 
 
 @receiver(post_save, sender=WeekPlan)
@@ -38,15 +41,7 @@ def create_week_days(
     if not created:
         return
 
-    plan = instance
-
-    for num in range(plan.PLAN_LENGTH_DAYS):
-        Day.objects.create(
-            plan=plan,
-            day=plan.start_date + datetime.timedelta(num),
-            day_num=num + 1,
-            deficit=(plan.deficit * plan.DEFICIT_DISTRIBUTION[num] / 100),
-        )
+    instance.create_days(using=kwargs["using"])
 
 
 def _recalculate_intake_days(instance: Intake, using: str) -> None:
@@ -55,13 +50,24 @@ def _recalculate_intake_days(instance: Intake, using: str) -> None:
     Intake model writes lock all affected days before any model signal runs.
     Bulk/cascaded deletion obtains the same locks in ``pre_delete`` below. This
     function deliberately derives totals from persisted rows instead of cached
-    model arithmetic.
+    model arithmetic. Inside an open unit of work the days are only queued.
 
     Args:
         instance (Intake): intake whose affected days are recomputed.
         using (str): database alias used by the write.
     """
     day_ids = getattr(instance, "_nutrition_day_ids", (instance.day_id,))
+    recompute = get_plan_recompute(using)
+    if recompute is not None:
+        recompute.mark_days(
+            day_ids,
+            observer=instance,
+            caller_day=getattr(instance, "_caller_day", None),
+        )
+        if Intake._meta.get_field("day").is_cached(instance):
+            # The plan is refreshed even if a cascade deletes the day.
+            recompute.mark_plans((instance.day.plan_id,))
+        return
     aggregate_locks = getattr(instance, "_nutrition_locks", None)
     if aggregate_locks is None or not aggregate_locks.covers_days(
         day_ids, using
@@ -72,18 +78,9 @@ def _recalculate_intake_days(instance: Intake, using: str) -> None:
         setattr(instance, "_nutrition_locks", aggregate_locks)
     days_by_pk = aggregate_locks.days_by_pk
     days = [days_by_pk[day_id] for day_id in sorted(day_ids)]
-    aggregate_fields = {
-        nutrient: Sum(nutrient, default=Decimal("0"))
-        for nutrient in NUTRIENT_LIST
-    }
+    totals = intake_totals_by_day(day_ids, using)
     for day in days:
-        totals = (
-            Intake.objects.using(using)
-            .filter(day_id=day.pk, processed=True)
-            .aggregate(**aggregate_fields)
-        )
-        for nutrient, total in totals.items():
-            setattr(day, nutrient, total)
+        totals[day.pk].store(day)
         day.save(using=using)
         if day.pk == instance.day_id:
             caller_day = getattr(instance, "_caller_day", None)
@@ -166,6 +163,23 @@ def recalculate_flags_on_delete(
     _recalculate_intake_days(instance, kwargs["using"])
 
 
+def _queue_day(day_id: int, using: str) -> bool:
+    """Queue a day into the open unit of work instead of saving it.
+
+    Args:
+        day_id (int): day whose exercises or steps changed.
+        using (str): database alias of the write.
+
+    Returns:
+        bool: whether a unit of work took the day.
+    """
+    recompute = get_plan_recompute(using)
+    if recompute is None:
+        return False
+    recompute.mark_days((day_id,))
+    return True
+
+
 @receiver(post_save, sender=Exercise)
 def increase_day_goals_and_percs_and_tracked(
     sender: Exercise,  # pylint: disable=unused-argument
@@ -179,6 +193,10 @@ def increase_day_goals_and_percs_and_tracked(
         instance (Exercise): instance to be saved.
         kwargs (Any): keyword arguments.
     """
+    recompute = get_plan_recompute(kwargs["using"])
+    if recompute is not None:
+        recompute.mark_days((instance.day_id,), tracked=True)
+        return
     instance.day.tracked = True
     instance.day.save()
 
@@ -196,6 +214,8 @@ def decrease_day_goals_and_percs(
         instance (Exercise): instance to be deleted.
         kwargs (Any): keyword arguments.
     """
+    if _queue_day(instance.day_id, kwargs["using"]):
+        return
     instance.day.save()
 
 
@@ -212,6 +232,8 @@ def enable_steps_flag(
         instance (DayStep): instance to be saved.
         kwargs (Any): keyword arguments.
     """
+    if _queue_day(instance.day_id, kwargs["using"]):
+        return
     instance.day.save()
 
 
@@ -228,6 +250,8 @@ def disable_steps_flag(
         instance (DayStep): instance to be deleted.
         kwargs (Any): keyword arguments.
     """
+    if _queue_day(instance.day_id, kwargs["using"]):
+        return
     day = instance.day
     day.steps = None
     day.save()
@@ -246,4 +270,27 @@ def complete_week(
         instance (Day): instance to be saved.
         kwargs (Any): keyword arguments.
     """
+    if queue_plan_save(instance.plan_id, kwargs["using"]):
+        return
     instance.plan.save()
+
+
+@receiver(post_delete, sender=Day)
+def refresh_deleted_day_rollups(
+    sender: Day,  # pylint: disable=unused-argument
+    instance: Day,
+    **kwargs: Any,
+) -> None:
+    """Recompute the week and month rollups of a deleted day.
+
+    The rollups are recomputed from the days left rather than decremented,
+    since cascaded intake deletions may save the day after it was loaded.
+
+    Args:
+        sender (Day): signal sender.
+        instance (Day): deleted instance.
+        kwargs (Any): keyword arguments.
+    """
+    rollups = RollupChanges()
+    rollups.mark_stale(instance.plan.user_id, instance.day)
+    apply_rollup_changes(rollups, kwargs["using"])
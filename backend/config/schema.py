@@ -22,9 +22,12 @@ from apps.foods.schema import (
 )
 from apps.goals.schema import GoalMutation, GoalQuery
 from apps.libs.graphql import get_request_user
+from apps.libs.loaders import RelationLoaderExtension
 from apps.measurements.models import Measurement
 from apps.measurements.schema import MeasurementMutation, MeasurementQuery
+from apps.plans.intake_schema import IntakeBatchMutation
 from apps.plans.models import Day
+from apps.plans.rollup_schema import RollupQuery
 from apps.plans.schema import PlanMutation, PlanQuery
 from config.middleware import authenticated_request_user
 
@@ -183,12 +186,15 @@ class Query(
     GoalQuery,
     ExerciseQuery,
     PlanQuery,
+    RollupQuery,
     FoodQuery,
     RecipeQuery,
     CupboardQuery,
 ):
     """Root Query."""
 
+    # pylint: disable=too-many-ancestors
+
     @strawberry.field
     def hello(self) -> str:
         """Return hello world string.
@@ -227,12 +233,15 @@ class Mutation(
     GoalMutation,
     ExerciseMutation,
     PlanMutation,
+    IntakeBatchMutation,
     FoodMutation,
     RecipeMutation,
     CupboardMutation,
 ):
     """Root Mutation."""
 
+    # pylint: disable=too-many-ancestors
+
     @strawberry.mutation
     def login(self, email: str, password: str) -> AuthPayload:
         """Authenticate user and return token.
@@ -272,4 +281,8 @@ class Mutation(
         raise ValueError("Invalid credentials")
 
 
-schema = strawberry.Schema(query=Query, mutation=Mutation)
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[RelationLoaderExtension],
+)
@@ -112,6 +112,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "django_extensions",
     "nested_admin",
     "taggit",
@@ -249,6 +250,14 @@ CARB_KCAL_GRAM = 4
 KCAL_KG = 7700
 
 
+# Recipe aggregates
+# Apply each ingredient change to the stored recipe totals instead of
+# re-summing every ingredient; verify_recipe_aggregates repairs drift.
+RECIPE_AGGREGATES_INCREMENTAL = ENV.bool(
+    "RECIPE_AGGREGATES_INCREMENTAL", default=True
+)
+
+
 # https://adamj.eu/tech/2023/12/07/django-fix-urlfield-assume-scheme-warnings/
 filterwarnings(
     "ignore",
@@ -0,0 +1,101 @@
+"""Compare one-by-one and batch barcode lookups against a fake OFF API.
+
+Reads go to a local stand-in for Open Food Facts with a fixed latency and
+take tokens from a benchmark-only quota bucket. The benchmark's cache rows
+and bucket are deleted afterwards, so it can run against any development
+database.
+"""
+
+import os
+import time
+from collections.abc import Callable
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from apps.foods import open_food_facts  # noqa: E402
+from apps.foods.models import (  # noqa: E402
+    OpenFoodFactsCacheEntry,
+    OpenFoodFactsRateLimit,
+)
+from apps.foods.open_food_facts_rate_limit import TokenBucket  # noqa: E402
+from tests.foods.fake_open_food_facts import (  # noqa: E402
+    FakeOpenFoodFacts,
+    fake_barcodes,
+)
+
+BATCH_SIZE = 20
+LATENCY_SECONDS = 0.05
+BUCKET_KEY = "benchmark_product_reads"
+
+
+def _one_by_one(barcodes: list[str]) -> None:
+    """Look barcodes up the way the scanner did, one request at a time."""
+    for barcode in barcodes:
+        open_food_facts.fetch_open_food_facts_product(barcode)
+
+
+def _batch(barcodes: list[str]) -> None:
+    """Look barcodes up with one batch lookup."""
+    for _lookup in open_food_facts.iter_open_food_facts_products(barcodes):
+        pass
+
+
+def _measure(
+    lookup: Callable[[list[str]], None], barcodes: list[str]
+) -> tuple[float, int, int]:
+    """Time a lookup path on cold caches.
+
+    Args:
+        lookup (Callable[[list[str]], None]): lookup path to measure.
+        barcodes (list[str]): barcodes to look up.
+
+    Returns:
+        tuple[float, int, int]: seconds taken, provider reads and
+        connections opened to the provider.
+    """
+    open_food_facts.LOCAL_PRODUCT_CACHE.clear()
+    OpenFoodFactsCacheEntry.objects.filter(barcode__in=barcodes).delete()
+    OpenFoodFactsRateLimit.objects.filter(key=BUCKET_KEY).delete()
+    with FakeOpenFoodFacts(delay_seconds=LATENCY_SECONDS) as server:
+        open_food_facts.OFF_API_BASE_URL = server.api_base_url
+        started = time.perf_counter()
+        lookup(barcodes)
+        seconds = time.perf_counter() - started
+        open_food_facts.HTTP_SESSION.close()
+    return seconds, len(server.reads), len(server.connections)
+
+
+def main() -> None:
+    """Measure both lookup paths and clean up after them."""
+    barcodes = fake_barcodes(BATCH_SIZE)
+    # Room for every read, so that only the provider latency is measured.
+    open_food_facts.REQUEST_BUCKET = TokenBucket(
+        BUCKET_KEY, capacity=BATCH_SIZE, refill_per_second=1
+    )
+    try:
+        results = {
+            "one by one": _measure(_one_by_one, barcodes),
+            "batch": _measure(_batch, barcodes),
+        }
+    finally:
+        OpenFoodFactsCacheEntry.objects.filter(barcode__in=barcodes).delete()
+        OpenFoodFactsRateLimit.objects.filter(key=BUCKET_KEY).delete()
+
+    print(
+        f"barcodes: {BATCH_SIZE}, "
+        f"provider latency: {LATENCY_SECONDS * 1000:.0f} ms"
+    )
+    for name, (seconds, reads, connections) in results.items():
+        print(
+            f"{name + ':':<12}{seconds * 1000:8.1f} ms, "
+            f"{reads} reads over {connections} connections"
+        )
+    (serial_seconds, _, _), (batch_seconds, _, _) = results.values()
+    print(f"speedup: {serial_seconds / batch_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Compare full-row and projected catalog reads on a large catalog.
+
+Rows are created inside a transaction that is rolled back afterwards, so
+the benchmark can run against any development database.
+"""
+
+import os
+import timeit
+from decimal import Decimal
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+from django.db.models import QuerySet  # noqa: E402
+
+from apps.foods.models import FoodProduct  # noqa: E402
+from apps.foods.schema import (  # noqa: E402
+    _PRODUCT_COLUMNS,
+    FoodProductType,
+)
+from apps.libs.projection import project  # noqa: E402
+
+CATALOG_SIZE = 2_000
+REPEAT = 5
+# The fields a typical food picker screen selects.
+SELECTED = {"id", "name", "energyKcal", "proteinG", "fatG", "carbsG"}
+
+
+def _create_catalog() -> None:
+    """Create products with every optional nutrient filled in."""
+    for index in range(CATALOG_SIZE):
+        FoodProduct.objects.create(
+            name=f"Benchmark product {index:05}",
+            brand="Benchmark",
+            url="https://example.com/product",
+            notes="Benchmark notes " * 4,
+            energy_kcal=Decimal("123.45"),
+            protein_g=Decimal("12.3"),
+            fat_g=Decimal("4.5"),
+            saturated_fat_g=Decimal("1.2"),
+            polyunsaturated_fat_g=Decimal("0.8"),
+            monosaturated_fat_g=Decimal("1.9"),
+            trans_fat_g=Decimal("0.1"),
+            carbs_g=Decimal("20.1"),
+            fibre_carbs_g=Decimal("3.4"),
+            sugar_carbs_g=Decimal("6.7"),
+            salt_g=Decimal("0.5"),
+        )
+
+
+def _fetched_bytes(queryset: QuerySet) -> int:
+    """Return the size of the values the database sends for a queryset.
+
+    Args:
+        queryset (QuerySet): rows to read.
+
+    Returns:
+        int: bytes of the textual representation of every fetched value.
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return sum(
+            len(str(value).encode())
+            for row in cursor.fetchall()
+            for value in row
+            if value is not None
+        )
+
+
+def _hydration_seconds(queryset: QuerySet) -> float:
+    """Return the best time to load and wrap every row of a queryset.
+
+    Args:
+        queryset (QuerySet): rows to read.
+
+    Returns:
+        float: seconds of the fastest run.
+    """
+
+    def _hydrate() -> None:
+        for row in queryset.all():
+            FoodProductType.from_model(row)
+
+    return min(timeit.repeat(_hydrate, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    """Create a catalog, measure both read paths and roll it back."""
+    with transaction.atomic():
+        _create_catalog()
+        paths = {
+            "full": FoodProduct.objects.order_by("name"),
+            "projected": project(
+                FoodProduct.objects.order_by("name"),
+                SELECTED,
+                _PRODUCT_COLUMNS,
+            ),
+        }
+        results = {
+            name: (_fetched_bytes(queryset), _hydration_seconds(queryset))
+            for name, queryset in paths.items()
+        }
+        transaction.set_rollback(True)
+
+    print(f"catalog: {CATALOG_SIZE} benchmark products")
+    for name, (size, seconds) in results.items():
+        print(
+            f"{name + ':':<11}{size / 1024:9.1f} KiB fetched, "
+            f"{seconds * 1000:8.1f} ms to hydrate"
+        )
+    (full_size, full_seconds), (size, seconds) = results.values()
+    print(
+        f"saved: {1 - size / full_size:.0%} of bytes, "
+        f"{1 - seconds / full_seconds:.0%} of hydration time"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Compare per-nutrient and vector recipe aggregation of many ingredients."""
+
+import os
+import timeit
+from decimal import Decimal
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from apps.foods.models import Recipe, RecipeIngredient  # noqa: E402
+from apps.foods.models.nutrient_vector import NutrientVector  # noqa: E402
+from apps.foods.models.nutrients import NUTRIENT_LIST  # noqa: E402
+from apps.foods.signals.handlers.recipe_nutrients import (  # noqa: E402
+    validate_derived_nutrients,
+)
+
+INGREDIENTS = 300
+ITERATIONS = 20
+RECIPE = Recipe()
+
+
+def _ingredients() -> list[RecipeIngredient]:
+    """Build ingredients with every nutrient set."""
+    return [
+        RecipeIngredient(
+            **{
+                nutrient: Decimal(index % 97) + Decimal("0.25")
+                for nutrient in NUTRIENT_LIST
+            }
+        )
+        for index in range(INGREDIENTS)
+    ]
+
+
+def _legacy_clean(value: Decimal, field_name: str) -> Decimal:
+    """Validate a value the way recipe aggregation previously did."""
+    field = Recipe._meta.get_field(field_name)
+    normalized = value.normalize() if value else Decimal("0")
+    return field.clean(normalized, None)
+
+
+def _legacy_totals(ingredients: list[RecipeIngredient]) -> None:
+    """Sum with a getattr, two cleans and a setattr per nutrient."""
+    totals = {nutrient: Decimal("0") for nutrient in NUTRIENT_LIST}
+    for ingredient in ingredients:
+        for nutrient in NUTRIENT_LIST:
+            contribution = _legacy_clean(
+                getattr(ingredient, nutrient) or Decimal("0"), nutrient
+            )
+            totals[nutrient] = _legacy_clean(
+                totals[nutrient] + contribution, nutrient
+            )
+    for nutrient, value in totals.items():
+        setattr(RECIPE, nutrient, value)
+
+
+def _vector_totals(ingredients: list[RecipeIngredient]) -> None:
+    """Sum validated nutrient vectors with compiled field bounds."""
+    validate_derived_nutrients(
+        NutrientVector.sum(
+            validate_derived_nutrients(
+                NutrientVector.load(ingredient), Recipe, "Recipe"
+            )
+            for ingredient in ingredients
+        ),
+        Recipe,
+        "Recipe",
+    ).store(RECIPE)
+
+
+def main() -> None:
+    """Time both aggregation paths and check they agree."""
+    ingredients = _ingredients()
+    _legacy_totals(ingredients)
+    legacy = NutrientVector.load(RECIPE)
+    _vector_totals(ingredients)
+    assert NutrientVector.load(RECIPE) == legacy
+
+    timings = {
+        name: min(
+            timeit.repeat(
+                lambda path=path: path(ingredients),
+                number=ITERATIONS,
+                repeat=3,
+            )
+        )
+        / ITERATIONS
+        for name, path in (
+            ("legacy", _legacy_totals),
+            ("vector", _vector_totals),
+        )
+    }
+    print(f"ingredients: {INGREDIENTS}, nutrients: {len(NUTRIENT_LIST)}")
+    for name, seconds in timings.items():
+        print(f"{name + ':':<8}{seconds * 1000:8.2f} ms/recompute")
+    print(f"speedup: {timings['legacy'] / timings['vector']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare the precomputed conversion table with the pint registry path."""
+
+import os
+import timeit
+from decimal import Decimal
+from itertools import product
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from apps.foods.models.conversions import convert  # noqa: E402
+from apps.foods.models.units import (  # noqa: E402
+    MASS_UNITS,
+    UREG,
+    VOLUME_UNITS,
+)
+
+ITERATIONS = 2_000
+AMOUNT = Decimal("123.4")
+PAIRS = [
+    pair
+    for dimension in (sorted(MASS_UNITS), sorted(VOLUME_UNITS))
+    for pair in product(dimension, repeat=2)
+]
+
+
+def _pint_path() -> None:
+    """Convert every pair the way the write paths previously did."""
+    for source, target in PAIRS:
+        (UREG.Quantity(AMOUNT) * UREG(source)).to(target).m
+
+
+def _table_path() -> None:
+    """Convert every pair through the precomputed factor table."""
+    for source, target in PAIRS:
+        convert(AMOUNT, source, target)
+
+
+def main() -> None:
+    """Time both conversion paths and print the per-call cost."""
+    calls = ITERATIONS * len(PAIRS)
+    pint_seconds = min(timeit.repeat(_pint_path, number=ITERATIONS, repeat=3))
+    table_seconds = min(
+        timeit.repeat(_table_path, number=ITERATIONS, repeat=3)
+    )
+    print(f"pairs: {len(PAIRS)}, calls per path: {calls}")
+    print(f"pint:  {pint_seconds / calls * 1e6:.3f} us/call")
+    print(f"table: {table_seconds / calls * 1e6:.3f} us/call")
+    print(f"speedup: {pint_seconds / table_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
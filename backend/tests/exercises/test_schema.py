@@ -108,6 +108,63 @@ class TestExerciseQuery:
         assert len(result.data["exercises"]) == 1
         assert result.data["exercises"][0]["kcals"] == 200
 
+    def test_exercise_and_steps_connections_page_latest_first(self, mocker):
+        """Exercise and step connections page through days newest first."""
+        # Given exercises across two days and steps on both days
+        user, day = _create_user_with_day("expages@example.com")
+        earlier = Day.objects.get(
+            plan=day.plan, day=day.day - datetime.timedelta(days=1)
+        )
+        Exercise.objects.create(
+            day=earlier, time="09:00", type="walk", kcals=1
+        )
+        Exercise.objects.create(day=earlier, time="18:00", type="run", kcals=2)
+        Exercise.objects.create(day=day, time="07:00", type="gym", kcals=3)
+        DaySteps.objects.create(day=earlier, steps=1000)
+        DaySteps.objects.create(day=day, steps=2000)
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        query = """
+            query Pages($after: String, $stepsAfter: String) {
+                exercisesConnection(first: 2, after: $after) {
+                    edges { node { kcals } }
+                    pageInfo { hasNextPage endCursor }
+                }
+                dayStepsListConnection(first: 1, after: $stepsAfter) {
+                    edges { node { steps } }
+                    pageInfo { hasNextPage endCursor }
+                }
+            }
+        """
+
+        # When paging through both connections
+        first = schema.execute_sync(query, context_value=mock_context).data
+        rest = schema.execute_sync(
+            query,
+            variable_values={
+                "after": first["exercisesConnection"]["pageInfo"]["endCursor"],
+                "stepsAfter": first["dayStepsListConnection"]["pageInfo"][
+                    "endCursor"
+                ],
+            },
+            context_value=mock_context,
+        ).data
+
+        # Then the latest day comes first, then later times within a day
+        def values(page, connection, field):
+            return [e["node"][field] for e in page[connection]["edges"]]
+
+        assert values(first, "exercisesConnection", "kcals") == [3, 2]
+        assert values(rest, "exercisesConnection", "kcals") == [1]
+        assert values(first, "dayStepsListConnection", "steps") == [2000]
+        assert values(rest, "dayStepsListConnection", "steps") == [1000]
+        assert rest["dayStepsListConnection"]["pageInfo"]["hasNextPage"] is (
+            False
+        )
+        anonymous = schema.execute_sync(query, context_value=None).data
+        assert anonymous["exercisesConnection"]["edges"] == []
+        assert anonymous["dayStepsListConnection"]["edges"] == []
+
     def test_create_exercise(self, mocker):
         """Test creating an exercise."""
         # Given an authenticated user with a day
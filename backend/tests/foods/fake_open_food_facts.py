@@ -0,0 +1,141 @@
+"""Local HTTP stand-in for the Open Food Facts product API."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+
+def fake_barcodes(count: int) -> list[str]:
+    """Return valid EAN-13 barcodes from the in-store numbering range.
+
+    Args:
+        count: Number of barcodes.
+
+    Returns:
+        list[str]: distinct barcodes no real product uses.
+    """
+    bodies = [f"200{number:09d}" for number in range(count)]
+    return [f"{body}{_check_digit(body)}" for body in bodies]
+
+
+def _check_digit(body: str) -> int:
+    """Return the GTIN check digit of a barcode body.
+
+    Args:
+        body: Barcode digits without the check digit.
+
+    Returns:
+        int: the check digit.
+    """
+    weighted_sum = sum(
+        int(digit) * (3 if position % 2 else 1)
+        for position, digit in enumerate(reversed(body), start=1)
+    )
+    return (10 - weighted_sum % 10) % 10
+
+
+class _ProductHandler(BaseHTTPRequestHandler):
+    """Answer ``/api/v3/product/<barcode>`` reads over keep-alive HTTP."""
+
+    protocol_version = "HTTP/1.1"
+    server: "FakeOpenFoodFacts"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Record the read and return the product or a 404."""
+        barcode = urlsplit(self.path).path.rsplit("/", 1)[-1]
+        self.server.record(barcode, self.client_address)
+        time.sleep(self.server.delay_seconds)
+        product = self.server.product(barcode)
+        if product is None:
+            self.send_response(404)
+            body = json.dumps({"status": "failure"}).encode()
+        else:
+            self.send_response(200)
+            body = json.dumps(
+                {"status": "success", "product": product}
+            ).encode()
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Keep request logs out of the output."""
+
+
+class FakeOpenFoodFacts(ThreadingHTTPServer):
+    """Serve products from memory on a free local port.
+
+    Use it as a context manager and point ``OFF_API_BASE_URL`` at
+    ``api_base_url``. Every barcode not listed in ``missing`` is a product
+    named after it.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, delay_seconds: float = 0.0, missing: frozenset[str] = frozenset()
+    ):
+        """Bind the server.
+
+        Args:
+            delay_seconds: Time each read takes, so that reads overlap.
+            missing: Barcodes answered with a 404.
+        """
+        super().__init__(("127.0.0.1", 0), _ProductHandler)
+        self.delay_seconds = delay_seconds
+        self.missing = missing
+        self.reads: list[str] = []
+        self.connections: set[tuple[str, int]] = set()
+        self._reads_lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def api_base_url(self) -> str:
+        """Return the base URL to use in place of the OFF API's.
+
+        Returns:
+            str: local API base URL.
+        """
+        return f"http://127.0.0.1:{self.server_port}/api/v3"
+
+    def product(self, barcode: str) -> dict | None:
+        """Return the product of a barcode.
+
+        Args:
+            barcode: Requested barcode.
+
+        Returns:
+            dict | None: OFF product mapping, or None when it is missing.
+        """
+        if barcode in self.missing:
+            return None
+        return {"product_name": f"Product {barcode}", "quantity": "350 g"}
+
+    def record(self, barcode: str, client_address: tuple[str, int]) -> None:
+        """Count a read and the connection it came on.
+
+        Args:
+            barcode: Requested barcode.
+            client_address: Address of the client socket.
+        """
+        with self._reads_lock:
+            self.reads.append(barcode)
+            self.connections.add(client_address)
+
+    def __enter__(self) -> "FakeOpenFoodFacts":
+        """Start serving in a background thread.
+
+        Returns:
+            FakeOpenFoodFacts: the running server.
+        """
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop serving and release the port."""
+        self.shutdown()
+        self.server_close()
+        self._thread.join(timeout=10)
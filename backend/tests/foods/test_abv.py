@@ -15,4 +15,4 @@ def test_abv_to_kcals(food_factory):
     )
 
     # Then its kcals are correct
-    assert food.energy_kcal == Decimal("32.1233215667508595000")
+    assert food.energy_kcal == Decimal("32.12332156675086360347670122")
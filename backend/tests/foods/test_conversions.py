@@ -0,0 +1,62 @@
+"""Tests for the exact unit conversion table."""
+
+from decimal import Decimal
+
+import pytest
+from pint.errors import DimensionalityError, UndefinedUnitError
+
+from apps.foods.models.conversions import CONVERSION_FACTORS, convert
+from apps.foods.models.units import MASS_UNITS, UREG, VOLUME_UNITS
+
+
+def test_factor_table_covers_every_same_dimension_pair():
+    """Every mass and volume unit pair has a precomputed factor."""
+    # Then each dimension contributes a complete square matrix
+    assert (
+        len(CONVERSION_FACTORS)
+        == len(MASS_UNITS) ** 2 + len(VOLUME_UNITS) ** 2
+    )
+    assert all(
+        CONVERSION_FACTORS[unit, unit] == 1
+        for unit in MASS_UNITS | VOLUME_UNITS
+    )
+
+
+@pytest.mark.parametrize("dimension", [MASS_UNITS, VOLUME_UNITS])
+def test_factors_agree_with_unit_registry(dimension):
+    """Precomputed factors match the pint definitions they replace."""
+    for source in dimension:
+        for target in dimension:
+            # When the same amount is converted by both paths
+            expected = UREG.Quantity(Decimal("100"), source).to(target).m
+
+            # Then they agree beyond the persisted decimal precision
+            assert convert(Decimal("100"), source, target) == pytest.approx(
+                expected, rel=Decimal("1e-12")
+            )
+
+
+def test_terminating_conversions_are_exact():
+    """Conversions with a finite decimal expansion carry no float noise."""
+    # Then chained definitions stay exact
+    assert convert(Decimal("2"), "c", "floz") == Decimal("16")
+    assert convert(Decimal("6"), "tsp", "tbsp") == Decimal("2")
+    assert convert(Decimal("1"), "pt", "ml") == Decimal("473.17647299999976")
+    assert convert(Decimal("1"), "lb", "kg") == Decimal("0.45359237")
+    assert convert(Decimal("0.3"), "kg", "g") == Decimal("300")
+
+
+def test_incompatible_dimensions_raise_dimensionality_error():
+    """Mass and volume units cannot be converted implicitly."""
+    with pytest.raises(DimensionalityError):
+        convert(Decimal("1"), "g", "ml")
+
+
+@pytest.mark.parametrize(
+    ("source", "target"),
+    [("serving", "g"), ("ml", "container"), ("unit", "unit")],
+)
+def test_contextual_units_raise_undefined_unit_error(source, target):
+    """Contextual units have no physical conversion factor."""
+    with pytest.raises(UndefinedUnitError):
+        convert(Decimal("1"), source, target)
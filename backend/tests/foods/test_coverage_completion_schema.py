@@ -30,7 +30,8 @@ pytestmark = pytest.mark.django_db
 
 def _info(user):
     return SimpleNamespace(
-        context=SimpleNamespace(request=SimpleNamespace(user=user))
+        context=SimpleNamespace(request=SimpleNamespace(user=user)),
+        selected_fields=[],
     )
 
 
@@ -92,9 +93,7 @@ def test_food_product_query_success_and_missing_paths(mocker):
     mapped = mocker.Mock()
     queryset = mocker.Mock()
     queryset.get.return_value = obj
-    mocker.patch.object(
-        FoodProduct.objects, "prefetch_related", return_value=queryset
-    )
+    mocker.patch("apps.foods.schema._food_products", return_value=queryset)
     converter = mocker.patch.object(
         FoodProductType, "from_model", return_value=mapped
     )
@@ -108,7 +107,9 @@ def test_food_product_query_success_and_missing_paths(mocker):
 
 def test_recipe_query_missing_path(mocker):
     """Cover recipe query missing path."""
-    mocker.patch.object(Recipe.objects, "get", side_effect=Recipe.DoesNotExist)
+    queryset = mocker.Mock()
+    queryset.get.side_effect = Recipe.DoesNotExist
+    mocker.patch("apps.foods.schema._recipes", return_value=queryset)
 
     assert RecipeQuery().recipe(_info(_user()), "404") is None
 
@@ -137,7 +138,7 @@ def test_recipe_ingredient_type_food_label_empty_without_model():
 def test_food_product_type_servings_uses_prefetched_models(mocker):
     """Cover servings resolver model-present path."""
     serving = mocker.Mock()
-    model = mocker.Mock()
+    model = mocker.Mock(_prefetched_objects_cache={"servings": None})
     model.servings.all.return_value = [serving]
     mapped = mocker.Mock()
     converter = mocker.patch(
@@ -171,7 +172,7 @@ def test_recipe_type_ingredients_converts_ordered_models(mocker):
 def test_recipe_type_ingredients_uses_prefetched_models(mocker):
     """Cover ingredients resolver model-present path."""
     ingredient = mocker.Mock()
-    model = mocker.Mock()
+    model = mocker.Mock(_prefetched_objects_cache={"ingredients": None})
     model.ingredients.all.return_value = [ingredient]
     mapped = mocker.Mock()
     converter = mocker.patch(
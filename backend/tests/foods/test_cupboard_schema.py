@@ -70,6 +70,53 @@ class TestCupboardSchema:
         assert len(result.data["cupboardItems"]) == 1
         assert "Milk" in result.data["cupboardItems"][0]["foodLabel"]
 
+    def test_cupboard_items_connection_pages_latest_purchase_first(
+        self, mocker
+    ):
+        """Cupboard connections page the user's items newest first."""
+        # Given three items purchased on different days
+        user = _create_user("cpages@test.com")
+        fp = FoodProduct.objects.create(name="Milk", num_servings=4)
+        now = timezone.now()
+        items = [
+            CupboardItem.objects.create(
+                owner=user,
+                food=fp,
+                purchased_at=now - timezone.timedelta(days=days),
+            )
+            for days in (2, 0, 1)
+        ]
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        query = """
+            query Items($after: String) {
+                cupboardItemsConnection(first: 2, after: $after) {
+                    edges { node { id } }
+                    pageInfo { hasNextPage endCursor }
+                }
+            }
+        """
+
+        # When paging through the connection
+        first = schema.execute_sync(query, context_value=mock_context).data[
+            "cupboardItemsConnection"
+        ]
+        rest = schema.execute_sync(
+            query,
+            variable_values={"after": first["pageInfo"]["endCursor"]},
+            context_value=mock_context,
+        ).data["cupboardItemsConnection"]
+
+        # Then the latest purchases come first
+        assert [e["node"]["id"] for e in first["edges"]] == [
+            str(items[1].id),
+            str(items[2].id),
+        ]
+        assert [e["node"]["id"] for e in rest["edges"]] == [str(items[0].id)]
+        assert rest["pageInfo"]["hasNextPage"] is False
+        anonymous = schema.execute_sync(query, context_value=None)
+        assert anonymous.data["cupboardItemsConnection"]["edges"] == []
+
     def test_create_cupboard_item(self, mocker):
         """Test creating a cupboard item."""
         # Given an authenticated user and a food product
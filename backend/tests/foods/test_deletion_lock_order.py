@@ -19,6 +19,7 @@ from apps.foods.models import (
     Serving,
 )
 from apps.plans.models import Day, Intake, WeekPlan
+from apps.plans.rollups import rollup_models
 
 
 def test_serving_delete_locks_day_before_cupboard(
@@ -365,6 +366,18 @@ def test_day_cascade_prelocks_every_cupboard_item_before_collection(
                 (queryset.model, [row.pk for row in queryset._result_cache])
             )
 
+    # The periods of the day are refreshed once every row is deleted.
+    rollups = [
+        (
+            model,
+            list(
+                model.objects.filter(
+                    user=day.plan.user, start=model.period_start(day.day)
+                ).values_list("pk", flat=True)
+            ),
+        )
+        for model in rollup_models()
+    ]
     mocker.patch.object(QuerySet, "_fetch_all", new=record_locked_queryset)
 
     day_id = day.pk
@@ -376,6 +389,7 @@ def test_day_cascade_prelocks_every_cupboard_item_before_collection(
         (Day, [day_id]),
         (Intake, sorted(intake.pk for intake in intakes)),
         (CupboardItem, sorted(item.pk for item in items)),
+        *rollups,
     ]
     from apps.foods.cupboard_locks import get_cupboard_item_locks
 
@@ -0,0 +1,365 @@
+"""Tests for the ranked food catalog search."""
+
+from contextlib import nullcontext
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.postgres.lookups import TrigramWordSimilar
+from django.db import connection
+from django.db.models import CharField
+from django.test.utils import CaptureQueriesContext, register_lookup
+
+from apps.foods import search
+from apps.foods.models import Food, FoodProduct, Recipe
+from apps.foods.search import (
+    MAX_SEARCH_RESULTS,
+    decode_cursor,
+    encode_cursor,
+    search_foods,
+)
+from config.schema import schema
+
+User = get_user_model()
+
+SEARCH_QUERY = """
+    query Search($query: String!, $first: Int, $after: String) {
+        searchFoods(query: $query, first: $first, after: $after) {
+            hasNextPage
+            endCursor
+            hits {
+                cursor
+                rank
+                product { name }
+                recipe { name ingredients { id } }
+                servings { servingUnit }
+            }
+        }
+    }
+"""
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(name="context")
+def fixture_context(mocker):
+    """Return a GraphQL context for an authenticated user."""
+    context = mocker.Mock()
+    context.request.user = User.objects.create_user(
+        email="search@test.com",
+        password="password123",
+        date_of_birth="2000-01-01",
+        height=170.0,
+    )
+    return context
+
+
+def _search(context, query: str, **variables) -> dict:
+    """Execute searchFoods in a GraphQL context.
+
+    Args:
+        context: GraphQL request context.
+        query: search text.
+        variables: extra query variables.
+
+    Returns:
+        dict: searchFoods payload.
+    """
+    result = schema.execute_sync(
+        SEARCH_QUERY,
+        variable_values={"query": query, **variables},
+        context_value=context,
+    )
+    assert result.errors is None
+    return result.data["searchFoods"]
+
+
+def _names(page: dict) -> list[str]:
+    """Return the product or recipe name of every hit, in rank order."""
+    return [(hit["product"] or hit["recipe"])["name"] for hit in page["hits"]]
+
+
+def _product(name: str, brand: str | None = None) -> FoodProduct:
+    """Create a food product with its default servings."""
+    return FoodProduct.objects.create(name=name, brand=brand, num_servings=1)
+
+
+def test_search_ranks_name_matches_above_tag_matches(context):
+    """Products and recipes match by name, brand or tag, best first."""
+    # Given
+    _product("Hazelnut spread", brand="Nutella")
+    Recipe.objects.create(name="Nutella toast", num_servings=2)
+    _product("Porridge").tags.add("nutella")
+    _product("Apple")
+
+    # When
+    page = _search(context, "nutella")
+
+    # Then
+    assert sorted(_names(page)[:2]) == ["Hazelnut spread", "Nutella toast"]
+    assert _names(page)[2] == "Porridge"
+    ranks = [hit["rank"] for hit in page["hits"]]
+    assert ranks == sorted(ranks, reverse=True)
+    assert page["hasNextPage"] is False
+    assert page["endCursor"] == page["hits"][-1]["cursor"]
+
+
+def test_search_hits_include_servings_and_recipe_ingredients(context):
+    """Each hit carries its servings, and recipes their ingredients."""
+    # Given
+    _product("Oat milk")
+    Recipe.objects.create(name="Oat cookies", num_servings=12)
+
+    # When
+    hits = _search(context, "oat")["hits"]
+
+    # Then
+    product = next(hit for hit in hits if hit["product"])
+    recipe = next(hit for hit in hits if hit["recipe"])
+    assert product["recipe"] is None and recipe["product"] is None
+    assert {s["servingUnit"] for s in product["servings"]} == {
+        "g",
+        "container",
+    }
+    assert recipe["servings"] == [{"servingUnit": "serving"}]
+    assert recipe["recipe"]["ingredients"] == []
+
+
+def test_search_paginates_with_cursors(context):
+    """Cursors continue after the last hit until the results run out."""
+    # Given
+    for index in range(3):
+        _product(f"Protein bar {index}")
+
+    # When
+    first = _search(context, "protein", first=2)
+    rest = _search(context, "protein", first=2, after=first["endCursor"])
+
+    # Then
+    assert _names(first) == ["Protein bar 0", "Protein bar 1"]
+    assert first["hasNextPage"] is True
+    assert _names(rest) == ["Protein bar 2"]
+    assert rest["hasNextPage"] is False
+
+
+def test_search_query_count_does_not_grow_with_page_size(context):
+    """A page costs the same queries however many hits it holds."""
+    # Given
+    for index in range(6):
+        _product(f"Granola {index}")
+        Recipe.objects.create(name=f"Granola pot {index}", num_servings=1)
+
+    def queries(first: int) -> int:
+        with CaptureQueriesContext(connection) as captured:
+            page = _search(context, "granola", first=first)
+        assert len(page["hits"]) == first
+        return len(captured)
+
+    # When the tag content types are cached by a first search
+    queries(1)
+
+    # Then
+    assert queries(2) == queries(12)
+
+
+def test_search_skips_foods_that_are_neither_products_nor_recipes():
+    """Bare food rows match the ranking but have no hit representation."""
+    # Given
+    Food.objects.create(name="Orphan", num_servings=1)
+
+    # When
+    page = search_foods("orphan", 10)
+
+    # Then
+    assert not page.hits
+
+
+def test_search_falls_back_to_substrings_without_trigrams(context, mocker):
+    """Without pg_trgm, substrings of names, brands and tags still match."""
+    # Given
+    mocker.patch.object(search, "trigram_search_enabled", return_value=False)
+    _product("Nutella")
+    _product("Crackers", brand="Jacob's")
+    _product("Bread").tags.add("wholemeal")
+
+    # Then
+    assert _names(_search(context, "utel")) == ["Nutella"]
+    assert _names(_search(context, "jacob")) == ["Crackers"]
+    assert _names(_search(context, "meal")) == ["Bread"]
+
+
+# pylint: disable-next=abstract-method
+class _PortableTrigramWordSimilar(TrigramWordSimilar):
+    """Compile the pg_trgm operator on any database to inspect the SQL."""
+
+    def as_sql(self, compiler, connection):
+        """Render the operator the way PostgreSQL would."""
+        return self.as_postgresql(compiler, connection)
+
+
+def test_search_without_full_text_matches_substrings(context, mocker):
+    """Databases other than PostgreSQL rank substring matches."""
+    # Given
+    mocker.patch.object(search, "full_text_search_enabled", return_value=False)
+    _product("Hazelnut spread", brand="Nutella")
+    _product("Porridge").tags.add("nutella")
+    _product("Nutella")
+
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        page = _search(context, "utel")
+
+    # Then
+    assert _names(page) == ["Hazelnut spread", "Nutella", "Porridge"]
+    assert [hit["rank"] for hit in page["hits"]] == [1.0, 1.0, 0.0]
+    assert not any(
+        "pg_extension" in query["sql"] for query in captured.captured_queries
+    )
+
+
+@pytest.mark.parametrize(
+    ("trigrams", "operator"), [(True, "%>"), (False, "LIKE")]
+)
+def test_full_text_search_unions_one_branch_per_source(
+    mocker, trigrams, operator
+):
+    """Full-text search matches every text source in its own branch."""
+    # Given
+    mocker.patch.object(search, "full_text_search_enabled", return_value=True)
+    mocker.patch.object(
+        search, "trigram_search_enabled", return_value=trigrams
+    )
+    # Other backends only register the pg_trgm lookups on PostgreSQL.
+    lookups = (
+        nullcontext()
+        if connection.vendor == "postgresql"
+        else register_lookup(CharField, _PortableTrigramWordSimilar)
+    )
+
+    # When
+    with lookups:
+        sql = str(search.ranked_foods("nutela").query)
+
+    # Then
+    assert sql.upper().count(operator.upper()) == 3
+    assert ("WORD_SIMILARITY" in sql.upper()) is trigrams
+    assert "UNION" in sql
+
+
+def test_pg_trgm_probe_runs_once_per_database(mocker):
+    """The extension probe is cached instead of run on every search."""
+    # Given
+    probe = mocker.MagicMock()
+    probe.cursor.return_value.__enter__.return_value.fetchone.return_value = (
+        True,
+    )
+    mocker.patch.object(search, "connections", {"probe": probe})
+    # pylint: disable=protected-access
+    search._pg_trgm_installed.cache_clear()
+
+    # When
+    installed = [search._pg_trgm_installed("probe") for _ in range(3)]
+
+    # Then
+    search._pg_trgm_installed.cache_clear()
+    # pylint: enable=protected-access
+    assert installed == [True] * 3
+    probe.cursor.assert_called_once()
+
+
+def test_trigram_search_needs_postgresql(mocker):
+    """Other databases never probe for the pg_trgm extension."""
+    # Given
+    probe = mocker.patch.object(search, "_pg_trgm_installed")
+    mocker.patch.object(search, "full_text_search_enabled", return_value=False)
+
+    # Then
+    assert search.trigram_search_enabled() is False
+    probe.assert_not_called()
+
+
+def test_search_tolerates_typos_through_trigram_indexes(context):
+    """Misspelled words match, answered by the GIN indexes."""
+    if not search.trigram_search_enabled():
+        pytest.skip("PostgreSQL pg_trgm extension is not installed")
+
+    # Given
+    _product("Nutella")
+    _product("Apple")
+
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        page = _search(context, "nutela")
+
+    # Then
+    assert _names(page) == ["Nutella"]
+    ranked_sql = next(
+        query["sql"]
+        for query in captured.captured_queries
+        if "ORDER BY" in query["sql"] and "word_similarity" in query["sql"]
+    )
+    with connection.cursor() as cursor:
+        # Tiny test tables make a sequential scan cheapest; disabling it
+        # shows whether the planner can answer the query from the indexes.
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"EXPLAIN {ranked_sql}")
+        plan = "\n".join(row[0] for row in cursor.fetchall())
+    assert "Seq Scan on foods_food" not in plan
+    assert "foods_food_search_vector" in plan
+    assert "foods_food_name_trgm" in plan
+
+
+@pytest.mark.parametrize("query", ["", "   "])
+def test_blank_queries_return_nothing_without_querying(query):
+    """Blank search text does not scan the catalog."""
+    with CaptureQueriesContext(connection) as captured:
+        page = search_foods(query, 10)
+
+    assert not page.hits and page.has_next_page is False
+    assert not captured.captured_queries
+
+
+@pytest.mark.parametrize("first", [0, MAX_SEARCH_RESULTS + 1])
+def test_page_size_must_be_bounded(first):
+    """Pages hold between one and the maximum number of results."""
+    with pytest.raises(ValueError, match="first must be between 1 and"):
+        search_foods("nutella", first)
+
+
+@pytest.mark.parametrize(
+    "cursor", ["%%%", "bm90LWEtY3Vyc29y", "b2Zmc2V0Oi0x", "_w=="]
+)
+def test_foreign_cursors_are_rejected(cursor):
+    """Cursors not issued by the search are invalid."""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+def test_cursors_round_trip_to_the_next_offset():
+    """A cursor resumes right after the result it was issued for."""
+    assert decode_cursor(None) == 0
+    assert decode_cursor(encode_cursor(4)) == 5
+
+
+@pytest.mark.parametrize("user", [None, AnonymousUser()])
+def test_search_requires_authentication(mocker, user):
+    """Anonymous requests get an empty page."""
+    # Given
+    _product("Nutella")
+    context = mocker.Mock()
+    context.request.user = user
+
+    # When
+    result = schema.execute_sync(
+        SEARCH_QUERY,
+        variable_values={"query": "nutella"},
+        context_value=context,
+    )
+
+    # Then
+    assert result.errors is None
+    assert result.data["searchFoods"] == {
+        "hasNextPage": False,
+        "endCursor": None,
+        "hits": [],
+    }
@@ -113,6 +113,7 @@ def _run_data_migration(migration_name: str) -> None:
                 ("recipeingredient", "size_snapshot_unit"),
             },
         ),
+        ("0040_foodproduct_gtin", {("foodproduct", "gtin")}),
     ],
 )
 def test_expansion_migrations_are_short_schema_only_steps(
@@ -151,6 +152,7 @@ def test_expansion_migrations_are_short_schema_only_steps(
             "0038_backfill_serving_snapshots",
             "0037_backfill_consumption_num_servings",
         ),
+        ("0041_backfill_foodproduct_gtin", "0040_foodproduct_gtin"),
     ],
 )
 def test_backfills_are_separately_recorded_non_atomic_data_steps(
@@ -231,6 +233,51 @@ class TestCupboardOwnerMigration:
         assert item.owner is None
 
 
+@pytest.mark.parametrize(
+    ("vendor", "trigram_available", "expected_indexes"),
+    [
+        ("sqlite", True, []),
+        ("postgresql", False, ["foods_food_search_vector"]),
+        (
+            "postgresql",
+            True,
+            [
+                "foods_food_search_vector",
+                "foods_food_name_trgm",
+                "foods_food_brand_trgm",
+                "foods_taggit_tag_name_trgm",
+            ],
+        ),
+    ],
+)
+def test_search_indexes_need_postgresql_and_an_available_pg_trgm(
+    mocker, vendor, trigram_available, expected_indexes
+):
+    """Trigram indexes are only created where the extension can exist."""
+    migration = importlib.import_module(
+        "apps.foods.migrations.0042_food_search_indexes"
+    )
+    connection_ = mocker.MagicMock(vendor=vendor)
+    cursor = connection_.cursor.return_value.__enter__.return_value
+    cursor.fetchone.return_value = (trigram_available,)
+    indexes = []
+    statements = []
+    schema_editor = SimpleNamespace(
+        connection=connection_,
+        add_index=lambda model, index: indexes.append(index.name),
+        execute=statements.append,
+    )
+
+    migration.create_search_indexes(apps, schema_editor)
+
+    assert indexes == expected_indexes
+    assert statements == (
+        ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+        if len(expected_indexes) > 1
+        else []
+    )
+
+
 @pytest.mark.django_db
 def test_manual_consumption_migration_subtracts_unit_safe_linked_totals():
     """Legacy baselines are the non-negative remainder after linked usage."""
@@ -456,6 +503,31 @@ def test_consumption_quantity_migration_backfills_intakes_and_legacy_links(
     assert legacy_link.num_servings == Decimal("1")
 
 
+@pytest.mark.django_db
+def test_gtin_backfill_canonicalizes_valid_barcodes_in_batches(monkeypatch):
+    """0041 fills canonical GTINs across batches and skips invalid codes."""
+    migration = importlib.import_module(
+        "apps.foods.migrations.0041_backfill_foodproduct_gtin"
+    )
+    monkeypatch.setattr(migration, "BATCH_SIZE", 1)
+    barcodes = ["03017620422003", "https://example.com/qr", "96385074", ""]
+    products = [
+        FoodProduct.objects.create(name=f"Legacy {index}", barcode=barcode)
+        for index, barcode in enumerate(barcodes)
+    ]
+    FoodProduct.objects.filter(pk__in=[p.pk for p in products]).update(
+        gtin=None
+    )
+
+    _run_data_migration("0041_backfill_foodproduct_gtin")
+
+    assert list(
+        FoodProduct.objects.filter(pk__in=[p.pk for p in products])
+        .order_by("pk")
+        .values_list("gtin", flat=True)
+    ) == ["3017620422003", None, "96385074", None]
+
+
 @pytest.mark.django_db
 def test_quantity_backfill_handles_rolling_writer_insert_and_update(
     monkeypatch,
@@ -1187,9 +1259,12 @@ def test_committed_batch_failure_resumes_with_a_fresh_executor(monkeypatch):
     latest_target = ("foods", "0038_backfill_serving_snapshots")
     executor = MigrationExecutor(connection)
     executor.migrate([start_target])
-    product = FoodProduct.objects.create(name="Restartable batches")
+    historical_apps = executor.loader.project_state([start_target]).apps
+    product = historical_apps.get_model("foods", "FoodProduct").objects.create(
+        name="Restartable batches"
+    )
     items = [
-        CupboardItem.objects.create(
+        historical_apps.get_model("foods", "CupboardItem").objects.create(
             food=product,
             purchased_at=timezone.now(),
             consumed_perc=Decimal(value),
@@ -0,0 +1,138 @@
+"""Tests for the nutrient vector value type."""
+
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from apps.foods.models import Recipe, RecipeIngredient
+from apps.foods.models.nutrient_vector import (
+    NutrientVector,
+    copy_nutrients,
+    decimal_bounds,
+)
+from apps.foods.models.nutrients import NUTRIENT_LIST
+from apps.foods.signals.handlers.recipe_nutrients import (
+    validate_derived_nutrients,
+)
+
+
+def _vector(**values: str) -> NutrientVector:
+    """Return a vector with the given nutrients and zeros elsewhere."""
+    return NutrientVector(
+        Decimal(values.get(nutrient, "0")) for nutrient in NUTRIENT_LIST
+    )
+
+
+def test_load_reads_missing_nutrients_as_zero_and_store_writes_all():
+    """Vectors round trip through Nutrients model instances."""
+    # Given an ingredient with an unset optional nutrient
+    source = RecipeIngredient(
+        energy_kcal=Decimal("120.5"), protein_g=Decimal("3")
+    )
+    source.salt_g = None
+    target = Recipe()
+
+    # When
+    vector = NutrientVector.load(source)
+    vector.store(target)
+
+    # Then
+    assert vector == _vector(energy_kcal="120.5", protein_g="3")
+    assert target.energy_kcal == Decimal("120.5")
+    assert target.salt_g == Decimal("0")
+    assert NutrientVector.load(target) == vector
+
+
+def test_copy_nutrients_keeps_nulls():
+    """Copying nutrients between rows preserves unset values."""
+    # Given
+    source = Recipe(energy_kcal=Decimal("10"))
+    source.salt_g = None
+    target = Recipe(salt_g=Decimal("1"))
+
+    # When
+    copy_nutrients(source, target)
+
+    # Then
+    assert target.energy_kcal == Decimal("10")
+    assert target.salt_g is None
+
+
+def test_arithmetic_matches_per_nutrient_decimals():
+    """Add, scale and sum are exact per nutrient."""
+    # Given
+    first = _vector(energy_kcal="1.25", fat_g="0.1")
+    second = _vector(energy_kcal="2.5", carbs_g="3")
+
+    # Then
+    assert first + second == _vector(
+        energy_kcal="3.75", fat_g="0.1", carbs_g="3"
+    )
+    assert second - first == _vector(
+        energy_kcal="1.25", fat_g="-0.1", carbs_g="3"
+    )
+    assert first.scale(Decimal("1.5")) == _vector(
+        energy_kcal="1.875", fat_g="0.15"
+    )
+    assert NutrientVector.sum([first, second, first]) == _vector(
+        energy_kcal="5", fat_g="0.2", carbs_g="3"
+    )
+    assert NutrientVector.sum([]) == NutrientVector.zero()
+    assert NutrientVector.zero().is_zero()
+    assert dict(first.nonzero_items()) == {
+        "energy_kcal": Decimal("1.25"),
+        "fat_g": Decimal("0.1"),
+    }
+
+
+@pytest.mark.parametrize("field_name", ["energy_kcal", "salt_g", "size"])
+@pytest.mark.parametrize(
+    "value",
+    [
+        "0",
+        "1E+2",
+        "12.34",
+        "12.345",
+        "99999999.99",
+        "100000000",
+        "1E+8",
+        "-1",
+        "0.001",
+        "1E-7",
+    ],
+)
+def test_bounds_match_the_decimal_field_clean(field_name, value):
+    """Compiled bounds accept and reject exactly like DecimalField.clean."""
+    # Given
+    field = Recipe._meta.get_field(field_name)
+    value = Decimal(value)
+
+    # When
+    try:
+        expected = field.clean(value, None)
+    except ValidationError:
+        expected = None
+
+    # Then
+    if expected is None:
+        with pytest.raises(ValidationError):
+            decimal_bounds(Recipe, field_name).check(value)
+    else:
+        assert decimal_bounds(Recipe, field_name).check(value) == expected
+
+
+def test_validated_nutrients_are_normalized_and_labelled():
+    """Validation normalizes values and names the failing nutrient."""
+    # Given
+    valid = _vector(energy_kcal="1.50", protein_g="100")
+    too_precise = _vector(fat_g="0.125")
+
+    # Then
+    validated = validate_derived_nutrients(valid, Recipe, "Recipe")
+    assert validated.values[NUTRIENT_LIST.index("energy_kcal")] == Decimal(
+        "1.5"
+    )
+    assert str(validated.values[NUTRIENT_LIST.index("protein_g")]) == "1E+2"
+    with pytest.raises(ValidationError, match="Recipe fatG exceeds"):
+        validate_derived_nutrients(too_precise, Recipe, "Recipe")
@@ -7,14 +7,16 @@ import pytest
 import requests
 from django.utils import timezone
 
-from apps.foods import open_food_facts
+from apps.foods import gtin, open_food_facts, open_food_facts_rate_limit
 from apps.foods.models import OpenFoodFactsCacheEntry, OpenFoodFactsRateLimit
 from apps.foods.open_food_facts import (
     OFF_API_BASE_URL,
     OpenFoodFactsProduct,
     fetch_open_food_facts_product,
+    open_food_facts_cache_stats,
     parse_quantity,
 )
+from apps.foods.open_food_facts_cache import CachedProduct, LocalProductCache
 
 BARCODE = "3017620422003"
 OFF_PRODUCT_PAGE = "https://world.openfoodfacts.org/product/3017620422003"
@@ -24,9 +26,10 @@ pytestmark = pytest.mark.django_db
 
 @pytest.fixture(autouse=True)
 def _clear_off_persistence(db):
-    """Start each test with an empty OFF cache and quota window."""
+    """Start each test with empty OFF caches and quota window."""
     OpenFoodFactsCacheEntry.objects.all().delete()
     OpenFoodFactsRateLimit.objects.all().delete()
+    open_food_facts.LOCAL_PRODUCT_CACHE.clear()
 
 
 def _off_url(barcode: str = BARCODE) -> str:
@@ -100,17 +103,17 @@ def test_normalize_gtin_canonicalizes_valid_product_barcode_lengths(
     barcode, expected
 ):
     """Valid GTINs use their shortest supported equivalent representation."""
-    assert open_food_facts.normalize_gtin(f"  {barcode}\n") == expected
+    assert gtin.normalize_gtin(f"  {barcode}\n") == expected
 
 
 def test_equivalent_gtins_preserves_gtin8_representation():
     """GTIN-8 values stay eight digits and never gain zero prefixes."""
-    assert open_food_facts.equivalent_gtins("96385074") == ("96385074",)
+    assert gtin.equivalent_gtins("96385074") == ("96385074",)
 
 
 def test_equivalent_gtins_returns_empty_for_invalid_barcodes():
     """Invalid values produce no stored representations to match."""
-    assert not open_food_facts.equivalent_gtins("not-a-barcode")
+    assert not gtin.equivalent_gtins("not-a-barcode")
 
 
 @pytest.mark.parametrize(
@@ -588,13 +591,81 @@ def test_fetch_skips_request_when_cache_is_live(requests_mock):
     assert requests_mock.call_count == 0
 
 
-def test_fetch_rate_limit_coordinates_request_slots(requests_mock):
-    """Slots persist so replicas share the documented OFF quota."""
+def test_fetch_serves_repeat_scans_from_the_process_tier(
+    requests_mock, django_assert_num_queries
+):
+    """Repeat scans in one worker skip the shared cache table."""
+    requests_mock.get(_off_url(), json=_payload())
+    assert fetch_open_food_facts_product(BARCODE) is not None
+
+    with django_assert_num_queries(0):
+        product = fetch_open_food_facts_product(BARCODE)
+
+    assert product is not None
+    assert requests_mock.call_count == 1
+    stats = open_food_facts_cache_stats()
+    assert (stats["local"].hits, stats["local"].misses) == (1, 1)
+    assert (stats["database"].hits, stats["database"].misses) == (0, 1)
+    assert stats["local"].hit_ratio == 0.5
+
+
+def test_fetch_serves_stale_product_when_revalidation_fails(requests_mock):
+    """A recently expired product outlives an unreachable provider."""
+    requests_mock.get(_off_url(), exc=requests.exceptions.ConnectTimeout)
+    OpenFoodFactsCacheEntry.objects.create(
+        barcode=BARCODE,
+        product=_payload()["product"],
+        expires_at=timezone.now() - timedelta(minutes=5),
+    )
+
+    product = fetch_open_food_facts_product(BARCODE)
+
+    assert product is not None
+    assert product.name == "Nutella"
+    assert requests_mock.call_count == 1
+    assert open_food_facts_cache_stats()["stale"].hits == 1
+
+
+def test_fetch_revalidates_expired_negative_results(requests_mock):
+    """Missing barcodes are looked up again once their TTL has passed."""
     requests_mock.get(_off_url(), json=_payload())
+    OpenFoodFactsCacheEntry.objects.create(
+        barcode=BARCODE,
+        product=None,
+        expires_at=timezone.now() - timedelta(seconds=1),
+    )
+
+    product = fetch_open_food_facts_product(BARCODE)
+
+    assert product is not None
+    assert requests_mock.call_count == 1
+
+
+def test_local_product_cache_evicts_least_recently_used_entries():
+    """The process tier stays within its bounds and expires negatives."""
+    cache = LocalProductCache(max_products=2, max_missing=1, stale_seconds=0)
     now = timezone.now().timestamp()
+    for barcode in ("1", "2"):
+        cache.put(barcode, CachedProduct({"product_name": barcode}, now + 60))
+    assert cache.get("1", now) is not None
+    cache.put("3", CachedProduct({"product_name": "3"}, now + 60))
+    cache.put("01234565", CachedProduct(None, now + 60))
+    cache.put("4", CachedProduct(None, now + 1))
+
+    assert cache.get("2", now) is None
+    assert cache.get("1", now) is not None
+    assert cache.get("01234565", now) is None
+    assert cache.get("4", now) == CachedProduct(None, now + 1)
+    assert cache.get("4", now + 1) is None
+
+
+def test_fetch_rate_limit_coordinates_request_slots(requests_mock):
+    """Tokens persist so replicas share the documented OFF quota."""
+    requests_mock.get(_off_url(), json=_payload())
     OpenFoodFactsRateLimit.objects.create(
         key=open_food_facts.OFF_RATE_LIMIT_KEY,
-        request_timestamps=[now - 1, now - 2],
+        tokens=5,
+        refilled_at=timezone.now().timestamp(),
     )
 
     assert fetch_open_food_facts_product(BARCODE) is not None
@@ -602,15 +673,18 @@ def test_fetch_rate_limit_coordinates_request_slots(requests_mock):
     limiter = OpenFoodFactsRateLimit.objects.get(
         key=open_food_facts.OFF_RATE_LIMIT_KEY
     )
-    assert len(limiter.request_timestamps) == 3
+    assert limiter.tokens == pytest.approx(4, abs=0.1)
 
 
-def test_fetch_rejects_request_when_quota_window_is_exhausted(requests_mock):
-    """A full rolling window blocks new provider reads."""
-    now = timezone.now().timestamp()
+def test_fetch_rejects_request_when_next_token_is_past_the_deadline(
+    requests_mock,
+):
+    """Reads queued beyond the wait deadline fail without a request."""
+    before = open_food_facts.open_food_facts_rate_limit_stats()
     OpenFoodFactsRateLimit.objects.create(
         key=open_food_facts.OFF_RATE_LIMIT_KEY,
-        request_timestamps=[now - i for i in range(14)],
+        tokens=-2,
+        refilled_at=timezone.now().timestamp(),
     )
 
     with pytest.raises(
@@ -619,14 +693,44 @@ def test_fetch_rejects_request_when_quota_window_is_exhausted(requests_mock):
         fetch_open_food_facts_product(BARCODE)
 
     assert requests_mock.call_count == 0
+    limiter = OpenFoodFactsRateLimit.objects.get(
+        key=open_food_facts.OFF_RATE_LIMIT_KEY
+    )
+    assert limiter.tokens == -2
+    after = open_food_facts.open_food_facts_rate_limit_stats()
+    assert after.rejected == before.rejected + 1
 
 
-def test_fetch_expired_slots_reopen_the_quota_window(requests_mock):
-    """Slots outside the rolling window no longer count against the quota."""
+def test_fetch_waits_for_the_next_token(requests_mock, mocker):
+    """An empty bucket queues the read until its token is due."""
     requests_mock.get(_off_url(), json=_payload())
+    sleep = mocker.patch.object(open_food_facts_rate_limit.time, "sleep")
+    before = open_food_facts.open_food_facts_rate_limit_stats()
     OpenFoodFactsRateLimit.objects.create(
         key=open_food_facts.OFF_RATE_LIMIT_KEY,
-        request_timestamps=[timezone.now().timestamp() - 120],
+        tokens=0.5,
+        refilled_at=timezone.now().timestamp(),
+    )
+
+    assert fetch_open_food_facts_product(BARCODE) is not None
+
+    wait = 0.5 / open_food_facts.REQUEST_BUCKET.refill_per_second
+    assert sleep.call_args.args[0] == pytest.approx(wait, abs=0.1)
+    after = open_food_facts.open_food_facts_rate_limit_stats()
+    assert after.granted == before.granted + 1
+    assert after.wait_seconds - before.wait_seconds == pytest.approx(
+        wait, abs=0.1
+    )
+    assert after.lock_seconds > before.lock_seconds
+
+
+def test_fetch_refills_the_bucket_to_capacity(requests_mock):
+    """Tokens come back with time, up to the quota burst."""
+    requests_mock.get(_off_url(), json=_payload())
+    OpenFoodFactsRateLimit.objects.create(
+        key=open_food_facts.OFF_RATE_LIMIT_KEY,
+        tokens=0,
+        refilled_at=timezone.now().timestamp() - 120,
     )
 
     assert fetch_open_food_facts_product(BARCODE) is not None
@@ -634,4 +738,62 @@ def test_fetch_expired_slots_reopen_the_quota_window(requests_mock):
     limiter = OpenFoodFactsRateLimit.objects.get(
         key=open_food_facts.OFF_RATE_LIMIT_KEY
     )
-    assert len(limiter.request_timestamps) == 1
+    assert limiter.tokens == pytest.approx(
+        open_food_facts.OFF_RATE_LIMIT_MAX_REQUESTS - 1, abs=0.1
+    )
+
+
+def test_bucket_falls_back_to_a_row_lock_off_postgresql(mocker):
+    """Other databases take tokens through the ORM under a row lock."""
+    mocker.patch.object(
+        open_food_facts_rate_limit, "connection", mocker.Mock(vendor="sqlite")
+    )
+    bucket = open_food_facts_rate_limit.TokenBucket(
+        "row_lock_test", capacity=2, refill_per_second=0.001
+    )
+
+    bucket.acquire(max_wait_seconds=0)
+    bucket.acquire(max_wait_seconds=0)
+    with pytest.raises(
+        ValueError, match="Open Food Facts lookup is temporarily unavailable"
+    ):
+        bucket.acquire(max_wait_seconds=0)
+
+    limiter = OpenFoodFactsRateLimit.objects.get(key="row_lock_test")
+    assert limiter.tokens == pytest.approx(0, abs=0.1)
+    assert limiter.refilled_at == pytest.approx(
+        timezone.now().timestamp(), abs=60
+    )
+
+
+def test_bucket_takes_tokens_in_one_statement_on_postgresql(mocker):
+    """One UPDATE ... RETURNING refills and takes a token on PostgreSQL."""
+    connection = mocker.patch.object(
+        open_food_facts_rate_limit, "connection", vendor="postgresql"
+    )
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.fetchone.side_effect = [(0.0,), None, None]
+    bucket = open_food_facts_rate_limit.TokenBucket(
+        "statement_test", capacity=2, refill_per_second=1
+    )
+
+    bucket.acquire(max_wait_seconds=0)
+    with pytest.raises(
+        ValueError, match="Open Food Facts lookup is temporarily unavailable"
+    ):
+        bucket.acquire(max_wait_seconds=0)
+
+    sql, params = cursor.execute.call_args.args
+    assert "RETURNING bucket.tokens" in sql
+    assert params["key"] == "statement_test"
+    assert cursor.execute.call_count == 3
+    assert OpenFoodFactsRateLimit.objects.filter(key="statement_test").exists()
+
+
+def test_equivalent_gtins_lists_zero_prefixed_legacy_forms():
+    """Longer GTINs match every zero-prefixed form up to fourteen digits."""
+    assert gtin.equivalent_gtins("036000291452") == (
+        "036000291452",
+        "0036000291452",
+        "00036000291452",
+    )
@@ -0,0 +1,128 @@
+"""PostgreSQL concurrency tests for Open Food Facts lookups."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest import skipUnless
+
+import pytest
+from django.db import close_old_connections, connection
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from apps.foods import open_food_facts
+from apps.foods.models import OpenFoodFactsCacheEntry, OpenFoodFactsRateLimit
+
+from .fake_open_food_facts import FakeOpenFoodFacts, fake_barcodes
+
+BARCODE = "3017620422003"
+
+
+@skipUnless(
+    connection.vendor == "postgresql",
+    "PostgreSQL advisory locks are required",
+)
+class OpenFoodFactsConcurrencyTests(TransactionTestCase):
+    """Concurrent lookups against a local stand-in for the OFF API."""
+
+    server: FakeOpenFoodFacts
+
+    @pytest.fixture(autouse=True)
+    def _off_stand_in(self, fallback_requests_mock, monkeypatch):
+        """Serve OFF reads from a local HTTP server instead of the mock."""
+        fallback_requests_mock.stop()
+        open_food_facts.LOCAL_PRODUCT_CACHE.clear()
+        with FakeOpenFoodFacts(delay_seconds=0.5) as server:
+            monkeypatch.setattr(
+                open_food_facts, "OFF_API_BASE_URL", server.api_base_url
+            )
+            self.server = server
+            yield
+            open_food_facts.HTTP_SESSION.close()
+        open_food_facts.LOCAL_PRODUCT_CACHE.clear()
+
+    @staticmethod
+    def _lookup_concurrently(count):
+        """Look the barcode up from several threads at once."""
+        ready = threading.Barrier(count)
+
+        def run():
+            close_old_connections()
+            try:
+                ready.wait(timeout=10)
+                return open_food_facts.fetch_open_food_facts_product(BARCODE)
+            finally:
+                close_old_connections()
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [executor.submit(run) for _ in range(count)]
+            return [future.result(timeout=30) for future in futures]
+
+    def test_concurrent_lookups_share_one_provider_request(self):
+        """One lookup fetches and the others read the cached result."""
+        products = self._lookup_concurrently(4)
+
+        self.assertEqual(
+            [product.name for product in products], [f"Product {BARCODE}"] * 4
+        )
+        self.assertEqual(self.server.reads, [BARCODE])
+        limiter = OpenFoodFactsRateLimit.objects.get(
+            key=open_food_facts.OFF_RATE_LIMIT_KEY
+        )
+        self.assertAlmostEqual(
+            limiter.tokens,
+            open_food_facts.OFF_RATE_LIMIT_MAX_REQUESTS - 1,
+            delta=0.5,
+        )
+        self.assertTrue(
+            OpenFoodFactsCacheEntry.objects.filter(
+                barcode=BARCODE, product__isnull=False
+            ).exists()
+        )
+
+    def test_batch_lookup_fetches_misses_concurrently_within_the_quota(
+        self,
+    ):
+        """Cached barcodes come first and misses share pooled connections."""
+        cached, missing, *others = fake_barcodes(6)
+        OpenFoodFactsCacheEntry.objects.create(
+            barcode=cached,
+            product={"product_name": "Cached"},
+            expires_at=timezone.now() + timedelta(hours=1),
+        )
+        OpenFoodFactsRateLimit.objects.create(
+            key=open_food_facts.OFF_RATE_LIMIT_KEY,
+            tokens=4,
+            refilled_at=timezone.now().timestamp(),
+        )
+        self.server.missing = frozenset({missing})
+
+        lookups = list(
+            open_food_facts.iter_open_food_facts_products(
+                [cached, missing, *others, f" {others[0]} ", "123"],
+                max_wait_seconds=0,
+            )
+        )
+
+        self.assertEqual(lookups[0].barcode, cached)
+        self.assertEqual(lookups[0].product.name, "Cached")
+        self.assertCountEqual(
+            [lookup.barcode for lookup in lookups],
+            [cached, missing, *others],
+        )
+        failed = [lookup for lookup in lookups if lookup.error is not None]
+        self.assertEqual(len(failed), 1)
+        self.assertIn("temporarily unavailable", failed[0].error)
+        self.assertEqual(len(self.server.reads), 4)
+        self.assertLessEqual(
+            len(self.server.connections),
+            open_food_facts.OFF_FETCH_CONCURRENCY,
+        )
+        names = {
+            lookup.barcode: lookup.product and lookup.product.name
+            for lookup in lookups[1:]
+            if lookup.error is None
+        }
+        expected = {barcode: f"Product {barcode}" for barcode in others}
+        expected[missing] = None
+        self.assertLessEqual(names.items(), expected.items())
@@ -0,0 +1,398 @@
+"""Open Food Facts dump import tests."""
+
+import csv
+import gzip
+import json
+import re
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.foods.models import FoodProduct, Serving
+from apps.foods.models.nutrients import NUTRIENT_LIST
+from apps.foods.open_food_facts_dump import (
+    DumpImportStats,
+    dump_format,
+    import_dump_batch,
+    read_checkpoint,
+    write_checkpoint,
+)
+
+NUTELLA = "3017620422003"
+WATER = "96385074"
+UPC = "036000291452"
+
+pytestmark = pytest.mark.django_db
+
+
+def _record(code: str = NUTELLA, **overrides) -> dict:
+    """Return an OFF dump record with the given overrides.
+
+    Args:
+        code: product barcode.
+        overrides: fields to override on the default record.
+
+    Returns:
+        dict: OFF dump product record.
+    """
+    record = {
+        "code": code,
+        "product_name": "Nutella",
+        "brands": "Nutella, Ferrero",
+        "product_quantity": "350",
+        "product_quantity_unit": "g",
+        "nutriments": {
+            "energy-kcal_100g": 539,
+            "proteins_100g": 6.3,
+            "fat_100g": 30.9,
+            "carbohydrates_100g": 57.5,
+            "sugars_100g": 56.3,
+            "salt_100g": 0.107,
+        },
+    }
+    record.update(overrides)
+    return record
+
+
+def _gtin8(number: int) -> str:
+    """Return a valid GTIN-8 for a seven digit number.
+
+    Args:
+        number: item reference.
+
+    Returns:
+        str: GTIN-8 with its check digit.
+    """
+    digits = f"{number:07d}"
+    weighted = sum(
+        int(digit) * (3 if position % 2 else 1)
+        for position, digit in enumerate(reversed(digits), start=1)
+    )
+    return f"{digits}{(10 - weighted % 10) % 10}"
+
+
+def _write_jsonl(path: Path, records: list) -> Path:
+    """Write records as JSON lines.
+
+    Args:
+        path: destination path.
+        records: records, or raw lines for non-dict entries.
+
+    Returns:
+        Path: the written dump path.
+    """
+    path.write_text(
+        "\n".join(
+            json.dumps(record) if isinstance(record, dict) else record
+            for record in records
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def _import(dump: Path, *args: str) -> str:
+    """Run the import command and return its output.
+
+    Args:
+        dump: dump path.
+        args: extra command line arguments.
+
+    Returns:
+        str: command output.
+    """
+    out = StringIO()
+    call_command("import_open_food_facts", str(dump), *args, stdout=out)
+    return out.getvalue()
+
+
+def test_jsonl_import_creates_products_and_default_servings(tmp_path):
+    """Dump records become products with their derived default servings."""
+    # Given
+    dump = _write_jsonl(tmp_path / "products.jsonl", [_record()])
+
+    # When
+    output = _import(dump)
+
+    # Then
+    product = FoodProduct.objects.get(barcode=NUTELLA)
+    assert (product.brand, product.name) == ("Nutella", "Nutella")
+    assert (product.size, product.size_unit) == (Decimal("350"), "g")
+    assert product.sugar_carbs_g == Decimal("56.3")
+    assert product.sodium_mg == 44
+    assert "1 created" in output
+    servings = list(product.servings.order_by("pk"))
+    assert [(s.serving_size, s.serving_unit) for s in servings] == [
+        (Decimal("100"), "g"),
+        (Decimal("1"), "g"),
+        (Decimal("1"), "container"),
+    ]
+    assert servings[2].energy_kcal == Decimal("1886.50")
+    assert not (tmp_path / "products.jsonl.checkpoint").exists()
+
+
+def test_created_servings_reflect_the_persisted_product():
+    """Servings are projected from the rounded product row, as on save."""
+    # When
+    import_dump_batch([_record(nutriments={"energy-kcal_100g": 539.456})])
+
+    # Then
+    product = FoodProduct.objects.get(barcode=NUTELLA)
+    assert product.energy_kcal == Decimal("539.46")
+    for serving in product.servings.all():
+        imported = {field: getattr(serving, field) for field in NUTRIENT_LIST}
+        serving.save()
+        serving.refresh_from_db()
+        assert imported == {
+            field: getattr(serving, field) for field in NUTRIENT_LIST
+        }
+
+
+def test_compressed_csv_import_maps_columns(tmp_path):
+    """Tab separated OFF exports are read through the same mapping."""
+    # Given
+    dump = tmp_path / "products.csv.gz"
+    with gzip.open(dump, "wt", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file, delimiter="\t")
+        writer.writerow(
+            ["code", "product_name", "quantity", "energy-kcal_100g", "x"]
+        )
+        writer.writerow([UPC, "Cola", "33 cl", "42", "ignored"])
+        writer.writerow(["", "No code", "", "", ""])
+
+    # When
+    output = _import(dump)
+
+    # Then
+    product = FoodProduct.objects.get(barcode=UPC)
+    assert (product.size, product.size_unit) == (Decimal("33"), "cl")
+    assert product.nutritional_info_unit == "ml"
+    assert product.energy_kcal == Decimal("42")
+    assert "1 skipped" in output
+
+
+def test_reimport_updates_only_changed_products(tmp_path):
+    """Refreshing a dump rewrites changed products and their servings."""
+    # Given
+    water = _record(WATER, product_name="Water", nutriments={})
+    _import(_write_jsonl(tmp_path / "first.jsonl", [_record(), water]))
+    changed = _record(nutriments={"energy-kcal_100g": 540, "salt_100g": 1})
+    dump = _write_jsonl(tmp_path / "second.jsonl", [changed, water])
+
+    # When
+    output = _import(dump)
+
+    # Then
+    assert "1 updated, 1 unchanged" in output
+    product = FoodProduct.objects.get(barcode=NUTELLA)
+    assert product.energy_kcal == 540
+    assert product.sodium_mg == 400
+    for serving in product.servings.all():
+        imported = {field: getattr(serving, field) for field in NUTRIENT_LIST}
+        serving.save()
+        serving.refresh_from_db()
+        assert imported == {
+            field: getattr(serving, field) for field in NUTRIENT_LIST
+        }
+
+
+def test_import_matches_legacy_zero_padded_barcodes(food_product_factory):
+    """Existing products stored with padded GTINs are refreshed in place."""
+    # Given
+    product = food_product_factory(barcode=f"0{NUTELLA}")
+
+    # When
+    stats = import_dump_batch([_record()])
+
+    # Then
+    assert (stats.created, stats.updated) == (0, 1)
+    product.refresh_from_db()
+    assert product.barcode == NUTELLA
+    assert product.name == "Nutella"
+    assert product.energy_kcal == 539
+    assert FoodProduct.objects.count() == 1
+
+
+def test_batch_skips_unusable_and_superseded_records():
+    """Invalid records are skipped and repeated barcodes keep the last."""
+    # When
+    stats = import_dump_batch(
+        [
+            None,
+            _record("123"),
+            _record(product_name=" "),
+            _record(product_name="First"),
+            _record(product_name="Second"),
+        ]
+    )
+
+    # Then
+    assert stats == DumpImportStats(records=5, created=1, skipped=4)
+    assert FoodProduct.objects.get().name == "Second"
+
+
+def test_draft_values_fit_the_food_columns():
+    """Oversized text falls back or truncates, missing sizes use the basis."""
+    # When
+    import_dump_batch(
+        [
+            _record(
+                product_name="N" * 300,
+                url="https://example.com/" + "u" * 200,
+                product_quantity=None,
+                product_quantity_unit=None,
+            )
+        ]
+    )
+
+    # Then
+    product = FoodProduct.objects.get()
+    assert len(product.name) == 255
+    assert product.url == f"https://world.openfoodfacts.org/product/{NUTELLA}"
+    assert (product.size, product.size_unit) == (Decimal("100"), "g")
+    assert product.fibre_carbs_g is None
+
+
+def test_batch_query_count_does_not_grow_with_batch_size():
+    """Creating and refreshing products costs a constant number of queries."""
+
+    def batch(first: int, size: int) -> list[dict]:
+        return [
+            _record(_gtin8(number), product_name=f"Product {number}")
+            for number in range(first, first + size)
+        ]
+
+    def queries(records: list[dict]) -> list[str]:
+        with CaptureQueriesContext(connection) as captured:
+            import_dump_batch(records)
+        # Backends split bulk writes into batches of their own size, so
+        # consecutive statements of the same kind on a table count once.
+        statements = [
+            " ".join(re.sub(r"^\d+ times: ", "", query["sql"]).split()[:3])
+            for query in captured
+        ]
+        return [
+            statement
+            for position, statement in enumerate(statements)
+            if not position or statement != statements[position - 1]
+        ]
+
+    # Then
+    assert queries(batch(1, 2)) == queries(batch(10, 20))
+    changed = [{**record, "product_name": "Renamed"} for record in batch(1, 2)]
+    more_changed = [
+        {**record, "product_name": "Renamed"} for record in batch(10, 20)
+    ]
+    assert queries(changed) == queries(more_changed)
+
+
+def test_import_resumes_after_checkpoint(tmp_path):
+    """A checkpoint skips the records a previous run committed."""
+    # Given
+    dump = _write_jsonl(
+        tmp_path / "products.jsonl",
+        [_record(), "{not json", "[]", "", _record(UPC)],
+    )
+    checkpoint = tmp_path / "state.json"
+    write_checkpoint(checkpoint, dump, 1)
+
+    # When
+    output = _import(dump, "--checkpoint", str(checkpoint), "--batch-size=1")
+
+    # Then
+    assert "Resuming after 1 records." in output
+    assert list(FoodProduct.objects.values_list("barcode", flat=True)) == [UPC]
+    assert "Imported 4 records: 1 created, 0 updated" in output
+    assert not checkpoint.exists()
+
+
+def test_restart_ignores_checkpoint(tmp_path):
+    """Restarting imports the whole dump regardless of the checkpoint."""
+    # Given
+    dump = _write_jsonl(tmp_path / "products.jsonl", [_record()])
+    write_checkpoint(tmp_path / "products.jsonl.checkpoint", dump, 1)
+
+    # When
+    _import(dump, "--restart")
+
+    # Then
+    assert FoodProduct.objects.filter(barcode=NUTELLA).exists()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        None,
+        "{broken",
+        "[]",
+        '{"dump": "other.jsonl", "records": 3}',
+        '{"dump": "<dump>", "records": -1}',
+    ],
+)
+def test_unusable_checkpoints_start_from_the_top(tmp_path, content):
+    """Missing, corrupt, foreign, or invalid checkpoints are ignored."""
+    # Given
+    dump = tmp_path / "products.jsonl"
+    checkpoint = tmp_path / "products.jsonl.checkpoint"
+    if content is not None:
+        checkpoint.write_text(
+            content.replace("<dump>", str(dump.resolve())), encoding="utf-8"
+        )
+
+    # Then
+    assert read_checkpoint(checkpoint, dump) == 0
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("products.jsonl", "jsonl"),
+        ("products.jsonl.gz", "jsonl"),
+        ("en.openfoodfacts.org.products.csv.gz", "csv"),
+        ("products.TSV", "csv"),
+        ("products.txt", None),
+        ("products", None),
+    ],
+)
+def test_dump_format_is_inferred_from_the_file_name(name, expected):
+    """Dump formats follow the file suffix, ignoring gzip compression."""
+    assert dump_format(Path(name)) == expected
+
+
+def test_explicit_format_overrides_the_file_name(tmp_path):
+    """An explicit format imports dumps with unknown suffixes."""
+    # Given
+    dump = _write_jsonl(tmp_path / "products.txt", [_record()])
+
+    # When
+    _import(dump, "--format=jsonl")
+
+    # Then
+    assert Serving.objects.filter(food__foodproduct__barcode=NUTELLA).exists()
+
+
+@pytest.mark.parametrize(
+    ("name", "args", "message"),
+    [
+        ("missing.jsonl", (), "Dump file not found"),
+        ("products.txt", (), "Cannot infer the dump format"),
+        ("products.jsonl", ("--batch-size=0",), "--batch-size"),
+    ],
+)
+def test_invalid_invocations_raise_command_errors(
+    tmp_path, name, args, message
+):
+    """Unusable dumps and options fail before anything is imported."""
+    # Given
+    dump = tmp_path / name
+    if name != "missing.jsonl":
+        dump.write_text("", encoding="utf-8")
+
+    # Then
+    with pytest.raises(CommandError, match=message):
+        _import(dump, *args)
@@ -2,6 +2,12 @@
 
 from decimal import Decimal
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.foods.models import FoodProduct
+from apps.foods.models.nutrients import NUTRIENT_LIST
+
 
 def test_proudct_defualt_three_servings(db, food_product):
     """Product get three servings on creation."""
@@ -73,6 +79,42 @@ def test_product_different_container_unit(db, food_product_factory):
     assert serving.energy_kcal == Decimal("339200")
 
 
+def test_product_default_servings_are_inserted_at_once(
+    db, food_product_factory
+):
+    """Default servings are written with a single insert statement."""
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        food_product = food_product_factory(salt_g=Decimal("1.5"))
+
+    # Then
+    inserts = [
+        sql for sql in _serving_queries(captured) if sql.startswith("INSERT")
+    ]
+    assert len(inserts) == 1
+    assert food_product.servings.count() == 4
+
+
+def test_product_default_servings_match_serving_save(db, food_product_factory):
+    """Bulk created servings hold the values a per-row save derives."""
+    # Given
+    food_product = food_product_factory(salt_g=Decimal("1.5"))
+
+    # When
+    for serving in food_product.servings.all():
+        bulk = {
+            nutrient: getattr(serving, nutrient) for nutrient in NUTRIENT_LIST
+        }
+        serving.save()
+        serving.refresh_from_db()
+
+        # Then
+        assert bulk == {
+            nutrient: getattr(serving, nutrient) for nutrient in NUTRIENT_LIST
+        }
+        assert serving.sodium_mg
+
+
 def test_product_save_no_more_servings(db, food_product):
     """Already created product doesn't create more servings when saved."""
     # Given
@@ -105,3 +147,154 @@ def test_product_update_size_on_servings(db, food_product):
     # Then
     serving = food_product.servings.all()[2]
     assert serving.energy_kcal == Decimal("678.4")
+
+
+def _serving_queries(captured):
+    """Get the captured queries touching the servings table."""
+    return [
+        query["sql"]
+        for query in captured.captured_queries
+        if "foods_serving" in query["sql"]
+    ]
+
+
+def test_product_non_nutritional_save_skips_servings(db, food_product):
+    """Saving unrelated fields leaves the servings untouched."""
+    # Given
+    food_product = FoodProduct.objects.get(pk=food_product.pk)
+
+    # When
+    food_product.name = "Renamed"
+    with CaptureQueriesContext(connection) as captured:
+        food_product.save()
+
+    # Then
+    assert not _serving_queries(captured)
+
+
+def test_product_partial_save_skips_servings(db, food_product):
+    """A partial save of unrelated fields ignores pending nutrient edits."""
+    # Given
+    food_product.energy_kcal = 1
+
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        food_product.save(update_fields=["name"])
+
+    # Then
+    assert not _serving_queries(captured)
+
+
+def test_product_refresh_resets_serving_baseline(db, food_product):
+    """Reloaded values become the baseline for the next save."""
+    # Given
+    FoodProduct.objects.filter(pk=food_product.pk).update(energy_kcal=212)
+    food_product.refresh_from_db()
+
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        food_product.save()
+
+    # Then
+    assert not _serving_queries(captured)
+
+
+def test_product_partial_refresh_keeps_pending_serving_edits(db, food_product):
+    """Refreshing other fields leaves unsaved nutrient edits pending."""
+    # Given
+    food_product = FoodProduct.objects.get(pk=food_product.pk)
+    food_product.nutritional_info_size = 200
+
+    # When
+    food_product.refresh_from_db(fields=["name", "energy_kcal"])
+    food_product.save()
+
+    # Then
+    assert food_product.servings.all()[0].energy_kcal == 53
+
+
+def test_product_nutritional_save_query_count_is_constant(
+    db, food_product, serving_factory
+):
+    """Servings are written in one statement regardless of their number."""
+    # Given
+    food_product.energy_kcal = 200
+    with CaptureQueriesContext(connection) as few:
+        food_product.save()
+    serving_factory.create_batch(20, food=food_product, serving_size=3)
+
+    # When
+    food_product.energy_kcal = 300
+    with CaptureQueriesContext(connection) as many:
+        food_product.save()
+
+    # Then
+    assert len(many) == len(few)
+    assert len(_serving_queries(many)) == 2
+
+
+def test_product_bulk_update_matches_serving_save(db, food_product):
+    """Bulk projected values equal those of saving every serving."""
+    # Given
+    food_product.energy_kcal = Decimal("123.45")
+    food_product.salt_g = Decimal("1.5")
+    food_product.size = 450
+
+    # When
+    food_product.save()
+
+    # Then
+    for serving in food_product.servings.all():
+        bulk = {
+            nutrient: getattr(serving, nutrient) for nutrient in NUTRIENT_LIST
+        }
+        serving.save()
+        serving.refresh_from_db()
+        assert bulk == {
+            nutrient: getattr(serving, nutrient) for nutrient in NUTRIENT_LIST
+        }
+
+
+def test_product_without_baseline_updates_servings(db, food_product):
+    """Instances not loaded from the db always refresh their servings."""
+    # Given
+    food_product = FoodProduct.objects.get(pk=food_product.pk)
+    del food_product._loaded_serving_source_values
+    food_product.servings.update(energy_kcal=1)
+
+    # When
+    food_product.save()
+
+    # Then
+    assert food_product.servings.all()[0].energy_kcal == 106
+
+
+def test_product_save_syncs_canonical_gtin(db, food_product_factory):
+    """Saving a product derives its canonical GTIN from the barcode."""
+    # When
+    food_product = food_product_factory(barcode=" 03017620422003")
+
+    # Then
+    assert food_product.gtin == "3017620422003"
+
+
+def test_product_invalid_barcode_has_no_gtin(db, food_product_factory):
+    """Barcodes that are not valid GTINs leave the column empty."""
+    # When
+    food_product = food_product_factory(barcode="https://example.com/qr")
+
+    # Then
+    assert food_product.gtin is None
+
+
+def test_product_partial_barcode_save_writes_gtin(db, food_product):
+    """A partial save of the barcode keeps the GTIN column in sync."""
+    # Given
+    food_product.barcode = "036000291452"
+
+    # When
+    food_product.save(update_fields=["barcode"])
+
+    # Then
+    food_product.refresh_from_db()
+    assert food_product.gtin == "036000291452"
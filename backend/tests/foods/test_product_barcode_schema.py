@@ -6,15 +6,21 @@ import pytest
 import requests
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from apps.foods import open_food_facts
 from apps.foods.models import (
     FoodProduct,
     OpenFoodFactsCacheEntry,
     OpenFoodFactsRateLimit,
     Serving,
 )
+from apps.foods.schema import MAX_BARCODE_BATCH_SIZE
 from config.schema import schema
 
+from .fake_open_food_facts import fake_barcodes
+
 User = get_user_model()
 
 BARCODE = "3017620422003"
@@ -23,9 +29,10 @@ OFF_PRODUCT_PAGE = "https://world.openfoodfacts.org/product/3017620422003"
 
 @pytest.fixture(autouse=True)
 def _clear_off_persistence(db):
-    """Start each test with an empty OFF cache and quota window."""
+    """Start each test with empty OFF caches and quota window."""
     OpenFoodFactsCacheEntry.objects.all().delete()
     OpenFoodFactsRateLimit.objects.all().delete()
+    open_food_facts.LOCAL_PRODUCT_CACHE.clear()
 
 
 def _create_user(email: str, *, is_staff: bool = False):
@@ -522,6 +529,38 @@ class TestFoodProductBarcodeLookup:
         assert lookup["openFoodFacts"] is None
         assert not requests_mock.called
 
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="PostgreSQL EXPLAIN output is required",
+    )
+    def test_local_lookup_is_an_index_scan(self, mocker, requests_mock):
+        """The local lookup query is answered by the GTIN btree index."""
+        user = _create_user("barcode-explain@test.com")
+        FoodProduct.objects.create(name="Indexed", barcode=f"0{BARCODE}")
+        with CaptureQueriesContext(connection) as captured:
+            result = schema.execute_sync(
+                _lookup_query("product { id }"),
+                context_value=self._context(mocker, user),
+            )
+        assert result.data["foodProductByBarcode"]["product"] is not None
+        lookup_sql = next(
+            query["sql"]
+            for query in captured.captured_queries
+            if '"foods_foodproduct"."gtin" =' in query["sql"]
+        )
+
+        with connection.cursor() as cursor:
+            # Tiny test tables make a sequential scan cheapest; disabling it
+            # shows whether the planner can answer the query from the index.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN {lookup_sql}")
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        assert "Seq Scan on foods_foodproduct" not in plan
+        assert "foods_foodproduct_gtin" in plan
+        assert "Index Cond: ((gtin)::text" in plan
+        assert not requests_mock.called
+
     def test_lookup_requires_authentication(self, mocker, requests_mock):
         """Anonymous users get an empty lookup without querying OFF."""
         off = requests_mock.get(
@@ -581,3 +620,128 @@ class TestFoodProductBarcodeLookup:
 
         assert result.errors is not None
         assert "Open Food Facts lookup failed" in str(result.errors[0])
+
+    def test_cache_stats_report_hit_ratios_to_staff(
+        self, mocker, requests_mock
+    ):
+        """Staff can read the OFF cache hit ratios of each tier."""
+        user = _create_user("barcode-stats@test.com")
+        staff = _create_user("barcode-stats-staff@test.com", is_staff=True)
+        requests_mock.get(_off_url(BARCODE), json=_off_payload())
+        for _ in range(2):
+            schema.execute_sync(
+                _lookup_query("openFoodFacts { name }"),
+                context_value=self._context(mocker, user),
+            )
+        query = "{ openFoodFactsCacheStats { tier hits misses hitRatio } }"
+
+        denied = schema.execute_sync(
+            query, context_value=self._context(mocker, user)
+        )
+        result = schema.execute_sync(
+            query, context_value=self._context(mocker, staff)
+        )
+
+        assert denied.errors is not None
+        assert "Staff access required" in str(denied.errors[0])
+        assert result.errors is None
+        assert result.data["openFoodFactsCacheStats"] == [
+            {"tier": "local", "hits": 1, "misses": 1, "hitRatio": 0.5},
+            {"tier": "database", "hits": 0, "misses": 1, "hitRatio": 0.0},
+            {"tier": "stale", "hits": 0, "misses": 0, "hitRatio": 0.0},
+        ]
+
+    def test_rate_limit_stats_count_token_requests(
+        self, mocker, requests_mock
+    ):
+        """Staff can read the quota token requests of this process."""
+        user = _create_user("barcode-quota@test.com")
+        staff = _create_user("barcode-quota-staff@test.com", is_staff=True)
+        requests_mock.get(_off_url(BARCODE), json=_off_payload())
+        query = "{ openFoodFactsRateLimitStats { granted rejected } }"
+        before = schema.execute_sync(
+            query, context_value=self._context(mocker, staff)
+        )
+
+        schema.execute_sync(
+            _lookup_query("openFoodFacts { name }"),
+            context_value=self._context(mocker, user),
+        )
+        result = schema.execute_sync(
+            query, context_value=self._context(mocker, staff)
+        )
+
+        assert result.errors is None
+        counted = before.data["openFoodFactsRateLimitStats"]
+        assert result.data["openFoodFactsRateLimitStats"] == {
+            "granted": counted["granted"] + 1,
+            "rejected": counted["rejected"],
+        }
+
+    def test_batch_lookup_answers_each_distinct_barcode(
+        self, mocker, requests_mock
+    ):
+        """Batch lookups normalize input and answer every barcode once."""
+        user = _create_user("barcode-batch@test.com")
+        local, remote, unknown = fake_barcodes(3)
+        FoodProduct.objects.create(
+            name="Local Oats",
+            barcode=local,
+            size=500,
+            size_unit="g",
+            num_servings=1,
+            url="",
+        )
+        off = requests_mock.get(_off_url(remote), json=_off_payload())
+        requests_mock.get(_off_url(unknown), status_code=404)
+
+        result = schema.execute_sync(
+            "query Lookup($barcodes: [String!]!) { "
+            "foodProductsByBarcodes(barcodes: $barcodes) { barcode error "
+            "product { name } openFoodFacts { name } } }",
+            variable_values={
+                "barcodes": [remote, f" {local} ", "123", unknown, remote]
+            },
+            context_value=self._context(mocker, user),
+        )
+
+        assert result.errors is None
+        assert result.data["foodProductsByBarcodes"] == [
+            {
+                "barcode": remote,
+                "error": None,
+                "product": None,
+                "openFoodFacts": {"name": "Nutella"},
+            },
+            {
+                "barcode": local,
+                "error": None,
+                "product": {"name": "Local Oats"},
+                "openFoodFacts": None,
+            },
+            {
+                "barcode": unknown,
+                "error": None,
+                "product": None,
+                "openFoodFacts": None,
+            },
+        ]
+        assert off.call_count == 1
+
+    def test_batch_lookup_rejects_oversized_batches(
+        self, mocker, requests_mock
+    ):
+        """Batches above the size limit fail before any lookup."""
+        user = _create_user("barcode-batch-limit@test.com")
+        barcodes = fake_barcodes(MAX_BARCODE_BATCH_SIZE + 1)
+
+        result = schema.execute_sync(
+            "query Lookup($barcodes: [String!]!) { "
+            "foodProductsByBarcodes(barcodes: $barcodes) { barcode } }",
+            variable_values={"barcodes": barcodes},
+            context_value=self._context(mocker, user),
+        )
+
+        assert result.errors is not None
+        assert "barcodes can be looked up at once" in str(result.errors[0])
+        assert not requests_mock.called
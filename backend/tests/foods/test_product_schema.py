@@ -66,7 +66,7 @@ def _create_user(email: str, *, is_staff: bool = False):
 
 
 @pytest.mark.django_db
-class TestFoodProductSchema:
+class TestFoodProductSchema:  # pylint: disable=too-many-public-methods
     """Tests for FoodProduct mutations and queries."""
 
     def _count_food_products_with_servings_query(
@@ -116,6 +116,43 @@ class TestFoodProductSchema:
         assert result.data["foodProducts"][0]["name"] == "Apple"
         assert result.data["foodProducts"][1]["name"] == "Banana"
 
+    def test_food_products_connection_pages_by_name(self, mocker):
+        """Product connections page by name with prefetched servings."""
+        # Given three products
+        user = _create_user("fp-pages@test.com")
+        for name in ("Cherry", "Apple", "Banana"):
+            FoodProduct.objects.create(name=name, num_servings=1)
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        query = """
+            query Products($after: String) {
+                foodProductsConnection(first: 2, after: $after) {
+                    edges { node { name servings { id } } }
+                    pageInfo { hasNextPage endCursor }
+                }
+            }
+        """
+
+        first = schema.execute_sync(query, context_value=mock_context).data[
+            "foodProductsConnection"
+        ]
+        rest = schema.execute_sync(
+            query,
+            variable_values={"after": first["pageInfo"]["endCursor"]},
+            context_value=mock_context,
+        ).data["foodProductsConnection"]
+
+        # Then products come in name order with their servings
+        assert [e["node"]["name"] for e in first["edges"]] == [
+            "Apple",
+            "Banana",
+        ]
+        assert all(e["node"]["servings"] for e in first["edges"])
+        assert first["pageInfo"]["hasNextPage"] is True
+        assert [e["node"]["name"] for e in rest["edges"]] == ["Cherry"]
+        anonymous = schema.execute_sync(query, context_value=None)
+        assert anonymous.data["foodProductsConnection"]["edges"] == []
+
     def test_food_products_query_with_servings_has_bounded_query_growth(
         self, mocker
     ):
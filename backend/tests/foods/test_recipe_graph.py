@@ -0,0 +1,101 @@
+"""Tests for the recipe dependency graph and ordered re-propagation."""
+
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+
+from apps.foods.models import FoodProduct, Recipe, RecipeIngredient
+from apps.foods.models.units import UNIT_SERVING
+from apps.foods.recipe_graph import RecipeDependencies
+from apps.foods.recipe_ingredients import refresh_dependent_recipes
+
+pytestmark = pytest.mark.django_db
+
+
+def _nested_recipes():
+    """Return a product, a recipe using it and a recipe using both."""
+    product = FoodProduct.objects.create(
+        name="Base", energy_kcal=Decimal("100")
+    )
+    base_serving = product.servings.get(serving_size=100, serving_unit="g")
+    inner = Recipe.objects.create(
+        name="Inner", nutrients_from_ingredients=True
+    )
+    RecipeIngredient.objects.create(recipe=inner, food=base_serving)
+    outer = Recipe.objects.create(
+        name="Outer", nutrients_from_ingredients=True
+    )
+    RecipeIngredient.objects.create(
+        recipe=outer, food=inner.servings.get(serving_unit=UNIT_SERVING)
+    )
+    RecipeIngredient.objects.create(recipe=outer, food=base_serving)
+    return product, inner, outer
+
+
+def test_dependencies_order_sub_recipes_before_their_parents():
+    """Each level only uses foods refreshed on earlier levels."""
+    # Given
+    product, inner, outer = _nested_recipes()
+
+    # When
+    dependencies = RecipeDependencies.collect([product.pk])
+
+    # Then
+    assert dependencies.recipes == {inner.pk, outer.pk}
+    assert dependencies.levels() == [[inner.pk], [outer.pk]]
+    assert not RecipeDependencies.collect([outer.pk]).levels()
+
+
+def test_ingredients_cannot_nest_a_recipe_inside_itself():
+    """A recipe cannot use its own serving or a dependent recipe's."""
+    # Given
+    _, inner, outer = _nested_recipes()
+
+    # When / Then
+    with pytest.raises(ValidationError, match="cannot contain its recipe"):
+        RecipeIngredient.objects.create(
+            recipe=inner, food=outer.servings.get(serving_unit=UNIT_SERVING)
+        )
+    with pytest.raises(ValidationError, match="cannot contain its recipe"):
+        RecipeIngredient.objects.create(
+            recipe=inner, food=inner.servings.get(serving_unit=UNIT_SERVING)
+        )
+    assert inner.ingredients.count() == 1
+
+
+def test_refresh_propagates_a_product_correction_through_nested_recipes():
+    """A corrected product reaches every transitive parent recipe."""
+    # Given a corrected product whose recipes still hold old snapshots
+    product, inner, outer = _nested_recipes()
+    assert Recipe.objects.get(pk=outer.pk).energy_kcal == Decimal("200")
+    product.energy_kcal = Decimal("150")
+    product.save()
+
+    # When
+    levels = refresh_dependent_recipes([product.pk])
+
+    # Then
+    assert levels == [[inner.pk], [outer.pk]]
+    assert Recipe.objects.get(pk=inner.pk).energy_kcal == Decimal("150")
+    assert Recipe.objects.get(pk=outer.pk).energy_kcal == Decimal("300")
+    assert set(
+        RecipeIngredient.objects.values_list("energy_kcal", flat=True)
+    ) == {Decimal("150")}
+
+
+def test_refresh_command_reports_levels():
+    """The command refreshes dependents of the given foods."""
+    # Given
+    product, inner, outer = _nested_recipes()
+    out = StringIO()
+
+    # When
+    call_command("refresh_dependent_recipes", str(product.pk), stdout=out)
+
+    # Then
+    assert f"Level 1: {inner.pk}" in out.getvalue()
+    assert f"Level 2: {outer.pk}" in out.getvalue()
+    assert "Refreshed 2 recipes in 2 levels." in out.getvalue()
@@ -11,6 +11,7 @@ from django.db import connection
 from django.test.utils import CaptureQueriesContext
 
 from apps.foods.models import FoodProduct, Recipe, RecipeIngredient
+from apps.foods.recipe_graph import RecipeDependencies
 from config.schema import schema
 
 User = get_user_model()
@@ -235,6 +236,43 @@ class TestRecipeQuery:
         assert result.data["recipes"][0]["name"] == "Omelette"
         assert result.data["recipes"][1]["name"] == "Smoothie"
 
+    def test_recipes_connection_pages_by_name(self, mocker):
+        """Recipe connections page by name, last pages included."""
+        # Given three recipes
+        user = _create_user("rq-pages@test.com")
+        for name in ("Soup", "Omelette", "Smoothie"):
+            Recipe.objects.create(name=name, num_servings=1)
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        query = """
+            query Recipes($before: String) {
+                recipesConnection(last: 2, before: $before) {
+                    edges { node { name ingredients { id } } }
+                    pageInfo { hasPreviousPage startCursor }
+                }
+            }
+        """
+
+        # When paging backwards from the end
+        last = schema.execute_sync(query, context_value=mock_context).data[
+            "recipesConnection"
+        ]
+        rest = schema.execute_sync(
+            query,
+            variable_values={"before": last["pageInfo"]["startCursor"]},
+            context_value=mock_context,
+        ).data["recipesConnection"]
+
+        # Then each page keeps the name order
+        assert [e["node"]["name"] for e in last["edges"]] == [
+            "Smoothie",
+            "Soup",
+        ]
+        assert last["pageInfo"]["hasPreviousPage"] is True
+        assert [e["node"]["name"] for e in rest["edges"]] == ["Omelette"]
+        anonymous = schema.execute_sync(query, context_value=None)
+        assert anonymous.data["recipesConnection"]["edges"] == []
+
     def test_recipes_query_with_ingredients_has_bounded_query_growth(
         self, mocker
     ):
@@ -1656,6 +1694,108 @@ class TestRecipeMutation:  # pylint: disable=too-many-public-methods
         assert result.data["deleteRecipeIngredient"] is True
         assert not RecipeIngredient.objects.filter(pk=ingredient.id).exists()
 
+    def test_staff_can_patch_recipe_ingredients_in_one_batch(self, mocker):
+        """A batch of changes recomputes the recipe and serving once."""
+        user = _create_user("ingredient-patch-staff@test.com", is_staff=True)
+        context = mocker.Mock()
+        context.request.user = user
+        recipe = Recipe.objects.create(
+            name="Patched", num_servings=1, nutrients_from_ingredients=True
+        )
+        servings = [
+            FoodProduct.objects.create(
+                name=f"Ingredient {index}",
+                energy_kcal=Decimal(f"{index}0"),
+            ).servings.get(serving_size=100, serving_unit="g")
+            for index in range(1, 4)
+        ]
+        kept, removed = (
+            RecipeIngredient.objects.create(recipe=recipe, food=serving)
+            for serving in servings[:2]
+        )
+        mutation = """
+            mutation Patch(
+                $recipeId: ID!, $changes: [RecipeIngredientChangeInput!]!
+            ) {
+                patchRecipeIngredients(
+                    recipeId: $recipeId, changes: $changes
+                ) {
+                    energyKcal
+                    ingredients { foodLabel numServings }
+                }
+            }
+        """
+        changes = [
+            {
+                "id": str(kept.pk),
+                "foodId": str(servings[0].pk),
+                "numServings": 2,
+            },
+            {"id": str(removed.pk), "delete": True},
+            {"foodId": str(servings[2].pk), "numServings": 0.5},
+        ]
+        collect = mocker.spy(RecipeDependencies, "collect")
+
+        with CaptureQueriesContext(connection) as captured:
+            result = schema.execute_sync(
+                mutation,
+                variable_values={
+                    "recipeId": str(recipe.pk),
+                    "changes": changes,
+                },
+                context_value=context,
+            )
+
+        assert result.errors is None
+        patched = result.data["patchRecipeIngredients"]
+        assert patched["energyKcal"] == 35
+        assert [i["numServings"] for i in patched["ingredients"]] == [2, 0.5]
+        assert not RecipeIngredient.objects.filter(pk=removed.pk).exists()
+        serving_updates = [
+            query["sql"]
+            for query in captured.captured_queries
+            if query["sql"].startswith('UPDATE "foods_serving"')
+        ]
+        assert len(serving_updates) == 1
+        assert recipe.servings.get().energy_kcal == 35
+        collect.assert_called_once()
+
+    def test_patch_recipe_ingredients_rejects_foreign_rows_atomically(
+        self, mocker
+    ):
+        """A change to another recipe's ingredient rejects the whole batch."""
+        user = _create_user("ingredient-patch-foreign@test.com", is_staff=True)
+        context = mocker.Mock()
+        context.request.user = user
+        recipe, other = (
+            Recipe.objects.create(name=name, nutrients_from_ingredients=True)
+            for name in ("Target", "Other")
+        )
+        serving = FoodProduct.objects.create(name="Ingredient").servings.get(
+            serving_size=100, serving_unit="g"
+        )
+        foreign = RecipeIngredient.objects.create(recipe=other, food=serving)
+
+        result = schema.execute_sync(
+            f"""
+            mutation {{
+                patchRecipeIngredients(
+                    recipeId: "{recipe.pk}",
+                    changes: [
+                        {{ foodId: "{serving.pk}" }},
+                        {{ id: "{foreign.pk}", delete: true }}
+                    ]
+                ) {{ id }}
+            }}
+            """,
+            context_value=context,
+        )
+
+        assert result.errors is not None
+        assert "RecipeIngredient not found" in str(result.errors[0])
+        assert not recipe.ingredients.exists()
+        assert RecipeIngredient.objects.filter(pk=foreign.pk).exists()
+
     def test_create_recipe_unauthenticated(self):
         """Test creating a recipe without authentication."""
         # When attempting to create a recipe without authentication
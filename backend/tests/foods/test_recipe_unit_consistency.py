@@ -292,12 +292,20 @@ def test_recipe_mutation_rolls_back_late_serving_failure(mocker, operation):
         )
     )
     real_save = Serving.save
+    real_bulk_create = type(Serving.objects).bulk_create
 
     def save_then_fail(instance, *args, **kwargs):
         real_save(instance, *args, **kwargs)
         raise RuntimeError("injected late serving failure")
 
+    def bulk_create_then_fail(manager, *args, **kwargs):
+        real_bulk_create(manager, *args, **kwargs)
+        raise RuntimeError("injected late serving failure")
+
     mocker.patch.object(Serving, "save", save_then_fail)
+    mocker.patch.object(
+        type(Serving.objects), "bulk_create", bulk_create_then_fail
+    )
     if operation == "create":
         mutation = """
             mutation {
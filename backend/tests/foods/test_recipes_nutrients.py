@@ -725,3 +725,116 @@ def test_bulk_recipe_ingredient_delete_prelocks_all_rows_globally(
             "default",
         ),
     ]
+
+
+def _calculated_recipe(recipe_factory) -> Recipe:
+    """Return a recipe whose totals are calculated from no ingredients."""
+    recipe = recipe_factory(size_unit="g")
+    recipe.nutrients_from_ingredients = True
+    recipe.save()
+    return recipe
+
+
+def _rebuilt(recipe: Recipe) -> Recipe:
+    """Return a copy of a recipe with fully rebuilt aggregates."""
+    from apps.foods.signals.handlers.recipe_nutrients import (
+        apply_recipe_ingredient_totals,
+    )
+
+    rebuilt = Recipe.objects.get(pk=recipe.pk)
+    apply_recipe_ingredient_totals(
+        rebuilt,
+        rebuilt.ingredients.select_related("food__food").order_by("pk"),
+    )
+    return rebuilt
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_ingredient_changes_keep_totals_equal_to_a_rebuild(
+    db,
+    settings,
+    incremental,
+    recipe_factory,
+    food_product_factory,
+    recipe_ingredient_factory,
+):
+    """Incremental deltas maintain exactly the totals of a full rebuild."""
+    from apps.foods.models.nutrient_vector import NutrientVector
+    from apps.foods.signals.handlers.recipe_nutrients import (
+        verify_recipe_aggregates,
+    )
+
+    # Given two calculated recipes
+    settings.RECIPE_AGGREGATES_INCREMENTAL = incremental
+    first = _calculated_recipe(recipe_factory)
+    second = _calculated_recipe(recipe_factory)
+    servings = [
+        Serving.objects.create(
+            food=food_product_factory(
+                size=Decimal("100"),
+                size_unit="g",
+                energy_kcal=Decimal(f"{index}1.2"),
+                protein_g=Decimal(f"{index}.5"),
+            ),
+            serving_size=Decimal("100"),
+            serving_unit="g",
+        )
+        for index in range(1, 5)
+    ]
+
+    # When ingredients are added, resized, moved and deleted
+    ingredients = [
+        recipe_ingredient_factory(recipe=first, food=serving)
+        for serving in servings
+    ]
+    ingredients[0].num_servings = Decimal("2.5")
+    ingredients[0].save()
+    ingredients[1].recipe = second
+    ingredients[1].save()
+    ingredients[2].delete()
+    RecipeIngredient.objects.filter(pk=ingredients[3].pk).delete()
+
+    # Then
+    for recipe in (first, second):
+        stored = Recipe.objects.get(pk=recipe.pk)
+        rebuilt = _rebuilt(recipe)
+        assert NutrientVector.load(stored) == NutrientVector.load(rebuilt)
+        assert stored.size == rebuilt.size
+    assert Recipe.objects.get(pk=first.pk).energy_kcal == Decimal("28")
+    assert not verify_recipe_aggregates()
+
+
+def test_verify_recipe_aggregates_reports_and_repairs_drift(
+    db, recipe_factory, recipe_ingredient_factory
+):
+    """The verifier reports drifted totals and repairs them on request."""
+    from io import StringIO
+
+    from django.core.management import CommandError, call_command
+
+    from apps.foods.signals.handlers.recipe_nutrients import (
+        RecipeAggregateDrift,
+        verify_recipe_aggregates,
+    )
+
+    # Given a calculated recipe whose stored totals drifted
+    recipe = _calculated_recipe(recipe_factory)
+    recipe_ingredient_factory(recipe=recipe)
+    expected = Recipe.objects.get(pk=recipe.pk)
+    Recipe.objects.filter(pk=recipe.pk).update(
+        protein_g=Decimal("999"), size=Decimal("1")
+    )
+
+    # When / Then
+    drift = [RecipeAggregateDrift(recipe.pk, ("protein_g", "size"))]
+    assert verify_recipe_aggregates([recipe.pk]) == drift
+    with pytest.raises(CommandError, match="1 recipes drifted"):
+        call_command("verify_recipe_aggregates", "--fail-on-drift")
+
+    out = StringIO()
+    call_command("verify_recipe_aggregates", "--repair", stdout=out)
+    assert f"Recipe {recipe.pk}: protein_g, size repaired" in out.getvalue()
+    repaired = Recipe.objects.get(pk=recipe.pk)
+    assert repaired.protein_g == expected.protein_g
+    assert repaired.size == expected.size
+    assert not verify_recipe_aggregates()
@@ -1,5 +1,8 @@
 """recipe servings tests module."""
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 
 def test_recipe_serving(db, recipe_factory):
     """Serving is created on recipe creation."""
@@ -11,6 +14,23 @@ def test_recipe_serving(db, recipe_factory):
     assert recipe.servings.first().energy_kcal == 100
 
 
+def test_recipe_serving_is_derived_in_memory(db, recipe_factory):
+    """Recipe creation inserts its serving without a per-row save."""
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        recipe = recipe_factory(num_servings=4, energy_kcal=600)
+
+    # Then
+    serving_queries = [
+        query["sql"]
+        for query in captured.captured_queries
+        if "foods_serving" in query["sql"]
+    ]
+    assert len(serving_queries) == 1
+    assert serving_queries[0].startswith("INSERT")
+    assert recipe.servings.get().energy_kcal == 150
+
+
 def test_recipe_save_no_more_servings(db, recipe):
     """Save an already created recipe doesn't create more servings."""
     # Given
@@ -1,6 +1,17 @@
 """Tests for the serving model."""
 
-from apps.foods.models.units import UNIT_CONTAINER
+from decimal import Decimal
+
+import pytest
+
+from apps.foods.models import Food, Serving
+from apps.foods.models.nutrients import NUTRIENT_LIST
+from apps.foods.models.units import (
+    UNIT_CONTAINER,
+    UNIT_GRAM,
+    UNIT_KILOGRAM,
+    UNIT_SERVING,
+)
 
 
 def test_serving_container_str(serving_factory):
@@ -13,3 +24,92 @@ def test_serving_container_str(serving_factory):
 
     # Then the string representation includes the size
     assert str(serving) == "Ocado Chicken Breast - 1 container (320g)"
+
+
+@pytest.mark.parametrize(
+    ("serving_size", "serving_unit", "energy_kcal"),
+    [
+        (Decimal("50"), UNIT_GRAM, Decimal("53")),
+        (Decimal("1"), UNIT_CONTAINER, Decimal("339.2")),
+        (Decimal("1"), UNIT_SERVING, Decimal("169.6")),
+        (Decimal("1"), UNIT_KILOGRAM, Decimal("1060")),
+    ],
+)
+def test_projection_scales_every_nutrient(
+    food_product_factory, serving_size, serving_unit, energy_kcal
+):
+    """One projection scales the whole nutrient vector of the product."""
+    # Given a 320g product with two servings
+    product = food_product_factory(protein_g=Decimal("25"))
+    serving = Serving(
+        food=product, serving_size=serving_size, serving_unit=serving_unit
+    )
+
+    # When the nutrients are projected onto the serving
+    projected = serving.project_nutrients()
+    projection = serving.get_projection()
+
+    # Then every present nutrient uses the same scale as the legacy portion
+    assert projected["energy_kcal"] == energy_kcal
+    assert projected == {
+        nutrient: projection.apply(getattr(product, nutrient))
+        for nutrient in NUTRIENT_LIST
+        if getattr(product, nutrient)
+    }
+    assert serving.get_portion_for(product, "protein_g") == (
+        projected["protein_g"]
+    )
+
+
+def test_serving_of_non_product_food_uses_its_servings_as_basis(
+    food_factory,
+):
+    """Servings of plain foods are a fraction of their serving count."""
+    # Given a food split into four servings
+    food = food_factory(num_servings=4, energy_kcal=Decimal("100"))
+
+    # When a serving is created
+    serving = Serving.objects.create(
+        food=food, serving_size=1, serving_unit=UNIT_SERVING
+    )
+
+    # Then it carries a quarter of the food energy
+    assert serving.energy_kcal == Decimal("25")
+
+
+def test_food_without_nutrients_projects_nothing(food_factory):
+    """Empty nutrient vectors skip the projection entirely."""
+    # Given a food without any nutrient
+    food = food_factory(
+        **{
+            nutrient: 0
+            for nutrient in NUTRIENT_LIST
+            if not Food._meta.get_field(nutrient).null
+        },
+        **{
+            nutrient: None
+            for nutrient in NUTRIENT_LIST
+            if Food._meta.get_field(nutrient).null
+        },
+    )
+
+    # Then no nutrient is projected onto its servings
+    assert (
+        Serving(food=food, serving_unit=UNIT_SERVING).project_nutrients() == {}
+    )
+
+
+def test_serving_save_resolves_food_kind_once(
+    food_product_factory, django_assert_num_queries
+):
+    """Saving a per-serving portion costs one kind lookup, not one per nutrient."""
+    # Given a serving loaded without its product subclass
+    product = food_product_factory()
+    serving = Serving.objects.get(food=product, serving_unit=UNIT_SERVING)
+    serving.food = Food.objects.get(pk=product.pk)
+
+    # When it is saved, then only the kind lookup and the update run
+    with django_assert_num_queries(2):
+        serving.save()
+
+    assert serving.energy_kcal == Decimal("169.6")
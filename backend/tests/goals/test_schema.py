@@ -52,6 +52,51 @@ class TestGoalsQuery:
         assert len(result.data["fatPercGoals"]) == 1
         assert result.data["fatPercGoals"][0]["bodyFatPerc"] == 15.0
 
+    def test_goals_connection_pages_latest_first(self, mocker):
+        """Goal connections page through the user's goals newest first."""
+        # Given a user with three goals
+        user = User.objects.create_user(
+            email="goalpages@example.com",
+            password="password123",
+            date_of_birth="2000-01-01",
+            height=170.0,
+        )
+        goals = [
+            FatPercGoal.objects.create(user=user, body_fat_perc=perc)
+            for perc in (15.0, 14.0, 13.0)
+        ]
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        query = """
+            query Goals($after: String) {
+                fatPercGoalsConnection(first: 2, after: $after) {
+                    edges { node { id } }
+                    pageInfo { hasNextPage endCursor }
+                }
+            }
+        """
+
+        # When paging through the connection
+        first = schema.execute_sync(query, context_value=mock_context).data[
+            "fatPercGoalsConnection"
+        ]
+        rest = schema.execute_sync(
+            query,
+            variable_values={"after": first["pageInfo"]["endCursor"]},
+            context_value=mock_context,
+        ).data["fatPercGoalsConnection"]
+
+        # Then the newest goals come first and anonymous users get nothing
+        assert [e["node"]["id"] for e in first["edges"]] == [
+            str(goals[2].id),
+            str(goals[1].id),
+        ]
+        assert first["pageInfo"]["hasNextPage"] is True
+        assert [e["node"]["id"] for e in rest["edges"]] == [str(goals[0].id)]
+        assert rest["pageInfo"]["hasNextPage"] is False
+        anonymous = schema.execute_sync(query, context_value=None)
+        assert anonymous.data["fatPercGoalsConnection"]["edges"] == []
+
     def test_goal_detail(self, mocker):
         """Test single goal query."""
         # Given a user with a goal
@@ -1,5 +1,7 @@
 """Tests for Measurements GraphQL schema."""
 
+# pylint: disable=too-many-lines
+
 import datetime
 from decimal import Decimal
 
@@ -64,6 +66,46 @@ class TestMeasurementsQuery:
         assert len(result.data["measurements"]) == 1
         assert result.data["measurements"][0]["weight"] == 80.0
 
+    def test_measurements_connection_pages_latest_first(self, mocker):
+        """Measurement connections page through the history newest first."""
+        # Given a user with three measurements
+        user = User.objects.create_user(
+            email="pages@example.com",
+            password="password123",
+            date_of_birth="2000-01-01",
+            height=170.0,
+        )
+        for weight in (80.0, 79.0, 78.0):
+            Measurement.objects.create(user=user, weight=weight)
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        query = """
+            query Measurements($before: String) {
+                measurementsConnection(last: 2, before: $before) {
+                    edges { node { weight } }
+                    pageInfo { hasPreviousPage startCursor }
+                }
+            }
+        """
+
+        # When paging backwards from the oldest measurement
+        last = schema.execute_sync(query, context_value=mock_context).data[
+            "measurementsConnection"
+        ]
+        earlier = schema.execute_sync(
+            query,
+            variable_values={"before": last["pageInfo"]["startCursor"]},
+            context_value=mock_context,
+        ).data["measurementsConnection"]
+
+        # Then pages keep the newest first order and anonymous users get none
+        assert [e["node"]["weight"] for e in last["edges"]] == [79.0, 80.0]
+        assert last["pageInfo"]["hasPreviousPage"] is True
+        assert [e["node"]["weight"] for e in earlier["edges"]] == [78.0]
+        assert earlier["pageInfo"]["hasPreviousPage"] is False
+        anonymous = schema.execute_sync(query, context_value=None)
+        assert anonymous.data["measurementsConnection"]["edges"] == []
+
     def test_latest_measurement_returns_current_users_newest_record(
         self, mocker
     ):
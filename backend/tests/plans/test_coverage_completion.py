@@ -57,7 +57,10 @@ def test_plan_queries_return_none_when_owned_object_is_missing(
     """Owned-object lookups translate model absence into nullable results."""
     user = _authenticated_user()
     queryset_mock = mocker.Mock()
+    # Resolvers project the queryset onto the selected columns.
+    queryset_mock.only.return_value = queryset_mock
     queryset_mock.get.side_effect = model.DoesNotExist
+    mocker.patch.object(model.objects, "all", return_value=queryset_mock)
     filter_mock = mocker.patch.object(
         model.objects, "filter", return_value=queryset_mock
     )
@@ -69,8 +72,7 @@ def test_plan_queries_return_none_when_owned_object_is_missing(
 
     assert result is None
     if resolver == "week_plan":
-        filter_mock.assert_called_once_with(pk="404", user=user)
-        queryset_mock.get.assert_called_once_with()
+        queryset_mock.get.assert_called_once_with(pk="404", user=user)
     elif resolver == "day":
         filter_mock.assert_called_once_with(plan__user=user)
         queryset_mock.get.assert_called_once_with(pk="404")
@@ -107,17 +109,14 @@ def test_plan_queries_convert_found_owned_objects(
     user = _authenticated_user()
     queryset_mock = mocker.Mock()
     queryset_mock.get.return_value = obj
-    filter_mock = mocker.patch.object(
-        model.objects, "filter", return_value=queryset_mock
-    )
+    mocker.patch.object(model.objects, "all", return_value=queryset_mock)
     get_mock = mocker.patch.object(model.objects, "get", return_value=obj)
 
     result = getattr(PlanQuery(), resolver)(_info(user), "1")
 
     assert result is converted
     if resolver == "week_plan":
-        filter_mock.assert_called_once_with(pk="1", user=user)
-        queryset_mock.get.assert_called_once_with()
+        queryset_mock.get.assert_called_once_with(pk="1", user=user)
     else:
         get_mock.assert_called_once_with(pk="1", day__plan__user=user)
     converter.assert_called_once_with(obj)
@@ -212,17 +211,18 @@ def test_week_plan_type_scalars_return_zero_without_model():
     assert WeekPlanType.energy_kcal(value) == 0.0
 
 
-def test_week_plan_type_energy_scalars_read_model_values():
+def test_week_plan_type_energy_scalars_read_model_values(mocker):
     """Energy scalars surface the model values when the model is present."""
-    value = SimpleNamespace(
-        model=SimpleNamespace(
-            energy_kcal_goal=Decimal("2000"),
-            energy_kcal=Decimal("1500"),
-        )
+    load = mocker.patch("apps.plans.schema._DAYS.load")
+    model = SimpleNamespace(
+        energy_kcal_goal=Decimal("2000"),
+        energy_kcal=Decimal("1500"),
     )
+    value = SimpleNamespace(model=model)
 
     assert WeekPlanType.energy_kcal_goal(value) == 2000.0
     assert WeekPlanType.energy_kcal(value) == 1500.0
+    assert load.call_args_list == [mocker.call(model)] * 2
 
 
 def test_week_plan_validation_rejects_mismatched_daily_inputs(mocker):
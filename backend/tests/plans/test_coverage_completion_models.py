@@ -177,20 +177,19 @@ def test_recalculate_intake_days_acquires_missing_aggregate_locks(mocker):
         "apps.plans.signals.handlers.lock_plan_aggregate_rows",
         return_value=locks,
     )
-    totals_query = mocker.Mock()
-    totals_query.filter.return_value.aggregate.return_value = {
-        "energy_kcal": 12
-    }
-    manager = mocker.Mock()
-    manager.using.return_value = totals_query
-    mocker.patch.object(Intake, "objects", manager)
+    totals = mocker.Mock()
+    totals_by_day = mocker.patch(
+        "apps.plans.signals.handlers.intake_totals_by_day",
+        return_value={3: totals},
+    )
     instance = SimpleNamespace(day_id=3)
 
     _recalculate_intake_days(instance, "default")
 
     lock_rows.assert_called_once_with(using="default", day_ids=(3,))
     assert instance._nutrition_locks is locks
-    assert day.energy_kcal == 12
+    totals_by_day.assert_called_once_with((3,), "default")
+    totals.store.assert_called_once_with(day)
     day.save.assert_called_once_with(using="default")
     assert instance.day is day
 
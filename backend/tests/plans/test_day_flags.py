@@ -1,5 +1,9 @@
 """Tests for the day flags."""
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.plans.activity import DayActivity
 from apps.plans.models import Intake
 
 
@@ -130,3 +134,58 @@ def test_unprocessed_intake_is_flagged(day, intake_factory):
 
     # Then the day is flagged
     assert not day.breakfast_flag
+
+
+def _activity_queries(day) -> list[str]:
+    """Save a day and return the queries reading its activity tables."""
+    with CaptureQueriesContext(connection) as captured:
+        day.save()
+    return [
+        query["sql"]
+        for query in captured.captured_queries
+        if "plans_intake" in query["sql"]
+        or "exercises_exercise" in query["sql"]
+        or "exercises_daysteps" in query["sql"]
+    ]
+
+
+def test_day_save_reads_its_activity_in_one_query(
+    day, intake_factory, exercise_factory, day_steps_factory
+):
+    """Saving a day costs the same queries however much it logged."""
+    # Given the query count of saving an empty day
+    with CaptureQueriesContext(connection) as empty:
+        day.save()
+    assert len(_activity_queries(day)) == 1
+
+    # And a day with every meal, exercises and steps logged
+    for meal in Intake.MEAL_ORDER:
+        intake_factory(day=day, meal=meal)
+        intake_factory(day=day, meal=meal)
+    exercise_factory(day=day)
+    exercise_factory(day=day)
+    day_steps_factory(day=day)
+
+    # When
+    with CaptureQueriesContext(connection) as busy:
+        day.save()
+
+    # Then
+    assert len(busy.captured_queries) == len(empty.captured_queries)
+    assert len(_activity_queries(day)) == 1
+    assert day.breakfast_flag and day.dinner_flag
+    assert day.exercises_flag and day.steps_flag
+
+
+def test_day_activity_collects_many_days_at_once(day, day_factory):
+    """Bulk recompute reads the activity of many days in one query."""
+    # Given
+    other = day_factory(plan=day.plan, day_num=2)
+
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        activities = DayActivity.collect([day.pk, other.pk], "default")
+
+    # Then
+    assert len(captured.captured_queries) == 1
+    assert activities == {day.pk: DayActivity(), other.pk: DayActivity()}
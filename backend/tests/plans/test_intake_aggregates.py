@@ -4,12 +4,16 @@
 # pylint: disable=missing-return-type-doc,protected-access
 
 from decimal import Decimal
+from functools import reduce
+from operator import or_
 
 import pytest
 from django.contrib import admin
+from django.db.models import Q
 from django.db.models.query import QuerySet
 
 from apps.plans.models import Day, Intake, WeekPlan
+from apps.plans.rollups import rollup_models
 
 
 def _create_custom_intake(day, energy: str, protein: str = "0") -> Intake:
@@ -23,6 +27,30 @@ def _create_custom_intake(day, energy: str, protein: str = "0") -> Intake:
     )
 
 
+def _refreshed_rollups(days) -> list:
+    """Return the rollup rows locked to refresh the periods of days."""
+    return [
+        (
+            model,
+            sorted(
+                model.objects.filter(
+                    reduce(
+                        or_,
+                        (
+                            Q(
+                                user_id=day.plan.user_id,
+                                start=model.period_start(day.day),
+                            )
+                            for day in days
+                        ),
+                    )
+                ).values_list("pk", flat=True)
+            ),
+        )
+        for model in rollup_models()
+    ]
+
+
 def test_create_recomputes_day_nutrients_from_persisted_intakes(day):
     """A stale caller-side day cache cannot corrupt a create rollup."""
     day.energy_kcal = Decimal("900")
@@ -257,6 +285,7 @@ def test_day_queryset_cascade_prelocks_all_intake_hierarchies(
                 (queryset.model, [row.pk for row in queryset._result_cache])
             )
 
+    rollups = _refreshed_rollups(days)
     mocker.patch.object(QuerySet, "_fetch_all", new=record_locked_queryset)
 
     Day.objects.filter(pk__in=[row.pk for row in days]).order_by(
@@ -267,6 +296,7 @@ def test_day_queryset_cascade_prelocks_all_intake_hierarchies(
         (WeekPlan, sorted(day.plan_id for day in days)),
         (Day, [day.pk for day in days]),
         (Intake, sorted(row.pk for row in intakes)),
+        *rollups,
     ]
     assert not Intake.objects.filter(
         pk__in=[row.pk for row in intakes]
@@ -291,6 +321,7 @@ def test_day_instance_cascade_prelocks_all_intakes(mocker, day_factory):
                 (queryset.model, [row.pk for row in queryset._result_cache])
             )
 
+    rollups = _refreshed_rollups([day])
     mocker.patch.object(QuerySet, "_fetch_all", new=record_locked_queryset)
 
     day_id = day.pk
@@ -302,6 +333,7 @@ def test_day_instance_cascade_prelocks_all_intakes(mocker, day_factory):
         (WeekPlan, [plan_id]),
         (Day, [day_id]),
         (Intake, intake_ids),
+        *rollups,
     ]
 
 
@@ -325,6 +357,9 @@ def test_week_plan_queryset_cascade_prelocks_all_intake_hierarchies(
                 (queryset.model, [row.pk for row in queryset._result_cache])
             )
 
+    rollups = _refreshed_rollups(
+        Day.objects.filter(plan__in=[row.plan_id for row in days])
+    )
     mocker.patch.object(QuerySet, "_fetch_all", new=record_locked_queryset)
 
     WeekPlan.objects.filter(pk__in=[row.plan_id for row in days]).order_by(
@@ -335,6 +370,7 @@ def test_week_plan_queryset_cascade_prelocks_all_intake_hierarchies(
         (WeekPlan, sorted(day.plan_id for day in days)),
         (Day, sorted(day.pk for day in days)),
         (Intake, sorted(row.pk for row in intakes)),
+        *rollups,
     ]
     assert not Intake.objects.filter(
         pk__in=[row.pk for row in intakes]
@@ -365,6 +401,7 @@ def test_week_plan_instance_cascade_prelocks_all_intake_hierarchies(
                 (queryset.model, [row.pk for row in queryset._result_cache])
             )
 
+    rollups = _refreshed_rollups(plan.days.all())
     mocker.patch.object(QuerySet, "_fetch_all", new=record_locked_queryset)
 
     plan.delete()
@@ -373,6 +410,7 @@ def test_week_plan_instance_cascade_prelocks_all_intake_hierarchies(
         (WeekPlan, [plan_id]),
         (Day, sorted((day.pk, other_day.pk))),
         (Intake, sorted(row.pk for row in intakes)),
+        *rollups,
     ]
 
 
@@ -0,0 +1,87 @@
+"""Tests for the transaction-scoped Day and WeekPlan recomputation."""
+
+# pylint: disable=missing-any-param-doc,missing-return-doc
+# pylint: disable=missing-return-type-doc
+
+from decimal import Decimal
+
+import pytest
+
+from apps.plans.models import Day, Intake, WeekPlan
+from apps.plans.recompute import get_plan_recompute, plan_recompute
+
+pytestmark = pytest.mark.django_db
+
+
+def _create_custom_intake(day, energy: str) -> Intake:
+    """Create a processed custom intake with concise defaults."""
+    return Intake.objects.create(
+        day=day,
+        food=None,
+        meal=Intake.MEAL_LUNCH,
+        energy_kcal=Decimal(energy),
+    )
+
+
+def test_bulk_intake_delete_recomputes_each_day_and_plan_once(mocker, day):
+    """Deleting many intakes saves their day and plan once."""
+    # Given
+    for _ in range(5):
+        _create_custom_intake(day, "100")
+    kept = _create_custom_intake(day, "50")
+    day_save = mocker.spy(Day, "save")
+    plan_save = mocker.spy(WeekPlan, "save")
+
+    # When
+    Intake.objects.filter(day=day).exclude(pk=kept.pk).delete()
+
+    # Then
+    assert day_save.call_count == 1
+    assert plan_save.call_count == 1
+    day.refresh_from_db()
+    assert day.energy_kcal == Decimal("50.00")
+    assert day.plan.energy_kcal == Decimal("50.00")
+
+
+def test_scope_defers_intake_totals_until_it_closes(day):
+    """Writes inside a scope update the day once when it closes."""
+    # Given
+    with plan_recompute("default") as recompute:
+        # When
+        _create_custom_intake(day, "100")
+        with plan_recompute("default") as nested:
+            _create_custom_intake(day, "200")
+
+        # Then the nested scope joined and nothing was flushed yet
+        assert nested is recompute
+        assert recompute.day_ids == {day.pk}
+        assert Day.objects.get(pk=day.pk).energy_kcal == Decimal("0")
+
+    assert get_plan_recompute("default") is None
+    assert Day.objects.get(pk=day.pk).energy_kcal == Decimal("300.00")
+
+
+def test_writes_outside_a_scope_recompute_inline(day):
+    """Single writes keep recomputing their day immediately."""
+    # When
+    intake = _create_custom_intake(day, "100")
+
+    # Then
+    assert get_plan_recompute("default") is None
+    assert intake.day.energy_kcal == Decimal("100.00")
+
+
+def test_day_deletion_refreshes_its_plan(day):
+    """Deleting an incomplete day lets its plan complete."""
+    # Given
+    _create_custom_intake(day, "100")
+    plan = day.plan
+    plan.days.exclude(pk=day.pk).update(completed=True)
+    Day.objects.filter(pk=day.pk).update(completed=False)
+
+    # When
+    day.delete()
+
+    # Then
+    plan.refresh_from_db()
+    assert plan.completed
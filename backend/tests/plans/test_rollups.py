@@ -0,0 +1,102 @@
+"""Week and month rollup tests module."""
+
+import datetime
+from decimal import Decimal
+
+from django.core.management import call_command
+
+from apps.plans.models import MonthRollup, WeekRollup
+from apps.plans.rollup_rebuild import rebuild_rollups
+from apps.plans.rollups import rollup_models
+
+
+def _rollups(user) -> dict:
+    """Return the user's rollup rows as comparable values."""
+    return {
+        (model.__name__, row.start): {
+            name: getattr(row, name) for name in model.COUNTERS + model.TOTALS
+        }
+        for model in rollup_models()
+        for row in model.objects.filter(user=user)
+    }
+
+
+def test_new_plan_is_rolled_up_per_week_and_month(db, week_plan_factory):
+    """A plan crossing a week and a month splits its days between them."""
+    # When a plan runs from Saturday 28 January to Friday 3 February
+    plan = week_plan_factory(start_date=datetime.date(2023, 1, 28))
+
+    # Then
+    weeks = WeekRollup.objects.filter(user=plan.user).order_by("start")
+    months = MonthRollup.objects.filter(user=plan.user).order_by("start")
+    assert [(row.start, row.days) for row in weeks] == [
+        (datetime.date(2023, 1, 23), 2),
+        (datetime.date(2023, 1, 30), 5),
+    ]
+    assert [(row.start, row.days) for row in months] == [
+        (datetime.date(2023, 1, 1), 4),
+        (datetime.date(2023, 2, 1), 3),
+    ]
+    goal = sum(day.energy_kcal_goal for day in plan.days.all())
+    assert sum(row.energy_kcal_goal for row in weeks) == goal
+    assert sum(row.tdee - row.deficit for row in months) == goal
+
+
+def test_day_writes_keep_rollups_equal_to_a_rebuild(
+    db, week_plan, intake_factory, exercise_factory, day_steps_factory
+):
+    """Incremental updates leave the rollups a rebuild would write."""
+    # Given intakes, exercises, steps and settings changed on some days
+    first, second, third = week_plan.days.order_by("day_num")[:3]
+    intake_factory(day=first, food=None, energy_kcal=Decimal("812.35"))
+    intake_factory(day=second, food=None, protein_g=Decimal("40.5"))
+    exercise_factory(day=first, kcals=300)
+    day_steps_factory(day=second, steps=10000)
+    for flag in ("breakfast", "lunch", "snack", "dinner", "exercises"):
+        setattr(third, f"{flag}_exc", True)
+    third.steps_exc = True
+    third.tracked = False
+    third.save()
+    incremental = _rollups(week_plan.user)
+
+    # When
+    rebuild_rollups(week_plan.user_id, "default")
+
+    # Then
+    assert _rollups(week_plan.user) == incremental
+    week = WeekRollup.objects.get(user=week_plan.user)
+    assert week.energy_kcal == Decimal("812.35")
+    assert week.completed_days == 1
+    assert week.tracked_days == 6
+
+
+def test_deleting_a_plan_drops_its_periods(db, week_plan_factory):
+    """Periods left without days are removed with their plan."""
+    # Given two plans of the same user in January
+    first = week_plan_factory(start_date=datetime.date(2023, 1, 2))
+    second = week_plan_factory(
+        user=first.user, start_date=datetime.date(2023, 1, 9)
+    )
+
+    # When
+    second.delete()
+
+    # Then
+    assert list(
+        WeekRollup.objects.filter(user=first.user).values_list("start", "days")
+    ) == [(datetime.date(2023, 1, 2), 7)]
+    assert MonthRollup.objects.get(user=first.user).days == 7
+
+
+def test_rebuild_command_restores_history(db, week_plan):
+    """The rebuild command rewrites rollups from the days."""
+    # Given rollups lost or written before they were maintained
+    expected = _rollups(week_plan.user)
+    WeekRollup.objects.all().delete()
+    MonthRollup.objects.update(days=0, energy_kcal_goal=0)
+
+    # When
+    call_command("rebuild_rollups")
+
+    # Then
+    assert _rollups(week_plan.user) == expected
@@ -123,6 +123,74 @@ class TestWeekPlanSchema:
         assert len(result.data["weekPlans"]) == 1
         assert result.data["weekPlans"][0]["proteinGKg"] == 1.8
 
+    @pytest.mark.parametrize(
+        ("query", "summarised"),
+        [
+            ("{ weekPlans { id days { energyKcal } } }", False),
+            ("{ weekPlans { ... on WeekPlanType { energyKcal } } }", True),
+            (
+                "{ weekPlans { ...Totals } } "
+                "fragment Totals on WeekPlanType { twee }",
+                True,
+            ),
+        ],
+    )
+    def test_week_plans_summarise_only_selected_plan_totals(
+        self, mocker, query, summarised
+    ):
+        """Totals selected on the plan, directly or in fragments, count."""
+        user, _ = _create_user_and_plan("wpsummary@test.com")
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        with_summary = mocker.spy(WeekPlan.objects, "with_summary")
+
+        result = schema.execute_sync(query, context_value=mock_context)
+
+        assert result.errors is None
+        assert with_summary.called is summarised
+
+    def test_week_plans_connection_pages_latest_first(self, mocker):
+        """Week plan connections page newest first with their days."""
+        # Given a user with two consecutive week plans
+        user, plan = _create_user_and_plan("wppages@test.com")
+        later = WeekPlan.objects.create(
+            user=user,
+            measurement=plan.measurement,
+            start_date=plan.start_date + datetime.timedelta(days=7),
+            protein_g_kg=Decimal("2.0"),
+            fat_perc=Decimal("25.0"),
+            deficit=Decimal("500.0"),
+        )
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        query = """
+            query Plans($after: String) {
+                weekPlansConnection(first: 1, after: $after) {
+                    edges { node { id days { id } } }
+                    pageInfo { hasNextPage endCursor }
+                }
+            }
+        """
+
+        # When paging through the connection
+        first = schema.execute_sync(query, context_value=mock_context).data[
+            "weekPlansConnection"
+        ]
+        rest = schema.execute_sync(
+            query,
+            variable_values={"after": first["pageInfo"]["endCursor"]},
+            context_value=mock_context,
+        ).data["weekPlansConnection"]
+
+        # Then the later plan comes first and anonymous users get nothing
+        assert first["edges"][0]["node"]["id"] == str(later.id)
+        assert len(first["edges"][0]["node"]["days"]) == 7
+        assert first["pageInfo"]["hasNextPage"] is True
+        assert rest["edges"][0]["node"]["id"] == str(plan.id)
+        assert rest["pageInfo"]["hasNextPage"] is False
+        anonymous = schema.execute_sync(query, context_value=None)
+        assert anonymous.data["weekPlansConnection"]["edges"] == []
+
 
 @pytest.mark.django_db
 class TestPlanGraphQLBudget:
@@ -256,6 +324,29 @@ class TestPlanGraphQLBudget:
         assert result.data["day"]["id"] == str(day.id)
         assert result.data["day"]["intakes"] == []
 
+    def test_day_accumulated_diffs_resolve_without_a_plan_load(self, mocker):
+        """Days read on their own resolve their plan's running diffs."""
+        user, plan = _create_user_and_plan("plan-day-diffs@test.com")
+        days = list(Day.objects.filter(plan=plan).order_by("day_num"))
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        query = "{ %s }" % " ".join(
+            'd%s: day(id: "%s") { energyKcalGoalAccumulatedDiff }'
+            % (day.day_num, day.id)
+            for day in days
+        )
+
+        result = schema.execute_sync(query, context_value=mock_context)
+
+        assert result.errors is None
+        assert [
+            result.data[f"d{day.day_num}"]["energyKcalGoalAccumulatedDiff"]
+            for day in days
+        ] == [
+            float(plan.energy_kcal_goal_accumulated_diff(day.day_num))
+            for day in days
+        ]
+
     def test_week_plans_fragment_query_has_bounded_budget(self, mocker):
         """Named fragment day selections keep the hydration bounded."""
         fragment_query = (
@@ -467,6 +558,92 @@ class TestPlanGraphQLBudget:
         assert result.errors is None
         assert result.data["updateWeekPlan"]["proteinGKg"] == 2.2
 
+    def test_clone_week_plan(self, mocker):
+        """Cloning a week plan creates the following week."""
+        user, plan = _create_user_and_plan("wpclone@test.com")
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+
+        result = schema.execute_sync(
+            """
+                mutation ClonePlan($id: ID!) {
+                    cloneWeekPlan(id: $id) { id startDate }
+                }
+            """,
+            variable_values={"id": str(plan.id)},
+            context_value=mock_context,
+        )
+
+        assert result.errors is None
+        clone = WeekPlan.objects.get(pk=result.data["cloneWeekPlan"]["id"])
+        assert clone.start_date == plan.start_date + datetime.timedelta(7)
+        assert clone.days.count() == WeekPlan.PLAN_LENGTH_DAYS
+
+    def test_rollups_query(self, mocker):
+        """Rollups are read per period with totals and averages."""
+        user, plan = _create_user_and_plan("wprollups@test.com")
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        query = """
+            query Rollups($period: String!) {
+                rollups(period: $period, since: "2000-01-01") {
+                    start end days completedDays adherencePerc
+                    totals { energyKcalGoal tdee }
+                    averages { energyKcalGoal }
+                }
+            }
+        """
+
+        result = schema.execute_sync(
+            query,
+            variable_values={"period": "month"},
+            context_value=mock_context,
+        )
+        invalid = schema.execute_sync(
+            query,
+            variable_values={"period": "year"},
+            context_value=mock_context,
+        )
+
+        assert result.errors is None
+        days = plan.days.all()
+        goal = sum(day.energy_kcal_goal for day in days)
+        assert sum(row["days"] for row in result.data["rollups"]) == 7
+        assert sum(
+            row["totals"]["energyKcalGoal"] for row in result.data["rollups"]
+        ) == pytest.approx(float(goal))
+        month = result.data["rollups"][-1]
+        assert month["start"].endswith("-01")
+        assert month["averages"]["energyKcalGoal"] == pytest.approx(
+            month["totals"]["energyKcalGoal"] / month["days"]
+        )
+        assert invalid.errors is not None
+
+    def test_update_week_plan_coalesces_plan_saves(self, mocker):
+        """Updating seven days saves their plan once more, not per day."""
+        user, plan = _create_user_and_plan("wpsaves@test.com")
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        plan_save = mocker.spy(WeekPlan, "save")
+
+        result = schema.execute_sync(
+            """
+                mutation UpdatePlan($id: ID!) {
+                    updateWeekPlan(
+                        id: $id, proteinGKg: 2.2, fatPerc: 30.0, deficit: 100
+                    ) { deficit }
+                }
+            """,
+            variable_values={"id": str(plan.id)},
+            context_value=mock_context,
+        )
+
+        assert result.errors is None
+        assert plan_save.call_count == 2
+        assert set(
+            Day.objects.filter(plan=plan).values_list("deficit", flat=True)
+        ) == {80, 90, 110}
+
         days = list(Day.objects.filter(plan=plan).order_by("day_num"))
         assert [day.deficit for day in days] == [
             90,
@@ -1178,6 +1355,190 @@ class TestIntakeSchema:
         assert cupboard_item.consumed_perc == 0
         assert not cupboard_item.consumptions.exists()
 
+    def test_create_intakes_logs_a_meal_with_one_recompute_per_day(
+        self, mocker
+    ):
+        """A batch links stock and recomputes each affected day once."""
+        user, plan = _create_user_and_plan("intakes-batch@test.com")
+        first_day, second_day = Day.objects.filter(plan=plan)[:2]
+        product = FoodProduct.objects.create(
+            name="Batch food",
+            nutritional_info_size=100,
+            nutritional_info_unit="g",
+            size=400,
+            size_unit="g",
+            num_servings=4,
+            energy_kcal=100,
+        )
+        serving = product.servings.get(serving_size=100, serving_unit="g")
+        cupboard_item = CupboardItem.objects.create(
+            owner=user, food=product, purchased_at=timezone.now()
+        )
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        day_save = mocker.spy(Day, "save")
+
+        result = schema.execute_sync(
+            """
+                mutation CreateIntakes($intakes: [IntakeInput!]!) {
+                    createIntakes(intakes: $intakes) { dayId energyKcal }
+                }
+            """,
+            variable_values={
+                "intakes": [
+                    {
+                        "dayId": first_day.id,
+                        "meal": "lunch",
+                        "numServings": 1,
+                        "foodId": str(serving.id),
+                    },
+                    {
+                        "dayId": first_day.id,
+                        "meal": "lunch",
+                        "numServings": 1,
+                        "energyKcal": 50,
+                    },
+                    {
+                        "dayId": second_day.id,
+                        "meal": "dinner",
+                        "numServings": 2,
+                        "foodId": str(serving.id),
+                    },
+                ]
+            },
+            context_value=mock_context,
+        )
+
+        assert result.errors is None
+        assert [
+            intake["energyKcal"] for intake in result.data["createIntakes"]
+        ] == [100.0, 50.0, 200.0]
+        assert day_save.call_count == 2
+        first_day.refresh_from_db()
+        second_day.refresh_from_db()
+        assert first_day.energy_kcal == Decimal("150")
+        assert first_day.lunch_flag
+        assert second_day.energy_kcal == Decimal("200")
+        cupboard_item.refresh_from_db()
+        assert cupboard_item.consumed_perc == 75
+        assert cupboard_item.consumptions.count() == 2
+
+    def test_create_intakes_overconsumption_rolls_back_everything(
+        self, mocker
+    ):
+        """Intakes that together overdraw stock leave nothing behind."""
+        user, plan = _create_user_and_plan("intakes-atomic@test.com")
+        day = Day.objects.filter(plan=plan).first()
+        product = FoodProduct.objects.create(
+            name="Batch atomic food",
+            nutritional_info_size=100,
+            nutritional_info_unit="g",
+            size=400,
+            size_unit="g",
+            num_servings=4,
+            energy_kcal=100,
+        )
+        serving = product.servings.get(serving_size=100, serving_unit="g")
+        cupboard_item = CupboardItem.objects.create(
+            owner=user, food=product, purchased_at=timezone.now()
+        )
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        intake = {"dayId": day.id, "meal": "lunch", "foodId": str(serving.id)}
+
+        result = schema.execute_sync(
+            """
+                mutation CreateIntakes($intakes: [IntakeInput!]!) {
+                    createIntakes(intakes: $intakes) { id }
+                }
+            """,
+            variable_values={
+                "intakes": [
+                    {**intake, "numServings": 3},
+                    {**intake, "numServings": 2},
+                ]
+            },
+            context_value=mock_context,
+        )
+
+        assert isinstance(
+            result.errors[0].original_error,
+            CupboardItemConsumptionTooBigError,
+        )
+        day.refresh_from_db()
+        cupboard_item.refresh_from_db()
+        assert not Intake.objects.filter(day=day).exists()
+        assert day.energy_kcal == 0
+        assert cupboard_item.consumed_perc == 0
+
+    def test_create_intakes_moves_on_once_an_item_is_finished(self, mocker):
+        """Intakes after the one finishing an item consume the next item."""
+        user, plan = _create_user_and_plan("intakes-finish@test.com")
+        day = Day.objects.filter(plan=plan).first()
+        product = FoodProduct.objects.create(
+            name="Batch finished food",
+            nutritional_info_size=100,
+            nutritional_info_unit="g",
+            size=200,
+            size_unit="g",
+            num_servings=2,
+            energy_kcal=100,
+        )
+        serving = product.servings.get(serving_size=100, serving_unit="g")
+        first_item, second_item = (
+            CupboardItem.objects.create(
+                owner=user, food=product, purchased_at=timezone.now()
+            )
+            for _ in range(2)
+        )
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+        intake = {"dayId": day.id, "meal": "lunch", "foodId": str(serving.id)}
+
+        result = schema.execute_sync(
+            """
+                mutation CreateIntakes($intakes: [IntakeInput!]!) {
+                    createIntakes(intakes: $intakes) { id }
+                }
+            """,
+            variable_values={
+                "intakes": [
+                    {**intake, "numServings": 2},
+                    {**intake, "numServings": 1},
+                ]
+            },
+            context_value=mock_context,
+        )
+
+        assert result.errors is None
+        first_item.refresh_from_db()
+        second_item.refresh_from_db()
+        assert (first_item.consumed_perc, first_item.finished) == (100, True)
+        assert (second_item.consumed_perc, second_item.finished) == (50, False)
+
+    def test_create_intakes_rejects_days_of_other_users(self, mocker):
+        """A batch cannot log into another user's plan."""
+        user, _ = _create_user_and_plan("intakes-owner@test.com")
+        _, other_plan = _create_user_and_plan("intakes-other@test.com")
+        other_day = Day.objects.filter(plan=other_plan).first()
+        mock_context = mocker.Mock()
+        mock_context.request.user = user
+
+        result = schema.execute_sync(
+            """
+                mutation CreateIntakes($dayId: Int!) {
+                    createIntakes(intakes: [
+                        {dayId: $dayId, meal: "lunch", numServings: 1}
+                    ]) { id }
+                }
+            """,
+            variable_values={"dayId": other_day.id},
+            context_value=mock_context,
+        )
+
+        assert result.errors[0].message == "Day not found"
+        assert not Intake.objects.filter(day=other_day).exists()
+
     @pytest.mark.parametrize(
         "num_servings",
         [
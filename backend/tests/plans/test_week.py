@@ -52,11 +52,14 @@ CG110  ECG110  ECG110  ECG110  ECG90  ECG80  ECG90
 
 """
 
+import datetime
 from decimal import Decimal
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-from apps.plans.models import Intake
+from apps.plans.models import Day, Intake, WeekPlan
 
 
 def test_days_are_created(db, week_plan):
@@ -90,6 +93,58 @@ def test_saving_week_doesnt_create_more_days(db, week_plan):
     assert week_plan.days.count() == 7
 
 
+def test_days_are_created_with_one_insert(db, user, measurement):
+    """Creating a plan inserts its days at once with saved-day goals."""
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        week = WeekPlan.objects.create(
+            user=user,
+            measurement=measurement,
+            start_date=datetime.date(2023, 1, 9),
+            protein_g_kg=Decimal("2.5"),
+            fat_perc=25,
+            deficit=200,
+        )
+
+    # Then
+    day_inserts = [
+        query
+        for query in captured.captured_queries
+        if query["sql"].startswith('INSERT INTO "plans_day"')
+    ]
+    assert len(day_inserts) == 1
+    assert len(captured.captured_queries) <= 8
+    for day in week.days.all():
+        goals = (day.energy_kcal_goal, day.fat_g_goal, day.carbs_g_goal)
+        day.save()
+        day.refresh_from_db()
+        assert goals == (
+            day.energy_kcal_goal,
+            day.fat_g_goal,
+            day.carbs_g_goal,
+        )
+
+
+def test_clone_copies_day_settings_to_the_next_week(db, week_plan):
+    """A cloned week starts after its source and keeps its day settings."""
+    # Given
+    week_plan.days.filter(day_num=3).update(tracked=False, snack_exc=True)
+
+    # When
+    clone = week_plan.clone()
+
+    # Then
+    assert clone.start_date == week_plan.start_date + datetime.timedelta(7)
+    assert (clone.protein_g_kg, clone.deficit) == (
+        week_plan.protein_g_kg,
+        week_plan.deficit,
+    )
+    third_day = clone.days.get(day_num=3)
+    assert not third_day.tracked
+    assert third_day.snack_exc and third_day.snack_flag
+    assert not clone.days.get(day_num=4).snack_exc
+
+
 @pytest.fixture
 def zero_energy_kcal_goal(mocker):
     """Zero energy kcal goal mock."""
@@ -264,3 +319,81 @@ def test_accumulated_diff_with_no_completed_days(
 
     # Then the accumulated consumed energy is correct
     assert accumulated == 0
+
+
+def test_accumulated_diffs_of_many_plans_come_from_one_query(
+    db, week_plan_factory, intake_factory
+):
+    """One window query applies the surplus rule to every plan's days."""
+    # Given a plan with a completed day and a plan with a surplus day
+    completed_week, surplus_week = week_plan_factory(), week_plan_factory()
+    day = completed_week.days.get(day_num=2)
+    for flag in ("breakfast", "lunch", "snack", "dinner", "exercises"):
+        setattr(day, f"{flag}_exc", True)
+    day.steps_exc = True
+    day.save()
+    intake_factory(
+        day=surplus_week.days.get(day_num=3),
+        food=None,
+        energy_kcal=Decimal("5000"),
+    )
+    expected = {}
+    for week in (completed_week, surplus_week):
+        accumulated = Decimal("0")
+        for day in week.days.order_by("day_num"):
+            if day.completed or day.energy_kcal_goal_diff < 0:
+                accumulated += day.energy_kcal_goal_diff
+            expected[day.pk] = accumulated
+
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        diffs = dict(
+            Day.objects.filter(plan__in=[completed_week, surplus_week])
+            .with_accumulated_diff()
+            .values_list("pk", "accumulated_energy_kcal_goal_diff")
+        )
+
+    # Then
+    assert len(captured.captured_queries) == 1
+    assert diffs == expected
+    assert diffs[surplus_week.days.get(day_num=7).pk] < 0
+    assert diffs[completed_week.days.get(day_num=1).pk] == 0
+    assert diffs[completed_week.days.get(day_num=7).pk] > 0
+
+
+def test_summary_annotations_match_the_day_totals(
+    db, week_plan, intake_factory, exercise_factory, day_steps_factory
+):
+    """with_summary() computes the weekly totals without loading days."""
+    # Given a week with intakes, exercises, steps and an untracked day
+    first, second, third = week_plan.days.order_by("day_num")[:3]
+    intake_factory(day=first, meal=Intake.MEAL_LUNCH)
+    exercise_factory(day=first, kcals=300)
+    day_steps_factory(day=second, steps=10000)
+    third.tracked = False
+    third.save()
+    week_plan.refresh_from_db()
+    expected = (
+        week_plan.twee,
+        week_plan.energy_kcal_goal,
+        week_plan.energy_kcal,
+        week_plan.energy_kcal_intake_perc,
+        week_plan.energy_kcal_goal_diff,
+    )
+
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        summarised = WeekPlan.objects.with_summary().get(pk=week_plan.pk)
+        values = (
+            summarised.twee,
+            summarised.energy_kcal_goal,
+            summarised.energy_kcal,
+            summarised.energy_kcal_intake_perc,
+            summarised.energy_kcal_goal_diff,
+        )
+
+    # Then
+    assert len(captured.captured_queries) == 1
+    assert [round(value, 2) for value in values] == [
+        round(value, 2) for value in expected
+    ]
@@ -0,0 +1,199 @@
+"""Tests for request-scoped relation loaders."""
+
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.foods.models import FoodProduct, Recipe, RecipeIngredient, Serving
+from apps.libs.loaders import (
+    BatchLoader,
+    RelationLoader,
+    RelationLoaderExtension,
+)
+from apps.measurements.models import Measurement
+from apps.plans.models import Day, Intake, WeekPlan
+from config.schema import schema
+
+pytestmark = pytest.mark.django_db
+
+SERVINGS = RelationLoader("servings", lambda: Serving.objects.order_by("id"))
+
+RECIPES_QUERY = """
+    {
+        recipes { name ingredients { id } }
+        named: recipesConnection(first: 50) {
+            edges { node { ...Ingredients } }
+        }
+    }
+    fragment Ingredients on RecipeType {
+        ingredients { foodLabel }
+        ... on RecipeType { again: ingredients { id } }
+    }
+"""
+
+PLANS_QUERY = """
+    {
+        weekPlans { twee energyKcal days { intakes { id } } }
+        latest: weekPlansConnection(first: 50) {
+            edges { node { ...Days } }
+        }
+    }
+    fragment Days on WeekPlanType {
+        energyKcalGoal
+        days { tdee intakes { meal } }
+    }
+"""
+
+PRODUCTS_QUERY = """
+    {
+        foodProducts { servings { id } }
+        page: foodProductsConnection(first: 50) {
+            edges { node { ... on FoodProductType { servings { size } } } }
+        }
+    }
+"""
+
+
+def _count_queries(user, mocker, query: str) -> int:
+    """Execute a query as a user and return its SQL query count.
+
+    Args:
+        user: authenticated user.
+        mocker: pytest-mock fixture.
+        query (str): GraphQL query.
+
+    Returns:
+        int: number of SQL queries issued.
+    """
+    mock_context = mocker.Mock()
+    mock_context.request.user = user
+    with CaptureQueriesContext(connection) as captured:
+        result = schema.execute_sync(query, context_value=mock_context)
+    assert result.errors is None
+    return len(captured)
+
+
+def _create_recipes(count: int) -> None:
+    """Create recipes with two ingredients each."""
+    product = FoodProduct.objects.create(name="Ingredient", num_servings=1)
+    serving = product.servings.order_by("id").first()
+    for index in range(count):
+        recipe = Recipe.objects.create(name=f"Recipe {index}", num_servings=1)
+        for _ in range(2):
+            RecipeIngredient.objects.create(
+                recipe=recipe, food=serving, num_servings=1
+            )
+
+
+def _create_plans(user, count: int) -> None:
+    """Create week plans with one intake per day."""
+    measurement = Measurement.objects.create(
+        user=user, body_fat_perc=Decimal("20.0"), weight=Decimal("80.0")
+    )
+    for index in range(count):
+        plan = WeekPlan.objects.create(
+            user=user,
+            measurement=measurement,
+            start_date=datetime.date(2026, 1, 5)
+            + datetime.timedelta(weeks=index),
+            protein_g_kg=Decimal("1.8"),
+            fat_perc=Decimal("25.0"),
+            deficit=500,
+        )
+        for day in Day.objects.filter(plan=plan):
+            Intake.objects.create(day=day, meal=Intake.MEAL_LUNCH)
+
+
+def test_deep_recipe_queries_batch_ingredients(user, mocker):
+    """Aliased and fragment-selected ingredients cost O(1) queries."""
+    # Given
+    _create_recipes(1)
+    small = _count_queries(user, mocker, RECIPES_QUERY)
+    _create_recipes(4)
+
+    # When
+    large = _count_queries(user, mocker, RECIPES_QUERY)
+
+    # Then
+    assert small == large
+
+
+def test_deep_week_plan_queries_batch_days_and_intakes(user, mocker):
+    """Plan days, their intakes and day-derived totals cost O(1) queries."""
+    # Given
+    _create_plans(user, 1)
+    small = _count_queries(user, mocker, PLANS_QUERY)
+    _create_plans(user, 3)
+
+    # When
+    large = _count_queries(user, mocker, PLANS_QUERY)
+
+    # Then
+    assert small == large
+
+
+def test_product_servings_batch_across_lists_and_connections(user, mocker):
+    """Servings load in one query per list however they are selected."""
+    # Given
+    FoodProduct.objects.create(name="First", num_servings=1)
+    small = _count_queries(user, mocker, PRODUCTS_QUERY)
+    for index in range(4):
+        FoodProduct.objects.create(name=f"Product {index}", num_servings=2)
+
+    # When
+    large = _count_queries(user, mocker, PRODUCTS_QUERY)
+
+    # Then
+    assert small == large
+
+
+def test_scalar_queries_do_not_load_relations(user, mocker):
+    """Parents queue lazily, so unselected relations are never loaded."""
+    # Given
+    _create_recipes(3)
+
+    # Then
+    assert _count_queries(user, mocker, "{ recipes { id name } }") == 1
+
+
+def test_loads_outside_an_operation_fetch_one_parent():
+    """Without an operation, parents load their own relation."""
+    # Given
+    product = FoodProduct.objects.create(name="Alone", num_servings=1)
+    product = FoodProduct.objects.get(pk=product.pk)
+    SERVINGS.add(product)
+
+    # When
+    rows = SERVINGS.load(product)
+
+    # Then
+    assert rows == list(product.servings.order_by("id"))
+    with CaptureQueriesContext(connection) as captured:
+        SERVINGS.load(product)
+    assert len(captured) == 0
+
+
+def test_batch_loader_loads_the_queue_with_the_first_instance(mocker):
+    """Queued instances load together and only once."""
+    # Given
+    loaded = []
+    load_batch = mocker.Mock(side_effect=loaded.extend)
+    loader = BatchLoader(
+        lambda instance: any(item is instance for item in loaded), load_batch
+    )
+    first, second = FoodProduct(name="First"), FoodProduct(name="Second")
+    operation = RelationLoaderExtension().on_operation()
+    next(operation)
+
+    # When
+    loader.add(first)
+    loader.add(second)
+    loader.ensure_loaded(second)
+    loader.ensure_loaded(first)
+    next(operation, None)
+
+    # Then
+    load_batch.assert_called_once_with([first, second])
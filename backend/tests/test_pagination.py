@@ -0,0 +1,223 @@
+"""Tests for keyset-paginated Relay connections."""
+
+import base64
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.foods.models import FoodProduct
+from apps.libs.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    encode_cursor,
+    keyset_connection,
+)
+from apps.measurements.models import Measurement
+
+pytestmark = pytest.mark.django_db
+
+NAME_ORDER = ("name", "id")
+LATEST_ORDER = ("-created_at", "-id")
+
+
+def _products(*names: str) -> list[int]:
+    """Create food products and return their ids in creation order."""
+    return [
+        FoodProduct.objects.create(name=name, num_servings=1).pk
+        for name in names
+    ]
+
+
+def _page(ordering=NAME_ORDER, queryset=None, **kwargs):
+    """Return a connection of primary keys.
+
+    Args:
+        ordering: keyset ordering.
+        queryset: rows to paginate, food products by default.
+        kwargs: pagination arguments.
+
+    Returns:
+        Connection: page whose nodes are primary keys.
+    """
+    if queryset is None:
+        queryset = FoodProduct.objects.all()
+    return keyset_connection(queryset, ordering, lambda row: row.pk, **kwargs)
+
+
+def _walk(size: int, ordering=NAME_ORDER, queryset=None):
+    """Return the node pages seen by following cursors to the end.
+
+    Args:
+        size: page size, negative to page backwards from the end.
+        ordering: keyset ordering.
+        queryset: rows to paginate, food products by default.
+
+    Returns:
+        list: primary keys of every page.
+    """
+    backward = size < 0
+    pages = []
+    cursor = None
+    while True:
+        if backward:
+            page = _page(ordering, queryset, last=-size, before=cursor)
+        else:
+            page = _page(ordering, queryset, first=size, after=cursor)
+        pages.append([edge.node for edge in page.edges])
+        info = page.page_info
+        if not (info.has_previous_page if backward else info.has_next_page):
+            return pages
+        cursor = info.start_cursor if backward else info.end_cursor
+
+
+def test_forward_pages_follow_the_ordering_with_ties_on_the_id():
+    """Following end cursors visits every row once, in order."""
+    # Given products sharing leading key values
+    ids = _products("Banana", "Apple", "Banana", "Cherry", "Apple")
+
+    # When
+    pages = _walk(2)
+
+    # Then
+    assert pages == [[ids[1], ids[4]], [ids[0], ids[2]], [ids[3]]]
+
+
+def test_backward_pages_mirror_the_forward_pages():
+    """Following start cursors backwards visits the same pages reversed."""
+    # Given
+    ids = _products("Banana", "Apple", "Banana", "Cherry", "Apple")
+
+    # When
+    pages = _walk(-2)
+
+    # Then
+    assert pages == [[ids[2], ids[3]], [ids[4], ids[0]], [ids[1]]]
+
+
+def test_descending_datetime_keys_page_latest_first(user):
+    """Timestamps round trip through cursors at full precision."""
+    # Given
+    for weight in range(5):
+        Measurement.objects.create(user=user, weight=80 + weight)
+    expected = list(
+        Measurement.objects.order_by(*LATEST_ORDER).values_list(
+            "pk", flat=True
+        )
+    )
+
+    # When
+    pages = _walk(2, LATEST_ORDER, Measurement.objects.all())
+
+    # Then
+    assert [pk for page in pages for pk in page] == expected
+    assert len(pages) == 3
+
+
+def test_cursor_window_between_after_and_before():
+    """After and before together bound the page on both sides."""
+    # Given
+    ids = _products("A", "B", "C", "D")
+    edges = _page().edges
+
+    # When
+    page = _page(after=edges[0].cursor, before=edges[3].cursor)
+
+    # Then
+    assert [edge.node for edge in page.edges] == ids[1:3]
+    assert page.page_info.start_cursor == edges[1].cursor
+    assert page.page_info.end_cursor == edges[2].cursor
+
+
+def test_default_and_empty_pages():
+    """Pages default to a bounded size and zero-sized pages are allowed."""
+    # Given
+    _products(*(f"Product {index:02}" for index in range(DEFAULT_PAGE_SIZE)))
+
+    # Then
+    assert len(_page().edges) == DEFAULT_PAGE_SIZE
+    assert _page().page_info.has_next_page is False
+    empty = _page(first=0)
+    assert empty.edges == []
+    assert empty.page_info.has_next_page is True
+    assert empty.page_info.start_cursor is None
+
+
+def test_page_query_count_does_not_grow_with_history():
+    """Deep pages cost one query like the first page."""
+    # Given
+    _products(*(f"Product {index:02}" for index in range(30)))
+    deep = _page(first=25).page_info.end_cursor
+
+    # Then
+    for kwargs in ({}, {"after": deep}):
+        with CaptureQueriesContext(connection) as captured:
+            _page(first=2, **kwargs)
+        assert len(captured) == 1
+
+
+@pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="PostgreSQL EXPLAIN output is required",
+)
+def test_deep_pages_are_index_range_scans(user):
+    """Keyset conditions are answered by the composite ordering index."""
+    # Given
+    for weight in range(3):
+        Measurement.objects.create(user=user, weight=80 + weight)
+    queryset = Measurement.objects.filter(user=user)
+    cursor = _page(LATEST_ORDER, queryset, first=1).page_info.end_cursor
+
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        _page(LATEST_ORDER, queryset, first=1, after=cursor)
+    with connection.cursor() as db_cursor:
+        # Tiny test tables make a sequential scan cheapest; disabling it
+        # shows whether the planner can answer the query from the index.
+        db_cursor.execute("SET LOCAL enable_seqscan = off")
+        db_cursor.execute(f"EXPLAIN {captured.captured_queries[0]['sql']}")
+        plan = "\n".join(row[0] for row in db_cursor.fetchall())
+
+    # Then
+    assert "measurement_latest_idx" in plan
+    assert "Sort" not in plan
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "%%%",
+        base64.urlsafe_b64encode(b"{not json").decode(),
+        encode_cursor(["Apple"]),
+        base64.urlsafe_b64encode(json.dumps({"a": 1}).encode()).decode(),
+    ],
+)
+def test_foreign_cursors_are_rejected(cursor):
+    """Cursors not issued for the ordering are invalid."""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _page(after=cursor)
+
+
+def test_cursors_with_unparseable_values_are_rejected():
+    """Cursor values must convert to the ordering key field types."""
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _page(
+            LATEST_ORDER,
+            Measurement.objects.all(),
+            before=encode_cursor(["yesterday", 1]),
+        )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"first": 1, "last": 1}, "either first or last"),
+        ({"first": -1}, "first must be between"),
+        ({"last": MAX_PAGE_SIZE + 1}, "last must be between"),
+    ],
+)
+def test_invalid_page_sizes_are_rejected(kwargs, message):
+    """Page sizes are bounded and directional."""
+    with pytest.raises(ValueError, match=message):
+        _page(**kwargs)
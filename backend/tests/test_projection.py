@@ -0,0 +1,149 @@
+"""Tests for selection-driven column projection."""
+
+import datetime
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.foods.models import FoodProduct
+from apps.libs.projection import Column, column_values, project
+from apps.measurements.models import Measurement
+from apps.plans.models import Day, WeekPlan
+from config.schema import schema
+
+pytestmark = pytest.mark.django_db
+
+COLUMNS = {
+    "id": Column("id"),
+    "name": Column("name", default=""),
+    "energy_kcal": Column("energy_kcal", float, 0.0),
+    "salt_g": Column("salt_g", float),
+}
+
+
+def _execute(user, mocker, query: str):
+    """Execute a query as a user, capturing its SQL.
+
+    Args:
+        user: authenticated user.
+        mocker: pytest-mock fixture.
+        query (str): GraphQL query.
+
+    Returns:
+        tuple: query data and the captured SQL statements.
+    """
+    mock_context = mocker.Mock()
+    mock_context.request.user = user
+    with CaptureQueriesContext(connection) as captured:
+        result = schema.execute_sync(query, context_value=mock_context)
+    assert result.errors is None
+    return result.data, [item["sql"] for item in captured.captured_queries]
+
+
+def test_project_loads_only_selected_columns_and_the_id():
+    """Unselected and non-column names are not loaded."""
+    # Given
+    FoodProduct.objects.create(name="Oats", energy_kcal=Decimal("389"))
+
+    # When
+    product = project(
+        FoodProduct.objects.all(), {"energyKcal", "servings"}, COLUMNS
+    ).get()
+
+    # Then
+    assert {"name", "salt_g"} <= product.get_deferred_fields()
+    assert {"id", "energy_kcal"}.isdisjoint(product.get_deferred_fields())
+
+
+def test_column_values_use_defaults_for_deferred_columns():
+    """Deferred columns are never loaded while building type values."""
+    # Given
+    FoodProduct.objects.create(name="Oats", energy_kcal=Decimal("389"))
+    product = FoodProduct.objects.only("id", "energy_kcal").get()
+
+    # When
+    with CaptureQueriesContext(connection) as captured:
+        values = column_values(product, COLUMNS)
+
+    # Then
+    assert len(captured) == 0
+    assert values == {
+        "id": product.id,
+        "name": "",
+        "energy_kcal": 389.0,
+        "salt_g": None,
+    }
+
+
+def test_catalog_reads_fetch_only_selected_columns(user, mocker):
+    """Lists, connections and single reads skip unselected nutrients."""
+    # Given
+    product = FoodProduct.objects.create(
+        name="Oats", energy_kcal=Decimal("389"), salt_g=Decimal("0.01")
+    )
+    query = f"""
+        {{
+            foodProducts {{ name energyKcal }}
+            foodProductsConnection {{ edges {{ node {{ name }} }} }}
+            foodProduct(id: {product.id}) {{ energyKcal servings {{ id }} }}
+        }}
+    """
+
+    # When
+    data, statements = _execute(user, mocker, query)
+
+    # Then
+    assert data["foodProducts"] == [{"name": "Oats", "energyKcal": 389.0}]
+    assert data["foodProduct"]["energyKcal"] == 389.0
+    assert data["foodProduct"]["servings"]
+    assert len(statements) == 4
+    catalog = [sql for sql in statements if "foods_foodproduct" in sql]
+    assert len(catalog) == 3
+    assert all('"salt_g"' not in sql for sql in catalog)
+
+
+def test_full_selection_still_reads_every_column(user, mocker):
+    """Selecting optional nutrients loads and returns them."""
+    # Given
+    FoodProduct.objects.create(name="Crisps", salt_g=Decimal("1.2"))
+
+    # When
+    data, statements = _execute(
+        user, mocker, "{ recipes { id } foodProducts { name saltG } }"
+    )
+
+    # Then
+    assert data["foodProducts"] == [{"name": "Crisps", "saltG": 1.2}]
+    assert len(statements) == 2
+
+
+def test_day_reads_fetch_only_selected_columns(user, mocker):
+    """Single day reads project unless the TDEE needs the full row."""
+    # Given
+    measurement = Measurement.objects.create(
+        user=user, body_fat_perc=Decimal("20.0"), weight=Decimal("80.0")
+    )
+    plan = WeekPlan.objects.create(
+        user=user,
+        measurement=measurement,
+        start_date=datetime.date(2026, 1, 5),
+        protein_g_kg=Decimal("1.8"),
+        fat_perc=Decimal("25.0"),
+        deficit=500,
+    )
+    day = Day.objects.filter(plan=plan).order_by("day").first()
+
+    # When
+    data, statements = _execute(
+        user, mocker, f"{{ day(id: {day.id}) {{ day energyKcalGoal }} }}"
+    )
+
+    # Then
+    assert data["day"] == {
+        "day": "2026-01-05",
+        "energyKcalGoal": float(day.energy_kcal_goal or 0),
+    }
+    assert len(statements) == 1
+    assert '"protein_g_goal"' not in statements[0]